@@ -7,6 +7,7 @@ from typing import List, Optional
 import bs4
 import requests
 from bs4 import BeautifulSoup
+from maccabistats.parse.maccabi_tlv_site.http_cache import get_maccabi_site_http_cache
 
 from maccabipediabot.calendar.calendar_operations import Event
 
@@ -115,6 +116,21 @@ def get_result(div: BeautifulSoup):
         return f"\nהפסד {maccabi_score} - {rival_score}"
 
 
+def get_page_content(url: str) -> bytes:
+    """
+    Gets the page from the maccabi-tlv.co.il http cache, it is downloaded again only if it changed
+
+    :param url: The page URL
+    :return: the page content, the content of an error page too (the site answers some valid pages with an error status)
+    """
+
+    try:
+        return get_maccabi_site_http_cache().get(url)
+    except requests.HTTPError as error:
+        _logger.warning(f'Got status code {error.response.status_code} for {url}, parsing its page anyway')
+        return error.response.content
+
+
 def handle_game(game: bs4.element.Tag) -> Event:
     """
     Parsing single game to event
@@ -124,11 +140,10 @@ def handle_game(game: bs4.element.Tag) -> Event:
     """
 
     official_game_page = game.find('a', href=True)['href']
-    # Connect to the URL
-    response = requests.get(official_game_page)
+    official_game_page_content = get_page_content(official_game_page)
 
     # Parse HTML and save to BeautifulSoup object
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(official_game_page_content, 'html.parser')
 
     img_src = soup.find("div", {"class": "tv"})
     if img_src.contents:
@@ -208,11 +223,10 @@ def fetch_games_from_maccabi_tlv_site(url: str, to_update_last_game: Optional[bo
     :return: a list of events representing the games
     """
 
-    # Connect to the URL
-    response = requests.get(url)
+    games_page_content = get_page_content(url)
 
     # Parse HTML and save to BeautifulSoup object
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(games_page_content, 'html.parser')
 
     events = []
 
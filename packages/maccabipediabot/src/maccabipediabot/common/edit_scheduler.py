@@ -0,0 +1,191 @@
+"""
+Saves pages for the writer bots with a few concurrent workers, instead of one page after another.
+
+pywikibot already sends maxlag with every request and waits on maxlag & ratelimited responses, but only in the thread
+that got them. When a save gives up on those (or is rate limited), the scheduler pauses all its workers with a growing
+backoff and retries the save. An edit conflict is retried on the fresh revision when the job knows how to rebase
+its change (a function from the page text to the new text), otherwise it is reported as failed.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pywikibot as pw
+from pywikibot.exceptions import APIError, EditConflictError, MaxlagTimeoutError, NoPageError
+from pywikibot.exceptions import TimeoutError as PywikibotTimeoutError
+
+EDIT_WORKERS = 4
+MAX_EDIT_ATTEMPTS = 5
+BACKOFF_SECONDS = 5
+SERVER_LIMIT_API_CODES = {"ratelimited", "maxlag", "readonly"}
+
+
+@dataclass
+class EditJob:
+    page: Union[pw.Page, str]
+    new_text: str
+    summary: str
+    rebase: Optional[Callable[[str], str]] = None
+    save_kwargs: dict = field(default_factory=dict)
+
+
+@dataclass
+class EditsSummary:
+    saved: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # Title to the error
+    cancelled: List[str] = field(default_factory=list)  # Not saved, the run was stopped before their turn
+    rebased: int = 0
+    throttled: int = 0
+
+    def log(self) -> None:
+        logging.info(f"Edits complete: {len(self.saved)} saved, {len(self.unchanged)} unchanged, "
+                     f"{len(self.failed)} failed, {len(self.cancelled)} cancelled "
+                     f"({self.rebased} rebased on edit conflicts, "
+                     f"{self.throttled} retried after the server limits)")
+        for title, error in self.failed.items():
+            logging.warning(f"Failed to save {title}: {error}")
+        if self.cancelled:
+            logging.warning(f"Cancelled edits: {', '.join(self.cancelled)}")
+
+
+def _is_server_limit_error(error: Exception) -> bool:
+    if isinstance(error, (MaxlagTimeoutError, PywikibotTimeoutError)):
+        return True
+    return isinstance(error, APIError) and error.code in SERVER_LIMIT_API_CODES
+
+
+def _current_text(page: pw.Page) -> str:
+    """The page text on the wiki, even if page.text was already changed."""
+    try:
+        return page.get(get_redirect=True)
+    except NoPageError:
+        return ""
+
+
+class EditScheduler(object):
+    """
+    Usage:
+        with EditScheduler(site) as edit_scheduler:
+            edit_scheduler.submit(page, new_text, summary="MaccabiBot - ...", bot=True)
+        edit_scheduler.summary  # Logged when leaving the with block
+
+    When the with block raises (or is interrupted), the edits that didn't start yet are cancelled, not saved.
+    """
+
+    def __init__(self, site: pw.Site, max_workers: int = EDIT_WORKERS, max_attempts: int = MAX_EDIT_ATTEMPTS,
+                 backoff_seconds: float = BACKOFF_SECONDS):
+        self._site = site
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="edit-scheduler")
+        self._jobs: List[Tuple[Future, EditJob]] = []
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.summary = EditsSummary()
+
+    def __enter__(self) -> "EditScheduler":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.wait()
+        else:
+            self.cancel()
+
+    def submit(self, page: Union[pw.Page, str], new_text: str, summary: str,
+               rebase: Optional[Callable[[str], str]] = None, **save_kwargs) -> Future:
+        """
+        Schedule saving new_text to this page (a title or a pywikibot page, its loaded text is reused).
+        rebase builds the new text from the fresh page text after an edit conflict, save_kwargs go to page.save.
+        """
+        job = EditJob(page, str(new_text), summary, rebase, save_kwargs)
+        future = self._executor.submit(self._edit, job)
+        self._jobs.append((future, job))
+        return future
+
+    def wait(self) -> EditsSummary:
+        """Wait for all the submitted edits, then log their summary."""
+        self._executor.shutdown(wait=True)
+        for future, _job in self._jobs:
+            future.result()  # Raises the scheduler own bugs, the edits errors are in the summary
+        self.summary.log()
+        return self.summary
+
+    def cancel(self) -> EditsSummary:
+        """Cancel the edits that didn't start yet, wait for the running ones, then log their summary."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for future, job in self._jobs:
+            if future.cancelled():
+                self.summary.cancelled.append(job.page if isinstance(job.page, str) else job.page.title())
+            elif future.exception() is not None:
+                # Logged and not raised, the error that stopped the run is the one to propagate
+                logging.error("Edit scheduler error", exc_info=future.exception())
+        self.summary.log()
+        return self.summary
+
+    def _wait_for_pause(self) -> None:
+        while True:
+            with self._lock:
+                seconds_to_wait = self._paused_until - time.monotonic()
+            if seconds_to_wait <= 0:
+                return
+            time.sleep(seconds_to_wait)
+
+    def _pause(self, attempt: int) -> None:
+        seconds_to_wait = self._backoff_seconds * 2 ** (attempt - 1)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds_to_wait)
+            self.summary.throttled += 1
+        logging.warning(f"Reached the server limits, pausing all edits for {seconds_to_wait} seconds")
+
+    def _record(self, outcome: str, title: str, error: str = "") -> None:
+        with self._lock:
+            if outcome == "failed":
+                self.summary.failed[title] = error
+            else:
+                getattr(self.summary, outcome).append(title)
+
+    def _edit(self, job: EditJob) -> None:
+        page = pw.Page(self._site, job.page) if isinstance(job.page, str) else job.page
+        title = page.title()
+        new_text = job.new_text
+
+        for attempt in range(1, self._max_attempts + 1):
+            self._wait_for_pause()
+            try:
+                if _current_text(page) == new_text:
+                    logging.info(f"No changes for {title}, not saving")
+                    self._record("unchanged", title)
+                    return
+
+                page.text = new_text
+                page.save(summary=job.summary, **job.save_kwargs)
+                self._record("saved", title)
+                return
+            except EditConflictError:
+                if job.rebase is None:
+                    self._record("failed", title, "Edit conflict")
+                    return
+
+                logging.info(f"Edit conflict on {title}, rebasing on the fresh revision")
+                page = pw.Page(self._site, title)
+                try:
+                    new_text = str(job.rebase(_current_text(page)))
+                except Exception as e:
+                    logging.exception(f"Failed to rebase {title}")
+                    self._record("failed", title, repr(e))
+                    return
+                with self._lock:
+                    self.summary.rebased += 1
+            except Exception as e:
+                if not _is_server_limit_error(e):
+                    logging.exception(f"Failed to save {title}")
+                    self._record("failed", title, repr(e))
+                    return
+                self._pause(attempt)
+
+        self._record("failed", title, f"Gave up after {self._max_attempts} attempts")
@@ -1,6 +1,8 @@
 import logging
+from typing import Optional
 
 from maccabipediabot.common.logging_setup import setup_logging
+from maccabipediabot.common.revision_cache import RevisionCache
 from maccabipediabot.common.wiki_login import get_site
 
 import mwparserfromhell as mw
@@ -18,6 +20,9 @@ basketball_games_template_name = "משחק כדורסל"
 
 SHOULD_SAVE = True
 SHOULD_SHOW_DIFF = False
+USE_REVISION_CACHE = True  # Handle only the pages that were edited since the last run
+# Bump the version when this bot output changes, so the pages it already handled are handled again
+REVISION_CACHE_BOT_NAME = "prettify_games_pages:v1"
 
 
 def iterate_games_pages():
@@ -37,34 +42,37 @@ def _save_page_changes(game_page, new_text):
     """
     :type game_page: pywikibot.page.Page
     :type new_text: str
+    :return: The page text on the wiki after this call (the new text if it was saved).
     """
     if game_page.text == new_text:
         logging.debug(f'No change for page: {game_page.title()}, Dont saving ')
-        return
+        return game_page.text
 
     if SHOULD_SHOW_DIFF:
         pw.showDiff(game_page.text, new_text)
     if not SHOULD_SAVE:
         logging.info(f"SHOULD_SAVE=False, dont saving changes for page: {game_page.title()}")
-        return
+        return game_page.text
 
     game_page.text = new_text
     game_page.save(summary="MaccabiBot - Prettify games pages", bot=True)
+    return new_text
 
 
 def matches_games_template(*args, **kwargs):
     return args[0].name.strip() in [games_template_name, volleyball_games_template_name, basketball_games_template_name]
 
 
-def prettify_game_page_main_template(game_page):
+def prettify_game_main_template(parsed_mw_text):
     """
-    :type game_page: pywikibot.page.Page
+    Prettifies the game main template of the given page text, in place (without saving anything).
+    :type parsed_mw_text: mwparserfromhell.wikicode.Wikicode
+    :return: Whether the page text has a game template.
+    :rtype: bool
     """
-    parsed_mw_text = mw.parse(game_page.text)
     templates = parsed_mw_text.filter_templates(matches=matches_games_template)
     if not templates:
-        logging.warning(f"Found no game template in this page: {game_page.title()}")
-        return
+        return False
 
     game_template = templates[0]
 
@@ -88,7 +96,21 @@ def prettify_game_page_main_template(game_page):
         # Param name should not contain new lines - that may cause two "|" (param definition) to be at the same line
         param.name = param.name.strip("\n")
 
-    _save_page_changes(game_page, parsed_mw_text)
+    return True
+
+
+def prettify_game_page_main_template(game_page, revision_cache: Optional[RevisionCache] = None):
+    """
+    :type game_page: pywikibot.page.Page
+    """
+    parsed_mw_text = mw.parse(game_page.text)
+    if not prettify_game_main_template(parsed_mw_text):
+        logging.warning(f"Found no game template in this page: {game_page.title()}")
+        return
+
+    page_text = _save_page_changes(game_page, parsed_mw_text)
+    if revision_cache is not None:
+        revision_cache.remember(game_page, page_text, parsed_mw_text)
 
 
 def main():
@@ -96,8 +118,11 @@ def main():
     logging.info("Should show diff: {diff}\n".format(diff=SHOULD_SHOW_DIFF))
 
     logging.info("\nIterating all pages that uses football games template:")
-    for game_page in iterate_games_pages():
-        prettify_game_page_main_template(game_page)
+    with RevisionCache(REVISION_CACHE_BOT_NAME) as revision_cache:
+        games_pages = revision_cache.changed_pages(get_site(), iterate_games_pages()) if USE_REVISION_CACHE \
+            else iterate_games_pages()
+        for game_page in games_pages:
+            prettify_game_page_main_template(game_page, revision_cache)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,72 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import pywikibot as pw
+
+# MediaWiki's action=purge takes up to 50 titles in one request (500 for users with apihighlimits, like bots)
+PURGE_TITLES_PER_REQUEST = 50
+PURGE_TITLES_PER_REQUEST_HIGH_LIMITS = 500
+PURGE_CONCURRENT_REQUESTS = 4
+
+
+@dataclass
+class PurgeResults:
+    purged: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+def _purge_titles_per_request(site: pw.Site) -> int:
+    try:
+        if site.has_right("apihighlimits"):
+            return PURGE_TITLES_PER_REQUEST_HIGH_LIMITS
+    except Exception as e:
+        logging.debug(f"Could not check the apihighlimits right, purging {PURGE_TITLES_PER_REQUEST} titles at once: {e}")
+    return PURGE_TITLES_PER_REQUEST
+
+
+def _purge_titles_batch(site: pw.Site, titles: list[str], forcelinkupdate: bool) -> PurgeResults:
+    results = PurgeResults()
+    try:
+        response = site.simple_request(action="purge", titles=titles, forcelinkupdate=forcelinkupdate).submit()
+    except Exception as e:
+        logging.warning(f"Failed to purge {len(titles)} pages ({titles[0]}, ...): {e}")
+        results.failed.extend(titles)
+        return results
+
+    for page in response.get("purge", []):
+        if "purged" in page:
+            results.purged.append(page["title"])
+        elif "missing" in page:
+            results.missing.append(page["title"])
+        else:  # Invalid titles and pages the wiki refused to purge
+            logging.warning(f"Failed to purge {page.get('title')}: {page}")
+            results.failed.append(page.get("title"))
+
+    return results
+
+
+def purge_pages(site: pw.Site, titles: Iterable[str], forcelinkupdate: bool = True,
+                max_concurrent_requests: int = PURGE_CONCURRENT_REQUESTS) -> PurgeResults:
+    """
+    Purge the given pages with as few API requests as possible: the titles are deduped and purged in batches
+    (a few batches at a time), the missing pages are reported by the purge response itself.
+    """
+    unique_titles = sorted(set(titles))
+    results = PurgeResults()
+    if not unique_titles:
+        return results
+
+    titles_per_request = _purge_titles_per_request(site)
+    batches = [unique_titles[index:index + titles_per_request]
+               for index in range(0, len(unique_titles), titles_per_request)]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrent_requests, len(batches))) as executor:
+        for batch_results in executor.map(lambda batch: _purge_titles_batch(site, batch, forcelinkupdate), batches):
+            results.purged.extend(batch_results.purged)
+            results.missing.extend(batch_results.missing)
+            results.failed.extend(batch_results.failed)
+
+    return results
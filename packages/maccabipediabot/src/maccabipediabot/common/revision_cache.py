@@ -0,0 +1,111 @@
+"""
+A local SQLite cache of the pages a maintenance bot already handled, so the next run fetches & parses only the pages
+that were edited since.
+
+For each (bot, page title) it keeps the revision id the bot saw and a hash of the bot output for that page. A page is
+remembered only when its text is the bot output (it was saved, or nothing had to change), so pages that still need a
+change (like on dry runs) are handled again on the next run.
+
+The bot name should have a version of its output (like "sort_players_events:v1"), bump it when the bot output changes,
+so all the pages are handled again by the new code.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import pywikibot as pw
+from pywikibot import pagegenerators
+
+REVISION_CACHE_FILE_ENV = "MACCABIPEDIA_REVISION_CACHE_FILE"
+DEFAULT_REVISION_CACHE_FILE = Path.home() / ".maccabipediabot" / "revision_cache.sqlite3"
+PRELOAD_CONTENT_BATCH_SIZE = 50
+
+
+def revision_cache_file() -> Path:
+    return Path(os.environ.get(REVISION_CACHE_FILE_ENV, DEFAULT_REVISION_CACHE_FILE))
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(str(text).encode("utf8")).hexdigest()
+
+
+class RevisionCache(object):
+    def __init__(self, bot_name: str, path: Optional[Path] = None):
+        self._bot_name = bot_name
+        self._path = Path(path or revision_cache_file())
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS pages ("
+                                     "bot TEXT NOT NULL, title TEXT NOT NULL, revid INTEGER NOT NULL, "
+                                     "output_hash TEXT NOT NULL, PRIMARY KEY (bot, title))")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "RevisionCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get(self, title: str) -> Optional[tuple]:
+        with self._lock:
+            return self._connection.execute("SELECT revid, output_hash FROM pages WHERE bot = ? AND title = ?",
+                                            (self._bot_name, title)).fetchone()
+
+    def is_handled(self, title: str, revid: int, text: Optional[str] = None) -> bool:
+        """
+        Whether the bot already handled this revision of the page,
+        or (when the text is given) the page text is what the bot produced for it.
+        """
+        cached = self._get(title)
+        if cached is None:
+            return False
+
+        cached_revid, cached_output_hash = cached
+        return cached_revid == revid or (text is not None and _text_hash(text) == cached_output_hash)
+
+    def _store(self, title: str, revid: int, output_hash: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO pages (bot, title, revid, output_hash) VALUES (?, ?, ?, ?)",
+                                     (self._bot_name, title, revid, output_hash))
+
+    def remember(self, page: pw.Page, page_text: str, output_text: str) -> None:
+        """
+        Remember the page as handled, if its text is the bot output (call it after saving the page).
+        page_text is the page text on the wiki, as the bot loaded it or saved it. page.text is not used, pywikibot
+        drops it after a save (reading it would fetch the page again), the saved revision id is kept though.
+        """
+        output_hash = _text_hash(output_text)
+        if _text_hash(page_text) != output_hash:
+            return
+
+        self._store(page.title(), page.latest_revision_id, output_hash)
+
+    def changed_pages(self, site: pw.Site, pages: Iterable[pw.Page]) -> Iterator[pw.Page]:
+        """
+        Yields the pages that were edited since the bot handled them, loaded with their text.
+        The revisions ids of all the pages are queried first (in batches, without the pages content),
+        then only the changed pages content is fetched (in batches as well).
+        """
+        pages_count = 0
+        changed_pages = []
+        for page in site.preloadpages(pages, content=False):
+            pages_count += 1
+            if not self.is_handled(page.title(), page.latest_revision_id):
+                changed_pages.append(page)
+
+        logging.info(f"{len(changed_pages)} of {pages_count} pages were edited since the last run")
+
+        for page in pagegenerators.PreloadingGenerator(changed_pages, groupsize=PRELOAD_CONTENT_BATCH_SIZE):
+            if self.is_handled(page.title(), page.latest_revision_id, page.text):
+                logging.debug(f"{page.title()} is already the bot output, skipping")
+                self._store(page.title(), page.latest_revision_id, _text_hash(page.text))  # Its new revision id
+                continue
+            yield page
@@ -1,7 +1,7 @@
 import logging
 import re
-from datetime import timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
 
 from maccabipediabot.common.wiki_login import get_site
 
@@ -16,11 +16,13 @@ site = get_site()
 from maccabistats import get_maccabi_stats_as_newest_wrapper
 from maccabistats.models.player_game_events import GameEventTypes
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabipediabot.common.edit_scheduler import EditScheduler
 from maccabipediabot.common.logging_setup import setup_logging
 from maccabipediabot.common.page_names import build_football_game_page_name
 from maccabipediabot.common.maccabistats_player_event import PlayerEvent
-from maccabipediabot.common.prettify_games_pages import prettify_game_page_main_template
-from maccabipediabot.football.sort_players_events import sort_player_events_in_games_page
+from maccabipediabot.common.purge_pages import purge_pages
+from maccabipediabot.common.prettify_games_pages import prettify_game_main_template
+from maccabipediabot.football.sort_players_events import sort_player_events_in_game_template
 
 setup_logging(level=logging.INFO)
 
@@ -54,6 +56,7 @@ SHOULD_SAVE = True
 SHOULD_SHOW_DIFF = True
 SHOULD_CHECK_FOR_UPDATE_IN_EXISTING_PAGES = False
 SHOULD_PURGE_RELATED_PAGES = True  # Purge related pages (opponent, players, coaches) after game uploads
+PREFETCH_PAGES_BATCH_SIZE = 50  # Games pages loaded (existence & text) in one API request
 
 
 def all_maccabi_games():
@@ -231,13 +234,53 @@ def handle_new_page(game_page, game):
     game_page.text = str(football_game_template)
 
 
-def create_or_update_game_page(game, overwrite_existing_pages: bool = True) -> bool:
-    """Returns True if the page was saved, False if skipped."""
+def render_game_page_text(game_page_text: str) -> str:
+    """
+    The game page text as it should be saved: with its main template prettified and its players events sorted.
+    Done in memory, so the page is saved once (instead of saving it again after each of these steps).
+    """
+    parsed_mw_text = mwparserfromhell.parse(game_page_text)
+    prettify_game_main_template(parsed_mw_text)
+    sort_player_events_in_game_template(parsed_mw_text)
+
+    return str(parsed_mw_text)
+
+
+def prefetch_game_pages(games: Iterable) -> Dict[str, pw.Page]:
+    """
+    Load the pages of these games (whether they exist & their text) in batches, rather than one request per page.
+    Returns the loaded pages by their titles.
+    """
+    pages = [pw.Page(site, generate_page_name_from_game(game)) for game in games]
+    logging.info(f"Prefetching {len(pages)} games pages")
+
+    return {page.title(): page
+            for page in pagegenerators.PreloadingGenerator(pages, groupsize=PREFETCH_PAGES_BATCH_SIZE)}
+
+
+def _rebase_game_page_text(page_text: str, game) -> str:
+    """The game page text after an edit conflict: this game values on the fresh page text."""
+    game_page = pw.Page(site, generate_page_name_from_game(game))
+    game_page.text = page_text
+    handle_existing_page(game_page, game)
+
+    return render_game_page_text(str(game_page.text))
+
+
+def create_or_update_game_page(game, overwrite_existing_pages: bool = True,
+                               game_page: Optional[pw.Page] = None,
+                               edit_scheduler: Optional[EditScheduler] = None) -> bool:
+    """
+    Returns True if the page was saved (or has changes to save), False if skipped or unchanged.
+    game_page may be given already loaded (see prefetch_game_pages), otherwise it is loaded here.
+    With an edit_scheduler the page is submitted to it, to be saved concurrently with the other games pages.
+    """
     logging.info(f"create_or_update_game_page : {game}")
 
     page_name = generate_page_name_from_game(game)
 
-    game_page = pw.Page(site, page_name)
+    if game_page is None:
+        game_page = pw.Page(site, page_name)
 
     # handle_new_page & handle_existing_page changes the game_page.text attribute.
     if game_page.exists():
@@ -246,42 +289,53 @@ def create_or_update_game_page(game, overwrite_existing_pages: bool = True) -> b
             return False
 
         logging.info("Page : {name} exists, check for updates\n".format(name=page_name))
+        current_text = game_page.text
         handle_existing_page(game_page, game)
     else:
         logging.info("Page : {name} does not exists, creating\n".format(name=page_name))
+        current_text = ""
         handle_new_page(game_page, game)
 
+    game_page.text = render_game_page_text(str(game_page.text))
+    if game_page.text == current_text:
+        logging.info(f"No changes for {game_page.title()}, not saving")
+        return False
+
     logging.info("")  # Empty line
-    if SHOULD_SAVE:
+    if SHOULD_SAVE and edit_scheduler is not None:
+        logging.info("Submitting {name}".format(name=game_page.title()))
+        edit_scheduler.submit(game_page, game_page.text, summary="MaccabiBot - Uploading Games",
+                              rebase=lambda page_text: _rebase_game_page_text(page_text, game))
+    elif SHOULD_SAVE:
         logging.info("Saving {name}".format(name=game_page.title()))
         game_page.save(summary="MaccabiBot - Uploading Games")
-
-        logging.info(f"Prettifying {game_page.title()}")
-        prettify_game_page_main_template(game_page)
-
-        logging.info(f"Sorting events {game_page.title()}")
-        sort_player_events_in_games_page(game_page)
     else:
         logging.info("Not saving {name}".format(name=game_page.title()))
 
     return True
 
 
-def get_games_that_has_existing_pages(games: List[str]):
+def get_games_that_has_existing_pages(games: Iterable) -> List:
+    games_by_date: Dict[date, list] = {}
+    for game in games:
+        games_by_date.setdefault(game.date.date(), []).append(game)
+
     existing_games = []
     existing_games_pages = get_all_football_games_category_pages()
     for game_page in existing_games_pages:
-        game_date_match = re.search("([0-9]{2}\-[0-9]{2}\-[0-9]{4})", game_page.title())
+        game_date_match = re.search(r"([0-9]{2}-[0-9]{2}-[0-9]{4})", game_page.title())
         if game_date_match is None:
             logging.warning("Found game page title without date, skipping this page, wtf?? - {title}".format(
                 title=game_page.title()))
             continue
-        game_date = game_date_match.group()
-        game_date = game_date.replace("-", ".")  # For maccabistats format played(before\after).
+        game_date = datetime.strptime(game_date_match.group(), "%d-%m-%Y").date()
 
-        game = games.played_before(game_date).played_after(game_date)
+        game = games_by_date.get(game_date, [])
         if len(game) > 1:
             raise RuntimeError("found more than one game for {date}".format(date=game_date))
+        if not game:
+            logging.debug(f"No game to update for {game_page.title()}")
+            continue
         existing_games.append(game[0])
 
     return existing_games
@@ -325,23 +379,13 @@ def purge_pages_batch(pages_to_purge: set[str]) -> None:
         return
 
     logging.info(f"Purging {len(pages_to_purge)} unique related pages...")
-    results = {"purged": 0, "skipped": 0, "failed": 0}
+    results = purge_pages(site, pages_to_purge)
 
-    for page_name in sorted(pages_to_purge):
-        try:
-            page = pw.Page(site, page_name)
-            if page.exists():
-                logging.debug(f"Purging: {page_name}")
-                page.purge(forcelinkupdate=True)
-                results["purged"] += 1
-            else:
-                logging.debug(f"Page doesn't exist, skipping: {page_name}")
-                results["skipped"] += 1
-        except Exception as e:
-            logging.warning(f"Failed to purge {page_name}: {e}")
-            results["failed"] += 1
+    for page_name in results.missing:
+        logging.debug(f"Page doesn't exist, skipping: {page_name}")
 
-    logging.info(f"Purge complete: {results['purged']} purged, {results['skipped']} skipped, {results['failed']} failed")
+    logging.info(f"Purge complete: {len(results.purged)} purged, {len(results.missing)} skipped, "
+                 f"{len(results.failed)} failed")
 
 
 def upload_games_to_maccabipedia(maccabi_games_to_add: MaccabiGamesStats):
@@ -353,11 +397,15 @@ def upload_games_to_maccabipedia(maccabi_games_to_add: MaccabiGamesStats):
     # Collect pages to purge across all games
     all_pages_to_purge = set()
 
-    for game in maccabi_games_to_add:
-        was_saved = create_or_update_game_page(game, overwrite_existing_pages=False)
-        if was_saved:
-            pages_from_game = collect_related_pages_from_game(game)
-            all_pages_to_purge.update(pages_from_game)
+    games_pages = prefetch_game_pages(maccabi_games_to_add)
+    with EditScheduler(site) as edit_scheduler:
+        for game in maccabi_games_to_add:
+            was_saved = create_or_update_game_page(game, overwrite_existing_pages=False,
+                                                   game_page=games_pages.get(generate_page_name_from_game(game)),
+                                                   edit_scheduler=edit_scheduler)
+            if was_saved:
+                pages_from_game = collect_related_pages_from_game(game)
+                all_pages_to_purge.update(pages_from_game)
 
     logging.info("Finished adding new games.")
 
@@ -373,10 +421,13 @@ def upload_games_to_maccabipedia(maccabi_games_to_add: MaccabiGamesStats):
         logging.info("Now handling existing games:")
         existing_games = get_games_that_has_existing_pages(maccabi_games_to_add.games)
 
-        for game in existing_games:
-            create_or_update_game_page(game)
-            pages_from_game = collect_related_pages_from_game(game)
-            all_pages_to_purge.update(pages_from_game)
+        games_pages = prefetch_game_pages(existing_games)
+        with EditScheduler(site) as edit_scheduler:
+            for game in existing_games:
+                create_or_update_game_page(game, game_page=games_pages.get(generate_page_name_from_game(game)),
+                                           edit_scheduler=edit_scheduler)
+                pages_from_game = collect_related_pages_from_game(game)
+                all_pages_to_purge.update(pages_from_game)
 
         # Purge again if we updated existing games
         if SHOULD_SAVE and SHOULD_PURGE_RELATED_PAGES:
@@ -1,4 +1,6 @@
 import logging
+from typing import Optional
+
 from maccabipediabot.common.wiki_login import get_site
 
 import mwparserfromhell as mw
@@ -6,6 +8,7 @@ import pywikibot as pw
 from pywikibot import pagegenerators
 
 from maccabipediabot.common.maccabistats_player_event import PlayerEvent, SQUAD, CARDS_AND_SUBS, GOALS_INVOLVED
+from maccabipediabot.common.revision_cache import RevisionCache
 
 from maccabipediabot.common.logging_setup import setup_logging
 setup_logging(level=logging.DEBUG)
@@ -17,6 +20,9 @@ games_template_name = "קטלוג משחקים"
 
 SHOULD_SAVE = True
 SHOULD_SHOW_DIFF = False
+USE_REVISION_CACHE = True  # Handle only the pages that were edited since the last run
+# Bump the version when this bot output changes, so the pages it already handled are handled again
+REVISION_CACHE_BOT_NAME = "sort_players_events:v1"
 
 
 def iterate_games_pages():
@@ -47,18 +53,20 @@ def _save_page_changes(game_page, new_text):
     """
     :type game_page: pywikibot.page.Page
     :type new_text: str
+    :return: The page text on the wiki after this call (the new text if it was saved).
     """
     if game_page.text == new_text:
-        return
+        return game_page.text
 
     if SHOULD_SHOW_DIFF:
         pw.showDiff(game_page.text, new_text)
     if not SHOULD_SAVE:
         logging.info(f"SHOULD_SAVE=False, dont saving changes for page: {game_page.title()}")
-        return
+        return game_page.text
 
     game_page.text = new_text
     game_page.save(summary="MaccabiBot - Sort players events", bot=True)
+    return new_text
 
 
 def matches_games_template(*args, **kwargs):
@@ -108,21 +116,22 @@ def sort_players_event_by_groups(players_event):
             unsorted_maccabi_goals_involved_events, unsorted_opponent_goals_involved_events)
 
 
-def sort_player_events_in_games_page(game_page):
+def sort_player_events_in_game_template(parsed_mw_text):
     """
-    :type game_page: pywikibot.page.Page
+    Sorts the players events of the game template of the given page text, in place (without saving anything).
+    :type parsed_mw_text: mwparserfromhell.wikicode.Wikicode
+    :return: Whether the page text has a game template.
+    :rtype: bool
     """
-    parsed_mw_text = mw.parse(game_page.text)
     templates = parsed_mw_text.filter_templates(matches=matches_games_template)
     if not templates:
-        logging.warning(f"Found no game template in this page: {game_page.title()}")
-        return
+        return False
 
     game_template = templates[0]
 
     player_events_param = [param for param in game_template.params if str(param.name).strip() == "אירועי שחקנים"][0]
     if not str(player_events_param.value).strip():
-        return  # Handle games without any player events (may be technical games at 50's).
+        return True  # Handle games without any player events (may be technical games at 50's).
 
     raw_players_events = str(player_events_param.value).split(",")
 
@@ -136,7 +145,21 @@ def sort_player_events_in_games_page(game_page):
          group_events))
     player_events_param.value = f"\n{raw_sorted_events}\n"  # Start and end with newline, better visualize in the ui editor.
 
-    _save_page_changes(game_page, parsed_mw_text)
+    return True
+
+
+def sort_player_events_in_games_page(game_page, revision_cache: Optional[RevisionCache] = None):
+    """
+    :type game_page: pywikibot.page.Page
+    """
+    parsed_mw_text = mw.parse(game_page.text)
+    if not sort_player_events_in_game_template(parsed_mw_text):
+        logging.warning(f"Found no game template in this page: {game_page.title()}")
+        return
+
+    page_text = _save_page_changes(game_page, parsed_mw_text)
+    if revision_cache is not None:
+        revision_cache.remember(game_page, page_text, parsed_mw_text)
 
 
 def main():
@@ -144,13 +167,16 @@ def main():
     logging.info("Should show diff: {diff}\n".format(diff=SHOULD_SHOW_DIFF))
 
     logging.info("\nIterating all pages that uses football games template:")
-    for game_page in iterate_games_pages():
-        try:
-            sort_player_events_in_games_page(game_page)
-        except TypeError:
-            logging.exception(f"Probably unknown event description, skipping this game: {game_page.title()}")
-        except Exception:
-            logging.exception(f"Unknown exception, skipping this game: {game_page.title()}")
+    with RevisionCache(REVISION_CACHE_BOT_NAME) as revision_cache:
+        games_pages = revision_cache.changed_pages(site, iterate_games_pages()) if USE_REVISION_CACHE \
+            else iterate_games_pages()
+        for game_page in games_pages:
+            try:
+                sort_player_events_in_games_page(game_page, revision_cache)
+            except TypeError:
+                logging.exception(f"Probably unknown event description, skipping this game: {game_page.title()}")
+            except Exception:
+                logging.exception(f"Unknown exception, skipping this game: {game_page.title()}")
 
 
 if __name__ == '__main__':
@@ -34,6 +34,7 @@ from typing import Iterator, Literal
 
 import pywikibot
 
+from maccabipediabot.common.edit_scheduler import EditScheduler
 from maccabipediabot.common.logging_setup import setup_logging
 from maccabipediabot.common.wiki_login import get_site
 
@@ -156,21 +157,24 @@ def main(
     setup_logging(level=logging.INFO)
     site = get_site()
 
-    edited = 0
+    to_install = 0
     matched_pages: list[pywikibot.Page] = []
 
-    for title, parsed in discover_matches(site, sport_filter=sport_filter):
-        page = pywikibot.Page(site, f"קטגוריה:{title}")
-        matched_pages.append(page)
-        canonical = build_canonical_wikitext(parsed)
-        if page.text == canonical:
-            logger.info("[SKIP] %s", page.title())
-        else:
-            logger.info("[INSTALL] %s → %s", page.title(), canonical)
-            edited += 1
-            if not dry_run:
-                page.text = canonical
-                page.save(summary=EDIT_SUMMARY, minor=False)
+    with EditScheduler(site) as edit_scheduler:
+        for title, parsed in discover_matches(site, sport_filter=sport_filter):
+            page = pywikibot.Page(site, f"קטגוריה:{title}")
+            matched_pages.append(page)
+            canonical = build_canonical_wikitext(parsed)
+            if page.text == canonical:
+                logger.info("[SKIP] %s", page.title())
+            else:
+                logger.info("[INSTALL] %s → %s", page.title(), canonical)
+                to_install += 1
+                if not dry_run:
+                    edit_scheduler.submit(page, canonical, summary=EDIT_SUMMARY, minor=False)
+
+    # Edit conflicts and failed saves are reported by the scheduler summary, they are not counted as edited
+    edited = to_install if dry_run else len(edit_scheduler.summary.saved)
 
     purged = 0
     if not skip_purge:
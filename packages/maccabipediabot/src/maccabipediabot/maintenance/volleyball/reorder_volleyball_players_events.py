@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass
 from typing import Dict, Optional
+from maccabipediabot.common.edit_scheduler import EditScheduler
 from maccabipediabot.common.logging_setup import setup_logging
 from maccabipediabot.common.wiki_login import get_site
 
@@ -137,21 +138,21 @@ def build_players_data(players_shirts_number: Dict[str, str], players_scores: Di
                        shirt_number=players_shirts_number.get(player_name)) for player_name in possible_players]
 
 
-def reorder_game_page(game_page):
+def reorder_players(page_text: str, title: str) -> str:
     """
-    :type game_page: pywikibot.page.Page
+    :return: The page text with the maccabi players ordered by their shirt numbers
     """
-    parsed_mw_text = mw.parse(game_page.text)
+    parsed_mw_text = mw.parse(page_text)
     templates = parsed_mw_text.filter_templates(matches=matches_games_template)
     if not templates:
-        logging.warning(f"Found no game template in this page: {game_page.title()}")
-        return
+        logging.warning(f"Found no game template in this page: {title}")
+        return page_text
 
     game_template = templates[0]
 
     if not game_template.has('שחקנים מכבי'):
-        logging.warning(f"Page hasn't the right maccabi players property: {game_page.title()}")
-        return
+        logging.warning(f"Page hasn't the right maccabi players property: {title}")
+        return page_text
 
     players_raw = game_template.get("שחקנים מכבי").value
 
@@ -166,16 +167,26 @@ def reorder_game_page(game_page):
 
     game_template.add('שחקנים מכבי', final_players)
 
+    return str(parsed_mw_text)
+
+
+def reorder_game_page(game_page, edit_scheduler: EditScheduler):
+    """
+    :type game_page: pywikibot.page.Page
+    """
+    title = game_page.title()
+    new_text = reorder_players(game_page.text, title)
+
     if not SHOULD_SAVE:
-        logging.info(f"SHOULD_SAVE=False, dont saving changes for page: {game_page.title()}")
+        logging.info(f"SHOULD_SAVE=False, dont saving changes for page: {title}")
         return
 
-    if game_page.text == parsed_mw_text:
+    if game_page.text == new_text:
         logging.info('Page is the same, skipping')
         return
 
-    game_page.text = parsed_mw_text
-    game_page.save(summary="MaccabiPediaBot - Reordering volleyball players events", bot=True)
+    edit_scheduler.submit(game_page, new_text, summary="MaccabiPediaBot - Reordering volleyball players events",
+                          rebase=lambda page_text: reorder_players(page_text, title), bot=True)
 
 
 def main():
@@ -183,13 +194,14 @@ def main():
     logging.info("Should show diff: {diff}\n".format(diff=SHOULD_SHOW_DIFF))
 
     logging.info("\nIterating all pages that uses football games template:")
-    for game_page in iterate_games_pages():
-        try:
-            reorder_game_page(game_page)
-        except TypeError:
-            logging.exception(f"Probably unknown event description, skipping this game: {game_page.title()}")
-        except Exception:
-            logging.exception(f"Unknown exception, skipping this game: {game_page.title()}")
+    with EditScheduler(site) as edit_scheduler:
+        for game_page in iterate_games_pages():
+            try:
+                reorder_game_page(game_page, edit_scheduler)
+            except TypeError:
+                logging.exception(f"Probably unknown event description, skipping this game: {game_page.title()}")
+            except Exception:
+                logging.exception(f"Unknown exception, skipping this game: {game_page.title()}")
 
 
 if __name__ == '__main__':
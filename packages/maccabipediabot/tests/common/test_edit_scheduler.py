@@ -0,0 +1,146 @@
+import threading
+
+import pytest
+from pywikibot.exceptions import APIError, EditConflictError, NoPageError
+
+from maccabipediabot.common import edit_scheduler as edit_scheduler_module
+from maccabipediabot.common.edit_scheduler import EditScheduler
+
+
+class _FakeWiki:
+    def __init__(self, pages_texts):
+        self.pages_texts = dict(pages_texts)
+        self.saves = []
+        self.save_errors = {}  # Title to the errors to raise on its next saves
+
+
+class _FakePage:
+    def __init__(self, wiki, title):
+        self._wiki = wiki
+        self._title = title
+        self.site = None
+        self.text = self.get() if title in wiki.pages_texts else ""
+
+    def title(self, as_link=False):
+        return f"[[{self._title}]]" if as_link else self._title
+
+    def get(self, get_redirect=False):
+        if self._title not in self._wiki.pages_texts:
+            raise NoPageError(self)
+        return self._wiki.pages_texts[self._title]
+
+    def save(self, summary, **kwargs):
+        errors = self._wiki.save_errors.get(self._title)
+        if errors:
+            raise errors.pop(0)
+        self._wiki.pages_texts[self._title] = self.text
+        self._wiki.saves.append((self._title, summary, kwargs))
+
+
+@pytest.fixture
+def wiki(monkeypatch):
+    wiki = _FakeWiki({"עמוד קיים": "טקסט", "עמוד ללא שינוי": "אותו טקסט"})
+    monkeypatch.setattr(edit_scheduler_module.pw, "Page", lambda _site, title: _FakePage(wiki, title))
+    return wiki
+
+
+def test_edits(wiki):
+    with EditScheduler(site=None) as edit_scheduler:
+        edit_scheduler.submit("עמוד קיים", "טקסט חדש", summary="MaccabiBot - Test", bot=True)
+        edit_scheduler.submit(_FakePage(wiki, "עמוד חדש"), "עמוד שנוצר", summary="MaccabiBot - Test")
+        edit_scheduler.submit("עמוד ללא שינוי", "אותו טקסט", summary="MaccabiBot - Test")
+
+    assert wiki.pages_texts["עמוד קיים"] == "טקסט חדש" and wiki.pages_texts["עמוד חדש"] == "עמוד שנוצר"
+    assert sorted(edit_scheduler.summary.saved) == ["עמוד חדש", "עמוד קיים"]
+    assert edit_scheduler.summary.unchanged == ["עמוד ללא שינוי"]
+    assert ("עמוד קיים", "MaccabiBot - Test", {"bot": True}) in wiki.saves
+
+
+def test_edit_conflict_is_rebased(wiki):
+    wiki.save_errors["עמוד קיים"] = [EditConflictError(_FakePage(wiki, "עמוד קיים"))]
+    page = _FakePage(wiki, "עמוד קיים")
+    wiki.pages_texts["עמוד קיים"] = "טקסט שנערך בינתיים"
+
+    with EditScheduler(site=None) as edit_scheduler:
+        edit_scheduler.submit(page, "טקסט + שינוי", summary="MaccabiBot - Test",
+                              rebase=lambda page_text: page_text + " + שינוי")
+
+    assert wiki.pages_texts["עמוד קיים"] == "טקסט שנערך בינתיים + שינוי"
+    assert edit_scheduler.summary.rebased == 1 and edit_scheduler.summary.saved == ["עמוד קיים"]
+
+
+def test_edit_conflict_without_rebase_fails(wiki):
+    wiki.save_errors["עמוד קיים"] = [EditConflictError(_FakePage(wiki, "עמוד קיים"))]
+
+    with EditScheduler(site=None) as edit_scheduler:
+        edit_scheduler.submit("עמוד קיים", "טקסט חדש", summary="MaccabiBot - Test")
+
+    assert wiki.pages_texts["עמוד קיים"] == "טקסט"
+    assert edit_scheduler.summary.failed == {"עמוד קיים": "Edit conflict"}
+
+
+def test_server_limits_pause_and_retry(wiki):
+    wiki.save_errors["עמוד קיים"] = [APIError("ratelimited", "You've exceeded your rate limit"),
+                                      APIError("maxlag", "Waiting for a database server")]
+
+    with EditScheduler(site=None, backoff_seconds=0.01) as edit_scheduler:
+        edit_scheduler.submit("עמוד קיים", "טקסט חדש", summary="MaccabiBot - Test")
+
+    assert wiki.pages_texts["עמוד קיים"] == "טקסט חדש"
+    assert edit_scheduler.summary.throttled == 2 and edit_scheduler.summary.saved == ["עמוד קיים"]
+
+
+def test_gives_up_and_reports_failures(wiki):
+    wiki.save_errors["עמוד קיים"] = [APIError("ratelimited", "You've exceeded your rate limit")] * 3
+    wiki.save_errors["עמוד ללא שינוי"] = [APIError("protectedpage", "This page has been protected")]
+
+    with EditScheduler(site=None, max_attempts=3, backoff_seconds=0.01) as edit_scheduler:
+        edit_scheduler.submit("עמוד קיים", "טקסט חדש", summary="MaccabiBot - Test")
+        edit_scheduler.submit("עמוד ללא שינוי", "טקסט חדש", summary="MaccabiBot - Test")
+
+    assert edit_scheduler.summary.failed["עמוד קיים"] == "Gave up after 3 attempts"
+    assert "protectedpage" in edit_scheduler.summary.failed["עמוד ללא שינוי"]
+    assert edit_scheduler.summary.saved == []
+
+
+def test_stopped_run_cancels_the_queued_edits(wiki):
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_save(page, summary, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+        wiki.pages_texts[page.title()] = page.text
+
+    with pytest.raises(KeyboardInterrupt):
+        with EditScheduler(site=None, max_workers=1) as edit_scheduler:
+            blocking_page = _FakePage(wiki, "עמוד קיים")
+            blocking_page.save = lambda summary, **kwargs: blocking_save(blocking_page, summary, **kwargs)
+            edit_scheduler.submit(blocking_page, "טקסט חדש", summary="MaccabiBot - Test")
+            edit_scheduler.submit("עמוד ללא שינוי", "טקסט חדש", summary="MaccabiBot - Test")
+            started.wait(timeout=5)
+
+            # The running save is released only after the queued edits were cancelled
+            executor_shutdown = edit_scheduler._executor.shutdown
+
+            def shutdown(wait=True, cancel_futures=False):
+                executor_shutdown(wait=False, cancel_futures=cancel_futures)
+                release.set()
+                executor_shutdown(wait=wait)
+
+            edit_scheduler._executor.shutdown = shutdown
+            raise KeyboardInterrupt()
+
+    assert wiki.pages_texts == {"עמוד קיים": "טקסט חדש", "עמוד ללא שינוי": "אותו טקסט"}
+    assert edit_scheduler.summary.saved == ["עמוד קיים"]
+    assert edit_scheduler.summary.cancelled == ["עמוד ללא שינוי"]
+
+
+def test_scheduler_errors_dont_hide_the_stopping_error(wiki, monkeypatch):
+    monkeypatch.setattr(EditScheduler, "_edit", lambda self, job: 1 / 0)
+
+    with pytest.raises(ValueError, match="stopped"):
+        with EditScheduler(site=None) as edit_scheduler:
+            future = edit_scheduler.submit("עמוד קיים", "טקסט חדש", summary="MaccabiBot - Test")
+            future.exception(timeout=5)
+            raise ValueError("stopped")
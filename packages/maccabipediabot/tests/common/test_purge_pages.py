@@ -0,0 +1,71 @@
+import threading
+
+from maccabipediabot.common.purge_pages import PURGE_TITLES_PER_REQUEST, purge_pages
+
+
+class _FakeRequest:
+    def __init__(self, site, titles):
+        self._site = site
+        self._titles = titles
+
+    def submit(self):
+        with self._site.lock:
+            self._site.requests.append(self._titles)
+        if self._site.fail:
+            raise RuntimeError("Server error")
+        return {"purge": [{"ns": 0, "title": title, "missing": ""} if title in self._site.missing_titles
+                          else {"ns": 0, "title": title, "purged": "", "linkupdate": ""}
+                          for title in self._titles]}
+
+
+class _FakeSite:
+    def __init__(self, missing_titles=(), high_limits=False, fail=False):
+        self.missing_titles = set(missing_titles)
+        self.high_limits = high_limits
+        self.fail = fail
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def has_right(self, right):
+        return self.high_limits and right == "apihighlimits"
+
+    def simple_request(self, action, titles, forcelinkupdate):
+        assert action == "purge" and forcelinkupdate
+        return _FakeRequest(self, titles)
+
+
+def test_purge_pages_dedupes_titles_and_reports_missing():
+    site = _FakeSite(missing_titles={"אין כזה עמוד"})
+
+    results = purge_pages(site, ["ערן זהבי", "אין כזה עמוד", "ערן זהבי", "עמוד ראשי"])
+
+    assert site.requests == [["אין כזה עמוד", "עמוד ראשי", "ערן זהבי"]]
+    assert results.purged == ["עמוד ראשי", "ערן זהבי"]
+    assert results.missing == ["אין כזה עמוד"]
+    assert results.failed == []
+
+
+def test_purge_pages_in_batches():
+    titles = [f"שחקן {index:03}" for index in range(120)]
+
+    site = _FakeSite()
+    results = purge_pages(site, titles)
+    assert sorted(map(len, site.requests)) == [20, PURGE_TITLES_PER_REQUEST, PURGE_TITLES_PER_REQUEST]
+    assert results.purged == titles  # In order, whichever batch finished first
+
+    site = _FakeSite(high_limits=True)
+    purge_pages(site, titles)
+    assert len(site.requests) == 1
+
+
+def test_purge_pages_failed_batch():
+    results = purge_pages(_FakeSite(fail=True), ["ערן זהבי"])
+
+    assert results.failed == ["ערן זהבי"] and results.purged == []
+
+
+def test_purge_no_pages():
+    site = _FakeSite()
+
+    assert purge_pages(site, set()).purged == []
+    assert site.requests == []
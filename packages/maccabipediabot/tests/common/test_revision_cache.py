@@ -0,0 +1,106 @@
+import pytest
+
+from maccabipediabot.common import revision_cache as revision_cache_module
+from maccabipediabot.common.revision_cache import RevisionCache
+
+
+class _FakePage:
+    def __init__(self, title, revid, text):
+        self._title = title
+        self.latest_revision_id = revid
+        self.text = text
+
+    def title(self):
+        return self._title
+
+
+class _FakeSite:
+    def __init__(self):
+        self.info_queries = []
+
+    def preloadpages(self, pages, content):
+        assert not content
+        pages = list(pages)
+        self.info_queries.append([page.title() for page in pages])
+        return iter(pages)
+
+
+@pytest.fixture
+def content_queries(monkeypatch):
+    content_queries = []
+
+    def preloading_generator(pages, groupsize):
+        content_queries.append([page.title() for page in pages])
+        yield from pages
+
+    monkeypatch.setattr(revision_cache_module.pagegenerators, "PreloadingGenerator", preloading_generator)
+    return content_queries
+
+
+def _pages():
+    return [_FakePage("משחק:1", 10, "טקסט מסודר"), _FakePage("משחק:2", 20, "טקסט לא מסודר"),
+            _FakePage("משחק:3", 30, "טקסט")]
+
+
+def test_first_run_handles_all_pages(tmp_path, content_queries):
+    with RevisionCache("bot", tmp_path / "cache.sqlite3") as revision_cache:
+        assert [page.title() for page in revision_cache.changed_pages(_FakeSite(), _pages())] == [
+            "משחק:1", "משחק:2", "משחק:3"]
+
+
+def test_only_edited_pages_are_fetched(tmp_path, content_queries):
+    cache_path = tmp_path / "cache.sqlite3"
+    with RevisionCache("bot", cache_path) as revision_cache:
+        first_page, second_page, third_page = _pages()
+        revision_cache.remember(first_page, first_page.text, "טקסט מסודר")
+        revision_cache.remember(second_page, second_page.text, "טקסט מסודר")  # A dry run, the page wasn't changed
+        revision_cache.remember(third_page, third_page.text, "טקסט")
+
+    pages = _pages()
+    pages[2].latest_revision_id, pages[2].text = 31, "טקסט שנערך"
+    with RevisionCache("bot", cache_path) as revision_cache:
+        site = _FakeSite()
+        assert [page.title() for page in revision_cache.changed_pages(site, pages)] == ["משחק:2", "משחק:3"]
+
+    assert site.info_queries == [["משחק:1", "משחק:2", "משחק:3"]]
+    assert content_queries == [["משחק:2", "משחק:3"]]
+
+
+def test_edited_page_with_the_bot_output_is_skipped(tmp_path, content_queries):
+    cache_path = tmp_path / "cache.sqlite3"
+    with RevisionCache("bot", cache_path) as revision_cache:
+        revision_cache.remember(_FakePage("משחק:1", 10, "טקסט מסודר"), "טקסט מסודר", "טקסט מסודר")
+
+        reverted_page = _FakePage("משחק:1", 12, "טקסט מסודר")  # Edited & reverted
+        assert list(revision_cache.changed_pages(_FakeSite(), [reverted_page])) == []
+        assert revision_cache.is_handled("משחק:1", 12)  # Remembered with the new revision
+
+    with RevisionCache("other bot", cache_path) as other_bot_revision_cache:  # Each bot handles the pages by its own
+        assert not other_bot_revision_cache.is_handled("משחק:1", 12)
+
+
+class _SavedPage(_FakePage):
+    """Like a pywikibot page after a save, its text was dropped and reading it would fetch the page again."""
+
+    @property
+    def text(self):
+        raise AssertionError("The page was fetched again")
+
+    @text.setter
+    def text(self, value):
+        pass
+
+
+def test_saved_page_is_remembered_without_fetching_it(tmp_path):
+    with RevisionCache("bot:v1", tmp_path / "cache.sqlite3") as revision_cache:
+        revision_cache.remember(_SavedPage("משחק:1", 11, None), "טקסט מסודר", "טקסט מסודר")
+        assert revision_cache.is_handled("משחק:1", 11)
+
+
+def test_new_bot_output_version_handles_all_pages_again(tmp_path):
+    cache_path = tmp_path / "cache.sqlite3"
+    with RevisionCache("bot:v1", cache_path) as revision_cache:
+        revision_cache.remember(_FakePage("משחק:1", 10, "טקסט מסודר"), "טקסט מסודר", "טקסט מסודר")
+
+    with RevisionCache("bot:v2", cache_path) as revision_cache:
+        assert not revision_cache.is_handled("משחק:1", 10)
@@ -0,0 +1,122 @@
+"""Tests for the football gamesbot: a game page is rendered in memory and saved at most once."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalGameEvent
+from maccabistats.models.player_in_game import PlayerInGame
+from maccabistats.models.team_in_game import TeamInGame
+
+from maccabipediabot.football import gamesbot
+
+
+def _game() -> GameData:
+    maccabi_team = TeamInGame("מכבי תל אביב", "אברם גרנט", 2, [
+        PlayerInGame("אבי נמני", 10, [GameEvent(GameEventTypes.LINE_UP, timedelta(0)),
+                                      GoalGameEvent(timedelta(minutes=70)),
+                                      GameEvent(GameEventTypes.YELLOW_CARD, timedelta(minutes=30))]),
+        PlayerInGame("ערן זהבי", 14, [GameEvent(GameEventTypes.SUBSTITUTION_IN, timedelta(minutes=60)),
+                                      GoalGameEvent(timedelta(minutes=80))]),
+    ])
+    opponent_team = TeamInGame("הפועל חיפה", "אלי כהן", 0, [
+        PlayerInGame("שוער חיפה", 1, [GameEvent(GameEventTypes.LINE_UP, timedelta(0))]),
+    ])
+    return GameData("ליגת העל", "מחזור 1", "", "בלומפילד", "12000", "אורי אזולאי", maccabi_team, opponent_team,
+                    "2019/20", [], date=datetime(2019, 8, 24, 20, 30))
+
+
+class _FakePage:
+    def __init__(self, title: str, text: str = ""):
+        self._title = title
+        self.text = text
+        self.saves = 0
+
+    def title(self) -> str:
+        return self._title
+
+    def exists(self) -> bool:
+        return bool(self.text)
+
+    def save(self, summary: str = "") -> None:
+        self.saves += 1
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    pages: dict[str, _FakePage] = {}
+    monkeypatch.setattr(gamesbot.pw, "Page", lambda _site, title: pages.setdefault(title, _FakePage(title)))
+    monkeypatch.setattr(gamesbot, "SHOULD_SAVE", True)
+    return pages
+
+
+def test_new_page_is_saved_once(pages):
+    assert gamesbot.create_or_update_game_page(_game())
+
+    game_page, = pages.values()
+    assert game_page.saves == 1
+    assert game_page.text.startswith(f"{{{{{gamesbot.football_games_template_name}\n")  # Prettified
+    # Sorted by groups: the squads, then the cards & subs, then the goals
+    events_groups = game_page.text.split(f"{gamesbot.PLAYERS_EVENTS}=")[1].split("\n\n")
+    assert events_groups[0].strip().startswith("אבי נמני::10::הרכב")
+    assert events_groups[-2] == ",אבי נמני::10::גול::70::מכבי\n,ערן זהבי::14::גול::80::מכבי"
+
+
+def test_rendered_text_is_stable():
+    game_page = _FakePage("game")
+    gamesbot.handle_new_page(game_page, _game())
+    rendered_text = gamesbot.render_game_page_text(game_page.text)
+
+    assert gamesbot.render_game_page_text(rendered_text) == rendered_text
+
+
+def test_unchanged_page_is_not_saved(pages):
+    gamesbot.create_or_update_game_page(_game())
+    game_page, = pages.values()
+
+    assert not gamesbot.create_or_update_game_page(_game())
+    assert game_page.saves == 1
+
+
+def test_changed_page_is_saved_once(pages):
+    gamesbot.create_or_update_game_page(_game())
+    game_page, = pages.values()
+
+    game = _game()
+    game.maccabi_team.players[1].events.append(GameEvent(GameEventTypes.YELLOW_CARD, timedelta(minutes=85)))
+    assert gamesbot.create_or_update_game_page(game)
+    assert game_page.saves == 2
+
+
+def test_prefetch_game_pages_in_batches(pages, monkeypatch):
+    batches = []
+
+    def preloading_generator(game_pages, groupsize):
+        game_pages = list(game_pages)
+        batches.extend(game_pages[index:index + groupsize] for index in range(0, len(game_pages), groupsize))
+        yield from game_pages
+
+    monkeypatch.setattr(gamesbot.pagegenerators, "PreloadingGenerator", preloading_generator)
+    games = []
+    for day in range(60):
+        game = _game()
+        game.date += timedelta(days=day)
+        games.append(game)
+
+    games_pages = gamesbot.prefetch_game_pages(games)
+
+    assert [len(batch) for batch in batches] == [50, 10]
+    assert games_pages[gamesbot.generate_page_name_from_game(games[0])] is pages[
+        gamesbot.generate_page_name_from_game(games[0])]
+
+
+def test_get_games_that_has_existing_pages(monkeypatch):
+    first_game, second_game = _game(), _game()
+    second_game.date += timedelta(days=7)
+    monkeypatch.setattr(gamesbot, "get_all_football_games_category_pages", lambda: [
+        _FakePage(gamesbot.generate_page_name_from_game(second_game)),
+        _FakePage("משחק:01-01-1950 מכבי תל אביב נגד הפועל תל אביב - ליגה"),  # Not one of the given games
+        _FakePage("משחק:ללא תאריך"),
+    ])
+
+    assert gamesbot.get_games_that_has_existing_pages([first_game, second_game]) == [second_game]
@@ -0,0 +1,91 @@
+"""
+Measures the time & peak memory of decoding one cargo export page (5,000 Games_Events rows).
+
+"whole page" re-creates what the crawler used to do: read the whole response body, json decode it to a list
+and copy every (cleaned) row to a queue before the first row is iterated.
+"streaming" is the current behavior: the rows are decoded one by one while the body chunks arrive.
+
+Run: python benchmarks/cargo_page_decoding.py [recorded_cargo_response.json]
+Without a recorded response, a page with the same structure as the Games_Events cargo export is generated.
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+from maccabistats.parse.maccabipedia.maccabipedia_cargo_chunks_crawler import MaccabiPediaCargoChunksCrawler, \
+    iter_json_array_items
+
+PAGE_ROWS_COUNT = 5000
+CHUNK_SIZE = 64 * 1024
+
+
+def _write_generated_page(page_path: Path) -> None:
+    random_generator = random.Random(1906)
+    rows = [{"_pageName": f"משחק:{1950 + row // 40}-05-18 מכבי תל אביב נגד הפועל תל אביב - ליגת העל",
+             "Date": f"{1950 + row // 40}-05-18",
+             "PlayerName": f"שחקן מספר {random_generator.randrange(600)}",
+             "PlayerNumber": random_generator.choice([None, random_generator.randrange(1, 40)]),
+             "Minute": random_generator.randrange(1, 90),
+             "EventType": random_generator.randrange(1, 10),
+             "SubType": random_generator.choice(["", 31, 32, 41, 71]),
+             "Team": random_generator.randrange(2),
+             "Part": None}
+            for row in range(PAGE_ROWS_COUNT)]
+    page_path.write_text(json.dumps(rows, ensure_ascii=False), encoding='utf-8')
+
+
+def _body_chunks(page_path: Path):
+    with open(page_path, 'rb') as page:
+        while chunk := page.read(CHUNK_SIZE):
+            yield chunk
+
+
+def decode_whole_page(page_path: Path) -> int:
+    body = b''.join(_body_chunks(page_path))
+    rows_queue = deque(MaccabiPediaCargoChunksCrawler._decode_maccabipedia_data_and_remove_nones(row)
+                       for row in json.loads(body))
+    rows_count = 0
+    while rows_queue:
+        rows_queue.pop()
+        rows_count += 1
+
+    return rows_count
+
+
+def decode_streaming(page_path: Path) -> int:
+    return sum(1 for row in iter_json_array_items(_body_chunks(page_path))
+               if MaccabiPediaCargoChunksCrawler._decode_maccabipedia_data_and_remove_nones(row))
+
+
+def measure(decode, page_path: Path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows_count = decode(page_path)
+    duration = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return rows_count, duration, peak_memory
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_folder:
+        if len(sys.argv) > 1:
+            page_path = Path(sys.argv[1])
+        else:
+            page_path = Path(temp_folder) / 'games_events_page.json'
+            _write_generated_page(page_path)
+
+        print(f'Cargo page: {page_path.stat().st_size / 2 ** 20:.1f}MB')
+        for name, decode in (('whole page', decode_whole_page), ('streaming', decode_streaming)):
+            rows_count, duration, peak_memory = measure(decode, page_path)
+            print(f'  {name:10}: {rows_count} rows, {duration:.3f}s, peak memory {peak_memory / 2 ** 20:.2f}MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Measures how long it takes to find the games errors of the daily errors job (3,000 synthetic games, split to the games
+before and after 1990 like the job splits them at 1950).
+
+"separate_passes" re-creates what ErrorsFinder used to do: a pass over the games for each check, for each report.
+"fused" is the current behavior (ErrorsFinder.create_errors_report): the facts of all of the checks are computed in one
+pass over all of the games, and both of the reports are checked on them.
+"processes" is "fused" with the facts pass spread across a processes pool (worth it only with a few cpus).
+
+Run: python benchmarks/errors_finder.py
+"""
+import os
+import time
+from typing import Callable
+
+from maccabistats.error_finder import ErrorsFinder
+from maccabistats.error_finder.games_checks import GAMES_CHECKS, compute_games_facts
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from synthetic_games import create_maccabi_games_stats
+
+
+def _separate_passes(maccabi_games_stats: MaccabiGamesStats) -> None:
+    for games in (maccabi_games_stats.played_before("1990"), maccabi_games_stats.played_after("1991")):
+        for check in GAMES_CHECKS.values():
+            check.find(compute_games_facts(games.games, check.facts))
+
+
+def _fused(maccabi_games_stats: MaccabiGamesStats, processes=None) -> None:
+    errors_finder = ErrorsFinder(maccabi_games_stats, processes)
+    for games in (maccabi_games_stats.played_before("1990"), maccabi_games_stats.played_after("1991")):
+        # The games are sorted by their date, so the games of each part are a range of all of the games
+        first_game_index = maccabi_games_stats.games.index(games[0])
+        errors_finder.create_errors_report(games_indices=range(first_game_index, first_game_index + len(games)))
+
+
+def measure(run: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    maccabi_games_stats = create_maccabi_games_stats()
+    maccabi_games_stats.columns  # Built once per root object, we don't want to measure it
+
+    print(f'{len(maccabi_games_stats)} games, {len(GAMES_CHECKS)} checks, {os.cpu_count()} cpus:')
+    print(f'  separate_passes {measure(lambda: _separate_passes(maccabi_games_stats)) * 1000:.0f}ms')
+    print(f'  fused {measure(lambda: _fused(maccabi_games_stats)) * 1000:.0f}ms')
+    print(f'  processes {measure(lambda: _fused(maccabi_games_stats, processes=0)) * 1000:.0f}ms')
+
+
+if __name__ == '__main__':
+    main()
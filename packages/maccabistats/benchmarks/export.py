@@ -0,0 +1,58 @@
+"""
+Measures the peak memory of exporting the players events to json (synthetic games, 1,000 & 3,000 games).
+
+"materialized" re-creates what ExportMaccabiGamesStats used to do: a list of all of the games events, dumped at once.
+"streaming" is the current behavior (ExportMaccabiGamesStats.export_players_events_json): the events are written one
+at a time, so the memory stays flat no matter how many games there are.
+
+Run: python benchmarks/export.py
+"""
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+from maccabistats.stats.export import ExportMaccabiGamesStats
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from synthetic_games import create_maccabi_games_stats
+
+
+def _materialized(maccabi_games_stats: MaccabiGamesStats, folder_path: Path) -> None:
+    players_events = list(ExportMaccabiGamesStats(maccabi_games_stats)._players_events())
+    (folder_path / 'players_events_maccabistats.json').write_text(
+        json.dumps(players_events, indent=4, ensure_ascii=False), encoding='utf8')
+
+
+def _streaming(maccabi_games_stats: MaccabiGamesStats, folder_path: Path) -> None:
+    ExportMaccabiGamesStats(maccabi_games_stats)._create_players_events_json(folder_path)
+
+
+def measure(run: Callable[[], None]) -> Tuple[float, float]:
+    """
+    :return: The run duration (seconds) and its peak memory (MB), measuring the memory slows the run down.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    duration = time.perf_counter() - start
+    peak_memory = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+
+    return duration, peak_memory
+
+
+def main() -> None:
+    for games_count in (1000, 3000):
+        maccabi_games_stats = create_maccabi_games_stats(games_count=games_count)
+        print(f'{games_count} games:')
+        for name, export in (('materialized', _materialized), ('streaming', _streaming)):
+            with tempfile.TemporaryDirectory() as folder_path:
+                duration, peak_memory = measure(lambda: export(maccabi_games_stats, Path(folder_path)))
+            print(f'  {name} {duration:.1f}s, peak memory {peak_memory:.1f}MB')
+
+
+if __name__ == '__main__':
+    main()
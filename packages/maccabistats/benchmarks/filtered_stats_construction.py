@@ -0,0 +1,74 @@
+"""
+Measures how long it takes to build 1,000 filtered MaccabiGamesStats objects.
+
+"eager" re-creates what MaccabiGamesStats.__init__ used to do: a new sorted object per filter that builds all of
+its sub stats objects, where the seasons sub stats builds such an object per season (recursively).
+"lazy" is the current behavior: a filter returns a view, the sub stats objects are built on their first use.
+
+Run: python benchmarks/filtered_stats_construction.py
+"""
+import itertools
+import time
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats, _SUB_STATS
+
+from synthetic_games import create_maccabi_games_stats
+
+FILTERED_OBJECTS_COUNT = 1000
+
+
+def _build_eagerly(maccabi_games_stats: MaccabiGamesStats) -> None:
+    for sub_stats_name in _SUB_STATS:
+        getattr(maccabi_games_stats, sub_stats_name)
+
+    seasons = maccabi_games_stats.seasons
+    if len(seasons) > 1:
+        for season_games in seasons:
+            _build_eagerly(season_games)
+
+
+def _filters(maccabi_games_stats: MaccabiGamesStats):
+    seasons = maccabi_games_stats.available_seasons
+    return itertools.cycle([
+        lambda: maccabi_games_stats.home_games,
+        lambda: maccabi_games_stats.league_games,
+        lambda: maccabi_games_stats.maccabi_wins,
+        lambda: maccabi_games_stats.official_games.away_games,
+        lambda: maccabi_games_stats.get_games_by_season(seasons[len(seasons) // 2]),
+    ])
+
+
+def measure_eager(maccabi_games_stats: MaccabiGamesStats) -> float:
+    filters = _filters(maccabi_games_stats)
+    start = time.perf_counter()
+    for _ in range(FILTERED_OBJECTS_COUNT):
+        filtered = next(filters)()
+        _build_eagerly(MaccabiGamesStats(filtered.games, filtered.description,
+                                         players_data=maccabi_games_stats.players_data))
+
+    return time.perf_counter() - start
+
+
+def measure_lazy(maccabi_games_stats: MaccabiGamesStats) -> float:
+    filters = _filters(maccabi_games_stats)
+    start = time.perf_counter()
+    for _ in range(FILTERED_OBJECTS_COUNT):
+        next(filters)()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    maccabi_games_stats = create_maccabi_games_stats()
+    maccabi_games_stats.columns  # Built once per root object, we don't want to measure it
+
+    print(f'{len(maccabi_games_stats)} games, {len(maccabi_games_stats.available_seasons)} seasons, '
+          f'{FILTERED_OBJECTS_COUNT} filtered objects:')
+    lazy = measure_lazy(maccabi_games_stats)
+    print(f'  lazy  : {lazy:.3f}s ({lazy / FILTERED_OBJECTS_COUNT * 1e6:.0f}us per object)')
+    eager = measure_eager(maccabi_games_stats)
+    print(f'  eager : {eager:.3f}s ({eager / FILTERED_OBJECTS_COUNT * 1e6:.0f}us per object)')
+
+
+if __name__ == '__main__':
+    main()
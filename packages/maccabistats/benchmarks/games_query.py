@@ -0,0 +1,70 @@
+"""
+Measures a chained filter and the teams ordering (3,000 synthetic games) with the games query.
+
+"chained" filters the games the way users do today: a MaccabiGamesStats (view) for each filter, then the next one.
+"query" is MaccabiGamesStats.query(): the season & player games from the games index, the rest only on these games.
+"per_team" re-creates what MaccabiGamesTeamsStats used to do: a MaccabiGamesStats of the games against each team.
+"group_by" is the current behavior: the results of all of the teams from one pass over the games.
+
+Run: python benchmarks/games_query.py
+"""
+import time
+from collections import Counter, defaultdict
+from typing import Callable
+
+from maccabistats.stats.consts import LEAGUE_COMPETITIONS
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from synthetic_games import create_maccabi_games_stats
+
+REPEATS = 100
+
+
+def _chained(maccabi_games_stats: MaccabiGamesStats, season: str, player_name: str) -> None:
+    games = maccabi_games_stats.league_games.home_games.get_games_by_season(season)
+    len(games.get_games_by_player_name(player_name).games)
+
+
+def _query(maccabi_games_stats: MaccabiGamesStats, season: str, player_name: str) -> None:
+    games = maccabi_games_stats.query().competition(in_=LEAGUE_COMPETITIONS).home().season(season).player(player_name)
+    len(games.games().games)
+
+
+def _per_team(maccabi_games_stats: MaccabiGamesStats) -> None:
+    teams_games = defaultdict(list)
+    for game in maccabi_games_stats.games:
+        teams_games[game.not_maccabi_team.current_name].append(game)
+
+    Counter({team_name: maccabi_games_stats.create_maccabi_stats_from_games(games).results.wins_percentage
+             for team_name, games in teams_games.items()}).most_common()[:20]
+
+
+def measure(run: Callable[[], None], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        run()
+
+    return (time.perf_counter() - start) / repeats
+
+
+def main() -> None:
+    maccabi_games_stats = create_maccabi_games_stats()
+    # Built once per root object, we don't want to measure them
+    maccabi_games_stats.columns
+    season = maccabi_games_stats.available_seasons[-1]
+    player_name = maccabi_games_stats.get_games_by_season(season).available_players_names[0]
+    maccabi_games_stats.query().season(season).player(player_name).games()
+
+    print(f'{len(maccabi_games_stats)} games, league & home & season & player filter:')
+    chained = measure(lambda: _chained(maccabi_games_stats, season, player_name), REPEATS)
+    query = measure(lambda: _query(maccabi_games_stats, season, player_name), REPEATS)
+    print(f'  chained : {chained * 1000:.2f}ms, query : {query * 1000:.2f}ms')
+
+    print('Teams ordered by wins percentage:')
+    per_team = measure(lambda: _per_team(maccabi_games_stats), 1)
+    group_by = measure(lambda: maccabi_games_stats.teams.teams_ordered_by_maccabi_wins_percentage(), REPEATS)
+    print(f'  per_team : {per_team * 1000:.1f}ms, group_by : {group_by * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Measures how long it takes to load the serialized games (3,000 synthetic games), a pickle against a snapshot.
+
+"pickle" is what get_maccabi_stats used to do: pickle.load of the whole MaccabiGamesStats objects graph.
+"snapshot" loads the snapshot file lazily (memory mapped arrays), then we measure creating its columns
+(what filtering and the columnar stats use) and creating its games objects (what everything else uses).
+Each load runs in a new python process, so nothing is cached by the previous loads (but the OS files cache).
+
+Run: python benchmarks/games_snapshot_loading.py
+"""
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from maccabistats.maccabipedia.players import MaccabiPediaPlayerData, MaccabiPediaPlayers
+from maccabistats.stats.games_snapshot import write_games_snapshot
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from synthetic_games import create_games
+
+REPEATS = 5
+
+_LOADS = dict(
+    pickle='''
+with open(file_path, 'rb') as f:
+    pickle.load(f)
+''',
+    snapshot='''
+load_games_snapshot(file_path)
+''',
+    snapshot_and_columns='''
+load_games_snapshot(file_path).columns
+''',
+    snapshot_and_games='''
+load_games_snapshot(file_path).games
+''',
+)
+
+_MEASURE_LOAD = '''
+import pickle, sys, time
+from maccabistats.stats.games_snapshot import load_games_snapshot
+file_path = sys.argv[1]
+start = time.perf_counter()
+{load}
+print(time.perf_counter() - start)
+'''
+
+
+def _create_maccabi_games_stats() -> MaccabiGamesStats:
+    games = create_games()
+    players_names = {player.name for game in games for player in game.maccabi_team.players}
+    players_data = MaccabiPediaPlayers({name: MaccabiPediaPlayerData(name=name, birth_date=games[0].date,
+                                                                     is_home_player=len(name) % 2 == 0)
+                                        for name in sorted(players_names)})
+    return MaccabiGamesStats(games, players_data=players_data)
+
+
+def measure_load(load: str, file_path: Path) -> float:
+    durations = [float(subprocess.check_output([sys.executable, '-c', _MEASURE_LOAD.format(load=load),
+                                                str(file_path)], env=dict(os.environ, PYTHONWARNINGS='ignore')))
+                 for _ in range(REPEATS)]
+    return min(durations)
+
+
+def main() -> None:
+    maccabi_games_stats = _create_maccabi_games_stats()
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        pickle_path, snapshot_path = Path(temp_folder) / 'maccabi.pickle', Path(temp_folder) / 'maccabi.snapshot'
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(maccabi_games_stats, f)
+        write_games_snapshot(maccabi_games_stats, str(snapshot_path))
+
+        print(f'{len(maccabi_games_stats)} games, pickle: {pickle_path.stat().st_size / 2 ** 20:.1f}MB, '
+              f'snapshot: {snapshot_path.stat().st_size / 2 ** 20:.1f}MB')
+        for name, load in _LOADS.items():
+            file_path = pickle_path if name == 'pickle' else snapshot_path
+            print(f'  {name:20}: {measure_load(load, file_path) * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures how long it takes to parse the cached maccabi-tlv.co.il games pages (100 synthetic games, each events &
+squads page padded to the size of a real site page with the site navigation).
+
+"beautifulsoup" re-creates what the site parsers used to do: a BeautifulSoup tree for each page, matched by css
+selectors on every page (the selections only, without building the games).
+"lxml" is the current behavior (MaccabiSiteGameSquadsParser.parse_game): an lxml tree for each page, matched by XPath
+selectors compiled once, up to the GameData of each game.
+"processes" is "lxml" spread across a processes pool, as main_parser parses the games (it should scale with the cpus).
+
+Run: python benchmarks/maccabi_site_parsing.py
+"""
+import logging
+import os
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from maccabistats.parse.maccabi_tlv_site.game_squads_parser import MaccabiSiteGameSquadsParser
+from maccabistats.parse.maccabi_tlv_site.html_elements import parse_html
+
+sys.path.insert(0, str(Path(__file__).parents[1] / 'tests'))
+from maccabi_site_pages import events_page, season_page, squads_page  # noqa: E402
+
+_GAMES_COUNT = 100
+# The site navigation, ~130KB for each page like a real game page
+_SITE_NAVIGATION = ''.join(f'<li class="menu-item"><a href="/page-{index}/">עמוד {index}</a><span>תפריט</span></li>'
+                           for index in range(1_500)).encode('utf8')
+
+
+def _with_navigation(page: bytes) -> bytes:
+    return page.replace(b'<body>', b'<body><nav><ul>' + _SITE_NAVIGATION + b'</ul></nav>', 1)
+
+
+_GAME_RECORD = MaccabiSiteGameSquadsParser.parse_game_record(parse_html(season_page()).xpath('//article')[0])
+_GAME_PAGES = (_with_navigation(events_page()), _with_navigation(squads_page()))
+
+
+def _beautifulsoup(games_pages: List[Tuple[bytes, bytes]]) -> None:
+    for events_page_content, squads_page_content in games_pages:
+        events_bs = BeautifulSoup(events_page_content, 'lxml')
+        events_bs.select_one("div.site-top-banner.fixtures-list")
+        for event_bs in events_bs.select("article div.play-by-play-homepage ul.play-by-play li"):
+            event_bs.select_one("div.min").get_text(), event_bs.select_one("p").get_text()
+
+        squads_bs = BeautifulSoup(squads_page_content, 'lxml')
+        for team_div in squads_bs.select("article div.teams div.p50"):
+            for player_bs in team_div.select("li"):
+                player_bs.find(string=True, recursive=False), player_bs.find('b'), player_bs.select("div")
+        squads_bs.select_one("div.info div.referee"), squads_bs.select_one("div.info div.viewers")
+
+
+def _parse_game(events_page_content: bytes, squads_page_content: bytes) -> None:
+    MaccabiSiteGameSquadsParser.parse_game(_GAME_RECORD, '2023/24', events_page_content, squads_page_content)
+
+
+def _lxml(games_pages: List[Tuple[bytes, bytes]]) -> None:
+    for game_pages in games_pages:
+        _parse_game(*game_pages)
+
+
+def _processes(games_pages: List[Tuple[bytes, bytes]]) -> None:
+    with Pool(os.cpu_count()) as pool:
+        pool.starmap(_parse_game, games_pages, chunksize=max(len(games_pages) // (os.cpu_count() * 4), 1))
+
+
+def measure(run: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)  # The parsers log every game & event, we measure the parsing only
+    games_pages = [_GAME_PAGES] * _GAMES_COUNT
+
+    print(f'{_GAMES_COUNT} games ({sum(map(len, _GAME_PAGES)) // 1024}KB of pages each), {os.cpu_count()} cpus:')
+    print(f'  beautifulsoup {measure(lambda: _beautifulsoup(games_pages)) * 1000:.0f}ms')
+    print(f'  lxml {measure(lambda: _lxml(games_pages)) * 1000:.0f}ms')
+    print(f'  processes {measure(lambda: _processes(games_pages)) * 1000:.0f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Measures how long it takes to find the games of 100 players (3,000 synthetic games), one by one,
+like TransfermarktComparator.compare_games_date does for each player file.
+
+"scan" re-creates what get_games_by_played_player_name used to do: walk all of the games for each lookup.
+"index" is the current behavior: the games index is built on the first lookup, then each lookup takes its games.
+
+Run: python benchmarks/player_games_lookups.py
+"""
+import time
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from synthetic_games import create_maccabi_games_stats
+
+LOOKUPS_COUNT = 100
+
+
+def measure_scan(maccabi_games_stats: MaccabiGamesStats, players_names) -> float:
+    start = time.perf_counter()
+    for player_name in players_names:
+        maccabi_games_stats._create_maccabi_games_stats_by_condition(
+            lambda game: player_name in [p.name.strip() for p in game.maccabi_team.played_players], player_name)
+
+    return time.perf_counter() - start
+
+
+def measure_index(maccabi_games_stats: MaccabiGamesStats, players_names) -> float:
+    start = time.perf_counter()
+    for player_name in players_names:
+        maccabi_games_stats.get_games_by_played_player_name(player_name)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    maccabi_games_stats = create_maccabi_games_stats()
+    maccabi_games_stats.columns  # Built once per root object, we don't want to measure it
+    players_names = maccabi_games_stats.available_players_names[:LOOKUPS_COUNT]
+
+    print(f'{len(maccabi_games_stats)} games, {len(players_names)} players lookups:')
+    scan = measure_scan(maccabi_games_stats, players_names)
+    print(f'  scan  : {scan:.3f}s ({scan / len(players_names) * 1e6:.0f}us per lookup)')
+    index = measure_index(maccabi_games_stats, players_names)
+    print(f'  index : {index:.3f}s ({index / len(players_names) * 1e6:.0f}us per lookup, including the index build)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Measures how long it takes to find the top players streaks against each team, on the tests games scaled up x50
+(each copy of the 10 tests games is moved 3 years later).
+
+"per_team" re-creates what PlayersAndTeamsStreaksStats used to do: a MaccabiGamesStats (view) of the games each player
+played against each team, and the streak of each of these objects. For the played in game streaks: the games against
+each team (from the team name each game has) and the streak of each player from all of these games.
+"index" is the current behavior: the (player, team) -> ordered games index is built once, then one pass over it.
+
+Run: python benchmarks/players_and_teams_streaks.py
+"""
+import copy
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, List
+
+from maccabistats.models.game_data import GameData
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from synthetic_games import create_players_data
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tests'))
+from game_fixtures import GAMES  # noqa: E402
+
+SCALE = 50
+TOP_PLAYERS_COUNT = 10
+
+
+def _scaled_tests_games() -> List[GameData]:
+    games = []
+    for copy_index in range(SCALE):
+        for game in copy.deepcopy(GAMES):
+            game._full_date += timedelta(days=3 * 365 * copy_index)
+            game.date += timedelta(days=3 * 365 * copy_index)
+            games.append(game)
+
+    return games
+
+
+def _per_team_from_games_they_played(maccabi_games_stats: MaccabiGamesStats) -> None:
+    players_and_teams_games = maccabi_games_stats.played_games_by_player_and_team()
+    players_and_teams_streaks = [(player_name, team_name, games.streaks.get_longest_unbeaten_streak_games())
+                                 for player_name, teams_games in players_and_teams_games.items()
+                                 for team_name, games in teams_games.items()]
+    sorted(players_and_teams_streaks, key=lambda kv: len(kv[2]), reverse=True)[:TOP_PLAYERS_COUNT]
+
+
+def _per_team_from_all_games(maccabi_games_stats: MaccabiGamesStats) -> None:
+    players_and_teams_streaks = []
+    for team_name in maccabi_games_stats.available_opponents:
+        team_games = maccabi_games_stats.get_games_against_team(team_name)
+        for player_name in maccabi_games_stats.available_players_names:
+            streak = team_games.streaks.get_longest_player_played_in_game(player_name)
+            if streak:
+                players_and_teams_streaks.append((player_name, team_name, streak))
+
+    sorted(players_and_teams_streaks, key=lambda kv: len(kv[2]), reverse=True)[:TOP_PLAYERS_COUNT]
+
+
+_STREAKS = dict(
+    unbeaten=(_per_team_from_games_they_played,
+              lambda games: games.players_and_teams_streaks.get_players_with_best_unbeaten_streak()),
+    played_in_game=(_per_team_from_all_games,
+                    lambda games: games.players_and_teams_streaks.get_players_with_best_played_in_game_streak()),
+)
+
+
+def measure(run: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    games = _scaled_tests_games()
+    maccabi_games_stats = MaccabiGamesStats(games, players_data=create_players_data())
+    maccabi_games_stats.columns  # Built once per root object, we don't want to measure it
+
+    print(f'{len(maccabi_games_stats)} games, {len(maccabi_games_stats.available_players_names)} players, '
+          f'{len(maccabi_games_stats.available_opponents)} teams:')
+    for name, (per_team, index) in _STREAKS.items():
+        per_team_duration = measure(lambda: per_team(maccabi_games_stats))
+        # A new root object each time, so the index is built as part of the measure
+        indexed_games = MaccabiGamesStats(games, players_data=maccabi_games_stats.players_data)
+        indexed_games.columns
+        index_duration = measure(lambda: index(indexed_games))
+        print(f'  {name:15}: per_team {per_team_duration * 1000:.1f}ms, index {index_duration * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Measures how long it takes to find the top players streaks (3,000 synthetic games, 600 players).
+
+"per_player" re-creates what MaccabiGamesPlayersStreaksStats used to do: a MaccabiGamesStats (view) of the games
+each player played, and the streak of each of these objects.
+"sweep" is the current behavior: the streaks of all of the players from one pass over the games they played.
+
+Run: python benchmarks/players_streaks.py
+"""
+import time
+from typing import Callable
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.players_games_condition import PlayerGamesCondition
+
+from synthetic_games import create_maccabi_games_stats
+
+TOP_PLAYERS_COUNT = 10
+
+
+def _per_player(maccabi_games_stats: MaccabiGamesStats,
+                streak_condition: Callable[[MaccabiGamesStats, str], MaccabiGamesStats]) -> None:
+    players_games = maccabi_games_stats.played_games_by_player_name()
+    players_streaks = {player_name: streak_condition(players_games[player_name], player_name)
+                       for player_name in maccabi_games_stats.available_players_names}
+    sorted(players_streaks.items(), key=lambda kv: len(kv[1]), reverse=True)[:TOP_PLAYERS_COUNT]
+
+
+def _scored_streak(games: MaccabiGamesStats, player_name: str) -> MaccabiGamesStats:
+    scored_in_a_game = PlayerGamesCondition.create_score_x_goals_in_game__condition(1)
+    return games.streaks._get_longest_streak_by_condition(lambda g: scored_in_a_game(g, player_name))
+
+
+_STREAKS = dict(
+    unbeaten=(lambda games, player_name: games.streaks.get_longest_unbeaten_streak_games(),
+              lambda games: games.players_streaks.get_players_with_best_unbeaten_streak()),
+    goal_scoring=(_scored_streak,
+                  lambda games: games.players_streaks.get_players_with_best_goal_scoring_streak()),
+)
+
+
+def measure(run: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    maccabi_games_stats = create_maccabi_games_stats()
+    maccabi_games_stats.columns  # Built once per root object, we don't want to measure it
+
+    print(f'{len(maccabi_games_stats)} games, {len(maccabi_games_stats.available_players_names)} players:')
+    for name, (streak_condition, players_streaks) in _STREAKS.items():
+        per_player = measure(lambda: _per_player(maccabi_games_stats, streak_condition))
+        # A new root object each time, so the sweep rows are created as part of the measure
+        games = MaccabiGamesStats(maccabi_games_stats.games, players_data=maccabi_games_stats.players_data)
+        games.columns
+        sweep = measure(lambda: players_streaks(games))
+        print(f'  {name:13}: per_player {per_player:.3f}s, sweep {sweep * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Measures how long it takes to find the couples & trios of players that played the most games together
+(3,000 synthetic games).
+
+"combinations" re-creates what scripts/top_players_to_play_together.py used to do: a Counter of the combinations
+of each game played players.
+"co_occurrence" is the current behavior (MaccabiGamesStats.players_together): the pairs of all of the games at once,
+and the trios extended only from the couples that played enough games together.
+
+Run: python benchmarks/players_together.py
+"""
+import time
+from collections import Counter
+from itertools import combinations
+from typing import Callable
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.players_together import MaccabiGamesPlayersTogetherStats
+
+from synthetic_games import create_maccabi_games_stats
+
+TOP_COUNT = 25
+
+
+def _combinations(maccabi_games_stats: MaccabiGamesStats, players_count: int) -> None:
+    played_together = Counter()
+    for game in maccabi_games_stats:
+        for players in combinations(sorted(game.maccabi_team.played_players_with_amount.keys()), players_count):
+            played_together[players] += 1
+
+    played_together.most_common(TOP_COUNT)
+
+
+def measure(run: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    maccabi_games_stats = create_maccabi_games_stats()
+    maccabi_games_stats.columns  # Built once per root object, we don't want to measure it
+
+    print(f'{len(maccabi_games_stats)} games, top {TOP_COUNT} groups:')
+    for players_count in (2, 3):
+        combinations_duration = measure(lambda: _combinations(maccabi_games_stats, players_count))
+        # A new sub stats object each time, so the pairs are created as part of the measure
+        players_together = MaccabiGamesPlayersTogetherStats(maccabi_games_stats)
+        co_occurrence_duration = measure(lambda: players_together.most_played_together(players_count, TOP_COUNT))
+        print(f'  {players_count} players: combinations {combinations_duration * 1000:.0f}ms, '
+              f'co_occurrence {co_occurrence_duration * 1000:.0f}ms')
+
+
+if __name__ == '__main__':
+    main()
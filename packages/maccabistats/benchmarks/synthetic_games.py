@@ -0,0 +1,90 @@
+"""
+Synthetic (but deterministic) games for the benchmarks, so they run offline and without a pickled source.
+"""
+import datetime
+import random
+from collections import defaultdict
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import List
+
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalGameEvent, GoalTypes, \
+    AssistGameEvent, AssistTypes
+from maccabistats.models.player_in_game import PlayerInGame
+from maccabistats.models.team_in_game import TeamInGame
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+_COMPETITIONS = ['ליגת העל', 'ליגת העל', 'ליגת העל', 'גביע המדינה', 'ליגת האלופות', 'ידידות']
+_MACCABI_PLAYERS_IN_GAME = 16
+_OPPONENT_PLAYERS_IN_GAME = 14
+
+
+def _create_team(name: str, coach: str, score: int, players_names: List[str], randomizer: random.Random) \
+        -> TeamInGame:
+    players = []
+    for player_index, player_name in enumerate(players_names):
+        if player_index < 11:
+            events = [GameEvent(GameEventTypes.LINE_UP, timedelta(0))]
+        else:
+            events = [GameEvent(GameEventTypes.BENCHED, timedelta(0))]
+            if randomizer.random() < 0.5:
+                events.append(GameEvent(GameEventTypes.SUBSTITUTION_IN, timedelta(minutes=randomizer.randint(46, 85))))
+
+        if randomizer.random() < 0.1:
+            events.append(GameEvent(GameEventTypes.YELLOW_CARD, timedelta(minutes=randomizer.randint(1, 90))))
+        players.append(PlayerInGame(name=player_name, number=player_index + 1, game_events=events))
+
+    for _ in range(score):
+        scorer, assister = randomizer.sample(players[:11], 2)
+        minute = timedelta(minutes=randomizer.randint(1, 90))
+        scorer.add_event(GoalGameEvent(minute, randomizer.choice([GoalTypes.NORMAL_KICK, GoalTypes.HEADER])))
+        assister.add_event(AssistGameEvent(minute, AssistTypes.NORMAL_ASSIST))
+
+    return TeamInGame(name=name, coach=coach, score=score, players=players)
+
+
+def create_games(games_count: int = 3000, seasons_count: int = 60, players_count: int = 600,
+                 opponents_count: int = 40, seed: int = 1906) -> List[GameData]:
+    """
+    Creates games spread evenly over the given seasons count, with a random squad of the given players pool.
+    """
+    randomizer = random.Random(seed)
+    players_pool = [f'שחקן {player_index}' for player_index in range(players_count)]
+    games_per_season = max(1, games_count // seasons_count)
+    first_season_year = 2024 - seasons_count
+
+    games = []
+    for game_index in range(games_count):
+        season_year = first_season_year + min(game_index // games_per_season, seasons_count - 1)
+        game_date = datetime.datetime(season_year, 8, 1) + timedelta(days=(game_index % games_per_season) * 5)
+        opponent_name = f'קבוצה {randomizer.randrange(opponents_count)}'
+
+        # Nearby players in the pool play at nearby seasons, like a real squad
+        squad_start = (season_year - first_season_year) * players_count // (seasons_count + 1)
+        squad_pool = players_pool[squad_start: squad_start + 30]
+        maccabi_team = _create_team('מכבי תל אביב', f'מאמן {season_year % 7}', randomizer.randint(0, 4),
+                                    randomizer.sample(squad_pool, _MACCABI_PLAYERS_IN_GAME), randomizer)
+        opponent_team = _create_team(opponent_name, 'מאמן יריב', randomizer.randint(0, 3),
+                                     [f'{opponent_name} {index}' for index in range(_OPPONENT_PLAYERS_IN_GAME)],
+                                     randomizer)
+        home_team, away_team = (maccabi_team, opponent_team) if game_index % 2 else (opponent_team, maccabi_team)
+
+        games.append(GameData(competition=randomizer.choice(_COMPETITIONS), fixture=str(game_index % 30),
+                              date_as_hebrew_string='', stadium=f'אצטדיון {randomizer.randrange(15)}',
+                              crowd='1000', referee=f'שופט {randomizer.randrange(50)}',
+                              home_team=home_team, away_team=away_team,
+                              season_string=f'{season_year}/{(season_year + 1) % 100:02}',
+                              half_parsed_events=[], date=game_date))
+
+    return games
+
+
+def create_players_data() -> SimpleNamespace:
+    """Players data with the attributes MaccabiGamesStats uses, without crawling MaccabiPedia."""
+    return SimpleNamespace(home_players=set(),
+                           players_dates=defaultdict(lambda: datetime.datetime(1900, 1, 1)))
+
+
+def create_maccabi_games_stats(**kwargs) -> MaccabiGamesStats:
+    return MaccabiGamesStats(create_games(**kwargs), players_data=create_players_data())
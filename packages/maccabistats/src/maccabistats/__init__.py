@@ -4,6 +4,7 @@ from .maccabilogging import initialize_logging
 initialize_logging()
 
 from .stats.serialized_games import get_maccabi_stats, get_maccabi_stats_as_newest_wrapper, serialize_maccabi_games
+from .stats.games_snapshot import convert_pickled_games_to_snapshot
 from .parse.parse_from_all_sites import merge_maccabi_games_from_all_input_serialized_sources, \
     load_from_maccabipedia_source, load_from_maccabipedia_file_source, load_from_maccabisite_source, \
     load_from_table_source, run_maccabipedia_source, run_maccabitlv_site_source, run_table_source
@@ -6,17 +6,36 @@ class _MaccabiPediaQueryGamesDataConfig:
     tables_names = 'Football_Games, Competitions, Stadiums, Opponents'
     fields_names = 'Football_Games._pageName, Football_Games.Date, Football_Games.Hour, Football_Games.MatchDay, Football_Games.Season, Football_Games.Competition, Football_Games.Leg, Opponents.OriginalName=Opponent, Football_Games.HomeAway, Stadiums.OriginalName=Stadium, Football_Games.ResultMaccabi, Football_Games.ResultOpponent, Football_Games.CoachMaccabi, Football_Games.CoachOpponent, Football_Games.Refs, Football_Games.Crowd, Football_Games.Technical'
     join_on = 'Football_Games.Competition=Competitions.OriginalName, Football_Games.Stadium=Stadiums.CanonicalName, Football_Games.Opponent=Opponents.CanonicalName'
+    page_name_field = 'Football_Games._pageName'
 
 
 @dataclass
 class _MaccabiPediaQueryGamesEventsConfig:
     tables_names = 'Games_Events'
-    fields_names = '_pageName, Date, PlayerName, PlayerNumber, Minute, EventType, SubType, Team, Part'
+    # The fields has the table name, so we could join the table with the pages data (modification date)
+    fields_names = 'Games_Events._pageName, Games_Events.Date, Games_Events.PlayerName, Games_Events.PlayerNumber, Games_Events.Minute, Games_Events.EventType, Games_Events.SubType, Games_Events.Team, Games_Events.Part'
+    join_on = ''
+    page_name_field = 'Games_Events._pageName'
+
+
+@dataclass
+class _MaccabiPediaQueryGamesPagesConfig:
+    tables_names = 'Football_Games'
+    fields_names = '_pageName'
+    join_on = ''
 
 
 @dataclass
 class MaccabiPediaConfig:
     base_crawling_address = 'http://www.maccabipedia.co.il/index.php?title=Special:CargoExport&format=json'
+    # How many pages (of 5,000 rows) of each table we request at once
+    concurrent_requests_per_table = 4
 
     games_data_query = _MaccabiPediaQueryGamesDataConfig()
     games_events_query = _MaccabiPediaQueryGamesEventsConfig()
+    games_pages_query = _MaccabiPediaQueryGamesPagesConfig()
+
+    # Cargo table with the pages metadata, it has a column for the last modification date of each page
+    pages_data_table_name = '_pageData'
+    # The tables the games data takes its names from, an edit to one of their pages may change any game
+    games_names_tables_names = ('Competitions', 'Stadiums', 'Opponents')
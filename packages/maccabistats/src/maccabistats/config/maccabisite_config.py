@@ -1,5 +1,6 @@
 import logging
 import os
+import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -20,8 +21,29 @@ class MaccabiSiteConfig:
     max_seasons_to_crawl: int = 87
     season_page_pattern: str = 'https://www.maccabi-tlv.co.il/משחקים-ותוצאות/הקבוצה-הבוגרת/תוצאות/?season={season_number}#content'
     folder_to_save_seasons_html_files: str = field(default_factory=lambda: str(get_maccabistats_data_dir() / "crawl" / "seasons"))
+    # The games pages files of the crawls before the http cache (2.86), not used anymore, they may be removed
     folder_to_save_games_html_files: str = field(default_factory=lambda: str(get_maccabistats_data_dir() / "crawl" / "games"))
+    folder_to_save_http_cache: str = field(default_factory=lambda: str(get_maccabistats_data_dir() / "crawl" / "http_cache"))
+    # Seconds a cached page is used without asking the site whether it changed (finished games pages are used forever)
+    seasons_pages_cache_max_age: float = 6 * 60 * 60
+    games_pages_cache_max_age: float = 10 * 60
     use_disk_as_cache_when_crawling = True
-    use_lxml_parser = True
     use_multiprocess_crawling = True
     crawling_process_number = 15
+    # The pages are fetched by a bounded threads pool (then parsed by the crawling processes)
+    crawling_fetch_threads = 8
+
+    @property
+    def use_lxml_parser(self) -> bool:
+        """ Deprecated: the pages are always parsed with lxml (since 2.87), setting it does nothing. """
+        _warn_use_lxml_parser_is_deprecated()
+        return True
+
+    @use_lxml_parser.setter
+    def use_lxml_parser(self, value: bool) -> None:
+        _warn_use_lxml_parser_is_deprecated()
+
+
+def _warn_use_lxml_parser_is_deprecated() -> None:
+    warnings.warn("MaccabiSiteConfig.use_lxml_parser is deprecated and ignored, "
+                  "the maccabi-tlv.co.il pages are always parsed with lxml", DeprecationWarning, stacklevel=3)
@@ -1 +1,2 @@
 from .error_finder import ErrorsFinder
+from .games_checks import ErrorsReport
@@ -2,10 +2,13 @@ import logging
 from collections import defaultdict
 from datetime import timedelta
 from itertools import chain, repeat
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
+from maccabistats.error_finder.games_checks import GAMES_CHECKS, ErrorsReport, Finding, GamesFacts, \
+    compute_games_facts, compute_games_facts_in_processes, select_games_facts
 from maccabistats.models.game_data import GameData
 from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.models.player_in_game import PlayerInGame
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 logger = logging.getLogger(__name__)
@@ -19,76 +22,100 @@ This should be run manually.
 
 
 class ErrorsFinder:
-    """ Each public function on this class wil lbe run automatically by 'get_all_errors_numbers'. """
+    """ Each public 'get_' function on this class wil lbe run automatically by 'get_all_errors_numbers'. """
 
-    def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats, processes: Optional[int] = None) -> None:
+        """
+        :param processes: Spread the games facts pass (of the registered checks) across a processes pool of this size
+                          (0 for the cpu count), None to compute them in the current process.
+        """
         self.maccabi_games_stats = maccabi_games_stats
+        self.processes = processes
+        self._games_facts: GamesFacts = {}
+
+    # region Games checks
+
+    def _facts(self, facts_names: Iterable[str]) -> GamesFacts:
+        """ Computes (in one pass over the games) only the facts that were not computed yet. """
+
+        missing_facts_names = [fact_name for fact_name in dict.fromkeys(facts_names)
+                               if fact_name not in self._games_facts]
+        if missing_facts_names:
+            games = self.maccabi_games_stats.games
+            if self.processes is None:
+                self._games_facts.update(compute_games_facts(games, missing_facts_names))
+            else:
+                self._games_facts.update(compute_games_facts_in_processes(games, missing_facts_names, self.processes))
+
+        return self._games_facts
+
+    def find_errors(self, check_name: str) -> List[Finding]:
+        """ The errors the given check (one of GAMES_CHECKS) found, the finding games are the games indices. """
+
+        if check_name not in GAMES_CHECKS:
+            raise ValueError(f"Unknown games check: {check_name}, should be one of: {list(GAMES_CHECKS)}")
+
+        check = GAMES_CHECKS[check_name]
+        return check.find(self._facts(check.facts))
+
+    def create_errors_report(self, checks_names: Optional[Iterable[str]] = None,
+                             games_indices: Optional[Iterable[int]] = None,
+                             description: Optional[str] = None) -> ErrorsReport:
+        """
+        Runs the given checks (all of them by default) on the facts of all of their games, computed in one pass.
+
+        :param games_indices: Check only these games (of maccabi_games_stats), so the facts are computed once for few
+                              reports of the same games.
+        """
+        checks = [GAMES_CHECKS[check_name] for check_name in checks_names or GAMES_CHECKS]
+        games_facts = self._facts(chain.from_iterable(check.facts for check in checks))
+        if games_indices is not None:
+            games_facts = select_games_facts(games_facts, games_indices)
+
+        return ErrorsReport(description or str(self.maccabi_games_stats), games_facts['game'],
+                            {check.name: check.find(games_facts) for check in checks})
+
+    def _games_of_check(self, check_name: str, description: str) -> MaccabiGamesStats:
+        games = self.maccabi_games_stats.games
+        return self.maccabi_games_stats.create_maccabi_games_stats_with_filtered_games(
+            [games[finding['games'][0]] for finding in self.find_errors(check_name)], description)
+
+    def _players_of_check(self, check_name: str) -> List[Tuple[PlayerInGame, GameData]]:
+        games = self.maccabi_games_stats.games
+        return [(games[finding['games'][0]].maccabi_team.players[finding['player_index']], games[finding['games'][0]])
+                for finding in self.find_errors(check_name)]
+
+    # endregion
 
     def get_games_without_11_maccabi_players_on_lineup(self):
         """ Each team should have 11 players with lineup event! but we care more about maccabi, skip technical games """
 
-        missing_lineup_games = [game for game in self.maccabi_games_stats
-                                if not game.technical_result
-                                if 11 != len(game.maccabi_team.lineup_players)]
-
-        return self.maccabi_games_stats.create_maccabi_games_stats_with_filtered_games(missing_lineup_games,
-                                                                'Games without 11 lineup players')
+        return self._games_of_check('games_without_11_lineup_players', 'Games without 11 lineup players')
 
     def get_dates_with_more_than_one_game(self):
         """
         Each game should be played in a unique date (that how our MaccabiPedia football modeling system works atm)
         """
-        games_by_date = defaultdict(list)
-
-        for game in self.maccabi_games_stats:
-            games_by_date[game.date.date()].append(game)
-
-        problematic_dates = {date: games for date, games in games_by_date.items() if len(games) > 1}
-        return problematic_dates
+        games = self.maccabi_games_stats.games
+        return {games[finding['games'][0]].date.date(): [games[game_index] for game_index in finding['games']]
+                for finding in self.find_errors('dates_with_more_than_one_game')}
 
     def get_lineup_players_with_substitution_in(self):
         """ Players that opened on lineup, should'nt has substitution in event. """
 
-        players_with_games = [(player, game) for game in self.maccabi_games_stats for player in
-                              game.maccabi_team.players
-                              if player.has_event_type(GameEventTypes.LINE_UP) and player.has_event_type(
-                GameEventTypes.SUBSTITUTION_IN)]
-
-        return players_with_games
+        return self._players_of_check('lineup_players_with_substitution_in')
 
     def get_games_with_missing_goals_events(self):
         """ Total score should be equals to the total goals event, excluding games that were finished by technical result """
 
-        games = [game for game in self.maccabi_games_stats
-                 if (game.maccabi_team.score + game.not_maccabi_team.score != len(
-                game.goals())) and not game.technical_result]
-
-        return self.maccabi_games_stats.create_maccabi_games_stats_with_filtered_games(games, 'Games with missing goals events')
+        return self._games_of_check('missing_goals_events', 'Games with missing goals events')
 
     def get_games_with_wrong_goals_team_belonging(self):
         """ Maccabi score in the game should be equal to the maccabi score that written in the last goal event
             We exclude technical games and the games that has some missing goals events which is counter by
             get_games_with_missing_goals_events """
 
-        games_with_wrong_goals_count = self.get_games_with_missing_goals_events()
-
-        def game_has_wrong_goals_belonging(game_to_check: GameData) -> bool:
-            if game_to_check.technical_result:
-                return False
-
-            if game_to_check in games_with_wrong_goals_count:
-                return False
-
-            maccabi_score, not_maccabi_score = 0, 0
-            if game_to_check.goals():
-                last_goal = game_to_check.goals()[-1]
-                maccabi_score, not_maccabi_score = last_goal['maccabi_score'], last_goal['not_maccabi_score']
-
-            return maccabi_score != game_to_check.maccabi_score or not_maccabi_score != not_maccabi_score
-
-        games = list(filter(game_has_wrong_goals_belonging, self.maccabi_games_stats))
-
-        return self.maccabi_games_stats.create_maccabi_games_stats_with_filtered_games(games, 'Games with wrong goals belonging')
+        return self._games_of_check('wrong_goals_team_belonging', 'Games with wrong goals belonging')
 
     def get_players_with_event_but_without_lineup_or_substitution(self):
         """ Every player that has any event should has atleast lineup or substitution or bench in event """
@@ -110,22 +137,12 @@ class ErrorsFinder:
     def get_games_with_incorrect_season(self):
         """ Finds games which their date does not match the seasons (date between seasons). """
 
-        def validate_season(game):
-            if game.season[-2:] == "00":  # We should add 100 year to the max season in this counting system:
-                return int(game.season[:4]) <= game.date.year <= int(game.season[:2] + game.season[-2:]) + 100
-            else:
-                return int(game.season[:4]) <= game.date.year <= int(game.season[:2] + game.season[-2:])
-
-        games_with_incorrect_season = [(game.season, str(game.date.date()), game) for game in self.maccabi_games_stats
-                                       if not validate_season(game)]
-
-        return games_with_incorrect_season
+        games = self.maccabi_games_stats.games
+        return [(finding['season'], finding['date'], games[finding['games'][0]])
+                for finding in self.find_errors('incorrect_season')]
 
     def get_players_with_unknown_events(self):
-        players_with_unknown_events = [(player, game) for game in self.maccabi_games_stats for player in
-                                       game.maccabi_team.players if
-                                       player.has_event_type(GameEventTypes.UNKNOWN)]
-        return players_with_unknown_events
+        return self._players_of_check('players_with_unknown_events')
 
     def get_missing_league_games_fixtures(self):
         """
@@ -153,23 +170,10 @@ class ErrorsFinder:
         """
         For each season check whether we have double fixtures (numbers)
         """
-        fixtures_from_all_seasons = defaultdict(list)
-
-        seasons = self.maccabi_games_stats.league_games.seasons
-
-        for season in seasons:
-            if not season:
-                continue
-
-            # This season is not empty
-            for game in season:
-                fixtures_from_all_seasons[f"Season {season[0].season} Fixture {game.league_fixture}"].append(game)
-
-        double_fixtures = [(season_and_fixture, self.maccabi_games_stats.create_maccabi_games_stats_with_filtered_games(games, f'Double fixture: {season_and_fixture}')) for season_and_fixture, games in
-                           fixtures_from_all_seasons.items() if
-                           len(games) > 1]
-
-        return double_fixtures
+        games = self.maccabi_games_stats.games
+        return [(finding['fixture'], self.maccabi_games_stats.create_maccabi_games_stats_with_filtered_games(
+            [games[game_index] for game_index in finding['games']], f"Double fixture: {finding['fixture']}"))
+            for finding in self.find_errors('double_league_fixtures')]
 
     def get_games_without_stadium(self):
         """
@@ -321,8 +325,7 @@ class ErrorsFinder:
     def get_all_errors_numbers(self):
         """ Iterate over all this class functions without this one, and summarize the results. """
         errors_finders = [func for func in dir(self) if
-                          callable(getattr(self, func)) and func != "get_all_errors_numbers" and not func.startswith(
-                              "_")]
+                          callable(getattr(self, func)) and func != "get_all_errors_numbers" and func.startswith("get_")]
 
         for func_name in errors_finders:
             error_finder_func = getattr(self, func_name)
@@ -0,0 +1,294 @@
+import json
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import ceil
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.consts import LEAGUE_COMPETITIONS
+
+logger = logging.getLogger(__name__)
+"""
+The games checks of the ErrorsFinder, each check declares the games facts it needs (such as the lineup players count
+or the goals timeline), so the facts of all of the checks are computed in one pass over the games.
+The facts are plain values, so this pass may be spread across processes, and the checks run on the facts only.
+"""
+
+GamesFacts = Dict[str, List[Any]]  # Fact name to its value for each game (by the game index)
+# The games (indices) of the error, its text line (for the text report) and its details (for the JSON report)
+Finding = Dict[str, Any]
+
+
+# region Games facts
+
+def _lineup_players_with_substitution_in(game: GameData) -> List[Tuple[int, str]]:
+    return [(player_index, player.name) for player_index, player in enumerate(game.maccabi_team.players)
+            if player.has_event_type(GameEventTypes.LINE_UP) and player.has_event_type(GameEventTypes.SUBSTITUTION_IN)]
+
+
+def _players_with_unknown_events(game: GameData) -> List[Tuple[int, str, str]]:
+    return [(player_index, player.name, str(player.events)) for player_index, player
+            in enumerate(game.maccabi_team.players) if player.has_event_type(GameEventTypes.UNKNOWN)]
+
+
+# Each fact name to the function that computes it from a game
+GAMES_FACTS: Dict[str, Callable[[GameData], Any]] = dict(
+    game=repr,
+    date=lambda game: game.date.date().isoformat(),
+    season=lambda game: game.season,
+    technical_result=lambda game: bool(game.technical_result),
+    score=lambda game: (game.maccabi_team.score, game.not_maccabi_team.score),
+    # The score after each goal
+    goals_timeline=lambda game: [(goal.maccabi_score, goal.not_maccabi_score) for goal in game.goals_timeline],
+    lineup_count=lambda game: len(game.maccabi_team.lineup_players),
+    is_league_game=lambda game: game.competition in LEAGUE_COMPETITIONS,
+    league_fixture=lambda game: game.league_fixture,
+    lineup_players_with_substitution_in=_lineup_players_with_substitution_in,
+    players_with_unknown_events=_players_with_unknown_events,
+)
+
+
+def compute_games_facts(games: List[GameData], facts_names: Iterable[str]) -> GamesFacts:
+    """
+    Computes all of the given facts in one pass over the games.
+    """
+    games_facts = {fact_name: [] for fact_name in facts_names}
+    facts_functions = [(GAMES_FACTS[fact_name], fact_values) for fact_name, fact_values in games_facts.items()]
+    for game in games:
+        for fact_function, fact_values in facts_functions:
+            fact_values.append(fact_function(game))
+
+    return games_facts
+
+
+# The games of the current processes pool worker, set once (by the pool initializer) instead of sending each chunk
+_pool_games: List[GameData] = []
+
+
+def _set_pool_games(games: List[GameData]) -> None:
+    global _pool_games
+    _pool_games = games
+
+
+def _compute_pool_games_facts(chunk_start: int, chunk_end: int, facts_names: Tuple[str, ...]) -> GamesFacts:
+    return compute_games_facts(_pool_games[chunk_start: chunk_end], facts_names)
+
+
+def compute_games_facts_in_processes(games: List[GameData], facts_names: Iterable[str],
+                                     processes: Optional[int] = None) -> GamesFacts:
+    """
+    Same as compute_games_facts, the games are split to chunks which are computed by a processes pool.
+    The games are given to each worker once (with fork they are not even pickled), only the facts are sent back.
+
+    :param processes: The pool processes count, the cpu count if None (or 0).
+    """
+    facts_names = tuple(facts_names)
+    processes = processes or os.cpu_count() or 1
+    # Few chunks for each process, so a slow chunk won't hold the others
+    chunk_size = max(ceil(len(games) / (processes * 4)), 1)
+    chunks_starts = range(0, len(games), chunk_size)
+    with ProcessPoolExecutor(processes, initializer=_set_pool_games, initargs=(games,)) as executor:
+        chunks_facts = list(executor.map(_compute_pool_games_facts, chunks_starts,
+                                         [chunk_start + chunk_size for chunk_start in chunks_starts],
+                                         repeat(facts_names)))
+
+    games_facts = {fact_name: [] for fact_name in facts_names}
+    for chunk_facts in chunks_facts:
+        for fact_name, fact_values in chunk_facts.items():
+            games_facts[fact_name].extend(fact_values)
+
+    logger.debug(f'Computed {len(facts_names)} facts of {len(games)} games in {len(chunks_starts)} chunks')
+    return games_facts
+
+
+def select_games_facts(games_facts: GamesFacts, games_indices: Iterable[int]) -> GamesFacts:
+    """
+    The facts of the given games only, so facts computed once may be checked for a few games subsets.
+    """
+    games_indices = list(games_indices)
+    return {fact_name: [fact_values[game_index] for game_index in games_indices]
+            for fact_name, fact_values in games_facts.items()}
+
+# endregion
+
+
+class GamesCheck(NamedTuple):
+    name: str
+    description: str  # The title of the check errors at the text report
+    facts: Tuple[str, ...]  # The games facts this check needs
+    find: Callable[[GamesFacts], List[Finding]]
+
+
+# Each check name to its check, by their registration order (the order of the report)
+GAMES_CHECKS: Dict[str, GamesCheck] = {}
+
+
+def games_check(description: str, facts: Iterable[str]) -> Callable:
+    """
+    Registers the decorated function (gets the games facts, returns the errors it found) as a games check.
+    """
+
+    def register(find: Callable[[GamesFacts], List[Finding]]) -> Callable[[GamesFacts], List[Finding]]:
+        GAMES_CHECKS[find.__name__] = GamesCheck(find.__name__, description, tuple(facts), find)
+        return find
+
+    return register
+
+
+# region Checks
+
+def _game_finding(facts: GamesFacts, game_index: int, **details: Any) -> Finding:
+    return dict(games=[game_index], text=facts['game'][game_index], **details)
+
+
+@games_check('League games with the same season and fixture', facts=('game', 'is_league_game', 'season',
+                                                                     'league_fixture'))
+def double_league_fixtures(facts: GamesFacts) -> List[Finding]:
+    fixtures_games = defaultdict(list)
+    for game_index, is_league_game in enumerate(facts['is_league_game']):
+        if is_league_game:
+            fixtures_games[f"Season {facts['season'][game_index]} Fixture {facts['league_fixture'][game_index]}"] \
+                .append(game_index)
+
+    return [dict(games=games, text=f"{fixture}: [{', '.join(facts['game'][game_index] for game_index in games)}]",
+                 fixture=fixture)
+            for fixture, games in fixtures_games.items() if len(games) > 1]
+
+
+def _has_missing_goals_events(facts: GamesFacts, game_index: int) -> bool:
+    return not facts['technical_result'][game_index] and \
+        sum(facts['score'][game_index]) != len(facts['goals_timeline'][game_index])
+
+
+@games_check('Games with wrong team goals belonging', facts=('game', 'technical_result', 'score', 'goals_timeline'))
+def wrong_goals_team_belonging(facts: GamesFacts) -> List[Finding]:
+    """
+    The score should be the score after the last goal, we skip the technical games and the games with missing goals.
+    """
+    findings = []
+    for game_index, goals_timeline in enumerate(facts['goals_timeline']):
+        if facts['technical_result'][game_index] or _has_missing_goals_events(facts, game_index):
+            continue
+
+        if tuple(goals_timeline[-1] if goals_timeline else (0, 0)) != tuple(facts['score'][game_index]):
+            findings.append(_game_finding(facts, game_index))
+
+    return findings
+
+
+@games_check('Games with missing goals events', facts=('game', 'technical_result', 'score', 'goals_timeline'))
+def missing_goals_events(facts: GamesFacts) -> List[Finding]:
+    """
+    The total score should be equal to the goals events count, we skip the technical games.
+    """
+    return [_game_finding(facts, game_index) for game_index in range(len(facts['game']))
+            if _has_missing_goals_events(facts, game_index)]
+
+
+def _is_valid_season(season: str, date: str) -> bool:
+    year = int(date[:4])
+    if season[-2:] == "00":  # We should add 100 year to the max season in this counting system
+        return int(season[:4]) <= year <= int(season[:2] + season[-2:]) + 100
+
+    return int(season[:4]) <= year <= int(season[:2] + season[-2:])
+
+
+@games_check('Games with incorrect season', facts=('game', 'season', 'date'))
+def incorrect_season(facts: GamesFacts) -> List[Finding]:
+    """
+    The game date should be between its season years.
+    """
+    return [dict(games=[game_index], text=f"({season!r}, {date!r}, {facts['game'][game_index]})",
+                 season=season, date=date)
+            for game_index, (season, date) in enumerate(zip(facts['season'], facts['date']))
+            if not _is_valid_season(season, date)]
+
+
+@games_check('Games without 11 players on lineup', facts=('game', 'technical_result', 'lineup_count'))
+def games_without_11_lineup_players(facts: GamesFacts) -> List[Finding]:
+    """
+    Maccabi should have 11 players with lineup event, we skip the technical games.
+    """
+    return [_game_finding(facts, game_index, lineup_count=lineup_count)
+            for game_index, lineup_count in enumerate(facts['lineup_count'])
+            if not facts['technical_result'][game_index] and lineup_count != 11]
+
+
+@games_check('Players that start the game and have sub-in event',
+             facts=('game', 'lineup_players_with_substitution_in'))
+def lineup_players_with_substitution_in(facts: GamesFacts) -> List[Finding]:
+    return [dict(games=[game_index], text=f"Player: {player_name}, Game: {facts['game'][game_index]}",
+                 player=player_name, player_index=player_index)
+            for game_index, players in enumerate(facts['lineup_players_with_substitution_in'])
+            for player_index, player_name in players]
+
+
+@games_check('Players with an unrecognized event', facts=('game', 'players_with_unknown_events'))
+def players_with_unknown_events(facts: GamesFacts) -> List[Finding]:
+    return [dict(games=[game_index], text=f"Player: {player_name}, Events: {events}, Game: {facts['game'][game_index]}",
+                 player=player_name, player_index=player_index, events=events)
+            for game_index, players in enumerate(facts['players_with_unknown_events'])
+            for player_index, player_name, events in players]
+
+
+@games_check('Dates with more than one game', facts=('game', 'date'))
+def dates_with_more_than_one_game(facts: GamesFacts) -> List[Finding]:
+    """
+    Each game should be played at a unique date (that how our MaccabiPedia football modeling system works atm).
+    """
+    dates_games = defaultdict(list)
+    for game_index, date in enumerate(facts['date']):
+        dates_games[date].append(game_index)
+
+    return [dict(games=games, text=f"{date}: [{', '.join(facts['game'][game_index] for game_index in games)}]",
+                 date=date)
+            for date, games in dates_games.items() if len(games) > 1]
+
+# endregion
+
+
+class ErrorsReport(object):
+    """
+    The errors each check found in the games, as text (a section for each check with errors) or as JSON.
+    """
+
+    def __init__(self, description: str, games_descriptions: List[str],
+                 checks_findings: Dict[str, List[Finding]]) -> None:
+        self.description = description
+        self.games_descriptions = games_descriptions
+        self.checks_findings = checks_findings
+
+    def __len__(self) -> int:
+        return sum(len(findings) for findings in self.checks_findings.values())
+
+    def to_text(self) -> str:
+        lines = [f"Showing errors for: {self.description}:\n"]
+        for check_name, findings in self.checks_findings.items():
+            if not findings:
+                continue
+
+            lines.append(f'\n{GAMES_CHECKS[check_name].description}:')
+            lines.extend(f"    {finding['text']}" for finding in findings)
+
+        return '\n'.join(lines)
+
+    def json_dict(self) -> Dict[str, Any]:
+        """
+        The games of each error are kept by their description (not their index), so reports of different days diff well.
+        """
+        return dict(description=self.description,
+                    errors={check_name: [dict({name: value for name, value in finding.items() if name != 'text'},
+                                              games=[self.games_descriptions[game_index]
+                                                     for game_index in finding['games']])
+                                         for finding in findings]
+                            for check_name, findings in self.checks_findings.items()})
+
+    def to_json(self) -> str:
+        return json.dumps(self.json_dict(), ensure_ascii=False, indent=2, sort_keys=True)
+
+    def __repr__(self) -> str:
+        return f'ErrorsReport: [{self.description}] ({len(self)} errors)'
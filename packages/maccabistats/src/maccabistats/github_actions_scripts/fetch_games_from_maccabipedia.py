@@ -1,11 +1,32 @@
 import logging
+import os
 
 from maccabistats import run_maccabipedia_source
+from maccabistats.parse.maccabipedia.maccabipedia_source import MaccabiPediaSource
 
 logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.INFO)
 
 
+def remove_old_maccabipedia_games_files() -> None:
+    """
+    The sources folder is cached between the workflow runs (for the incremental crawl), keep only the last crawl files.
+    Only the crawl files (the games files & their pages files) are removed.
+    """
+    maccabipedia_source = MaccabiPediaSource()
+    last_games_file = maccabipedia_source.find_last_created_source_maccabi_games_file()
+
+    for games_file in maccabipedia_source.find_source_maccabi_games_files():
+        if games_file == last_games_file:
+            continue
+
+        for crawl_file in (games_file, maccabipedia_source.games_pages_file_path(games_file)):
+            if os.path.isfile(crawl_file):
+                logging.info(f'Removing old crawl file: {crawl_file}')
+                os.remove(crawl_file)
+
+
 if __name__ == '__main__':
     logging.info('Starting to fetch Maccabi games from MaccabiPedia')
-    _ = run_maccabipedia_source()
+    _ = run_maccabipedia_source(incremental=True)
+    remove_old_maccabipedia_games_files()
     logging.info('Finished to fetch Maccabi games from MaccabiPedia')
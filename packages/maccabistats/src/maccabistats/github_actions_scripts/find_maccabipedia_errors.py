@@ -1,11 +1,14 @@
 import logging
 import subprocess
 from datetime import datetime
-from logging import FileHandler
 from pathlib import Path
 
+import numpy as np
+
 from maccabistats import load_from_maccabipedia_source, ErrorsFinder
+from maccabistats.error_finder import ErrorsReport
 from maccabistats.maccabilogging import remove_live_logging
+from maccabistats.stats.columns import as_datetime64
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 
@@ -17,89 +20,19 @@ def _get_repo_root() -> Path:
 logging.basicConfig(format='%(message)s', level=logging.INFO)
 
 
-def show_double_league_fixtures(errors_finder: ErrorsFinder) -> None:
-    problematic_games = errors_finder.get_double_league_games_fixtures()
-    if not problematic_games:
-        return
-
-    logging.info(f'\nLeague games with the same season and fixture:')
-    for fixture_and_season, maccabi_games_stats in problematic_games:
-        logging.info(f'    {fixture_and_season}: {maccabi_games_stats.games}')
-
-
-def show_games_with_difference_between_the_score_and_goals_amount(errors_finder: ErrorsFinder) -> None:
-    problematic_games = errors_finder.get_games_with_wrong_goals_team_belonging()
-    if not problematic_games:
-        return
-
-    logging.info(f'\nGames with wrong team goals belonging:')
-    for game in problematic_games:
-        logging.info(f'    {game}')
-
-
-def show_games_with_missing_goals_events(errors_finder: ErrorsFinder) -> None:
-    problematic_games = errors_finder.get_games_with_missing_goals_events()
-    if not problematic_games:
-        return
-
-    logging.info(f'\nGames with missing goals events:')
-    for game in problematic_games:
-        logging.info(f'    {game}')
-
-
-def show_games_with_incorrect_seasons(errors_finder: ErrorsFinder) -> None:
-    problematic_games = errors_finder.get_games_with_incorrect_season()
-    if not problematic_games:
-        return
-
-    logging.info(f'\nGames with incorrect season:')
-    for record in problematic_games:
-        logging.info(f'    {record}')
+def write_errors_report(errors_report: ErrorsReport, base_file_name: str) -> None:
+    """
+    Writes the report as text (for the telegram message) and as JSON (to diff against the previous day report).
+    """
+    errors_text = errors_report.to_text()
+    logging.info(errors_text)
 
-
-def show_games_without_11_lineup_players(errors_finder: ErrorsFinder) -> None:
-    problematic_games = errors_finder.get_games_without_11_maccabi_players_on_lineup()
-    if not problematic_games:
-        return
-
-    logging.info(f'\nGames without 11 players on lineup:')
-    for game in problematic_games:
-        logging.info(f'    {game}')
-
-
-def show_players_that_start_the_game_and_have_sub_in_event(errors_finder: ErrorsFinder) -> None:
-    problematic_players = errors_finder.get_lineup_players_with_substitution_in()
-    if not problematic_players:
-        return
-
-    logging.info(f'\nPlayers that start the game and have sub-in event:')
-    for player_record in problematic_players:
-        logging.info(f'    Player: {player_record[0].name}, Game: {player_record[1]}')
-
-
-def show_players_with_unknown_events(errors_finder: ErrorsFinder) -> None:
-    problematic_players = errors_finder.get_players_with_unknown_events()
-    if not problematic_players:
-        return
-
-    logging.info(f'\nPlayers with an unrecognized event:')
-    for player_record in problematic_players:
-        logging.info(
-            f'    Player: {player_record[0].name}, Events: {player_record[0].events}, Game: {player_record[1]}')
+    Path(f'{base_file_name}.txt').write_text(f'{errors_text}\n', encoding='utf8')
+    Path(f'{base_file_name}.json').write_text(f'{errors_report.to_json()}\n', encoding='utf8')
 
 
 def show_errors_for_maccabi_games(maccabi_games: MaccabiGamesStats) -> None:
-    logging.info(f"Showing errors for: {maccabi_games}:\n")
-    maccabipedia_errors_finder = ErrorsFinder(maccabi_games)
-
-    show_double_league_fixtures(maccabipedia_errors_finder)
-    show_games_with_difference_between_the_score_and_goals_amount(maccabipedia_errors_finder)
-    show_games_with_missing_goals_events(maccabipedia_errors_finder)
-    show_games_with_incorrect_seasons(maccabipedia_errors_finder)
-    show_games_without_11_lineup_players(maccabipedia_errors_finder)
-
-    show_players_that_start_the_game_and_have_sub_in_event(maccabipedia_errors_finder)
-    show_players_with_unknown_events(maccabipedia_errors_finder)
+    logging.info(ErrorsFinder(maccabi_games).create_errors_report().to_text())
 
 
 def show_all_errors() -> None:
@@ -112,15 +45,19 @@ def show_all_errors() -> None:
     maccabipedia_games = load_from_maccabipedia_source().official_games
     logging.info(f'Loaded MaccabiPedia games: {maccabipedia_games}')
 
-    old_games_file_handler = FileHandler(f'{base_log_file_name}_before_1950.txt', encoding='utf8')
-    logging.getLogger().addHandler(old_games_file_handler)
-    show_errors_for_maccabi_games(maccabipedia_games.played_before("1950"))
-    logging.getLogger().removeHandler(old_games_file_handler)
+    # The games facts are computed once (for both of the reports), spread across the cpus
+    maccabipedia_errors_finder = ErrorsFinder(maccabipedia_games, processes=0)
+    games_dates = maccabipedia_games.columns.dates
+
+    old_games_indices = np.flatnonzero(games_dates <= as_datetime64("1950")).tolist()
+    write_errors_report(maccabipedia_errors_finder.create_errors_report(
+        games_indices=old_games_indices, description=str(maccabipedia_games.played_before("1950"))),
+        f'{base_log_file_name}_before_1950')
 
-    new_games_file_handler = FileHandler(f'{base_log_file_name}_after_1950.txt', encoding='utf8')
-    logging.getLogger().addHandler(new_games_file_handler)
-    show_errors_for_maccabi_games(maccabipedia_games.played_after("1951"))
-    logging.getLogger().removeHandler(new_games_file_handler)
+    new_games_indices = np.flatnonzero(games_dates >= as_datetime64("1951")).tolist()
+    write_errors_report(maccabipedia_errors_finder.create_errors_report(
+        games_indices=new_games_indices, description=str(maccabipedia_games.played_after("1951"))),
+        f'{base_log_file_name}_after_1950')
 
     logging.info('\n\nFinished to find errors from MaccabiPedia')
 
@@ -1,7 +1,8 @@
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 from dateutil.parser import parse as datetime_parser
 
@@ -18,15 +19,19 @@ class MaccabiPediaPlayerData(object):
 class MaccabiPediaPlayers(object):
     missing_birth_date_value = datetime_parser("1000")
     _instance = None
+    _instance_lock = threading.Lock()
 
     @classmethod
     def default_birth_day_value(cls, *args, **kwargs):
         return cls.missing_birth_date_value
 
-    def __init__(self):
+    def __init__(self, players_data: Optional[Dict[str, MaccabiPediaPlayerData]] = None):
+        """
+        :param players_data: The players data by their name, crawled from maccabipedia when not given.
+        """
         # Using defaultdict in order for each player that does not have a date of birth in maccabipedia
         # will set to year 1000 (to notice visually in stats)
-        self._players_data = self._crawl_players_data()
+        self._players_data = self._crawl_players_data() if players_data is None else players_data
         self.players_dates = defaultdict(MaccabiPediaPlayers.default_birth_day_value,
                                          {player_name: player_data.birth_date for player_name, player_data in
                                           self._players_data.items()})
@@ -56,8 +61,10 @@ class MaccabiPediaPlayers(object):
 
     @classmethod
     def get_players_data(cls):
-        if cls._instance is None:
-            cls._instance = cls()
+        # The players data may be crawled in another thread, while the games are crawled
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
 
         return cls._instance
 
@@ -1,13 +1,47 @@
 import datetime
 import json
-from typing import List, Optional, Union, Dict
+from typing import List, Optional, Union, Dict, NamedTuple, Tuple, Any
 
 from dateutil.parser import parse as datetime_parser
 from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.models.player_in_game import PlayerInGame
 from maccabistats.models.team_in_game import TeamInGame
 
+# The names maccabi (home team) may have at the games
+MACCABI_TEAM_NAMES = ("מכבי תל אביב", "מכבי תא", 'מכבי ת"א')
+
+
+class GoalInTimeline(NamedTuple):
+    """
+    A goal from the game goals timeline, with the game score as it was AFTER the goal was scored.
+    """
+    minute: int
+    time_occur: datetime.timedelta
+    player: PlayerInGame  # The player that scored the goal (own goals are scored by the other team players)
+    team: TeamInGame  # The team of the player that scored the goal
+    goal_type: GoalTypes
+    for_maccabi: bool  # Whether this goal was counted for maccabi (includes own goals of the opponent)
+    maccabi_score: int
+    not_maccabi_score: int
+
+    @property
+    def is_own_goal(self) -> bool:
+        return self.goal_type is GoalTypes.OWN_GOAL
+
+    def json_dict(self) -> Dict:
+        """
+        This goal as a goal of GameData.goals (a game event dict, with the game score after the goal).
+        """
+        return dict(name=self.player.name, number=self.player.number,
+                    event_type=GameEventTypes.GOAL_SCORE.value, time_occur=str(self.time_occur),
+                    goal_type=self.goal_type.value, team=self.team.name,
+                    maccabi_score=self.maccabi_score, not_maccabi_score=self.not_maccabi_score)
+
 
 class GameData(object):
+    # The goals timeline and the game players events versions it was created from, see goals_timeline
+    _goals_timeline: Optional[Tuple[Tuple[int, ...], Tuple[GoalInTimeline, ...]]] = None
+
     def __init__(self, competition: str, fixture: str, date_as_hebrew_string: str, stadium: str, crowd: str,
                  referee: str, home_team: TeamInGame, away_team: TeamInGame,
                  season_string: str, half_parsed_events: List[Dict], date: Optional[datetime.datetime] = None,
@@ -83,7 +117,7 @@ class GameData(object):
     @property
     def is_maccabi_home_team(self) -> bool:
         # TODO: handle games which are not played on "home\away", radius and so on
-        return self.home_team.name in ["מכבי תל אביב", "מכבי תא", 'מכבי ת"א']
+        return self.home_team.name in MACCABI_TEAM_NAMES
 
     @property
     def maccabi_team(self) -> TeamInGame:
@@ -107,14 +141,14 @@ class GameData(object):
         """
 
         # Maccabi team players events
-        players_events = [dict(player.get_as_normal_player().__dict__,  # Players attributes, normal -> no events.
+        players_events = [dict(name=player.name, number=player.number,  # Players attributes, normal -> no events.
                                **event.json_dict(),
                                team=self.maccabi_team.name)
                           for player in self.maccabi_team.players
                           for event in player.events]
 
         # Not maccabi team players events
-        players_events.extend([dict(player.get_as_normal_player().__dict__,  # Players attributes, normal -> no events.
+        players_events.extend([dict(name=player.name, number=player.number,  # Players attributes, normal -> no events.
                                     **event.json_dict(),
                                     team=self.not_maccabi_team.name)
                                for player in self.not_maccabi_team.players
@@ -124,39 +158,68 @@ class GameData(object):
 
         return sorted_players_events
 
-    def goals(self) -> List[Dict]:
+    @property
+    def goals_timeline(self) -> Tuple[GoalInTimeline, ...]:
         """
-        Return list of game events which their type is goal (ordered by time).
-        Each event contains the results of the game as it was AFTER the goal was scored.
+        The game goals (of both teams) ordered by time, each one with the game score as it was AFTER the goal.
+        Created on the first use, and again only after this game players (or their events) were changed.
         """
+        events_versions = tuple(player.events_version for team in (self.home_team, self.away_team)
+                                for player in team.players)
+        if self._goals_timeline is None or self._goals_timeline[0] != events_versions:
+            self._goals_timeline = (events_versions, self.__create_goals_timeline())
 
-        goals_events = [event for event in self.events if event['event_type'] == GameEventTypes.GOAL_SCORE.value]
-        maccabi_score = not_maccabi_score = 0
+        return self._goals_timeline[1]
+
+    def __create_goals_timeline(self) -> Tuple[GoalInTimeline, ...]:
+        maccabi_team = self.maccabi_team
+        goals_events = sorted(((event, player, team) for team in (maccabi_team, self.not_maccabi_team)
+                               for player in team.players
+                               for event in player.events if event.event_type == GameEventTypes.GOAL_SCORE),
+                              key=lambda goal: goal[0].time_occur)
 
-        for goal in goals_events:
-            if goal['team'] == "מכבי תל אביב":
-                if goal['goal_type'] == GoalTypes.OWN_GOAL.value:
-                    not_maccabi_score += 1
-                else:
-                    maccabi_score += 1
+        goals_timeline = []
+        maccabi_score = not_maccabi_score = 0
+        for event, player, team in goals_events:
+            goal_type = getattr(event, 'goal_type', GoalTypes.UNKNOWN)
+            for_maccabi = (team is maccabi_team) != (goal_type is GoalTypes.OWN_GOAL)
+            if for_maccabi:
+                maccabi_score += 1
             else:
-                if goal['goal_type'] == GoalTypes.OWN_GOAL.value:
-                    maccabi_score += 1
-                else:
-                    not_maccabi_score += 1
+                not_maccabi_score += 1
+
+            goals_timeline.append(GoalInTimeline(minute=int(event.time_occur.total_seconds() // 60),
+                                                 time_occur=event.time_occur, player=player, team=team,
+                                                 goal_type=goal_type, for_maccabi=for_maccabi,
+                                                 maccabi_score=maccabi_score, not_maccabi_score=not_maccabi_score))
 
-            goal['maccabi_score'] = maccabi_score
-            goal['not_maccabi_score'] = not_maccabi_score
+        return tuple(goals_timeline)
+
+    @property
+    def maccabi_goals_timeline(self) -> List[GoalInTimeline]:
+        """
+        The goals that were counted for maccabi (including own goals scored by the opponent), ordered by time.
+        """
+        return [goal for goal in self.goals_timeline if goal.for_maccabi]
 
-        return goals_events
+    def goals(self) -> List[Dict]:
+        """
+        Return list of game events which their type is goal (ordered by time).
+        Each event contains the results of the game as it was AFTER the goal was scored.
+        """
+        return [goal.json_dict() for goal in self.goals_timeline]
 
     def maccabi_goals(self) -> List[Dict]:
         """
         Wrapper for self.goals, returns just maccabi goals (including own goals scored by the opponent)
         """
-        return [goal for goal in self.goals() if
-                (goal['team'] != 'מכבי תל אביב' and goal['goal_type'] == GoalTypes.OWN_GOAL.value) or
-                goal['team'] == 'מכבי תל אביב']
+        return [goal.json_dict() for goal in self.maccabi_goals_timeline]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The goals timeline is derived from the players events
+        state = self.__dict__.copy()
+        state.pop('_goals_timeline', None)
+        return state
 
     def json_dict(self) -> Dict:
         return dict(stadium=self.stadium,
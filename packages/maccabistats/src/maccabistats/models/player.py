@@ -1,9 +1,19 @@
+from typing import Any
+
+from maccabistats.models.slots_state import set_slots_state
+
+
 # TODO: can use dataclass
 class Player(object):
+    __slots__ = ('name', 'number')
+
     def __init__(self, name: str, number: int):
         self.name = name
         self.number = number
 
+    def __setstate__(self, state: Any) -> None:
+        set_slots_state(self, state)
+
     def __eq__(self, other) -> bool:
         return self.name == other.name and self.number == other.number
 
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from datetime import timedelta
 from enum import Enum
-from typing import Dict
+from typing import Any, Dict
+
+from maccabistats.models.slots_state import set_slots_state
 
 
 class AssistTypes(Enum):
@@ -85,6 +87,8 @@ class GameEventTypes(Enum):
 
 
 class GameEvent(object):
+    __slots__ = ('event_type', 'time_occur')
+
     def __init__(self, game_event_type: GameEventTypes, time_occur: timedelta):
         self.event_type = game_event_type
 
@@ -93,6 +97,9 @@ class GameEvent(object):
 
         self.time_occur = time_occur
 
+    def __setstate__(self, state: Any) -> None:
+        set_slots_state(self, state)
+
     def __repr__(self) -> str:
         return "{self.event_type.value} occur at {self.time_occur}".format(self=self)
 
@@ -108,6 +115,8 @@ class GameEvent(object):
 
 
 class GoalGameEvent(GameEvent):
+    __slots__ = ('goal_type',)
+
     def __init__(self, time_occur: timedelta, goal_type: GoalTypes = GoalTypes.UNKNOWN):
         super(GoalGameEvent, self).__init__(GameEventTypes.GOAL_SCORE, time_occur)
         self.goal_type = goal_type
@@ -124,6 +133,8 @@ class GoalGameEvent(GameEvent):
 
 
 class AssistGameEvent(GameEvent):
+    __slots__ = ('assist_type',)
+
     def __init__(self, time_occur: timedelta, assist_type: AssistTypes = AssistTypes.UNKNOWN):
         super(AssistGameEvent, self).__init__(GameEventTypes.GOAL_ASSIST, time_occur)
         self.assist_type = assist_type
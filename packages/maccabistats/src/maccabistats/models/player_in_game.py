@@ -1,40 +1,92 @@
 from __future__ import annotations
 
+import itertools
+from collections import Counter
 from datetime import timedelta
 from pprint import pformat
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Optional, Union
 
 from maccabistats.models.player import Player
 from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalTypes, GoalGameEvent, AssistTypes
 
+# Each change to a player events gets a new (unique) version, see PlayerInGame.events_version
+_events_versions = itertools.count()
+
 
 class PlayerInGame(Player):
+    __slots__ = ('_events', '_events_counts', '_events_version')
+
     def __init__(self, name: str, number: int, game_events: List[GameEvent]):
         super(PlayerInGame, self).__init__(name, number)
 
         self.events = game_events
 
+    @property
+    def events(self) -> List[GameEvent]:
+        return self._events
+
+    @events.setter
+    def events(self, game_events: List[GameEvent]) -> None:
+        self._events = game_events
+        self._events_changed()
+
     def add_event(self, game_event: GameEvent) -> None:
-        self.events.append(game_event)
+        self._events.append(game_event)
+        self._events_changed()
+
+    def set_goal_type(self, goal_event: GoalGameEvent, goal_type: GoalTypes) -> None:
+        """
+        Change the goal type of one of this player goals, use it instead of setting goal_type, to keep the counts right.
+        """
+        goal_event.goal_type = goal_type
+        self._events_changed()
+
+    def _events_changed(self) -> None:
+        self._events_counts = None
+        self._events_version = next(_events_versions)
+
+    @property
+    def events_version(self) -> int:
+        """
+        Changes whenever this player events are changed, and is unique among all the players,
+        so data that is derived from a game players (like its goals timeline) can be cached until they change.
+        """
+        return self._events_version
+
+    @property
+    def events_counts(self) -> Counter[Union[GameEventTypes, GoalTypes, AssistTypes]]:
+        """
+        Counts this player events by their type, goals by their goal type and assists by their assist type as well.
+        Created on the first use, until the next add_event.
+        """
+        if self._events_counts is None:
+            events_counts = Counter()
+            for event in self._events:
+                events_counts[event.event_type] += 1
+
+                # Goals & assists may be created without their type (as a regular GameEvent)
+                event_subtype = getattr(event, 'goal_type', None) or getattr(event, 'assist_type', None)
+                if event_subtype is not None:
+                    events_counts[event_subtype] += 1
+
+            self._events_counts = events_counts
+
+        return self._events_counts
 
     def has_event_type(self, event_type: GameEventTypes) -> bool:
-        # TODO: might use any
-        return event_type in [event.event_type for event in self.events]
+        return self.events_counts[event_type] > 0
 
     def get_events_by_type(self, event_type: GameEventTypes) -> List[GameEvent]:
         return [event for event in self.events if event.event_type == event_type]
 
     def event_count_by_type(self, event_type: GameEventTypes) -> int:
-        # TODO: create temp list with only the required event type and check the len of it ( O(1) )
-        return [event.event_type for event in self.events].count(event_type)
+        return self.events_counts[event_type]
 
     def goals_count_by_goal_type(self, goal_type: GoalTypes) -> int:
-        return [cast(GoalGameEvent, event).goal_type for event in
-                self.get_events_by_type(GameEventTypes.GOAL_SCORE)].count(goal_type)
+        return self.events_counts[goal_type]
 
     def assists_count_by_assist_type(self, assist_type: AssistTypes) -> int:
-        return [cast(AssistTypes, event).assist_type for event in
-                self.get_events_by_type(GameEventTypes.GOAL_ASSIST)].count(assist_type)
+        return self.events_counts[assist_type]
 
     def get_as_normal_player(self) -> Player:
         return Player(self.name, self.number)
@@ -67,6 +119,14 @@ class PlayerInGame(Player):
 
         return min_goal_time >= subs_in_time
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Same as the pickled state before we used __slots__, without the events counts
+        return dict(name=self.name, number=self.number, events=self._events)
+
+    def __setstate__(self, state: Any) -> None:
+        self._events_counts = None
+        super(PlayerInGame, self).__setstate__(state)  # Sets the events, and so a new events version
+
     def get_event_by_similar_event(self, event_to_find: GameEvent) -> Optional[GameEvent]:
         """  Return events that equals to the given event.
         :type event_to_find: GameEvent
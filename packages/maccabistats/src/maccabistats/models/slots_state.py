@@ -0,0 +1,14 @@
+from typing import Any
+
+
+def set_slots_state(obj: object, state: Any) -> None:
+    """
+    Loads the pickled state of an object with __slots__ (players & events),
+    old pickles (before we used __slots__) contain the attributes dict, new ones contain (None, slots attributes).
+    """
+    if isinstance(state, tuple):
+        dict_state, slots_state = state
+        state = {**(dict_state or {}), **(slots_state or {})}
+
+    for name, value in state.items():
+        setattr(obj, name, value)
@@ -236,4 +236,5 @@ def run_general_fixes(maccabi_games_stats):
 
     add_manual_games(maccabi_games_stats)
 
-    return maccabi_games_stats
+    # The manual games were appended to the games list, so create a new (sorted) stats object for all the games
+    return maccabi_games_stats.create_maccabi_stats_from_games(maccabi_games_stats.games)
@@ -54,6 +54,14 @@ _wrong_games_to_remove = [datetime_parser(game_date) for game_date in
                            ]]
 
 
+def __games_dates_changed(maccabi_games_stats):
+    """
+    The games are sorted by their dates and their columns keep the dates,
+    setting the games sorts them again and drops the columns (so the next lookups use the new dates).
+    """
+    maccabi_games_stats.games = maccabi_games_stats.games
+
+
 def __remove_games(maccabi_games_stats):
     before_len = len(maccabi_games_stats.games)
     maccabi_games_stats.games = [game for game in maccabi_games_stats.games if game.date not in _wrong_games_to_remove]
@@ -74,38 +82,43 @@ def __fix_games_date(maccabi_games_stats):
 
         game_to_be_changed = matching_games[0]
         game_to_be_changed.date = datetime_parser(game_dates[1])
+        __games_dates_changed(maccabi_games_stats)
         logger.info(f"Changed game date from {game_dates[0]} -> {game_dates[1]}.")
 
 
 def __fix_basel_three_three(games):
     against_basel_tie_three = games.played_at("2013-08-06")
     against_basel_tie_three = against_basel_tie_three[0]
-    if against_basel_tie_three.not_maccabi_team.scored_players[0].events[2].goal_type is not GoalTypes.OWN_GOAL:
-        against_basel_tie_three.not_maccabi_team.scored_players[0].events[2].goal_type = GoalTypes.OWN_GOAL
+    scorer = against_basel_tie_three.not_maccabi_team.scored_players[0]
+    if scorer.events[2].goal_type is not GoalTypes.OWN_GOAL:
+        scorer.set_goal_type(scorer.events[2], GoalTypes.OWN_GOAL)
         logger.info("Fixed פביאן שאר goal to be own goal at min 34.")
 
 
 def __fix_haifa_three_one(games):
     against_haifa_three_one_win = games.played_at("2014-10-20")
     against_haifa_three_one_win = against_haifa_three_one_win[0]
-    if against_haifa_three_one_win.not_maccabi_team.scored_players[0].events[1].goal_type is not GoalTypes.OWN_GOAL:
-        against_haifa_three_one_win.not_maccabi_team.scored_players[0].events[1].goal_type = GoalTypes.OWN_GOAL
+    scorer = against_haifa_three_one_win.not_maccabi_team.scored_players[0]
+    if scorer.events[1].goal_type is not GoalTypes.OWN_GOAL:
+        scorer.set_goal_type(scorer.events[1], GoalTypes.OWN_GOAL)
         logger.info("Fixed טאלב טאווטחה goal to be own goal at min 52.")
 
 
 def __fix_hibernians_five_one(games):
     against_hibernians_five_one_win = games.played_at("2015-07-21")
     against_hibernians_five_one_win = against_hibernians_five_one_win[0]
-    if against_hibernians_five_one_win.not_maccabi_team.scored_players[1].events[1].goal_type is not GoalTypes.OWN_GOAL:
-        against_hibernians_five_one_win.not_maccabi_team.scored_players[1].events[1].goal_type = GoalTypes.OWN_GOAL
+    scorer = against_hibernians_five_one_win.not_maccabi_team.scored_players[1]
+    if scorer.events[1].goal_type is not GoalTypes.OWN_GOAL:
+        scorer.set_goal_type(scorer.events[1], GoalTypes.OWN_GOAL)
         logger.info("Fixed ג'ורג' פריירה goal to be own goal at min 52.")
 
 
 def __fix_akko_two_zero(games):
     against_akko_two_zero_win = games.played_at("2012-10-20")
     against_akko_two_zero_win = against_akko_two_zero_win[0]
-    if against_akko_two_zero_win.not_maccabi_team.scored_players[0].events[1].goal_type is not GoalTypes.OWN_GOAL:
-        against_akko_two_zero_win.not_maccabi_team.scored_players[0].events[1].goal_type = GoalTypes.OWN_GOAL
+    scorer = against_akko_two_zero_win.not_maccabi_team.scored_players[0]
+    if scorer.events[1].goal_type is not GoalTypes.OWN_GOAL:
+        scorer.set_goal_type(scorer.events[1], GoalTypes.OWN_GOAL)
         logger.info("Fixed אימורו לוקמן goal to be own goal at min 52.")
 
 
@@ -151,6 +164,7 @@ def __fix_hapoel_haifa_four_two_date_99_00(games):
     against_hapoel_haifa = against_hapoel_haifa[0]
     against_hapoel_haifa.not_maccabi_team.name = "הפועל חיפה"
     against_hapoel_haifa.date = datetime(year=2000, month=1, day=3)
+    __games_dates_changed(games)
     logger.info("Changed the game at data: 2000-03-01 to be at date: 2000-01-03 and replaced the opponent name from הפועל חיפה to מכבי חיפה")
 
 
@@ -188,7 +202,7 @@ def __fix_half_parsed_goal_events(game):
         return
 
     total_score = game.maccabi_team.score + game.not_maccabi_team.score
-    total_goal_events = len(game.goals())
+    total_goal_events = len(game.goals_timeline)
 
     if total_score != total_goal_events:
         logger.info("Found game (date-{date}) with "
@@ -281,6 +295,9 @@ def fix_specific_games(games):
     except IndexError:
         logger.warning('Probably found no specific games to fix (it might cause because you run with MaccabiGamesStats without these games, Continue')
 
+    # The kfar saba games dates were changed (after their games were looked up)
+    __games_dates_changed(games)
+
     # Fix dates & name:
     __fix_hapoel_haifa_four_two_date_99_00(games)
 
@@ -300,4 +317,5 @@ def fix_specific_games(games):
         except LookupError:
             logger.exception("Error while parsing goals half parsed events.")
 
-    return games
+    # The fixes changed the games in place (dates, scores, events), so create a new (sorted) stats object for them
+    return games.create_maccabi_stats_from_games(games.games)
@@ -4,12 +4,19 @@ from collections import defaultdict
 from datetime import timedelta
 import logging
 
+from lxml import etree
+
 from maccabistats.parse.name_normalization import normalize_name
 from maccabistats.models.player_game_events import GameEventTypes, GoalGameEvent, GameEvent, GoalTypes
+from maccabistats.parse.maccabi_tlv_site.html_elements import classes, first, has_classes, text
 
 logger = logging.getLogger(__name__)
 fully_game_time_without_penalties = timedelta(minutes=120)
 
+_EVENTS = etree.XPath(f".//article//div[{has_classes('play-by-play-homepage')}]//ul[{has_classes('play-by-play')}]//li")
+_EVENT_MINUTE = etree.XPath(f".//div[{has_classes('min')}]")
+_EVENT_TEXT = etree.XPath(".//p")
+
 
 class CantFindEventException(Exception):
     pass
@@ -40,10 +47,10 @@ class MaccabiSiteGameEventsParser(object):
     others might be bug in maccabi site.
     """
 
-    def __init__(self, maccabi_team, not_maccabi_team, bs_content, game_link):
+    def __init__(self, maccabi_team, not_maccabi_team, events_page, game_link):
         """
         There are 3 divs for each team ordered as: lineup_players, bench_players, coach.
-        :type bs_content: bs4.element.Tag
+        :type events_page: lxml.html.HtmlElement
         :type maccabi_team: maccabistats.models.team_in_game.TeamInGame
         :type not_maccabi_team: maccabistats.models.team_in_game.TeamInGame
         :param game_link: the maccabi-tlv game link, for debugging.
@@ -52,14 +59,14 @@ class MaccabiSiteGameEventsParser(object):
 
         logger.info("Parsing maccabi-{opponent}".format(opponent=not_maccabi_team.name))
 
-        self.bs_content = bs_content
+        self.events_page = events_page
         self.maccabi_team = maccabi_team
         self.not_maccabi_team = not_maccabi_team
         self.game_link = game_link
         # We will save all the parsed events without matching events in squads page, to allow manipulate this data later.
         self.halfed_parsed_events = []
 
-        self.events_bs_content_list = self.bs_content.select("article div.play-by-play-homepage ul.play-by-play li")
+        self.events_elements = _EVENTS(self.events_page)
 
         # TODO - this should be oneliner
         self.event_type_to_handler_function = defaultdict(self.__handle_unknown_event)
@@ -77,21 +84,21 @@ class MaccabiSiteGameEventsParser(object):
         :rtype: TeamInGame, TeamInGame
         """
 
-        for event_id, event_bs_content in enumerate(self.events_bs_content_list):
-            event_time_in_minute = timedelta(minutes=int(event_bs_content.select_one("div.min").get_text()))
-            event_type = event_bs_content['class'][0]
-            event_text = event_bs_content.select_one("p").get_text().strip()
+        for event_id, event_element in enumerate(self.events_elements):
+            event_time_in_minute = timedelta(minutes=int(text(first(_EVENT_MINUTE, event_element))))
+            event_type = classes(event_element)[0]
+            event_text = text(first(_EVENT_TEXT, event_element)).strip()
 
             if fully_game_time_without_penalties <= event_time_in_minute:
                 logger.info("Ignoring event in minute {min}".format(min=event_time_in_minute.seconds / 60.0))
                 continue
             try:
                 # should be like - defaultdict seems to call the default function when just trying to access the key:
-                # self.event_type_to_handler_function[event_type](event_bs_content, event_text, event_time_in_minute)
+                # self.event_type_to_handler_function[event_type](event_type, event_text, event_time_in_minute)
                 if event_type in self.event_type_to_handler_function:
                     self.event_type_to_handler_function[event_type](event_text, event_time_in_minute)
                 else:
-                    self.__handle_unknown_event(event_bs_content, event_text, event_time_in_minute)
+                    self.__handle_unknown_event(event_type, event_text, event_time_in_minute)
             except ComplicatedEventException as e:
                 logger.info("ComplicatedEventException : {details}".format(details=str(e)))
             except CantFindEventException:
@@ -134,16 +141,16 @@ class MaccabiSiteGameEventsParser(object):
         :type player_name:str
         :param event: the event to look for similar event on player events.
         :type event: maccabistats.models.player_game_events.GameEvent
-        :return: PlayerInGame
+        :return: PlayerInGame, and his event that is similar to the given event
         """
 
         player_name = normalize_name(player_name)
         if len(player_name) > 20:
             raise ComplicatedEventException(player_name)
 
-        players_events = [player.get_event_by_similar_event(event) for player in self.maccabi_team.players if player.name == player_name]
-        players_events.extend([player.get_event_by_similar_event(event) for player in self.not_maccabi_team.players if player.name == player_name])
-        players_events = list(filter(lambda e: e is not None, players_events))
+        players_events = [(player, player.get_event_by_similar_event(event)) for player in self.maccabi_team.players if player.name == player_name]
+        players_events.extend([(player, player.get_event_by_similar_event(event)) for player in self.not_maccabi_team.players if player.name == player_name])
+        players_events = list(filter(lambda player_and_event: player_and_event[1] is not None, players_events))
 
         if len(players_events) > 1:
             logger.warning("Found more than 1 matching player events:{player_name}, event:{event}".format(player_name=player_name, event=event))
@@ -254,11 +261,11 @@ class MaccabiSiteGameEventsParser(object):
         player_name, goal_event = MaccabiSiteGameEventsParser.__extract_goal_details(event_text, event_time_in_minute)
 
         try:
-            player_event = self.__get_one_player_by_event_details(player_name, goal_event)
+            player, player_event = self.__get_one_player_by_event_details(player_name, goal_event)
 
             # Add goal type:
             if goal_event.goal_type is not GoalTypes.UNKNOWN:
-                player_event.goal_type = goal_event.goal_type
+                player.set_goal_type(player_event, goal_event.goal_type)
                 logger.info(
                     "Changed goal type to {goal_type} for player: {player}".format(goal_type=goal_event.goal_type,
                                                                                    player=player_name))
@@ -271,7 +278,8 @@ class MaccabiSiteGameEventsParser(object):
                 logger.info("Added goal event for player: {player}".format(player=player.name))
             except FoundNoMatchingPlayersByNameException:
                 logger.info("Adding event to half parsed event:{event}, for name:{name}".format(event=goal_event, name=player_name))
-                self.halfed_parsed_events.append(dict(name=player_name, **goal_event.__dict__))
+                self.halfed_parsed_events.append(dict(name=player_name, event_type=goal_event.event_type,
+                                                     time_occur=goal_event.time_occur, goal_type=goal_event.goal_type))
 
     def __handle_yellow_card_event(self, event_text, event_time_in_minute):
         player_name = event_text.replace("כרטיס צהוב ל", "").strip()
@@ -306,8 +314,7 @@ class MaccabiSiteGameEventsParser(object):
         logger.info("Added assist event for player: {player}".format(player=player_name))
 
     @staticmethod
-    def __handle_unknown_event(event_bs_content, event_text, event_time_in_minute):
-        event_type = event_bs_content['class'][0]
+    def __handle_unknown_event(event_type, event_text, event_time_in_minute):
         logger.info("Unknown event type :{event_type} in minute :{minute}\n"
                     "With event text :{event_text}".format(event_type=event_type,
                                                            minute=event_time_in_minute, event_text=event_text))
@@ -1,149 +1,64 @@
 # -*- coding: utf-8 -*-
 import logging
-import os
-
-import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import Optional, Tuple
 
 from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.parse.maccabi_tlv_site.html_elements import parse_html
+from maccabistats.parse.maccabi_tlv_site.http_cache import crawling_max_age, get_maccabi_site_http_cache
+from maccabistats.parse.maccabi_tlv_site.match_status import is_match_finished
 
 logger = logging.getLogger(__name__)
 
-# maccabi-tlv.co.il intermittently returns 500 for valid pages (CI run 24640051609),
-# so retry transient errors instead of aborting the whole season crawl.
-_session = requests.Session()
-_session.mount("https://", HTTPAdapter(max_retries=Retry(
-    total=4, backoff_factor=2, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",))))
-
-
-def _get(url):
-    response = _session.get(url, timeout=30)
-    response.raise_for_status()
-    return response.content
-
-
-folder_to_save_games_events_html_files_pattern = os.path.join(
-    MaccabiStatsConfigSingleton.maccabi_site.folder_to_save_games_html_files, "game+{game_date}+events")
 
-folder_to_save_games_squads_html_files_pattern = os.path.join(
-    MaccabiStatsConfigSingleton.maccabi_site.folder_to_save_games_html_files, "game+{game_date}+squads")
-
-
-def __get_beautifulsoup_parser_name():
-    if MaccabiStatsConfigSingleton.maccabi_site.use_lxml_parser:
-        logger.info("Using lxml parser for beautifulsoup")
-        return "lxml"
-    else:
-        logger.info("Using html.parser for beautifulsoup")
-        return "html.parser"
+def get_game_squads_link(link):
+    return link + "teams"
 
 
 def save_game_web_page_to_disk(web_page):
     """
+    Downloads the game events & squads pages to the http cache.
     :type web_page: str
     """
 
-    game_events_web_page_content = requests.get(web_page).content
-    game_squads_web_page_content = requests.get(web_page + "teams").content
-
-    game_date = __extract_games_date(web_page)
-    with open(folder_to_save_games_events_html_files_pattern.format(game_date=game_date),
-              'wb') as maccabi_game_event_file:
-        maccabi_game_event_file.write(game_events_web_page_content)
-    with open(folder_to_save_games_squads_html_files_pattern.format(game_date=game_date),
-              'wb') as maccabi_game_squad_file:
-        maccabi_game_squad_file.write(game_squads_web_page_content)
-
-
-def __extract_games_date(link):
-    web_page = link.strip("/")  # Remove / at the end if exists for rsplit.
-    game_date = web_page.rsplit("/")[-1]
-    return game_date
-
-
-# GameEvents #
-
-def __get_game_events_bs_from_disk(link):
-    game_date = __extract_games_date(link)
-
-    with open(folder_to_save_games_events_html_files_pattern.format(game_date=game_date), 'rb') as game_events_file:
-        return BeautifulSoup(game_events_file.read(), __get_beautifulsoup_parser_name())
-
-
-def __does_game_events_bs_exists_on_disk(link):
-    game_date = __extract_games_date(link)
-
-    return os.path.isfile(folder_to_save_games_events_html_files_pattern.format(game_date=game_date))
-
-
-def __get_game_events_bs_from_internet(link):
-    return _get(link)
+    http_cache = get_maccabi_site_http_cache()
+    http_cache.get(web_page, max_age=0)
+    http_cache.get(get_game_squads_link(web_page), max_age=0)
 
 
-def __download_game_events_page(link):
-    game_events_web_page_content = __get_game_events_bs_from_internet(link)
-    __save_game_events_bs_to_disk(link, game_events_web_page_content)
-    return __get_game_events_bs_from_disk(link)
-
-
-def __save_game_events_bs_to_disk(link, content):
-    game_date = __extract_games_date(link)
-
-    with open(folder_to_save_games_events_html_files_pattern.format(game_date=game_date),
-              'wb') as maccabi_game_event_file:
-        maccabi_game_event_file.write(content)
+def fetch_game_pages(link):
+    """
+    Brings the game events & squads pages to the http cache, so they can be parsed (by any process) from the disk.
+    The site uses the same page before, during and after the game, so a page is kept forever only once it is final
+    (see mark_game_pages_final), until then the events page is kept by the games pages max age and the squads page is
+    revalidated. The squads page of a game that has not finished yet (by its events page) is not fetched at all.
+    :type link: str
+    """
 
+    http_cache = get_maccabi_site_http_cache()
+    games_pages_max_age = crawling_max_age(MaccabiStatsConfigSingleton.maccabi_site.games_pages_cache_max_age)
+    events_page_content = http_cache.get(link, games_pages_max_age)
 
-def get_game_events_bs_by_link(link):
-    if MaccabiStatsConfigSingleton.maccabi_site.use_disk_as_cache_when_crawling:
-        if __does_game_events_bs_exists_on_disk(link):
-            return __get_game_events_bs_from_disk(link)
-        else:
-            return __download_game_events_page(link)
+    squads_link = get_game_squads_link(link)
+    if http_cache.is_final(squads_link):
+        http_cache.get(squads_link, games_pages_max_age)
+    elif is_match_finished(parse_html(events_page_content)):
+        http_cache.get(squads_link, max_age=0)
     else:
-        return __download_game_events_page(link)
-
-
-# GameSquads #
-
-def __get_game_squads_bs_from_disk(link):
-    game_date = __extract_games_date(link)
-
-    with open(folder_to_save_games_squads_html_files_pattern.format(game_date=game_date), 'rb') as game_squads_file:
-        return BeautifulSoup(game_squads_file.read(), __get_beautifulsoup_parser_name())
-
+        logger.debug(f"The game at {link} has not finished yet, not fetching its squads page")
 
-def __does_game_squads_bs_exists_on_disk(link):
-    game_date = __extract_games_date(link)
 
-    return os.path.isfile(folder_to_save_games_squads_html_files_pattern.format(game_date=game_date))
-
-
-def __get_game_squads_bs_from_internet(link):
-    return _get(link + "teams")
-
-
-def __download_game_squads_page(link):
-    game_squads_web_page_content = __get_game_squads_bs_from_internet(link)
-    __save_game_squads_bs_to_disk(link, game_squads_web_page_content)
-    return __get_game_squads_bs_from_disk(link)
-
-
-def __save_game_squads_bs_to_disk(link, content):
-    game_date = __extract_games_date(link)
+def get_game_pages(link) -> Tuple[bytes, Optional[bytes]]:
+    """
+    :return: The game events & squads pages, as fetched by fetch_game_pages (from the disk, without revalidating),
+             the squads page is None if it was not fetched (the game has not finished yet).
+    """
 
-    with open(folder_to_save_games_squads_html_files_pattern.format(game_date=game_date),
-              'wb') as maccabi_game_squad_file:
-        maccabi_game_squad_file.write(content)
+    http_cache = get_maccabi_site_http_cache()
+    return http_cache.get(link, max_age=None), http_cache.get_cached(get_game_squads_link(link))
 
 
-def get_game_squads_bs_by_link(link):
-    if MaccabiStatsConfigSingleton.maccabi_site.use_disk_as_cache_when_crawling:
-        if __does_game_squads_bs_exists_on_disk(link):
-            return __get_game_squads_bs_from_disk(link)
-        else:
-            return __download_game_squads_page(link)
-    else:
-        return __download_game_squads_page(link)
+def mark_game_pages_final(link):
+    """ The game has finished, its pages won't change anymore. """
+    http_cache = get_maccabi_site_http_cache()
+    http_cache.mark_final(link)
+    http_cache.mark_final(get_game_squads_link(link))
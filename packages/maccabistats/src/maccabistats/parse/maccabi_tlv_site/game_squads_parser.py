@@ -3,104 +3,144 @@
 
 from maccabistats.models.game_data import GameData
 from maccabistats.parse.maccabi_tlv_site.team_parser import MaccabiSiteTeamParser
-from maccabistats.parse.maccabi_tlv_site.game_pages_provider import get_game_squads_bs_by_link, \
-    get_game_events_bs_by_link
 from maccabistats.parse.maccabi_tlv_site.game_events_parser import MaccabiSiteGameEventsParser
+from maccabistats.parse.maccabi_tlv_site.html_elements import classes, first, has_classes, parse_html, text
 from maccabistats.parse.maccabi_tlv_site.match_status import MatchNotFinishedError, is_match_finished
 import logging
+from typing import NamedTuple
 from urllib.parse import unquote
 from maccabistats.parse.name_normalization import normalize_name
 
+from lxml import etree
+
 logger = logging.getLogger(__name__)
 
+# The season page game article
+_COMPETITION = etree.XPath(f".//div[{has_classes('league-title')}]")
+_FIXTURE = etree.XPath(f".//div[{has_classes('round')}]")
+_LOCATION_DATE = etree.XPath(f".//div[{has_classes('location')}]//span")
+_LOCATION_HOUR_AND_STADIUM = etree.XPath(f".//div[{has_classes('location')}]//div")
+_MACCABI_SCORE = etree.XPath(f".//span[{has_classes('ss', 'maccabi', 'h')}]")
+_SCORES = etree.XPath(f".//span[{has_classes('ss', 'h')}]")
+_NOT_MACCABI_TEAM_NAME = etree.XPath(f".//div[{has_classes('holder', 'notmaccabi', 'nn')}]")
+_MACCABI_HOME_RESULT = etree.XPath(f".//div[{has_classes('matchresult', 'Home')}]")
+_GAME_LINK = etree.XPath(".//a[@href]")
+# The game squads page
+_TEAMS_DIVS = etree.XPath(f".//article//div[{has_classes('teams')}]//div[{has_classes('p50')}]")
+_REFEREE = etree.XPath(f".//div[{has_classes('info')}]//div[{has_classes('referee')}]")
+_CROWD = etree.XPath(f".//div[{has_classes('info')}]//div[{has_classes('viewers')}]")
+
+
+class GameRecord(NamedTuple):
+    """ The details of a game from its season page article, small (and picklable) unlike the article element. """
+    date: str
+    competition: str
+    fixture: str
+    stadium: str
+    maccabi_score: int
+    not_maccabi_score: int
+    not_maccabi_team_name: str
+    is_maccabi_home_team: bool
+    link: str  # The game events page, its squads page is this link + "teams"
+
 
 class MaccabiSiteGameSquadsParser(object):
 
     @staticmethod
-    def parse_game(bs_content, season_string):
+    def parse_game_record(game_element):
+        """
+        :param game_element: the game article at the season page.
+        :type game_element: lxml.html.HtmlElement
+        :rtype: GameRecord
+        """
+
+        # Looking for <span class="ss h"> for not maccabi score
+        not_maccabi_final_score = int([text(span) for span in _SCORES(game_element)
+                                       if 'maccabi' not in classes(span)][0])
+
+        return GameRecord(
+            date=MaccabiSiteGameSquadsParser.__get_full_date(game_element),
+            competition=text(first(_COMPETITION, game_element)),
+            fixture=MaccabiSiteGameSquadsParser.__get_fixture_if_exists(game_element),
+            stadium=text(first(_LOCATION_HOUR_AND_STADIUM, game_element)).split(" ", 1)[1],
+            maccabi_score=int(text(first(_MACCABI_SCORE, game_element))),
+            not_maccabi_score=not_maccabi_final_score,
+            not_maccabi_team_name=normalize_name(text(first(_NOT_MACCABI_TEAM_NAME, game_element))),
+            is_maccabi_home_team=first(_MACCABI_HOME_RESULT, game_element) is not None,
+            link=unquote(first(_GAME_LINK, game_element).get("href")))
+
+    @staticmethod
+    def parse_game(game_record, season_string, events_page_content, squads_page_content):
         """
-        Gets an html content which relevant to maccabi game and return GameData object, uses bs4.BeautifulSoup.
+        Gets the game record (from its season page) and the game pages and return GameData object, uses lxml.
 
-        :param bs_content: the part of the html, like soup.find("article"), where soup is BeautifulSoup object.
-        :type bs_content: bs4.element.Tag
+        :type game_record: GameRecord
         :param season_string: season description, such as : 2000-2001 or 2000-01
         :type season_string: str
+        :param events_page_content: the game events page (the game link).
+        :type events_page_content: bytes
+        :param squads_page_content: the game squads page (the game link + teams), may be None for a game that has not
+                                    finished yet (it is not used).
+        :type squads_page_content: bytes
         :return: GameData
         """
 
-        date = MaccabiSiteGameSquadsParser.__get_full_date(bs_content)
-        logger.info("Parsing game at date - {date}".format(date=date))
-
-        competition = bs_content.find("div", "league-title").get_text()
-        fixture = MaccabiSiteGameSquadsParser.__get_fixture_if_exists(bs_content)
-
-        stadium = bs_content.select_one("div.location div").get_text().split(" ", 1)[1]
-
-        maccabi_final_score = int(bs_content.select_one("span.ss.maccabi.h").get_text())
-        # Looking for <span class="ss h"> for not maccabi score
-        not_maccabi_final_score = int([span.get_text() for span in bs_content.select("span.ss.h")
-                                       if 'maccabi' not in span.attrs['class']][0])
-
+        logger.info("Parsing game at date - {date}".format(date=game_record.date))
         maccabi_team_name = "מכבי תל אביב"
-        not_maccabi_team_name = normalize_name(bs_content.select_one("div.holder.notmaccabi.nn").get_text())
-
-        is_maccabi_home_team = bs_content.select_one("div.matchresult.Home") is not None
-
-        game_content_web_page = unquote(bs_content.find("a", href=True).get("href"))
 
-        events_bs_page_content = get_game_events_bs_by_link(game_content_web_page)
-        if not is_match_finished(events_bs_page_content):
+        events_page = parse_html(events_page_content)
+        if not is_match_finished(events_page):
             raise MatchNotFinishedError(
-                f"Match at {date} ({game_content_web_page}) has not finished yet")
+                f"Match at {game_record.date} ({game_record.link}) has not finished yet")
 
-        squads_bs_page_content = get_game_squads_bs_by_link(game_content_web_page)
+        squads_page = parse_html(squads_page_content)
 
-        maccabi_team, not_maccabi_team = MaccabiSiteGameSquadsParser.__get_teams(squads_bs_page_content,
+        maccabi_team, not_maccabi_team = MaccabiSiteGameSquadsParser.__get_teams(squads_page,
                                                                                  maccabi_team_name,
-                                                                                 not_maccabi_team_name,
-                                                                                 maccabi_final_score,
-                                                                                 not_maccabi_final_score)
+                                                                                 game_record.not_maccabi_team_name,
+                                                                                 game_record.maccabi_score,
+                                                                                 game_record.not_maccabi_score)
 
-        game_events_parser = MaccabiSiteGameEventsParser(maccabi_team, not_maccabi_team, events_bs_page_content, game_content_web_page)
+        game_events_parser = MaccabiSiteGameEventsParser(maccabi_team, not_maccabi_team, events_page, game_record.link)
         maccabi_team, not_maccabi_team = game_events_parser.enrich_teams_with_events()
         halfed_parsed_events = game_events_parser.halfed_parsed_events
 
-        referee = normalize_name(MaccabiSiteGameSquadsParser.__get_referee(squads_bs_page_content))
-        crowd = MaccabiSiteGameSquadsParser.__get_crowd(squads_bs_page_content)
+        referee = normalize_name(MaccabiSiteGameSquadsParser.__get_referee(squads_page))
+        crowd = MaccabiSiteGameSquadsParser.__get_crowd(squads_page)
 
-        home_team, away_team = (maccabi_team, not_maccabi_team) if is_maccabi_home_team else (
+        home_team, away_team = (maccabi_team, not_maccabi_team) if game_record.is_maccabi_home_team else (
             not_maccabi_team, maccabi_team)
 
-        return GameData(competition, fixture, date, stadium, crowd, referee, home_team, away_team, season_string,
-                        halfed_parsed_events)
+        return GameData(game_record.competition, game_record.fixture, game_record.date, game_record.stadium, crowd,
+                        referee, home_team, away_team, season_string, halfed_parsed_events)
 
     @staticmethod
-    def __get_fixture_if_exists(bs_content):
+    def __get_fixture_if_exists(game_element):
         """
-        :type bs_content: bs4.element.Tag
+        :type game_element: lxml.html.HtmlElement
         :return: str
         """
 
-        fixture_div = bs_content.find("div", "round")
-        if fixture_div:
-            return fixture_div.get_text()
+        fixture_div = first(_FIXTURE, game_element)
+        if fixture_div is not None:
+            return text(fixture_div)
         else:  # TODO - think about logging errors here
             return "No round found"
 
     @staticmethod
-    def __get_full_date(bs_content):
+    def __get_full_date(game_element):
         """
-        :type bs_content: bs4.element.Tag
+        :type game_element: lxml.html.HtmlElement
         :return: str
         """
-        date_without_hour = bs_content.select_one("div.location span").get_text()
-        date_hour = bs_content.select_one("div.location div").get_text().split(" ", 1)[0]
+        date_without_hour = text(first(_LOCATION_DATE, game_element))
+        date_hour = text(first(_LOCATION_HOUR_AND_STADIUM, game_element)).split(" ", 1)[0]
         return " ".join([date_without_hour, date_hour])
 
     @staticmethod
-    def __get_teams(bs_content, maccabi_team_name, not_maccabi_team_name, maccabi_score, not_maccabi_score):
+    def __get_teams(squads_page, maccabi_team_name, not_maccabi_team_name, maccabi_score, not_maccabi_score):
         """
-        :type bs_content: bs4.element.Tag
+        :type squads_page: lxml.html.HtmlElement
         :type maccabi_team_name: str
         :type not_maccabi_team_name: str
         :type maccabi_score: int
@@ -109,37 +149,37 @@ class MaccabiSiteGameSquadsParser(object):
         :rtype: MaccabiSiteTeamInGame, MaccabiSiteTeamInGame
         """
 
-        maccabi_team_in_game = MaccabiSiteTeamParser.parse_team(bs_content.select("article div.teams div.p50.yellow"),
-                                                                maccabi_team_name, maccabi_score)
+        teams_divs = _TEAMS_DIVS(squads_page)
+        maccabi_team_in_game = MaccabiSiteTeamParser.parse_team(
+            [div for div in teams_divs if "yellow" in classes(div)], maccabi_team_name, maccabi_score)
 
         not_maccabi_team_in_game = MaccabiSiteTeamParser.parse_team(
-            [div for div in bs_content.select("article div.teams div.p50") if "yellow" not in div["class"]],
-            not_maccabi_team_name, not_maccabi_score)
+            [div for div in teams_divs if "yellow" not in classes(div)], not_maccabi_team_name, not_maccabi_score)
 
         return maccabi_team_in_game, not_maccabi_team_in_game
 
     @staticmethod
-    def __get_referee(bs_content):
+    def __get_referee(squads_page):
         """"
-        :type bs_content: bs4.element.Tag
+        :type squads_page: lxml.html.HtmlElement
         :rtype: str.
         """
 
-        referee_div_bs = bs_content.select_one("div.info div.referee")
-        if referee_div_bs:
-            return referee_div_bs.get_text().strip("שופט:").strip()
+        referee_div = first(_REFEREE, squads_page)
+        if referee_div is not None:
+            return text(referee_div).strip("שופט:").strip()
         else:
             return "Cant found referee"
 
     @staticmethod
-    def __get_crowd(bs_content):
+    def __get_crowd(squads_page):
         """"
-        :type bs_content: bs4.element.Tag
+        :type squads_page: lxml.html.HtmlElement
         :rtype: str.
         """
 
-        crowd_div_bs = bs_content.select_one("div.info div.viewers")
-        if crowd_div_bs:
-            return crowd_div_bs.get_text().strip("צופים:").strip()
+        crowd_div = first(_CROWD, squads_page)
+        if crowd_div is not None:
+            return text(crowd_div).strip("צופים:").strip()
         else:
             return "Cant found crowd"
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+lxml helpers for the maccabi-tlv site pages. The pages selectors are compiled (as XPath) once per process, at the
+parsers modules, instead of building a BeautifulSoup tree and matching css selectors on every page.
+"""
+from typing import List, Optional
+
+from lxml import etree, html
+
+# The site pages are utf-8, we don't let libxml guess it
+_HTML_PARSER = html.HTMLParser(encoding='utf-8')
+
+
+def parse_html(content: bytes) -> html.HtmlElement:
+    return html.document_fromstring(content, parser=_HTML_PARSER)
+
+
+def has_classes(*css_classes: str) -> str:
+    """ The XPath condition of an element that has all of the given css classes (as the css selector: div.a.b). """
+    return ' and '.join(f"contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')"
+                        for css_class in css_classes)
+
+
+def first(selector: etree.XPath, element: html.HtmlElement) -> Optional[html.HtmlElement]:
+    """ The first element (by the document order) the selector found, like bs4 select_one. """
+    elements = selector(element)
+    return elements[0] if elements else None
+
+
+def classes(element: html.HtmlElement) -> List[str]:
+    return (element.get('class') or '').split()
+
+
+def text(element: html.HtmlElement) -> str:
+    """ All of the element texts, like bs4 get_text. """
+    return element.text_content()
+
+
+def direct_text(element: html.HtmlElement) -> Optional[str]:
+    """ The first text that is a direct child of the element, like bs4 find(text=True, recursive=False). """
+    return next((child_text for child_text in [element.text] + [child.tail for child in element] if child_text), None)
+
+
+def children_count(element: html.HtmlElement) -> int:
+    """ The count of the element children, texts included, like len of a bs4 Tag. """
+    return bool(element.text) + sum(1 + bool(child.tail) for child in element)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from maccabistats.config import MaccabiStatsConfigSingleton
+
+logger = logging.getLogger(__name__)
+
+CacheEntry = Dict[str, Any]  # url, body (hash), etag, last_modified, fetched_at, final
+
+
+def _create_session() -> requests.Session:
+    # maccabi-tlv.co.il intermittently returns 500 for valid pages (CI run 24640051609),
+    # so retry transient errors instead of aborting the whole season crawl.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=Retry(
+        total=4, backoff_factor=2, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",))))
+    return session
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """ The crawling processes share the cache folder, so a file is either missing or complete. """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temp_file:
+        temp_file.write(content)
+    os.replace(temp_file.name, path)
+
+
+class MaccabiSiteHttpCache(object):
+    """
+    Disk cache of the maccabi-tlv.co.il pages, shared by the seasons & games pages crawling (and the calendar).
+
+    The bodies are kept gzipped by their content hash (a page that did not change is kept once), each url has an entry
+    with its body hash and validators (ETag / Last-Modified). An entry older than the requested max age is revalidated
+    with a conditional request, so only the pages that changed are downloaded again. A final entry (such as a finished
+    game page) is never revalidated, unless max_age is 0.
+    """
+
+    def __init__(self, folder: Path, session: Optional[requests.Session] = None) -> None:
+        self.folder = Path(folder)
+        self.session = session or _create_session()
+        # hit (from disk), not_modified (revalidated), downloaded, stale (the revalidation failed, used the disk)
+        self.stats = Counter()
+
+    # region Storage
+
+    def _entry_path(self, url: str) -> Path:
+        return self.folder / 'entries' / f'{hashlib.sha256(url.encode("utf8")).hexdigest()}.json'
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.folder / 'bodies' / body_hash[:2] / f'{body_hash}.gz'
+
+    def _load_entry(self, url: str) -> Optional[CacheEntry]:
+        try:
+            entry = json.loads(self._entry_path(url).read_text(encoding='utf8'))
+        except (OSError, ValueError):
+            return None
+
+        # An entry without its body (a partially deleted cache) is as good as no entry
+        return entry if self._body_path(entry['body']).is_file() else None
+
+    def _save_entry(self, entry: CacheEntry) -> None:
+        _write_atomically(self._entry_path(entry['url']), json.dumps(entry, ensure_ascii=False).encode('utf8'))
+
+    def _read_body(self, entry: CacheEntry) -> bytes:
+        return gzip.decompress(self._body_path(entry['body']).read_bytes())
+
+    def _write_body(self, content: bytes) -> str:
+        body_hash = hashlib.sha256(content).hexdigest()
+        body_path = self._body_path(body_hash)
+        if not body_path.is_file():
+            _write_atomically(body_path, gzip.compress(content))
+
+        return body_hash
+
+    # endregion
+
+    def store(self, url: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None,
+              final: bool = False) -> None:
+        self._save_entry(dict(url=url, body=self._write_body(content), etag=etag, last_modified=last_modified,
+                              fetched_at=time.time(), final=final))
+
+    def get(self, url: str, max_age: Optional[float] = 0) -> bytes:
+        """
+        :param max_age: Seconds the cached page is used without asking the site whether it changed,
+                        None to use it forever, 0 to always revalidate it (even if it is final).
+        :return: The page content.
+        """
+        entry = self._load_entry(url)
+        if entry is not None and max_age != 0 and \
+                (entry['final'] or max_age is None or time.time() - entry['fetched_at'] <= max_age):
+            self.stats['hit'] += 1
+            return self._read_body(entry)
+
+        headers = {}
+        if entry is not None and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry is not None and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException:
+            if entry is None:
+                raise
+
+            logger.warning(f'Could not revalidate {url}, using its cached page', exc_info=True)
+            self.stats['stale'] += 1
+            return self._read_body(entry)
+
+        if response.status_code == 304:
+            self.stats['not_modified'] += 1
+            self._save_entry(dict(entry, fetched_at=time.time()))
+            return self._read_body(entry)
+
+        self.stats['downloaded'] += 1
+        self.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                   final=entry is not None and entry['final'])
+        return response.content
+
+    def get_cached(self, url: str) -> Optional[bytes]:
+        """ The cached page (without asking the site whether it changed), None if it is not cached. """
+        entry = self._load_entry(url)
+        if entry is None:
+            return None
+
+        self.stats['hit'] += 1
+        return self._read_body(entry)
+
+    def is_final(self, url: str) -> bool:
+        entry = self._load_entry(url)
+        return entry is not None and entry['final']
+
+    def mark_final(self, url: str) -> None:
+        """ The page of this url (already cached) will not change anymore, so it won't be revalidated. """
+        entry = self._load_entry(url)
+        if entry is not None and not entry['final']:
+            self._save_entry(dict(entry, final=True))
+
+    def __repr__(self) -> str:
+        return f'MaccabiSiteHttpCache: [{self.folder}] ({dict(self.stats)})'
+
+
+@lru_cache(maxsize=None)
+def get_maccabi_site_http_cache() -> MaccabiSiteHttpCache:
+    """ The http cache of this process, at the configured folder. """
+    return MaccabiSiteHttpCache(Path(MaccabiStatsConfigSingleton.maccabi_site.folder_to_save_http_cache))
+
+
+def crawling_max_age(max_age: Optional[float]) -> Optional[float]:
+    """ Without the disk as cache (use_disk_as_cache_when_crawling), every crawled page is revalidated. """
+    return max_age if MaccabiStatsConfigSingleton.maccabi_site.use_disk_as_cache_when_crawling else 0
@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
-
+"""
+The crawling is done by stages: the pages are fetched (to the http cache) by a bounded threads pool, then parsed from
+the disk by a processes pool, which returns compact records (a GameRecord for each season page game, a GameData for
+each game) rather than the pages elements. Each stage duration is logged, so a slow crawl shows whether the site or
+the parsing is the bottleneck.
+"""
 import itertools
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from math import ceil
 from multiprocessing import Pool
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+
 from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.parse.maccabi_tlv_site.game_pages_provider import fetch_game_pages, get_game_pages, \
+    mark_game_pages_final
 from maccabistats.parse.maccabi_tlv_site.game_squads_parser import MaccabiSiteGameSquadsParser
+from maccabistats.parse.maccabi_tlv_site.html_elements import has_classes, parse_html, text
+from maccabistats.parse.maccabi_tlv_site.http_cache import crawling_max_age, get_maccabi_site_http_cache
 from maccabistats.parse.maccabi_tlv_site.match_status import MatchNotFinishedError
 
 logger = logging.getLogger(__name__)
@@ -16,111 +29,140 @@ logger = logging.getLogger(__name__)
 folder_to_save_seasons_html_files_pattern = os.path.join(
     MaccabiStatsConfigSingleton.maccabi_site.folder_to_save_seasons_html_files, "season-{season_number}")
 
+_GAMES_ELEMENTS = etree.XPath("//article")
+_SEASON_DROPDOWN_LINKS = etree.XPath(f"//main//div[{has_classes('dropdown')}]//a")
+
 
-def __get_beautifulsoup_parser_name():
-    if MaccabiStatsConfigSingleton.maccabi_site.use_lxml_parser:
-        logger.info("Using lxml parser for beautifulsoup")
-        return "lxml"
-    else:
-        logger.info("Using html.parser for beautifulsoup")
-        return "html.parser"
+def __get_season_web_page_link(season_number):
+    return MaccabiStatsConfigSingleton.maccabi_site.season_page_pattern.format(season_number=season_number)
 
 
-def __extract_games_bs_elements(season_web_page_content):
+def __fetch_season_web_page(season_number):
     """
-    :param season_web_page_content: str
-    :rtype: list of bs4.element.Tag
+    Brings the season number page to the http cache.
+    :type season_number: int
     """
 
-    soup = BeautifulSoup(season_web_page_content, __get_beautifulsoup_parser_name())
-    return soup.find_all("article")
+    get_maccabi_site_http_cache().get(
+        __get_season_web_page_link(season_number),
+        crawling_max_age(MaccabiStatsConfigSingleton.maccabi_site.seasons_pages_cache_max_age))
+
 
+def __get_season_string_from_season_page(season_page):
+    # TODO try except that better
+    wrapped_season_string = text(_SEASON_DROPDOWN_LINKS(season_page)[0])
+    season_string = wrapped_season_string.strip("כל העונות()")
+
+    return season_string
 
-def __get_season_web_page_content_by_season_number(season_number):
+
+def __parse_season(season_number):
     """
-    Returns the current season number page content
-    :param season_number: season number to be requested.
+    Parses the season page (fetched by __fetch_season_web_page) to its games records.
     :type season_number: int
-    :return: bytes
+    :return: The season string and the season games records.
+    :rtype: (str, list of maccabistats.parse.maccabi_tlv_site.game_squads_parser.GameRecord)
     """
 
-    season_web_page_link = MaccabiStatsConfigSingleton.maccabi_site.season_page_pattern.format(
-        season_number=season_number)
-    return requests.get(season_web_page_link).content
+    season_page = parse_html(get_maccabi_site_http_cache().get(__get_season_web_page_link(season_number), max_age=None))
 
+    games_elements = _GAMES_ELEMENTS(season_page)
+    season_string = __get_season_string_from_season_page(season_page)
+    logger.info(
+        "Found {number} games on this season! {season}".format(number=len(games_elements), season=season_string))
 
-def __get_parsed_maccabi_games_from_web():
-    """ Parse maccabi games from maccabi site.
-    :rtype: list of maccabistats.models.game_data.GameData
+    return season_string, [MaccabiSiteGameSquadsParser.parse_game_record(game_element)
+                           for game_element in games_elements]
+
+
+def __parse_game(game_record, season_string):
+    """
+    Parses the game pages (fetched by fetch_game_pages), a finished game pages are marked as final.
+    :type game_record: maccabistats.parse.maccabi_tlv_site.game_squads_parser.GameRecord
+    :type season_string: str
+    :return: The game, None if it has not finished yet.
+    :rtype: maccabistats.models.game_data.GameData
     """
-    maccabi_games = []
-    start_to_parse_from_season_number = int(os.environ.get('START_SEASON_TO_CRAWL', 0))
-    season_to_crawl = MaccabiStatsConfigSingleton.maccabi_site.max_seasons_to_crawl
 
-    logging.info(f"Crawling seasons from index: {start_to_parse_from_season_number}, to: {season_to_crawl}")
+    try:
+        game = MaccabiSiteGameSquadsParser.parse_game(game_record, season_string, *get_game_pages(game_record.link))
+    except MatchNotFinishedError as not_finished:
+        logger.info("Skipping not-finished match: %s", not_finished)
+        return None
 
-    for season_number in range(start_to_parse_from_season_number, season_to_crawl):
-        logger.info("Parsing season number {s_n}".format(s_n=season_number))
-        maccabi_games.extend(__parse_games_from_season_number(season_number))
+    mark_game_pages_final(game_record.link)
+    return game
 
-    return maccabi_games
 
+@contextmanager
+def __timed_stage(stages_timings, stage_name):
+    start_time = time.perf_counter()
+    yield
+    stages_timings[stage_name] = time.perf_counter() - start_time
+    logger.info(f"Finished {stage_name} in {stages_timings[stage_name]:.2f} seconds")
 
-def __get_season_string_from_season_page_content(season_web_page_content):
-    soup = BeautifulSoup(season_web_page_content, __get_beautifulsoup_parser_name())
-    # TODO try except that better
-    wrapped_season_string = soup.select("main div.dropdown a")[0].get_text()
-    season_string = wrapped_season_string.strip("כל העונות()")
 
-    return season_string
+def __fetch_concurrently(fetch_function, items):
+    """ The fetching threads are bounded (crawling_fetch_threads), so the site won't get all of the requests at once """
+    with ThreadPoolExecutor(MaccabiStatsConfigSingleton.maccabi_site.crawling_fetch_threads) as executor:
+        list(executor.map(fetch_function, items))
 
 
-def __get_parsed_maccabi_games_from_web_multi_process():
-    """
-    Parse maccabi games same as __get_parsed_maccabi_games_from_web, just with multiprocess.
-    :return: list of maccabistats.models.game_data.GameData
-    """
+def __parse_in_processes(pool, parse_function, arguments):
+    """ Few chunks for each process (a slow chunk won't hold the others), without a pool the parsing is done here. """
+    if pool is None:
+        return list(itertools.starmap(parse_function, arguments))
 
     crawling_processes = MaccabiStatsConfigSingleton.maccabi_site.crawling_process_number
-    logger.info("Crawling with {num} processes".format(num=crawling_processes))
+    chunk_size = max(ceil(len(arguments) / (crawling_processes * 4)), 1)
+    return pool.starmap(parse_function, arguments, chunk_size)
+
+
+def __get_parsed_maccabi_games_from_web(pool):
+    """ Parse maccabi games from maccabi site.
+    :param pool: The processes pool that parses the pages, None to parse them in this process.
+    :type pool: multiprocessing.pool.Pool
+    :rtype: list of maccabistats.models.game_data.GameData
+    """
 
     start_to_parse_from_season_number = int(os.environ.get('START_SEASON_TO_CRAWL', 0))
     seasons_to_crawl = MaccabiStatsConfigSingleton.maccabi_site.max_seasons_to_crawl
     maccabi_seasons_numbers = range(start_to_parse_from_season_number, seasons_to_crawl)
+    logger.info(f"Crawling seasons from index: {start_to_parse_from_season_number}, to: {seasons_to_crawl}")
 
-    with Pool(crawling_processes) as pool:
-        maccabi_games = list(
-            itertools.chain.from_iterable(pool.map(__parse_games_from_season_number, maccabi_seasons_numbers)))
-
-    return maccabi_games
+    stages_timings = {}
+    with __timed_stage(stages_timings, "fetching seasons pages"):
+        __fetch_concurrently(__fetch_season_web_page, maccabi_seasons_numbers)
 
+    with __timed_stage(stages_timings, "parsing seasons pages"):
+        seasons = __parse_in_processes(pool, __parse_season, [(season_number,)
+                                                              for season_number in maccabi_seasons_numbers])
+    games_records = [(game_record, season_string) for season_string, season_games_records in seasons
+                     for game_record in season_games_records]
 
-def __parse_games_from_season_number(season_number):
-    maccabi_season_web_page_content = __get_season_web_page_content_by_season_number(season_number)
+    with __timed_stage(stages_timings, "fetching games pages"):
+        __fetch_concurrently(fetch_game_pages, [game_record.link for game_record, _ in games_records])
 
-    bs_games_elements = __extract_games_bs_elements(maccabi_season_web_page_content)
-    season_string = __get_season_string_from_season_page_content(maccabi_season_web_page_content)
-    logger.info(
-        "Found {number} games on this season! {season}".format(number=len(bs_games_elements), season=season_string))
+    with __timed_stage(stages_timings, "parsing games pages"):
+        maccabi_games = [game for game in __parse_in_processes(pool, __parse_game, games_records) if game is not None]
 
-    parsed_games = []
-    for bs_game_element in bs_games_elements:
-        try:
-            parsed_games.append(MaccabiSiteGameSquadsParser.parse_game(bs_game_element, season_string))
-        except MatchNotFinishedError as not_finished:
-            logger.info("Skipping not-finished match: %s", not_finished)
-    return parsed_games
+    logger.info(f"Crawled {len(maccabi_games)} games ({len(games_records)} games records) with: "
+                f"{get_maccabi_site_http_cache()}, stages timings (seconds): "
+                f"{', '.join(f'{stage_name}: {duration:.2f}' for stage_name, duration in stages_timings.items())}")
+    return maccabi_games
 
 
 def get_parsed_maccabi_games_from_maccabi_site():
     try:
         logger.info("Trying to iterate seasons pages from web")
         if MaccabiStatsConfigSingleton.maccabi_site.use_multiprocess_crawling:
-            logger.info("Crawling maccabi games with multi process!")
-            return __get_parsed_maccabi_games_from_web_multi_process()
+            crawling_processes = MaccabiStatsConfigSingleton.maccabi_site.crawling_process_number
+            logger.info("Crawling maccabi games with {num} processes!".format(num=crawling_processes))
+            with Pool(crawling_processes) as pool:
+                return __get_parsed_maccabi_games_from_web(pool)
         else:
             logger.info("Crawling maccabi games with one process!")
-            return __get_parsed_maccabi_games_from_web()
+            return __get_parsed_maccabi_games_from_web(None)
     except Exception:
         logger.exception("Exception while trying to parse maccabi-tlv site pages from web.")
 
@@ -136,9 +178,8 @@ def save_maccabi_seasons_web_pages_to_disk(folder_path=folder_to_save_seasons_ht
     max_seasons = MaccabiStatsConfigSingleton.maccabi_site.max_seasons_to_crawl
 
     for season_number in range(max_seasons):
-        season_web_page_link = MaccabiStatsConfigSingleton.maccabi_site.season_page_pattern.format(
-            season_number=season_number)
-        season_web_page_content = requests.get(season_web_page_link).content
+        season_web_page_link = __get_season_web_page_link(season_number)
+        season_web_page_content = get_maccabi_site_http_cache().get(season_web_page_link, max_age=0)
 
         logger.info("Writing {file_name} to disk".format(file_name=season_web_page_link))
         with open(folder_path.format(season_number=season_number), 'wb') as maccabi_site_file:
@@ -15,17 +15,23 @@ mid-match-upload bug this guard exists to prevent.
 
 import logging
 
+from lxml import etree
+
+from maccabistats.parse.maccabi_tlv_site.html_elements import classes, first, has_classes
+
 logger = logging.getLogger(__name__)
 
+_TOP_BANNER = etree.XPath(f"//div[{has_classes('site-top-banner', 'fixtures-list')}]")
+
 
 class MatchNotFinishedError(Exception):
     """Raised when a maccabi-tlv match page is for a not-yet-finished game."""
 
 
-def is_match_finished(match_page_bs) -> bool:
-    top_banner = match_page_bs.select_one("div.site-top-banner.fixtures-list")
+def is_match_finished(match_page) -> bool:
+    top_banner = first(_TOP_BANNER, match_page)
     if top_banner is None:
         logger.warning("maccabi-tlv match page is missing the fixtures-list "
                        "top banner — treating as unfinished")
         return False
-    return "live" not in (top_banner.get("class") or [])
+    return "live" not in classes(top_banner)
@@ -4,53 +4,63 @@ from maccabistats.models.team_in_game import TeamInGame
 from maccabistats.models.player_in_game import PlayerInGame
 from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalGameEvent
 from maccabistats.parse.name_normalization import normalize_name
+from maccabistats.parse.maccabi_tlv_site.html_elements import children_count, direct_text, first, has_classes, \
+    text
 
 from datetime import timedelta
 import logging
 
+from lxml import etree
+
 logger = logging.getLogger(__name__)
 
 CAPTAIN_IDENTIFY_IN_PLAYER_NAME = "(ק)"
 
+_LIST_ITEMS = etree.XPath(".//li")
+_DIVS = etree.XPath(".//div")
+_IMGS = etree.XPath(".//img")
+_PLAYER_NUMBER = etree.XPath(".//b")
+_PLAYER_GOALS = etree.XPath(f".//div[{has_classes('goals')}]")
+
 
 class MaccabiSiteTeamParser(object):
 
     @staticmethod
-    def parse_team(bs_contents, name, score):
+    def parse_team(team_elements, name, score):
         """
         There are 3 divs for each team ordered as: lineup_players, bench_players, coach.
-        :type bs_contents: list of bs4.element.Tag
+        :type team_elements: list of lxml.html.HtmlElement
         :type name: str
         :type score: int
         :rtype : TeamInGame
         """
 
         players = []
-        line_up_players_div = bs_contents[0]
+        line_up_players_div = team_elements[0]
 
-        for line_up_player_bs_content in line_up_players_div.select("li")[1:]:  # Without the first row (Header)
-            players.append(MaccabiSiteTeamParser.__parse_player(line_up_player_bs_content, True))
+        for line_up_player_element in _LIST_ITEMS(line_up_players_div)[1:]:  # Without the first row (Header)
+            players.append(MaccabiSiteTeamParser.__parse_player(line_up_player_element, True))
 
-        bench_players_div = bs_contents[1]
-        for bench_players_div in bench_players_div.select("li"):
-            players.append(MaccabiSiteTeamParser.__parse_player(bench_players_div, False))
+        bench_players_div = team_elements[1]
+        for bench_player_element in _LIST_ITEMS(bench_players_div):
+            players.append(MaccabiSiteTeamParser.__parse_player(bench_player_element, False))
 
-        coach = normalize_name(MaccabiSiteTeamParser.__get_coach(bs_contents[2]))
+        coach = normalize_name(MaccabiSiteTeamParser.__get_coach(team_elements[2]))
 
         return TeamInGame(name, coach, score, players)
 
     @staticmethod
-    def __parse_player(player_bs_content, is_line_up):
+    def __parse_player(player_element, is_line_up):
         """
-        :type player_bs_content: bs4.element.Tag
+        :type player_element: lxml.html.HtmlElement
         :type is_line_up: bool
         :rtype: PlayerInGame
         """
 
-        player_name = player_bs_content.find(text=True, recursive=False).strip()
+        player_name = direct_text(player_element).strip()
         player_name = normalize_name(player_name)
 
-        player_number = player_bs_content.find('b').get_text()
+        player_number = text(first(_PLAYER_NUMBER, player_element))
         events = []
 
         if CAPTAIN_IDENTIFY_IN_PLAYER_NAME in player_name:
@@ -62,46 +72,46 @@ class MaccabiSiteTeamParser(object):
         if is_line_up:
             events.append(GameEvent(GameEventTypes.LINE_UP, timedelta(minutes=0)))
 
-        for goal_minute in player_bs_content.select_one("div.goals").get_text().split():
+        for goal_minute in text(first(_PLAYER_GOALS, player_element)).split():
             events.append(
                 GoalGameEvent(MaccabiSiteTeamParser.__strip_geresh_as_timedelta(goal_minute)))
 
-        MaccabiSiteTeamParser.__append_card_events_for_player(player_bs_content, events)
-        MaccabiSiteTeamParser.__append_substitution_events_for_player(player_bs_content, events, is_line_up)
+        MaccabiSiteTeamParser.__append_card_events_for_player(player_element, events)
+        MaccabiSiteTeamParser.__append_substitution_events_for_player(player_element, events, is_line_up)
 
         return PlayerInGame(player_name, player_number, events)
 
     @staticmethod
-    def __append_card_events_for_player(player_bs_content, player_events):
+    def __append_card_events_for_player(player_element, player_events):
         """
-        :type player_bs_content: bs4.element.Tag
+        :type player_element: lxml.html.HtmlElement
         :type player_events: list of GameEvent
         """
 
-        cards_bs_div = [div for div in player_bs_content.select("div") if 'red' in div['id']]
+        cards_divs = [div for div in _DIVS(player_element) if 'red' in div.get('id', '')]
 
-        first_cards_bs_div = cards_bs_div[0]
-        card_events_times = first_cards_bs_div.get_text().strip().split()
-        cards_imgs_bs = first_cards_bs_div.find_all("img")
+        first_cards_div = cards_divs[0]
+        card_events_times = text(first_cards_div).strip().split()
+        cards_imgs = _IMGS(first_cards_div)
 
         # This player got no cards, need to check both :
         # because there are old games that recorded yellow cards without the minute the player got it in the game
-        if not card_events_times and not cards_imgs_bs:
+        if not card_events_times and not cards_imgs:
             return
-        elif not card_events_times and len(cards_imgs_bs) > 0:
+        elif not card_events_times and len(cards_imgs) > 0:
             logger.warning(
                 "Found card img without time, probably from old game, cards times: {times}, cards imgs {imgs}".format(
-                    times=card_events_times, imgs=cards_imgs_bs))
+                    times=card_events_times, imgs=cards_imgs))
             card_events_times.append('0')
-        elif len(card_events_times) > len(cards_imgs_bs):
+        elif len(card_events_times) > len(cards_imgs):
             logger.warning(
                 "Found more cards times than imgs, cards times: {times}, cards imgs {imgs}".format(
-                    times=card_events_times, imgs=cards_imgs_bs))
+                    times=card_events_times, imgs=cards_imgs))
 
-        cards = zip(card_events_times, cards_imgs_bs)
+        cards = zip(card_events_times, cards_imgs)
 
-        for card_event_time, card_img_bs in cards:
-            card_link = card_img_bs.get("src")
+        for card_event_time, card_img in cards:
+            card_link = card_img.get("src")
             if card_link.endswith("yellow.png"):
                 player_events.append(GameEvent(GameEventTypes.YELLOW_CARD,
                                                MaccabiSiteTeamParser.__strip_geresh_as_timedelta(card_event_time)))
@@ -112,23 +122,23 @@ class MaccabiSiteTeamParser(object):
                 raise Exception("unknown card {link}".format(link=card_link))
 
     @staticmethod
-    def __append_substitution_events_for_player(player_bs_content, player_events, is_line_up):
+    def __append_substitution_events_for_player(player_element, player_events, is_line_up):
         """
-        :type player_bs_content: bs4.element.Tag
+        :type player_element: lxml.html.HtmlElement
         :type player_events: list of GameEvent
         :type is_line_up: bool
         """
 
-        substitution_bs_div = [div for div in player_bs_content.select("div") if 'exchange' in div['id']]
+        substitution_divs = [div for div in _DIVS(player_element) if 'exchange' in div.get('id', '')]
 
-        first_substitution_bs_div = substitution_bs_div[0]
+        first_substitution_div = substitution_divs[0]
 
         # There are cases which only the exchange picture appear without minute, we count that as subs at min 0.
-        handle_old_subs = substitution_bs_div[0].select_one("img")
-        substitution_events_times = first_substitution_bs_div.get_text().strip().split()
-        if not substitution_events_times and not handle_old_subs:  # No substitutions events
+        handle_old_subs = first(_IMGS, first_substitution_div)
+        substitution_events_times = text(first_substitution_div).strip().split()
+        if not substitution_events_times and handle_old_subs is None:  # No substitutions events
             return
-        elif not substitution_events_times and handle_old_subs:
+        elif not substitution_events_times and handle_old_subs is not None:
             substitution_events_times.append('0')
 
         # First Substitution:
@@ -141,7 +151,7 @@ class MaccabiSiteTeamParser(object):
                                            MaccabiSiteTeamParser.__strip_geresh_as_timedelta(first_substitution_time)))
 
         # Second Substitution:
-        if len(first_substitution_bs_div) == 1:
+        if children_count(first_substitution_div) == 1:
             return
 
         # TODO - the lower value from first&seconds substitutions is the subs_in - should check
@@ -153,15 +163,15 @@ class MaccabiSiteTeamParser(object):
                                            MaccabiSiteTeamParser.__strip_geresh_as_timedelta(second_substitution_time)))
 
     @staticmethod
-    def __get_coach(bs_content):
+    def __get_coach(coach_element):
         """"
-        :type bs_content: bs4.element.Tag
+        :type coach_element: lxml.html.HtmlElement
         :rtype: str.
         """
 
-        coach_div_bs = bs_content.select_one("li")
-        if coach_div_bs:
-            return coach_div_bs.get_text().strip()
+        coach_li = first(_LIST_ITEMS, coach_element)
+        if coach_li is not None:
+            return text(coach_li).strip()
         else:
             return "Cant found coach"
 
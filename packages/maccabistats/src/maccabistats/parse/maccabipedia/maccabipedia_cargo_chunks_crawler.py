@@ -2,8 +2,15 @@
 import logging
 from collections.abc import Iterator
 from collections import deque
-from typing import Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+import codecs
 import html
+import itertools
+import json
+import re
+import threading
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -20,6 +27,83 @@ _MUST_HAVE_FIELDS = "_pageName"
 # seen twice in six days at ~19:00 UTC. Retry across those blips instead of failing the daily job.
 _RETRYABLE_STATUSES = (408, 415, 429, 500, 502, 503, 504)
 
+_RESPONSE_CHUNK_SIZE = 64 * 1024
+_JSON_WHITESPACES = re.compile(r'\s*')
+_JSON_ITEMS_SEPARATORS = re.compile(r'[\s,]*')
+_JSON_ITEMS_END = frozenset(' \t\n\r,]')
+
+
+def iter_json_array_items(chunks: Iterable[bytes]) -> Iterator:
+    """
+    Decodes the items of a json array one by one, while its (utf-8) chunks arrive.
+    Only the current chunk & the item that is currently decoded are kept in memory, not the whole array.
+    """
+
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    array_started = False
+    array_ended = False
+
+    for chunk in itertools.chain(chunks, [None]):
+        is_last_chunk = chunk is None
+        buffer += text_decoder.decode(b'' if is_last_chunk else chunk, final=is_last_chunk)
+
+        position = _JSON_WHITESPACES.match(buffer).end()
+        if array_ended:
+            if position != len(buffer):
+                raise ValueError(f"Unexpected data after the json array: {buffer[position:position + 100]}")
+            buffer = ''
+            continue
+
+        if not array_started:
+            if position == len(buffer):
+                continue
+            if buffer[position] != '[':
+                raise ValueError(f"Expected a json array, got: {buffer[position:position + 100]}")
+            array_started = True
+            position += 1
+
+        while True:
+            position = _JSON_ITEMS_SEPARATORS.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            if buffer[position] == ']':
+                array_ended = True
+                position += 1
+                break
+
+            try:
+                item, item_end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if is_last_chunk:
+                    raise
+                break  # The item continues at the next chunk
+
+            # A number may continue at the next chunk (we may have decoded 3 out of 3.5), so the item should end with a separator
+            if not is_last_chunk and (item_end == len(buffer) or buffer[item_end] not in _JSON_ITEMS_END):
+                break
+
+            yield item
+            position = item_end
+
+        buffer = buffer[position:]
+        if array_ended:
+            trailing_data_start = _JSON_WHITESPACES.match(buffer).end()
+            if trailing_data_start != len(buffer):
+                raise ValueError(f"Unexpected data after the json array: {buffer[trailing_data_start:][:100]}")
+            buffer = ''
+
+    if not array_started:
+        raise ValueError("Expected a json array, got an empty response")
+    if not array_ended:
+        raise ValueError("The json array is truncated, its closing ']' is missing")
+
+
+def _close_page_response(requested_page: Future) -> None:
+    if not requested_page.cancelled() and requested_page.exception() is None:
+        requested_page.result().close()
+
 
 def _build_session() -> requests.Session:
     session = requests.Session()
@@ -37,7 +121,8 @@ def _build_session() -> requests.Session:
 
 
 class MaccabiPediaCargoChunksCrawler(Iterator):
-    def __init__(self, tables_name, tables_fields, join_tables_on="", where_condition="1=1"):
+    def __init__(self, tables_name, tables_fields, join_tables_on="", where_condition="1=1",
+                 concurrent_requests=None):
         """
 
         :param tables_name: The table name to crawl
@@ -48,6 +133,8 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
         :type join_tables_on: str
         :param where_condition: The condition of the query
         :type where_condition: str
+        :param concurrent_requests: How many pages (offsets) to request at once, taken from the config if None
+        :type concurrent_requests: int
         """
 
         self.base_crawling_address = MaccabiStatsConfigSingleton.maccabipedia.base_crawling_address
@@ -57,48 +144,114 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
         self.tables_fields = tables_fields
         self.join_tables_on = join_tables_on
         self.where_condition = where_condition
+        self.concurrent_requests = concurrent_requests or \
+            MaccabiStatsConfigSingleton.maccabipedia.concurrent_requests_per_table
 
-        self._current_offset = 0
+        self._current_offset = 0  # The offset of the page we iterate
+        self._next_offset_to_request = 0
+        self._requested_pages = deque()  # Futures of the pages we requested, ordered by their offset
         self._finished_to_crawl = False
-        self._already_fetched_data_queue = deque()
-        self._session = _build_session()
+        self._current_page_rows = None  # Rows of the current page, decoded while its response arrives
+        self._current_page_rows_count = 0
+
+        # Each thread has its own session (with the same retry policy), sessions should not be shared between threads
+        self._thread_local = threading.local()
+        self._executor = None
 
     @property
     def full_crawl_address(self):
+        return self._crawl_address(self._current_offset)
+
+    def _crawl_address(self, offset):
         # Cargo for mediawiki 1.35 has a bug that enforce us to send some params with empty values
         return f"{self.base_crawling_address}" \
                f"&tables={self.tables_name}" \
                f"&fields={self.tables_fields}" \
                f"&join_on={self.join_tables_on}" \
                f"&limit={_MAX_LIMIT_PER_REQUEST}" \
-               f"&offset={self._current_offset}" \
+               f"&offset={offset}" \
                f"&where={self.where_condition}" \
                f"&group_by=" \
                f"&order_by=" \
                f"&having="
 
-    def _request_more_data(self):
+    @property
+    def _session(self) -> requests.Session:
+        if not hasattr(self._thread_local, 'session'):
+            self._thread_local.session = _build_session()
+
+        return self._thread_local.session
+
+    def _fetch_page(self, offset):
         """
-        Fetch more data from maccabipedia according to self.full_crawl_address
+        Request one page (up to the limit of rows) from maccabipedia, starting at the given offset.
+        The response body is not read here, the rows are decoded while it arrives (see _iter_page_rows).
+
+        :rtype: requests.Response
         """
 
-        # Get data
-        request_result = self._session.get(self.full_crawl_address, timeout=30)
+        crawl_address = self._crawl_address(offset)
+        request_result = self._session.get(crawl_address, timeout=30, stream=True)
         if request_result.status_code != 200:
-            logging.exception(f"Error while fetching data from address: {self.full_crawl_address}, "
+            logging.exception(f"Error while fetching data from address: {crawl_address}, "
                               f"status code: {request_result.status_code}, text: {request_result.text}")
             raise ValueError(f"status code {request_result.status_code} while fetching data from maccabipedia")
 
-        current_request_as_json = request_result.json()
+        return request_result
+
+    @staticmethod
+    def _iter_page_rows(page_response):
+        with page_response:
+            yield from iter_json_array_items(page_response.iter_content(_RESPONSE_CHUNK_SIZE))
+
+    def _request_pages_ahead(self):
+        """
+        Keeps self.concurrent_requests pages requested ahead of the page we iterate.
+        Until the first page returns we request only it, most of the queries (not the full tables) have one page.
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrent_requests,
+                                                thread_name_prefix=f"cargo-{self.tables_name}")
+
+        pages_to_request = 1 if self._current_offset == 0 else self.concurrent_requests
+        while len(self._requested_pages) < pages_to_request:
+            self._requested_pages.append(self._executor.submit(self._fetch_page, self._next_offset_to_request))
+            self._next_offset_to_request += _MAX_LIMIT_PER_REQUEST
+
+    def _finish_crawling(self):
+        self._finished_to_crawl = True
+        # The pages after the last one are empty, no need to wait for them (just close the ones that already answered)
+        for requested_page in self._requested_pages:
+            if not requested_page.cancel():
+                requested_page.add_done_callback(_close_page_response)
+        self._requested_pages.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _request_more_data(self):
+        """
+        Start to iterate the next page, its rows will be decoded while its response arrives
+        """
+
+        self._request_pages_ahead()
+        try:
+            page_response = self._requested_pages.popleft().result()
+        except Exception:
+            self._finish_crawling()
+            raise
+
+        self._current_page_rows = self._iter_page_rows(page_response)
+        self._current_page_rows_count = 0
+
+    def _finish_current_page(self):
+        self._current_page_rows = None
         self._current_offset += _MAX_LIMIT_PER_REQUEST
 
         # We have received smaller amount than the limit, that is the last query
-        if len(current_request_as_json) < _MAX_LIMIT_PER_REQUEST:
-            self._finished_to_crawl = True
-
-        # Add to queue for iteration
-        [self._already_fetched_data_queue.append(self._decode_maccabipedia_data_and_remove_nones(data)) for data in
-         current_request_as_json]
+        if self._current_page_rows_count < _MAX_LIMIT_PER_REQUEST:
+            self._finish_crawling()
 
     @staticmethod
     def _decode_maccabipedia_data_and_remove_nones(maccabipedia_data) -> Dict:
@@ -113,25 +266,57 @@ class MaccabiPediaCargoChunksCrawler(Iterator):
         return maccabipedia_data_without_nulls
 
     def __next__(self):
-        if not self._already_fetched_data_queue:
-            # Whether no data in the queue and the last request returned less than the limit
-            if self._finished_to_crawl:
-                raise StopIteration()
+        while not self._finished_to_crawl:
+            if self._current_page_rows is None:
+                self._request_more_data()
+
+            row = next(self._current_page_rows, None)
+            if row is not None:
+                self._current_page_rows_count += 1
+                return self._decode_maccabipedia_data_and_remove_nones(row)
 
-            self._request_more_data()
-            # Check whether no more data is available on the server (and local - queue)
-            if not self._already_fetched_data_queue:
-                raise StopIteration()
+            self._finish_current_page()
 
-        return self._already_fetched_data_queue.pop()
+        raise StopIteration()
 
     @classmethod
-    def create_games_crawler(cls):
-        return cls(tables_name=MaccabiStatsConfigSingleton.maccabipedia.games_data_query.tables_names,
-                   tables_fields=MaccabiStatsConfigSingleton.maccabipedia.games_data_query.fields_names,
-                   join_tables_on=MaccabiStatsConfigSingleton.maccabipedia.games_data_query.join_on)
+    def _create_query_crawler(cls, query, modified_since: Optional[datetime] = None):
+        """
+        :param query: One of the maccabipedia queries from the config
+        :param modified_since: Crawl only the rows of the pages that were modified since then (UTC), all of them if None.
+        """
+        if modified_since is None:
+            return cls(tables_name=query.tables_names, tables_fields=query.fields_names, join_tables_on=query.join_on)
+
+        pages_data_table = MaccabiStatsConfigSingleton.maccabipedia.pages_data_table_name
+        join_on_pages_data = f"{query.page_name_field}={pages_data_table}._pageName"
+        return cls(tables_name=f"{query.tables_names}, {pages_data_table}",
+                   tables_fields=query.fields_names,
+                   join_tables_on=", ".join(filter(None, [query.join_on, join_on_pages_data])),
+                   where_condition=f"{pages_data_table}._modificationDate>'{modified_since:%Y-%m-%d %H:%M:%S}'")
+
+    @classmethod
+    def create_games_crawler(cls, modified_since: Optional[datetime] = None):
+        return cls._create_query_crawler(MaccabiStatsConfigSingleton.maccabipedia.games_data_query, modified_since)
+
+    @classmethod
+    def create_games_events_crawler(cls, modified_since: Optional[datetime] = None):
+        return cls._create_query_crawler(MaccabiStatsConfigSingleton.maccabipedia.games_events_query, modified_since)
 
     @classmethod
-    def create_games_events_crawler(cls):
-        return cls(tables_name=MaccabiStatsConfigSingleton.maccabipedia.games_events_query.tables_names,
-                   tables_fields=MaccabiStatsConfigSingleton.maccabipedia.games_events_query.fields_names)
+    def create_modified_pages_crawler(cls, tables_name: str, modified_since: datetime):
+        """
+        Crawls only the page name of the given table rows, of the pages that were modified since then (UTC).
+        """
+        pages_data_table = MaccabiStatsConfigSingleton.maccabipedia.pages_data_table_name
+        return cls(tables_name=f"{tables_name}, {pages_data_table}",
+                   tables_fields=f"{tables_name}._pageName",
+                   join_tables_on=f"{tables_name}._pageName={pages_data_table}._pageName",
+                   where_condition=f"{pages_data_table}._modificationDate>'{modified_since:%Y-%m-%d %H:%M:%S}'")
+
+    @classmethod
+    def create_games_pages_crawler(cls):
+        """
+        Crawls only the page name of each game, lets us find which games were deleted since the last crawl.
+        """
+        return cls._create_query_crawler(MaccabiStatsConfigSingleton.maccabipedia.games_pages_query)
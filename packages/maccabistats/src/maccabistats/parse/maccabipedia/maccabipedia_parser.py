@@ -3,10 +3,14 @@
 
 import logging
 from collections import defaultdict
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
 
 from dateutil.parser import parse as datetime_parser
 
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.maccabipedia.players import MaccabiPediaPlayers
 from maccabistats.models.game_data import GameData
 from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalTypes, GoalGameEvent, AssistTypes, \
     AssistGameEvent
@@ -77,14 +81,23 @@ MACCABIPEDIA_ASSISTS_TYPE = {40: AssistTypes.UNCATEGORIZED,
 
 class MaccabiPediaParser(object):
 
-    def __init__(self):
+    def __init__(self, modified_since: Optional[datetime] = None):
         """
         Fetching games table and games_events table from maccabipedia and merge the results (group by the page name)
+
+        :param modified_since: Fetch only the games pages that were modified since then (UTC), all of them if None.
         """
 
-        # Json as it downloaded from maccabipedia mediawiki api
-        self._games_metadata_as_json = self._get_games_metadata()
-        self._games_events_as_json = self._get_games_events()
+        # Json as it downloaded from maccabipedia mediawiki api, the tables are crawled at the same time.
+        # The players data (Profiles table) is needed right after the parsing, so we crawl it meanwhile as well.
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="maccabipedia-tables") as executor:
+            players_data = executor.submit(MaccabiPediaPlayers.get_players_data)
+            games_metadata = executor.submit(self._get_games_metadata, modified_since)
+            games_events = executor.submit(self._get_games_events, modified_since)
+
+            self._games_metadata_as_json = games_metadata.result()
+            self._games_events_as_json = games_events.result()
+            players_data.result()
 
         # Dict from pageName to json
         # TODO: should check if there are more than 1 item in any list, means two game share the same date
@@ -95,14 +108,31 @@ class MaccabiPediaParser(object):
          self._games_events_as_json]
 
     @staticmethod
-    def _get_games_metadata():
+    def _get_games_metadata(modified_since: Optional[datetime] = None):
         return [game_metadata_as_json for game_metadata_as_json in
-                MaccabiPediaCargoChunksCrawler.create_games_crawler()]
+                MaccabiPediaCargoChunksCrawler.create_games_crawler(modified_since)]
 
     @staticmethod
-    def _get_games_events():
+    def _get_games_events(modified_since: Optional[datetime] = None):
         return [game_events_as_json for game_events_as_json in
-                MaccabiPediaCargoChunksCrawler.create_games_events_crawler()]
+                MaccabiPediaCargoChunksCrawler.create_games_events_crawler(modified_since)]
+
+    @staticmethod
+    def get_games_pages_names() -> Set[str]:
+        """
+        The page names of all the games on maccabipedia (a light query, without the games data).
+        """
+        return {game[_PAGE_NAME_FIELD_NAME] for game in MaccabiPediaCargoChunksCrawler.create_games_pages_crawler()}
+
+    @staticmethod
+    def get_modified_games_names_pages(modified_since: datetime) -> Set[str]:
+        """
+        The competitions, stadiums & opponents pages that were modified since then (UTC),
+        the games data takes their names from these pages, so they are not part of the games pages modifications.
+        """
+        names_tables_names = MaccabiStatsConfigSingleton.maccabipedia.games_names_tables_names
+        return {row[_PAGE_NAME_FIELD_NAME] for tables_name in names_tables_names
+                for row in MaccabiPediaCargoChunksCrawler.create_modified_pages_crawler(tables_name, modified_since)}
 
     def _parse_player_event(self, player_event):
         """
@@ -224,19 +254,26 @@ class MaccabiPediaParser(object):
                         date=datetime_parser(f"{game_metadata['Date']} {game_metadata.get('Hour', '')}"),
                         technical_result=technical)
 
-    def parse(self):
+    def parse_by_page_name(self) -> Dict[str, GameData]:
         """
         Building game data from each page name (game metadata & game events).
 
-        :return: List of the merged games from maccabipedia (with the games events)
-        :rtype: list of GameData
+        :return: The merged games from maccabipedia (with the games events) by their page name
         """
 
-        parsed_games = []
+        parsed_games = dict()
         for game_name in self._game_metadata_by_game.keys():
             logger.info(f"Parsing game at {game_name}")
             # Take the first game from each date, we should assume its ok or we will have a lot of problems
-            parsed_games.append(self._build_maccabistats_game(self._game_metadata_by_game[game_name][0],
-                                                              self._games_events_by_game[game_name]))
+            parsed_games[game_name] = self._build_maccabistats_game(self._game_metadata_by_game[game_name][0],
+                                                                    self._games_events_by_game[game_name])
 
         return parsed_games
+
+    def parse(self):
+        """
+        :return: List of the merged games from maccabipedia (with the games events)
+        :rtype: list of GameData
+        """
+
+        return list(self.parse_by_page_name().values())
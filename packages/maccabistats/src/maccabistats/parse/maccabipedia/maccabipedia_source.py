@@ -1,8 +1,16 @@
+import json
 import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
+import requests
+
+from maccabistats.models.game_data import GameData
 from maccabistats.parse.maccabipedia.maccabipedia_parser import MaccabiPediaParser
 from maccabistats.parse.maccabistats_source import MaccabiStatsSource
 from maccabistats.parse.sources import SourcesNames
+from maccabistats.version import version as maccabistats_version
 
 logger = logging.getLogger(__name__)
 
@@ -10,19 +18,137 @@ logger = logging.getLogger(__name__)
 Implement MaccabiStatsSource that crawl maccabipedia.
 """
 
+# Cargo may save the modification date in the server timezone, so we crawl some more hours to be on the safe side
+_MODIFICATION_DATE_SAFETY_MARGIN = timedelta(hours=3)
+
+GamesPages = Dict[str, str]  # Game page name to the game date (iso format)
+
+
+def splice_modified_games(previous_games: List[GameData], previous_games_pages: GamesPages,
+                          current_pages_names: Set[str], modified_games: Dict[str, GameData]) \
+        -> Optional[Tuple[List[GameData], GamesPages]]:
+    """
+    Replaces the games of the modified pages (and removes the games of deleted pages) in the previous crawl games.
+    The previous games are matched to their pages by their date (day), games played at the same day are kept as long
+    as none of them was modified.
+
+    :param previous_games: The games of the previous crawl.
+    :param previous_games_pages: The pages of the previous crawl games.
+    :param current_pages_names: All the games pages that exist now on maccabipedia.
+    :param modified_games: The games of the pages that were modified since the previous crawl, by their page name.
+    :return: The games & their pages, or None if we cant splice them (a full crawl is needed).
+    """
+    unknown_pages = current_pages_names - previous_games_pages.keys() - modified_games.keys()
+    if unknown_pages:
+        logger.warning(f"Found {len(unknown_pages)} games pages that are not in the previous crawl, "
+                       f"for example: {next(iter(unknown_pages))}")
+        return None
+
+    kept_games_pages = {page_name: game_date for page_name, game_date in previous_games_pages.items()
+                        if page_name in current_pages_names and page_name not in modified_games}
+    outdated_games_dates = {game_date for page_name, game_date in previous_games_pages.items()
+                            if page_name not in kept_games_pages}
+    if outdated_games_dates & set(kept_games_pages.values()):
+        logger.warning("A modified game was played at the same day as another game, "
+                       "we cant tell which game belongs to which page")
+        return None
+
+    games = [game for game in previous_games if game.date.isoformat() not in outdated_games_dates]
+    games.extend(modified_games.values())
+
+    games_pages = {**kept_games_pages,
+                   **{page_name: game.date.isoformat() for page_name, game in modified_games.items()}}
+
+    logger.info(f"Replaced {len(modified_games)} modified games, "
+                f"removed {len(previous_games_pages.keys() - current_pages_names)} deleted games")
+    return games, games_pages
+
 
 class MaccabiPediaSource(MaccabiStatsSource):
 
-    def __init__(self):
+    def __init__(self, incremental: bool = False):
+        """
+        :param incremental: Crawl only the games pages that were modified since the last serialized crawl,
+                            falls back to crawl all the games when we cant use the last crawl.
+        """
         super().__init__(name=SourcesNames.MaccabiPedia.value)
+        self.incremental = incremental
+
+        # Saved next to the serialized games, so the next incremental crawl would know what it has already crawled
+        self._crawled_at: Optional[datetime] = None
+        self._games_pages: GamesPages = dict()
+
+    @staticmethod
+    def games_pages_file_path(serialized_games_file_path: str) -> Path:
+        return Path(serialized_games_file_path).with_suffix('.pages.json')
 
     def _rerun_source(self):
         """
         Parse the raw data and saves it on self.maccabi_games_stats
         """
 
-        maccabipedia_parser = MaccabiPediaParser()
-        return maccabipedia_parser.parse()
+        crawled_at = datetime.now(timezone.utc)
+        games = self._rerun_source_incrementally() if self.incremental else None
+
+        if games is None:
+            maccabipedia_parser = MaccabiPediaParser()
+            games_by_page_name = maccabipedia_parser.parse_by_page_name()
+            self._games_pages = {page_name: game.date.isoformat() for page_name, game in games_by_page_name.items()}
+            games = list(games_by_page_name.values())
+
+        self._crawled_at = crawled_at
+        return games
+
+    def _rerun_source_incrementally(self) -> Optional[List[GameData]]:
+        """
+        :return: The previous crawl games with the modified games replaced, None if a full crawl is needed.
+        """
+        try:
+            previous_games_file = self.find_last_created_source_maccabi_games_file()
+            with open(self.games_pages_file_path(previous_games_file), 'r', encoding='utf-8') as f:
+                previous_crawl = json.load(f)
+        except (RuntimeError, OSError, ValueError) as e:
+            logger.info(f"Cant use the last crawl ({e}), crawling all the games")
+            return None
+
+        self.load_serialized_games()
+        if self.maccabi_games_stats.version != maccabistats_version:
+            logger.info(f"The last crawl was done with maccabistats {self.maccabi_games_stats.version}, "
+                        f"crawling all the games")
+            return None
+
+        modified_since = datetime.fromisoformat(previous_crawl['crawled_at']) - _MODIFICATION_DATE_SAFETY_MARGIN
+        logger.info(f"Crawling the games pages that were modified since: {modified_since} (UTC)")
+        try:
+            modified_names_pages = MaccabiPediaParser.get_modified_games_names_pages(modified_since)
+            if modified_names_pages:
+                logger.info(f"{len(modified_names_pages)} competitions, stadiums or opponents pages were modified "
+                            f"(for example: {next(iter(modified_names_pages))}), crawling all the games")
+                return None
+
+            current_pages_names = MaccabiPediaParser.get_games_pages_names()
+            modified_games = MaccabiPediaParser(modified_since=modified_since).parse_by_page_name()
+        except (ValueError, requests.RequestException):  # Timeouts are RequestException as well
+            logger.exception("Cant crawl the modified games pages, crawling all the games")
+            return None
+
+        spliced = splice_modified_games(self.maccabi_games_stats.games, previous_crawl['games_pages'],
+                                        current_pages_names, modified_games)
+        if spliced is None:
+            return None
+
+        games, self._games_pages = spliced
+        return games
+
+    def serialize_games(self) -> str:
+        serialized_games_file_path = super().serialize_games()
+
+        if self._crawled_at is not None:
+            with open(self.games_pages_file_path(serialized_games_file_path), 'w', encoding='utf-8') as f:
+                json.dump(dict(crawled_at=self._crawled_at.isoformat(), games_pages=self._games_pages), f,
+                          ensure_ascii=False)
+
+        return serialized_games_file_path
 
     def run_specific_fixes(self):
         """
@@ -1,13 +1,15 @@
 import glob
 import logging
 import os
-import pickle
 from datetime import datetime
 from pathlib import Path
+from typing import List
 
 from maccabistats.maccabipedia.players import MaccabiPediaPlayers
 from maccabistats.parse.general_fixes import run_general_fixes
+from maccabistats.stats.games_snapshot import write_games_snapshot
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.serialized_games import load_maccabi_games_file
 
 logger = logging.getLogger(__name__)
 
@@ -85,20 +87,24 @@ class MaccabiStatsSource(object):
 
         logger.info(f"Loading source {self.name} as MaccabiGamesStats from: {last_created_source_games_file},"
                     f" This is the last created serialized maccabi games file on this source folder")
-        with open(last_created_source_games_file, 'rb') as f:
-            self.maccabi_games_stats = pickle.load(f)
+        self.maccabi_games_stats = load_maccabi_games_file(last_created_source_games_file)
+
+    def find_source_maccabi_games_files(self) -> List[str]:
+        return glob.glob(self._serialized_games_path_pattern)
 
     def find_last_created_source_maccabi_games_file(self) -> str:
-        serialized_source_games = glob.glob(self._serialized_games_path_pattern)
+        serialized_source_games = self.find_source_maccabi_games_files()
         if not serialized_source_games:
             raise RuntimeError(f"Cant find source serialized games at: {self._serialized_games_path_pattern}")
 
         last_created_serialized_maccabi_games_file = max(serialized_source_games, key=os.path.getctime)
         return last_created_serialized_maccabi_games_file
 
-    def serialize_games(self):
+    def serialize_games(self) -> str:
         """
         Serialize the parsed games (without any fixes).
+
+        :return: The path of the serialized games file
         """
 
         source_games_file_path = self._serialized_games_path
@@ -111,5 +117,6 @@ class MaccabiStatsSource(object):
             # old_file_path.stem+= int(time())
             pass
 
-        with open(source_games_file_path, 'wb') as f:
-            pickle.dump(self.maccabi_games_stats, f)
+        write_games_snapshot(self.maccabi_games_stats, source_games_file_path)
+
+        return source_games_file_path
@@ -77,14 +77,15 @@ def run_table_source():
     return _run_source(TableSource())
 
 
-def run_maccabipedia_source():
+def run_maccabipedia_source(incremental: bool = False):
     """
     Runs the MaccabiPedia source and serialize its output.
 
+    :param incremental: Crawl only the games that were modified since the last serialized crawl (when possible).
     :rtype: maccabistats.stats.maccabi_games_stats.MaccabiGamesStats
     """
 
-    return _run_source(MaccabiPediaSource())
+    return _run_source(MaccabiPediaSource(incremental=incremental))
 
 
 def merge_maccabi_games_from_all_input_serialized_sources():
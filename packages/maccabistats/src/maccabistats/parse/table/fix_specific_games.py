@@ -32,4 +32,6 @@ def fix_specific_games(maccabi_games_stats):
     """
 
     __fix_games_date(maccabi_games_stats)
-    return maccabi_games_stats
+
+    # The dates were changed in place, so create a new (sorted) stats object for these games
+    return maccabi_games_stats.create_maccabi_stats_from_games(maccabi_games_stats.games)
@@ -60,25 +60,11 @@ def plotly_horizontal_bar_chart(best_players: List[Tuple]):
     fig.show()
 
 
-# For each player:
-# 1) take the games he played at
-# 2) From these games, calculate the amount of players that was participate in any game from these games
-# 3) Decrease by one (the checked player itself)
-# 4) The final number is the players number that this player played with~
+# For each player: the count of the different players that played at the same games with him (official games)
 if __name__ == '__main__':
     maccabipedia_games = load_from_maccabipedia_source().official_games
 
-    # Change 'games_by_player_name' players games to be just "played players" from maccabi and not in the squad
-    players_games = maccabipedia_games.played_games_by_player_name()
-    players_to_available_players_len = dict()
-
-    for player_name, games in players_games.items():
-        # Get just the played players, -1 himself
-        players_to_available_players_len[player_name] = len(games.players.most_played) - 1
-
-    most_played_with_others_player = sorted(players_to_available_players_len.items(), key=lambda item: item[1],
-                                            reverse=True)
-    top_players = most_played_with_others_player[:30]
+    top_players = maccabipedia_games.players_together.most_distinct_teammates(top_count=30)
     print(f'Top: {pformat(top_players)}')
 
     # squarify_show_chart(top_players)
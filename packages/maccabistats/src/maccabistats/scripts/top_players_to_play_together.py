@@ -1,7 +1,5 @@
 import logging
 import pprint
-from collections import Counter
-from itertools import combinations
 
 from maccabistats import load_from_maccabipedia_source
 
@@ -16,16 +14,6 @@ TOP_SET_OF_PLAYERS_TO_SHOW = 25
 if __name__ == '__main__':
     maccabi_games = load_from_maccabipedia_source().official_games
 
-    played_couples = Counter()
-
-    for game in maccabi_games:
-        _logger.info(f'Handle game date: {game.date}')
-
-        current_game_played_players = list(game.maccabi_team.played_players_with_amount.keys())
-        # We need to sort in order to have the same couple names
-        current_game_played_players.sort()
-
-        for couple in combinations(current_game_played_players, AMOUNT_OF_PLAYERS_TO_PLAY_TOGETHER):
-            played_couples[couple] += 1
-
-    _logger.info(pprint.pformat(played_couples.most_common(TOP_SET_OF_PLAYERS_TO_SHOW)))
+    played_together = maccabi_games.players_together.most_played_together(AMOUNT_OF_PLAYERS_TO_PLAY_TOGETHER,
+                                                                          TOP_SET_OF_PLAYERS_TO_SHOW)
+    _logger.info(pprint.pformat(played_together))
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from dateutil.parser import parse as datetime_parser
+
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes, AssistTypes
+
+if TYPE_CHECKING:
+    from maccabistats.models.game_data import GameData
+
+logger = logging.getLogger(__name__)
+
+# Dense ids for the enums, the id of each member is its index in these lists
+EVENT_TYPES: List[GameEventTypes] = list(GameEventTypes)
+GOAL_TYPES: List[GoalTypes] = list(GoalTypes)
+ASSIST_TYPES: List[AssistTypes] = list(AssistTypes)
+
+_EVENT_TYPE_TO_ID: Dict[GameEventTypes, int] = {event_type: index for index, event_type in enumerate(EVENT_TYPES)}
+_GOAL_TYPE_TO_ID: Dict[GoalTypes, int] = {goal_type: index for index, goal_type in enumerate(GOAL_TYPES)}
+_ASSIST_TYPE_TO_ID: Dict[AssistTypes, int] = {assist_type: index for index, assist_type in enumerate(ASSIST_TYPES)}
+
+NO_SUBTYPE = -1
+
+_STRING_TABLES = ('competitions', 'opponents', 'stadiums', 'referees', 'coaches', 'seasons', 'players')
+_GAMES_COLUMNS = ('dates', 'competition', 'opponent', 'stadium', 'referee', 'coach', 'season',
+                  'maccabi_score', 'not_maccabi_score', 'is_home', 'technical_result')
+_SQUADS_COLUMNS = ('squad_game', 'squad_player', 'squad_is_maccabi', 'squad_played')
+_EVENTS_COLUMNS = ('event_game', 'event_squad_row', 'event_player', 'event_is_maccabi', 'event_type', 'event_subtype',
+                   'event_second')
+
+
+def event_type_id(event_type: GameEventTypes) -> int:
+    return _EVENT_TYPE_TO_ID[event_type]
+
+
+def goal_type_id(goal_type: GoalTypes) -> int:
+    return _GOAL_TYPE_TO_ID[goal_type]
+
+
+def assist_type_id(assist_type: AssistTypes) -> int:
+    return _ASSIST_TYPE_TO_ID[assist_type]
+
+
+def as_datetime64(date: Union[datetime.datetime, datetime.date, str]) -> np.datetime64:
+    """
+    Convert the given date to the same type as the columnar games dates, parse strings the same as GameData does.
+    """
+    if isinstance(date, str):
+        date = datetime_parser(date)
+
+    return np.datetime64(date, 'us')
+
+
+class StringTable(object):
+    """
+    Maps every distinct string (player, team, competition...) to a dense int id, so we can keep ids in arrays.
+    """
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> StringTable:
+        """
+        Creates a table of the given (distinct) values, the id of each value is its index.
+        """
+        table = cls()
+        table.values = list(values)
+        table._ids = {value: value_id for value_id, value in enumerate(table.values)}
+        return table
+
+    def add(self, value: str) -> int:
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = len(self.values)
+            self._ids[value] = value_id
+            self.values.append(value)
+
+        return value_id
+
+    def find(self, value: str) -> int:
+        """
+        Returns the id of the given value, or -1 when we never saw it (so it won't match any row).
+        """
+        return self._ids.get(value, -1)
+
+    def find_many(self, values: Iterable[str]) -> np.ndarray:
+        return np.array([self._ids[value] for value in values if value in self._ids], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, value_id: int) -> str:
+        return self.values[value_id]
+
+
+class MaccabiGamesColumns(object):
+    """
+    A columnar copy of a list of games, built once and used for vectorized scans instead of walking the objects.
+
+    Games table: one row per game (same order as the given games), every text field is kept as an id.
+    Squads table: one row per player in game (both teams), with whether he played in the game.
+    Events table: one row per player event (both teams), ordered by game -> player -> event,
+                  which is the same order we get when we walk the games objects.
+                  Each event has the squads table row of its player in game as well.
+    """
+
+    def __init__(self, games: List[GameData]) -> None:
+        self.games_count = len(games)
+
+        self.competitions = StringTable()
+        self.opponents = StringTable()  # By the team current name
+        self.stadiums = StringTable()
+        self.referees = StringTable()
+        self.coaches = StringTable()
+        self.seasons = StringTable()
+        self.players = StringTable()
+
+        self._build_games_table(games)
+        self._build_squads_and_events_tables(games)
+
+        logger.debug(f'Built columns for {self.games_count} games, {len(self.squad_player)} players in game '
+                     f'and {len(self.event_player)} events')
+
+    def _build_games_table(self, games: List[GameData]) -> None:
+        self.dates = np.array([game.date for game in games], dtype='datetime64[us]')
+        self.competition = np.array([self.competitions.add(game.competition) for game in games], dtype=np.int32)
+        self.opponent = np.array([self.opponents.add(game.not_maccabi_team.current_name) for game in games],
+                                 dtype=np.int32)
+        self.stadium = np.array([self.stadiums.add(game.stadium) for game in games], dtype=np.int32)
+        self.referee = np.array([self.referees.add(game.referee) for game in games], dtype=np.int32)
+        self.coach = np.array([self.coaches.add(game.maccabi_team.coach) for game in games], dtype=np.int32)
+        self.season = np.array([self.seasons.add(game.season) for game in games], dtype=np.int32)
+        self.maccabi_score = np.array([game.maccabi_team.score for game in games], dtype=np.int32)
+        self.not_maccabi_score = np.array([game.not_maccabi_team.score for game in games], dtype=np.int32)
+        self.is_home = np.array([game.is_maccabi_home_team for game in games], dtype=bool)
+        self.technical_result = np.array([bool(game.technical_result) for game in games], dtype=bool)
+
+    def _build_squads_and_events_tables(self, games: List[GameData]) -> None:
+        squad_game, squad_player, squad_is_maccabi, squad_played = [], [], [], []
+        event_game, event_squad_row, event_player, event_is_maccabi, event_type, event_subtype, event_second = \
+            [], [], [], [], [], [], []
+
+        for game_index, game in enumerate(games):
+            maccabi_team = game.maccabi_team
+            for team in (maccabi_team, game.not_maccabi_team):
+                is_maccabi = team is maccabi_team
+                for player in team.players:
+                    player_id = self.players.add(player.name)
+                    squad_row = len(squad_game)
+
+                    squad_game.append(game_index)
+                    squad_player.append(player_id)
+                    squad_is_maccabi.append(is_maccabi)
+                    squad_played.append(player.played_in_game)
+
+                    for event in player.events:
+                        event_game.append(game_index)
+                        event_squad_row.append(squad_row)
+                        event_player.append(player_id)
+                        event_is_maccabi.append(is_maccabi)
+                        event_type.append(_EVENT_TYPE_TO_ID[event.event_type])
+                        event_subtype.append(self._event_subtype_id(event))
+                        event_second.append(int(event.time_occur.total_seconds()))
+
+        self.squad_game = np.array(squad_game, dtype=np.int32)
+        self.squad_player = np.array(squad_player, dtype=np.int32)
+        self.squad_is_maccabi = np.array(squad_is_maccabi, dtype=bool)
+        self.squad_played = np.array(squad_played, dtype=bool)
+
+        self.event_game = np.array(event_game, dtype=np.int32)
+        self.event_squad_row = np.array(event_squad_row, dtype=np.int32)
+        self.event_player = np.array(event_player, dtype=np.int32)
+        self.event_is_maccabi = np.array(event_is_maccabi, dtype=bool)
+        self.event_type = np.array(event_type, dtype=np.int8)
+        self.event_subtype = np.array(event_subtype, dtype=np.int8)
+        self.event_second = np.array(event_second, dtype=np.int32)
+
+    def take(self, games_indices: np.ndarray) -> MaccabiGamesColumns:
+        """
+        Returns the columns of the games at the given indices (should be sorted), sharing the strings tables.
+        The squads & events tables are copied only on their first use, filtering games needs just the games table.
+        """
+        taken = object.__new__(MaccabiGamesColumns)
+        taken.games_count = len(games_indices)
+
+        for table_name in _STRING_TABLES:
+            setattr(taken, table_name, getattr(self, table_name))
+        for column_name in _GAMES_COLUMNS:
+            setattr(taken, column_name, getattr(self, column_name)[games_indices])
+
+        taken._taken_from = (self, games_indices)
+        return taken
+
+    def __getattr__(self, name: str):
+        # Only taken columns get here before they have their squads & events tables
+        if name in _SQUADS_COLUMNS + _EVENTS_COLUMNS and '_taken_from' in self.__dict__:
+            self._take_squads_and_events_tables()
+            return getattr(self, name)
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _take_squads_and_events_tables(self) -> None:
+        source, games_indices = self.__dict__.pop('_taken_from')
+
+        # Maps each game index of the source to its index in these columns (-1 for games we don't have)
+        new_game_indices = np.full(source.games_count, -1, dtype=np.int32)
+        new_game_indices[games_indices] = np.arange(len(games_indices), dtype=np.int32)
+
+        squad_rows_new_game_indices = new_game_indices[source.squad_game]
+        squad_rows_to_take = squad_rows_new_game_indices >= 0
+        self.squad_game = squad_rows_new_game_indices[squad_rows_to_take]
+        for column_name in _SQUADS_COLUMNS[1:]:
+            setattr(self, column_name, getattr(source, column_name)[squad_rows_to_take])
+
+        # The events of the taken games belong to the taken squad rows, which get new (consecutive) indices
+        new_squad_rows = np.cumsum(squad_rows_to_take, dtype=np.int32) - 1
+        events_new_game_indices = new_game_indices[source.event_game]
+        events_to_take = events_new_game_indices >= 0
+        self.event_game = events_new_game_indices[events_to_take]
+        self.event_squad_row = new_squad_rows[source.event_squad_row[events_to_take]]
+        for column_name in _EVENTS_COLUMNS[2:]:
+            setattr(self, column_name, getattr(source, column_name)[events_to_take])
+
+    @staticmethod
+    def _event_subtype_id(event) -> int:
+        if event.event_type == GameEventTypes.GOAL_SCORE and hasattr(event, 'goal_type'):
+            return _GOAL_TYPE_TO_ID[event.goal_type]
+        elif event.event_type == GameEventTypes.GOAL_ASSIST and hasattr(event, 'assist_type'):
+            return _ASSIST_TYPE_TO_ID[event.assist_type]
+
+        return NO_SUBTYPE
+
+    # region Games masks
+
+    @property
+    def maccabi_score_diff(self) -> np.ndarray:
+        return self.maccabi_score - self.not_maccabi_score
+
+    def competition_mask(self, competitions: Iterable[str]) -> np.ndarray:
+        return np.isin(self.competition, self.competitions.find_many(competitions))
+
+    # endregion
+
+    # region Events masks
+
+    def maccabi_events_mask(self, event_type: GameEventTypes, subtype_id: Optional[int] = None) -> np.ndarray:
+        """
+        Mask of maccabi players events from the given type (and subtype, goal type or assist type id, if given).
+        """
+        mask = self.event_is_maccabi & (self.event_type == _EVENT_TYPE_TO_ID[event_type])
+        if subtype_id is not None:
+            mask &= self.event_subtype == subtype_id
+
+        return mask
+
+    @property
+    def maccabi_played_mask(self) -> np.ndarray:
+        return self.squad_is_maccabi & self.squad_played
+
+    # endregion
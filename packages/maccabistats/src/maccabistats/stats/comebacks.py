@@ -5,7 +5,6 @@ from itertools import chain
 from typing import TYPE_CHECKING
 
 from maccabistats.models.game_data import GameData
-from maccabistats.models.player_game_events import GoalTypes
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
@@ -156,17 +155,5 @@ class MaccabiGamesComebacksStats(object):
             Maccabi (1) - (2) Opponent -> advantage= -1
         """
 
-        game_goals = game.goals()
-
-        # We save list of all goals timeline and find the minimum (max advantage for opponent).
-        goals_diff = [0]
-        for goal in game_goals:
-            next_goal_status = 1 if goal['team'] == 'מכבי תל אביב' else -1
-
-            if 'goal_type' in goal and goal['goal_type'] == GoalTypes.OWN_GOAL.value:
-                next_goal_status *= -1
-
-            # We add the last status + new goal (1 for maccabi, -1 for opponent).
-            goals_diff.append(goals_diff[-1] + next_goal_status)
-
-        return min(goals_diff)
+        # The minimum score diff (for maccabi) along the goals timeline is the max advantage for the opponent.
+        return min([0] + [goal.maccabi_score - goal.not_maccabi_score for goal in game.goals_timeline])
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import csv
-import itertools
 import json
 import logging
 import shutil
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, TextIO
 
 from maccabistats.models.game_data import GameData
 from maccabistats.version import version
@@ -19,11 +18,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 GameInformation = Dict[str, Any]
-PlayersEventsInformation = List[Dict[str, Any]]
+PlayerEventInformation = Dict[str, Any]
+PlayersEventsInformation = List[PlayerEventInformation]
 
 _BASE_EXPORT_FOLDER = Path.home() / 'maccabistats' / 'export'
 
+_GAME_DATA_PROPERTIES = ['stadium', 'date', 'crowd', 'referee', 'competition', 'fixture', 'season', 'technical_result',
+                         'home_team_name', 'home_team_score', 'home_team_coach',
+                         'away_team_name', 'away_team_score', 'away_team_coach']
+_EVENT_PROPERTIES = ['player_name', 'player_number', 'player_event_type', 'player_time_occur', 'player_team']
 _OPTIONAL_EVENT_PROPERTIES = ['player_goal_type', 'player_assist_type']
+_PLAYERS_EVENTS_PROPERTIES = _GAME_DATA_PROPERTIES + _EVENT_PROPERTIES + _OPTIONAL_EVENT_PROPERTIES
+
+# The players events properties types at the columnar (parquet) export
+_PLAYERS_EVENTS_INT_PROPERTIES = {'home_team_score', 'away_team_score', 'player_time_occur'}
+_PLAYERS_EVENTS_BOOL_PROPERTIES = {'technical_result'}
+_PLAYERS_EVENTS_STRING_PROPERTIES = set(_PLAYERS_EVENTS_PROPERTIES) - _PLAYERS_EVENTS_INT_PROPERTIES - \
+    _PLAYERS_EVENTS_BOOL_PROPERTIES
+# The players events are written to parquet in batches of rows (a row group for each), so the memory stays flat
+_PARQUET_BATCH_ROWS = 50_000
 
 
 class ExportMaccabiGamesStats(object):
@@ -56,48 +69,49 @@ class ExportMaccabiGamesStats(object):
         game_events = []
         game_data = ExportMaccabiGamesStats._create_game_data_dict(game)
 
-        for current_event_data in game.events:
+        teams_events = [(team, player, event) for team in (game.maccabi_team, game.not_maccabi_team)
+                        for player in team.players for event in player.events]
+        for team, player, event in sorted(teams_events, key=lambda team_event: team_event[2].time_occur):
             # In order to prevent name collision and make te data more readable:
-            event_data_with_player_prefix = {f'player_{key}': value for key, value in current_event_data.items()}
-
-            hours, minutes, seconds = event_data_with_player_prefix['player_time_occur'].split(":")
-            event_data_with_player_prefix['player_time_occur'] = (int(hours) * 60) + int(minutes)
+            event_data_with_player_prefix = {f'player_{key}': value for key, value in event.json_dict().items()}
+            event_data_with_player_prefix['player_time_occur'] = event.time_occur // timedelta(minutes=1)
 
-            game_events.append({**game_data, **event_data_with_player_prefix})
+            game_events.append({**game_data, 'player_name': player.name, 'player_number': player.number,
+                                **event_data_with_player_prefix, 'player_team': team.name})
 
         return game_events
 
-    def _players_events_dict(self) -> List[PlayersEventsInformation]:
-        logger.info('Starting to create a dict with all player events data')
-        all_games = []
-
+    def _players_events(self) -> Iterator[PlayerEventInformation]:
+        """
+        The players events of all of the games, one game at a time (without holding all of the games events).
+        """
         for game in self.maccabi_games_stats:
-            current_game_data = self._create_players_events_from_specific_game(game)
+            game_events = self._create_players_events_from_specific_game(game)
 
-            if not current_game_data:
+            if not game_events:
                 logger.warning(f'Game: {game} is empty, could not serialize it, skipping it')
                 continue
 
-            all_games.append(current_game_data)
-
-        logger.info('Finished to create a dict with all players events data')
-        return all_games
-
-    def _create_all_games_data(self) -> List[GameInformation]:
-        logger.info('Starting to create a dict with all games data')
-        all_games = []
+            yield from game_events
 
+    def _games_data(self) -> Iterator[GameInformation]:
         for game in self.maccabi_games_stats:
-            current_game_data = self._create_game_data_dict(game)
-
-            if not current_game_data:
-                logger.warning(f'Game: {game} is empty, could not serialize it, skipping it')
-                continue
+            yield self._create_game_data_dict(game)
 
-            all_games.append(current_game_data)
+    def _players_events_dict(self) -> List[PlayersEventsInformation]:
+        """
+        The players events of all of the games, a list for each game (holds all of the games events in memory).
+        Kept for the code that used it before the export was streamed, the exports use _players_events.
+        """
+        players_events_by_game = [self._create_players_events_from_specific_game(game)
+                                  for game in self.maccabi_games_stats]
+        return [game_events for game_events in players_events_by_game if game_events]
 
-        logger.info('Finished to create a dict with all games data')
-        return all_games
+    def _create_all_games_data(self) -> List[GameInformation]:
+        """
+        The games data of all of the games, kept for the code that used it before the export was streamed.
+        """
+        return list(self._games_data())
 
     def export_players_events_json(self, folder_path: Optional[Path] = None) -> Path:
         now = _formatted_now()
@@ -111,6 +125,37 @@ class ExportMaccabiGamesStats(object):
         self._create_legend_for_maccabistats_data(folder_path)
         return file_path
 
+    def export_players_events_json_lines(self, folder_path: Optional[Path] = None) -> Path:
+        """
+        Export the players events as JSON lines, a JSON object for each event.
+        """
+        now = _formatted_now()
+        folder_path = folder_path or (_BASE_EXPORT_FOLDER / f'{now}_players_events')
+        folder_path.mkdir(parents=True, exist_ok=True)
+
+        file_path = self._create_players_events_json_lines(folder_path)
+
+        logger.info(f'Exported MaccabiGamesStats to players events json lines at: {file_path} successfully!')
+
+        self._create_legend_for_maccabistats_data(folder_path)
+        return file_path
+
+    def export_players_events_parquet(self, folder_path: Optional[Path] = None) -> Path:
+        """
+        Export the players events as a parquet (columnar) file, for pandas / duckdb and so on.
+        Requires pyarrow: pip install maccabistats[parquet]
+        """
+        now = _formatted_now()
+        folder_path = folder_path or (_BASE_EXPORT_FOLDER / f'{now}_players_events')
+        folder_path.mkdir(parents=True, exist_ok=True)
+
+        file_path = self._create_players_events_parquet(folder_path)
+
+        logger.info(f'Exported MaccabiGamesStats to players events parquet at: {file_path} successfully!')
+
+        self._create_legend_for_maccabistats_data(folder_path)
+        return file_path
+
     def export_games_data_json(self, folder_path: Optional[Path] = None) -> Path:
         now = _formatted_now()
         folder_path = folder_path or (_BASE_EXPORT_FOLDER / f'{now}_games_data')
@@ -194,51 +239,65 @@ class ExportMaccabiGamesStats(object):
     def _create_players_events_csv(self, folder_path: Path) -> Path:
         file_path = folder_path / 'players_events_maccabistats.csv'
 
-        games_data = itertools.chain.from_iterable(self._players_events_dict())
-        first_player_event = next(games_data)
-
         with file_path.open(mode='w', encoding='utf8', newline='') as csv_file:
-            writer = csv.DictWriter(csv_file,
-                                    delimiter=',',
-                                    fieldnames=list(first_player_event.keys()) + _OPTIONAL_EVENT_PROPERTIES)
+            writer = csv.DictWriter(csv_file, delimiter=',', fieldnames=_PLAYERS_EVENTS_PROPERTIES)
             writer.writeheader()
-
-            writer.writerow(first_player_event)  # Because we popped it out to set the header
-            writer.writerows(games_data)
+            writer.writerows(self._players_events())
 
         return file_path
 
     def _create_players_events_json(self, folder_path: Path) -> Path:
         file_path = folder_path / 'players_events_maccabistats.json'
 
-        players_events = itertools.chain.from_iterable(self._players_events_dict())
+        with file_path.open(mode='w', encoding='utf8') as json_file:
+            _write_json_list(json_file, self._players_events())
+
+        return file_path
+
+    def _create_players_events_json_lines(self, folder_path: Path) -> Path:
+        file_path = folder_path / 'players_events_maccabistats.jsonl'
 
-        jsoned_data = json.dumps(list(players_events), indent=4, ensure_ascii=False)
-        file_path.write_text(jsoned_data, encoding='utf8')
+        json_encoder = json.JSONEncoder(ensure_ascii=False)
+        with file_path.open(mode='w', encoding='utf8') as json_lines_file:
+            for player_event in self._players_events():
+                json_lines_file.write(f'{json_encoder.encode(player_event)}\n')
+
+        return file_path
+
+    def _create_players_events_parquet(self, folder_path: Path) -> Path:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError('Exporting to parquet requires pyarrow, install it with: '
+                              'pip install maccabistats[parquet]') from e
+
+        file_path = folder_path / 'players_events_maccabistats.parquet'
+        schema = pa.schema([(name, pa.string() if name in _PLAYERS_EVENTS_STRING_PROPERTIES else
+                                   pa.int64() if name in _PLAYERS_EVENTS_INT_PROPERTIES else pa.bool_())
+                            for name in _PLAYERS_EVENTS_PROPERTIES])
+
+        with pq.ParquetWriter(file_path, schema) as parquet_writer:
+            for players_events_columns in _columns_batches(self._players_events(), _PARQUET_BATCH_ROWS):
+                parquet_writer.write_table(pa.table(players_events_columns, schema=schema))
 
         return file_path
 
     def _create_games_data_csv(self, folder_path: Path) -> Path:
         file_path = folder_path / 'games_data_maccabistats.csv'
 
-        games_data = self._create_all_games_data()
-
         with file_path.open(mode='w', encoding='utf8', newline='') as csv_file:
-            writer = csv.DictWriter(csv_file,
-                                    delimiter=',',
-                                    fieldnames=list(games_data[0].keys()))
+            writer = csv.DictWriter(csv_file, delimiter=',', fieldnames=_GAME_DATA_PROPERTIES)
             writer.writeheader()
-            writer.writerows(games_data)
+            writer.writerows(self._games_data())
 
         return file_path
 
     def _create_games_data_json(self, folder_path: Path) -> Path:
         file_path = folder_path / 'games_data_maccabistats.json'
 
-        games_data = self._create_all_games_data()
-
-        jsoned_data = json.dumps(list(games_data), indent=4, ensure_ascii=False)
-        file_path.write_text(jsoned_data, encoding='utf8')
+        with file_path.open(mode='w', encoding='utf8') as json_file:
+            _write_json_list(json_file, self._games_data())
 
         return file_path
 
@@ -274,3 +333,43 @@ class ExportMaccabiGamesStats(object):
 
 def _formatted_now() -> str:
     return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+
+def _write_json_list(json_file: TextIO, items: Iterable[Dict[str, Any]]) -> None:
+    """
+    Writes the items as a JSON list, one item at a time (the same text as json.dumps(list(items), indent=4)).
+    """
+    json_encoder = json.JSONEncoder(indent=4, ensure_ascii=False)
+
+    json_file.write('[')
+    has_items = False
+    for item in items:
+        item_lines = json_encoder.encode(item).replace('\n', '\n    ')
+        json_file.write(f'{"," if has_items else ""}\n    {item_lines}')
+        has_items = True
+
+    json_file.write('\n]' if has_items else ']')
+
+
+def _columns_batches(players_events: Iterable[PlayerEventInformation],
+                     batch_rows: int) -> Iterator[Dict[str, List[Any]]]:
+    """
+    The players events as columns (property name to its values), batch_rows rows at a time.
+    """
+    columns = {name: [] for name in _PLAYERS_EVENTS_PROPERTIES}
+    rows_count = 0
+    for player_event in players_events:
+        for name, values in columns.items():
+            value = player_event.get(name)
+            if value is not None and name in _PLAYERS_EVENTS_STRING_PROPERTIES:
+                value = str(value)
+            values.append(value)
+
+        rows_count += 1
+        if rows_count == batch_rows:
+            yield columns
+            columns = {name: [] for name in _PLAYERS_EVENTS_PROPERTIES}
+            rows_count = 0
+
+    if rows_count:
+        yield columns
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from maccabistats.stats.columns import MaccabiGamesColumns, StringTable
+
+logger = logging.getLogger(__name__)
+
+# The indexed entities of the games table, by their column name and their strings table name
+GAMES_ENTITIES = dict(competition='competitions', opponent='opponents', stadium='stadiums', referee='referees',
+                      coach='coaches', season='seasons')
+# The indexed maccabi players, in the game squad (played or at the bench) or played in the game
+PLAYERS_ENTITIES = ('squad_player', 'played_player')
+
+
+class MaccabiGamesIndex(object):
+    """
+    Inverted index of the games: each entity value (coach, referee, stadium, opponent... or player) to the sorted
+    indices of its games. The games of each entity are indexed on its first lookup, then a lookup is O(its games).
+
+    The games of an entity are kept as one array ordered by the value id (and the game), with the bounds of each value.
+    """
+
+    def __init__(self, columns: MaccabiGamesColumns) -> None:
+        self.columns = columns
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._players_ids_by_stripped_name: Dict[str, List[int]] = {}
+
+    def _table(self, entity: str) -> StringTable:
+        return self.columns.players if entity in PLAYERS_ENTITIES else getattr(self.columns, GAMES_ENTITIES[entity])
+
+    def _entity_values_and_games(self, entity: str) -> Tuple[np.ndarray, np.ndarray]:
+        columns = self.columns
+        if entity in GAMES_ENTITIES:
+            return getattr(columns, entity), np.arange(columns.games_count)
+
+        rows = columns.squad_is_maccabi if entity == 'squad_player' else columns.maccabi_played_mask
+        # A player is counted once per game, even if his name appears twice at the game squad
+        keys = np.unique(columns.squad_player[rows].astype(np.int64) * max(columns.games_count, 1) +
+                         columns.squad_game[rows])
+        return np.divmod(keys, max(columns.games_count, 1))
+
+    def _entity_postings(self, entity: str) -> Tuple[np.ndarray, np.ndarray]:
+        postings = self._postings.get(entity)
+        if postings is None:
+            values, games = self._entity_values_and_games(entity)
+            order = np.argsort(values, kind='stable')
+            bounds = np.searchsorted(values[order], np.arange(len(self._table(entity)) + 1))
+            postings = self._postings[entity] = games[order], bounds
+
+            logger.debug(f'Indexed the games of {len(self._table(entity))} {entity} values')
+
+        return postings
+
+    def _value_ids(self, entity: str, value: str) -> List[int]:
+        if entity not in PLAYERS_ENTITIES:
+            value_id = self._table(entity).find(value)
+            return [value_id] if value_id >= 0 else []
+
+        # The players are searched by their stripped name (the name may be saved with spaces)
+        if not self._players_ids_by_stripped_name:
+            for player_id, player_name in enumerate(self.columns.players.values):
+                self._players_ids_by_stripped_name.setdefault(player_name.strip(), []).append(player_id)
+
+        return self._players_ids_by_stripped_name.get(value, [])
+
+    def games_indices(self, entity: str, values: Iterable[str]) -> np.ndarray:
+        """
+        :param entity: One of GAMES_ENTITIES (by its column name) or PLAYERS_ENTITIES.
+        :param values: The entity values (such as coaches names) to find the games of.
+        :return: The sorted indices of the games of any of the given values.
+        """
+        games, bounds = self._entity_postings(entity)
+        values_games = [games[bounds[value_id]: bounds[value_id + 1]]
+                        for value in values for value_id in self._value_ids(entity, value)]
+
+        if len(values_games) == 1:
+            return values_games[0]
+        return np.unique(np.concatenate(values_games)) if values_games else np.empty(0, dtype=np.intp)
+
+    def games_count(self, entity: str, values: Iterable[str]) -> int:
+        """
+        The count of the games of the given values, without taking them (a player games may be counted twice,
+        when he has two names with the same stripped name). Used to order the lookups by their selectivity.
+        """
+        _, bounds = self._entity_postings(entity)
+        return sum(int(bounds[value_id + 1] - bounds[value_id])
+                   for value in values for value_id in self._value_ids(entity, value))
+
+    def available_values(self, entity: str) -> List[str]:
+        """
+        The entity values that have games, by their first appearance.
+        """
+        _, bounds = self._entity_postings(entity)
+        table = self._table(entity)
+        return [table[value_id] for value_id in np.flatnonzero(np.diff(bounds)).tolist()]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from maccabistats.stats.columns import as_datetime64
+from maccabistats.stats.games_index import GAMES_ENTITIES
+from maccabistats.stats.results import results_ratio
+
+if TYPE_CHECKING:
+    from maccabistats.stats.columns import MaccabiGamesColumns
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+# Gets the columns of the candidate games and returns the mask of the games that pass the filter
+GamesMaskFilter = Callable[['MaccabiGamesColumns'], np.ndarray]
+
+
+class GamesGroup(object):
+    """
+    The games of one group by value and their results aggregates, named as the MaccabiGamesResultsStats properties.
+    """
+
+    def __init__(self, name: str, games_indices: np.ndarray, wins_count: int, ties_count: int, losses_count: int,
+                 clean_sheets_count: int, total_goals_for_maccabi: int, total_goals_against_maccabi: int) -> None:
+        """
+        :param games_indices: The sorted indices of the group games, in the games of the grouped MaccabiGamesStats.
+        """
+        self.name = name
+        self.games_indices = games_indices
+        self.wins_count = wins_count
+        self.ties_count = ties_count
+        self.losses_count = losses_count
+        self.clean_sheets_count = clean_sheets_count
+        self.total_goals_for_maccabi = total_goals_for_maccabi
+        self.total_goals_against_maccabi = total_goals_against_maccabi
+
+    @property
+    def total_games_count(self) -> int:
+        return len(self.games_indices)
+
+    @property
+    def total_goals_diff_for_maccabi(self) -> int:
+        return self.total_goals_for_maccabi - self.total_goals_against_maccabi
+
+    @property
+    def goals_ratio(self) -> float:
+        """
+        Goals for maccabi / Goals against maccabi
+        """
+        return results_ratio(self.total_goals_for_maccabi, self.total_goals_against_maccabi)
+
+    @property
+    def wins_percentage(self) -> float:
+        return results_ratio(self.wins_count, self.total_games_count)
+
+    @property
+    def ties_percentage(self) -> float:
+        return results_ratio(self.ties_count, self.total_games_count)
+
+    @property
+    def losses_percentage(self) -> float:
+        return results_ratio(self.losses_count, self.total_games_count)
+
+    @property
+    def clean_sheets_percentage(self) -> float:
+        return results_ratio(self.clean_sheets_count, self.total_games_count)
+
+    def __repr__(self) -> str:
+        return f'{self.name} | {self.total_games_count} games'
+
+
+class MaccabiGamesQuery(object):
+    """
+    Collects games filters and takes their games at once, instead of a MaccabiGamesStats for each chained filter:
+    maccabi_games_stats.query().competition(in_=LEAGUE_COMPETITIONS).home().season('2019/20').player('...').games()
+
+    The entities filters (season, coach, player...) are taken from the games index, from the one with the fewest games,
+    then the rest of the filters (home, competition, result, date) are applied only to the games that are left.
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+        self.maccabi_games_stats = maccabi_games_stats
+        self._index_filters: List[Tuple[str, List[str]]] = []
+        self._mask_filters: List[GamesMaskFilter] = []
+        self._descriptions: List[str] = []
+
+    def _by_index(self, entity: str, values: Iterable[str], description: str) -> MaccabiGamesQuery:
+        self._index_filters.append((entity, list(values)))
+        self._descriptions.append(description)
+        return self
+
+    def _by_mask(self, mask_filter: GamesMaskFilter, description: str) -> MaccabiGamesQuery:
+        self._mask_filters.append(mask_filter)
+        self._descriptions.append(description)
+        return self
+
+    # region Filters
+
+    def home(self) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: columns.is_home, 'Home games')
+
+    def away(self) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: ~columns.is_home, 'Away games')
+
+    def competition(self, *competitions: str, in_: Iterable[str] = ()) -> MaccabiGamesQuery:
+        """
+        :param competitions: The games of any of these competitions are kept, same as the competitions at in_.
+        """
+        competitions = list(competitions) + list(in_)
+        return self._by_mask(lambda columns: columns.competition_mask(competitions), f'Competitions: {competitions}')
+
+    def wins(self) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: columns.maccabi_score_diff > 0, 'Wins only')
+
+    def ties(self) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: columns.maccabi_score_diff == 0, 'Ties only')
+
+    def losses(self) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: columns.maccabi_score_diff < 0, 'Losses only')
+
+    def played_before(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: columns.dates <= as_datetime64(date), f'Played before: {date}')
+
+    def played_after(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesQuery:
+        return self._by_mask(lambda columns: columns.dates >= as_datetime64(date), f'Played after: {date}')
+
+    def season(self, *seasons: str) -> MaccabiGamesQuery:
+        """
+        :param seasons: The games of any of these seasons are kept, seasons may be entered as "1900/01".
+        """
+        return self._by_index('season', seasons, f'Season {", ".join(seasons)}')
+
+    def opponent(self, team_name: str) -> MaccabiGamesQuery:
+        # Same as get_games_against_team, the team is found by its name at the game or the name it has these days
+        current_team_name = self.maccabi_games_stats._team_names_convertor.find_team_current_name(team_name)
+        return self._by_index('opponent', [current_team_name], f'Against team: {team_name}')
+
+    def coach(self, coach_name: str) -> MaccabiGamesQuery:
+        return self._by_index('coach', [coach_name], f'Coach: {coach_name}')
+
+    def referee(self, referee_name: str) -> MaccabiGamesQuery:
+        return self._by_index('referee', [referee_name], f'Referee: {referee_name}')
+
+    def stadium(self, stadium_name: str) -> MaccabiGamesQuery:
+        return self._by_index('stadium', [stadium_name], f'Stadium: {stadium_name}')
+
+    def player(self, player_name: str) -> MaccabiGamesQuery:
+        """
+        The games that this player was in their squad, played or at the bench.
+        """
+        return self._by_index('squad_player', [player_name], f'Player in squad: {player_name}')
+
+    def played_player(self, player_name: str) -> MaccabiGamesQuery:
+        return self._by_index('played_player', [player_name], f'Played player: {player_name}')
+
+    # endregion
+
+    def _games_indices(self) -> np.ndarray:
+        columns = self.maccabi_games_stats.columns
+        games_index = self.maccabi_games_stats._games_index
+
+        # The filter with the fewest games first, so each of the next filters only narrows down a few games
+        games_indices = None
+        index_filters = sorted(self._index_filters, key=lambda index_filter: games_index.games_count(*index_filter))
+        for entity, values in index_filters:
+            entity_games_indices = games_index.games_indices(entity, values)
+            games_indices = entity_games_indices if games_indices is None \
+                else np.intersect1d(games_indices, entity_games_indices, assume_unique=True)
+
+            if len(games_indices) == 0:
+                return games_indices
+
+        if games_indices is None:
+            games_indices, games_columns = np.arange(columns.games_count), columns
+        else:
+            games_columns = columns.take(games_indices)
+
+        if self._mask_filters:
+            games_mask = np.ones(len(games_indices), dtype=bool)
+            for mask_filter in self._mask_filters:
+                games_mask &= mask_filter(games_columns)
+            games_indices = games_indices[games_mask]
+
+        return games_indices
+
+    def games(self) -> MaccabiGamesStats:
+        """
+        :return: A MaccabiGamesStats of the games that pass all of the filters, described by the filters.
+        """
+        description = self.maccabi_games_stats._new_description(' + '.join(self._descriptions)) \
+            if self._descriptions else self.maccabi_games_stats.description
+        return self.maccabi_games_stats._create_games_view(self._games_indices(), description)
+
+    def group_by(self, entity: str) -> Dict[str, GamesGroup]:
+        """
+        The games of each value of the given entity and their results aggregates, in one pass over the games.
+
+        :param entity: One of GAMES_ENTITIES (by its column name), such as season, opponent (current name) or coach.
+        :return: Each value (ordered by its first game) to its group, of the games that pass all of the filters.
+        """
+        if entity not in GAMES_ENTITIES:
+            raise ValueError(f"Unknown group by entity: {entity}, should be one of: {list(GAMES_ENTITIES)}")
+
+        columns = self.maccabi_games_stats.columns
+        games_indices = self._games_indices()
+        groups_values, groups_first_games, games_groups = np.unique(getattr(columns, entity)[games_indices],
+                                                                    return_index=True, return_inverse=True)
+
+        def groups_sum(games_values: np.ndarray) -> List[int]:
+            groups_sums = np.bincount(games_groups, weights=games_values, minlength=len(groups_values))
+            return groups_sums.astype(np.int64).tolist()
+
+        score_diff = columns.maccabi_score_diff[games_indices]
+        not_maccabi_score = columns.not_maccabi_score[games_indices]
+        wins, ties, losses = groups_sum(score_diff > 0), groups_sum(score_diff == 0), groups_sum(score_diff < 0)
+        clean_sheets = groups_sum(not_maccabi_score == 0)
+        goals_for, goals_against = groups_sum(columns.maccabi_score[games_indices]), groups_sum(not_maccabi_score)
+
+        # The games of each group are consecutive when ordered by their group, and still ordered by date
+        groups_games_counts = np.bincount(games_groups, minlength=len(groups_values))
+        groups_games_indices = np.split(games_indices[np.argsort(games_groups, kind='stable')],
+                                        np.cumsum(groups_games_counts)[:-1])
+
+        values_table = getattr(columns, GAMES_ENTITIES[entity])
+        groups = {}
+        for group in np.argsort(groups_first_games).tolist():
+            name = values_table[groups_values[group]]
+            groups[name] = GamesGroup(name, groups_games_indices[group], wins[group], ties[group], losses[group],
+                                      clean_sheets[group], goals_for[group], goals_against[group])
+
+        logger.debug(f'Grouped {len(games_indices)} games by {entity} to {len(groups)} groups')
+        return groups
@@ -0,0 +1,574 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+from collections import defaultdict
+from enum import Enum
+from functools import cached_property, partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from maccabistats.maccabipedia.players import MaccabiPediaPlayerData, MaccabiPediaPlayers
+from maccabistats.models.game_data import GameData, MACCABI_TEAM_NAMES
+from maccabistats.models.player_game_events import GameEvent, GoalGameEvent, AssistGameEvent, GameEventTypes, \
+    GoalTypes, AssistTypes
+from maccabistats.models.player_in_game import PlayerInGame
+from maccabistats.models.team_in_game import TeamInGame
+from maccabistats.stats.columns import MaccabiGamesColumns, StringTable, NO_SUBTYPE, event_type_id, goal_type_id, \
+    assist_type_id
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+# A snapshot file is: the magic, the format version (uint32), the header length (uint64), the header (json)
+# and the arrays. The header describes each array (dtype, shape and offset from the first array),
+# each array starts at a 64 bytes boundary, so it is used straight from the memory mapped file.
+# Every text (or any other loose) value is saved once in the values table (a json array), the arrays keep its index.
+SNAPSHOT_MAGIC = b'MACCSNAP'
+# 2: no player_played array, it is taken from the events
+# 3: game_date array, the fixes change a game date without its full date
+SNAPSHOT_FORMAT_VERSION = 3
+
+_PREFIX = struct.Struct('<IQ')
+_ALIGNMENT = 64
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_MICROSECONDS_IN_DAY = 24 * 60 * 60 * 10 ** 6
+
+# The enums are saved by their values (the header keeps the values list), so renamed values are loaded by their
+# _missing_ just like the pickled ones
+_ENUMS = {enum_class.__name__: enum_class for enum_class in (GameEventTypes, GoalTypes, AssistTypes)}
+
+# The class of each event, by its kind id
+_EVENTS_CLASSES = (GameEvent, GoalGameEvent, AssistGameEvent)
+_GAME_EVENT, _GOAL_EVENT, _ASSIST_EVENT = range(len(_EVENTS_CLASSES))
+_EVENTS_KINDS = {event_class: kind for kind, event_class in enumerate(_EVENTS_CLASSES)}
+
+_GAMES_VALUES_FIELDS = ('competition', 'fixture', 'date_as_hebrew_string', 'stadium', 'crowd', 'referee', 'season',
+                        '_half_parsed_events')
+_TEAMS_VALUES_FIELDS = ('name', 'current_name', 'coach')
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _encode_value(value: Any) -> Any:
+    # The half parsed events contain our enums and time deltas
+    if isinstance(value, Enum) and type(value).__name__ in _ENUMS:
+        return dict(__enum__=type(value).__name__, value=value.value)
+    elif isinstance(value, datetime.timedelta):
+        return dict(__timedelta__=value // _MICROSECOND)
+
+    raise TypeError(f"Can not save {type(value).__name__} in a games snapshot: {value!r}")
+
+
+def _decode_value(json_object: Dict[str, Any]) -> Any:
+    if '__enum__' in json_object:
+        return _ENUMS[json_object['__enum__']](json_object['value'])
+    elif '__timedelta__' in json_object:
+        return datetime.timedelta(microseconds=json_object['__timedelta__'])
+
+    return json_object
+
+
+class _ValuesTable(object):
+    """
+    Keeps each distinct value once (by its type as well, so crowd "1000" and 1000 are kept apart).
+    """
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self._ids: Dict[Any, int] = {}
+
+    def add(self, value: Any) -> int:
+        if isinstance(value, (str, int, float, type(None))):
+            key = (type(value), value)
+        else:
+            key = json.dumps(value, default=_encode_value, sort_keys=True)
+
+        value_id = self._ids.get(key)
+        if value_id is None:
+            value_id = self._ids[key] = len(self.values)
+            self.values.append(value)
+
+        return value_id
+
+    def as_array(self) -> np.ndarray:
+        return np.frombuffer(json.dumps(self.values, default=_encode_value, ensure_ascii=False).encode('utf-8'),
+                             dtype=np.uint8)
+
+
+def _players_profiles(players_data) -> List[MaccabiPediaPlayerData]:
+    # Players data (MaccabiPediaPlayers or the tests stub) is used only by its players dates & home players
+    players_dates = players_data.players_dates
+    names = list(players_dates) + sorted(players_data.home_players - players_dates.keys())
+    return [MaccabiPediaPlayerData(name=name,
+                                   birth_date=players_dates.get(name, MaccabiPediaPlayers.missing_birth_date_value),
+                                   is_home_player=name in players_data.home_players)
+            for name in names]
+
+
+def write_games_snapshot(maccabi_games_stats: MaccabiGamesStats, file_path: str) -> None:
+    """
+    Writes the games & players data of the given MaccabiGamesStats as a snapshot file.
+    The snapshot is written to a temporary file that replaces the given file once it is complete, so a snapshot that
+    is loaded from that file (its memory mapped arrays) is never changed under it.
+    """
+    values = _ValuesTable()
+    enums_ids = {enum_class: {member: index for index, member in enumerate(enum_class)}
+                 for enum_class in _ENUMS.values()}
+    event_types_ids, goal_types_ids, assist_types_ids = (enums_ids[GameEventTypes], enums_ids[GoalTypes],
+                                                         enums_ids[AssistTypes])
+
+    columns = defaultdict(list)
+    team_players_offsets, player_events_offsets = [0], [0]
+    for game in sorted(maccabi_games_stats.games, key=lambda g: g.date):
+        columns['game_full_date'].append((game._full_date - _EPOCH) // _MICROSECOND)
+        columns['game_date'].append((game.date - _EPOCH) // _MICROSECOND)
+        for field in _GAMES_VALUES_FIELDS:
+            columns[f'game_{field.lstrip("_")}'].append(values.add(getattr(game, field)))
+        columns['game_technical_result'].append(bool(game.technical_result))
+
+        for team in (game.home_team, game.away_team):
+            for field in _TEAMS_VALUES_FIELDS:
+                columns[f'team_{field}'].append(values.add(getattr(team, field)))
+            columns['team_score'].append(team.score)
+
+            for player in team.players:
+                columns['player_name'].append(values.add(player.name))
+                columns['player_number'].append(values.add(player.number))
+
+                for event in player.events:
+                    kind = _EVENTS_KINDS[type(event)]
+                    if kind == _GOAL_EVENT:
+                        subtype = goal_types_ids.get(getattr(event, 'goal_type', None), -1)
+                    elif kind == _ASSIST_EVENT:
+                        subtype = assist_types_ids.get(getattr(event, 'assist_type', None), -1)
+                    else:
+                        subtype = -1
+
+                    columns['event_type'].append(event_types_ids[event.event_type])
+                    columns['event_kind'].append(kind)
+                    columns['event_subtype'].append(subtype)
+                    columns['event_time'].append(event.time_occur // _MICROSECOND)
+
+                player_events_offsets.append(len(columns['event_type']))
+            team_players_offsets.append(len(columns['player_name']))
+
+    players_data = maccabi_games_stats.players_data
+    for profile in _players_profiles(players_data) if players_data is not None else []:
+        columns['profile_name'].append(values.add(profile.name))
+        columns['profile_birth_date'].append((profile.birth_date - _EPOCH) // _MICROSECOND)
+        columns['profile_is_home'].append(profile.is_home_player)
+
+    arrays = dict(
+        game_full_date=np.array(columns['game_full_date'], dtype='<i8'),
+        game_date=np.array(columns['game_date'], dtype='<i8'),
+        **{f'game_{field.lstrip("_")}': np.array(columns[f'game_{field.lstrip("_")}'], dtype='<i4')
+           for field in _GAMES_VALUES_FIELDS},
+        game_technical_result=np.array(columns['game_technical_result'], dtype=bool),
+        **{f'team_{field}': np.array(columns[f'team_{field}'], dtype='<i4') for field in _TEAMS_VALUES_FIELDS},
+        team_score=np.array(columns['team_score'], dtype='<i4'),
+        team_players_offsets=np.array(team_players_offsets, dtype='<i8'),
+        player_name=np.array(columns['player_name'], dtype='<i4'),
+        player_number=np.array(columns['player_number'], dtype='<i4'),
+        player_events_offsets=np.array(player_events_offsets, dtype='<i8'),
+        event_type=np.array(columns['event_type'], dtype=np.uint8),
+        event_kind=np.array(columns['event_kind'], dtype=np.uint8),
+        event_subtype=np.array(columns['event_subtype'], dtype=np.int8),
+        event_time=np.array(columns['event_time'], dtype='<i8'),
+        profile_name=np.array(columns['profile_name'], dtype='<i4'),
+        profile_birth_date=np.array(columns['profile_birth_date'], dtype='<i8'),
+        profile_is_home=np.array(columns['profile_is_home'], dtype=bool),
+        values=values.as_array(),
+    )
+
+    arrays_header, arrays_size = {}, 0
+    for name, array in arrays.items():
+        arrays_header[name] = dict(dtype=array.dtype.str, shape=list(array.shape), offset=arrays_size)
+        arrays_size = _aligned(arrays_size + array.nbytes)
+
+    header = json.dumps(dict(maccabistats_version=maccabi_games_stats.version,
+                             description=maccabi_games_stats.description,
+                             games_count=len(columns['game_full_date']),
+                             has_players_data=players_data is not None,
+                             enums={name: [member.value for member in enum_class]
+                                    for name, enum_class in _ENUMS.items()},
+                             arrays=arrays_header), ensure_ascii=False).encode('utf-8')
+    arrays_start = _aligned(len(SNAPSHOT_MAGIC) + _PREFIX.size + len(header))
+
+    temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_file_path, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + _PREFIX.pack(SNAPSHOT_FORMAT_VERSION, len(header)) + header)
+            for name, array in arrays.items():
+                f.seek(arrays_start + arrays_header[name]['offset'])
+                f.write(array.tobytes())
+        os.replace(temp_file_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+        raise
+
+    logger.info(f"Wrote a snapshot of {len(columns['game_full_date'])} games "
+                f"({len(values.values)} distinct values) to: {file_path}")
+
+
+def is_games_snapshot(file_path: str) -> bool:
+    with open(file_path, 'rb') as f:
+        return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+
+
+def _concatenated_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    The indices of all of the given ranges, one after the other.
+    """
+    lengths = ends - starts
+    return np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+
+
+def _string_table_by_first_appearance(value_ids: np.ndarray, values: List[Any]) -> Tuple[StringTable, np.ndarray]:
+    """
+    Re-maps the given values ids to a StringTable with the same ids as adding the values one by one would give.
+    """
+    unique_value_ids, first_rows, inverse = np.unique(value_ids, return_index=True, return_inverse=True)
+    order = np.argsort(first_rows, kind='stable')
+    table_ids = np.empty(len(unique_value_ids), dtype=np.int32)
+    table_ids[order] = np.arange(len(unique_value_ids), dtype=np.int32)
+
+    table = StringTable.from_values(values[value_id] for value_id in unique_value_ids[order].tolist())
+    return table, table_ids[inverse.ravel()]
+
+
+class MaccabiGamesSnapshot(object):
+    """
+    The (memory mapped) arrays of a snapshot file, the games objects and the columns are created from them.
+    close() releases the memory mapped file (a mapped file can't be replaced on Windows).
+    """
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, 'rb') as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{file_path} is not a maccabi games snapshot")
+
+            format_version, header_length = _PREFIX.unpack(f.read(_PREFIX.size))
+            if format_version > SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"{file_path} snapshot format version is {format_version}, this maccabistats version "
+                                 f"reads up to version {SNAPSHOT_FORMAT_VERSION}, please upgrade maccabistats")
+
+            header = json.loads(f.read(header_length))
+            self._mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        arrays_start = _aligned(len(SNAPSHOT_MAGIC) + _PREFIX.size + header_length)
+        self.arrays: Dict[str, np.ndarray] = {name: self._map_array(arrays_start, **array)
+                                              for name, array in header['arrays'].items()}
+
+        self.format_version = format_version
+        self.maccabistats_version: str = header['maccabistats_version']
+        self.description: str = header['description']
+        self.games_count: int = header['games_count']
+        self.has_players_data: bool = header['has_players_data']
+        self._enums_values: Dict[str, List[str]] = header['enums']
+
+    def close(self) -> None:
+        if self._mapped_file.closed:
+            return
+
+        self.arrays = {}  # The arrays are views of the mapped file, it can't be closed while they exist
+        self._mapped_file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._mapped_file.closed
+
+    def __enter__(self) -> MaccabiGamesSnapshot:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _check_not_closed(self) -> None:
+        if self.closed:
+            raise ValueError("The games snapshot is closed")
+
+    def _map_array(self, arrays_start: int, dtype: str, shape: List[int], offset: int) -> np.ndarray:
+        count = int(np.prod(shape))
+        if count == 0:
+            return np.empty(shape, dtype=dtype)
+
+        return np.frombuffer(self._mapped_file, dtype=dtype, count=count, offset=arrays_start + offset).reshape(shape)
+
+    @cached_property
+    def values(self) -> List[Any]:
+        self._check_not_closed()
+        return json.loads(self.arrays['values'].tobytes(), object_hook=_decode_value)
+
+    def _enum_members(self, enum_class: type) -> List[Enum]:
+        return [enum_class(value) for value in self._enums_values[enum_class.__name__]]
+
+    def create_players_data(self) -> Optional[MaccabiPediaPlayers]:
+        if not self.has_players_data:
+            return None
+
+        values = self.values
+        players_data = dict()
+        for name_id, birth_date, is_home_player in zip(self.arrays['profile_name'].tolist(),
+                                                       self.arrays['profile_birth_date'].tolist(),
+                                                       self.arrays['profile_is_home'].tolist()):
+            name = values[name_id]
+            players_data[name] = MaccabiPediaPlayerData(name=name, birth_date=_EPOCH + birth_date * _MICROSECOND,
+                                                        is_home_player=is_home_player)
+
+        return MaccabiPediaPlayers(players_data)
+
+    def create_games(self) -> List[GameData]:
+        """
+        Creates the games objects (sorted by date, as they were saved).
+        """
+        self._check_not_closed()
+        arrays, values = self.arrays, self.values
+        event_types, goal_types, assist_types = (self._enum_members(GameEventTypes), self._enum_members(GoalTypes),
+                                                 self._enum_members(AssistTypes))
+
+        times_occur: Dict[int, datetime.timedelta] = {}
+        events = []
+        for event_type, kind, subtype, time in zip(arrays['event_type'].tolist(), arrays['event_kind'].tolist(),
+                                                   arrays['event_subtype'].tolist(), arrays['event_time'].tolist()):
+            time_occur = times_occur.get(time)
+            if time_occur is None:
+                time_occur = times_occur[time] = time * _MICROSECOND
+
+            # Creating the events without their __init__ (which validates the types) is much faster
+            event = object.__new__(_EVENTS_CLASSES[kind])
+            event.event_type = event_types[event_type]
+            event.time_occur = time_occur
+            if subtype >= 0:
+                if kind == _GOAL_EVENT:
+                    event.goal_type = goal_types[subtype]
+                else:
+                    event.assist_type = assist_types[subtype]
+            events.append(event)
+
+        players = []
+        events_offsets = arrays['player_events_offsets'].tolist()
+        for player_index, (name, number) in enumerate(zip(arrays['player_name'].tolist(),
+                                                          arrays['player_number'].tolist())):
+            player = object.__new__(PlayerInGame)
+            player.name = values[name]
+            player.number = values[number]
+            player.events = events[events_offsets[player_index]: events_offsets[player_index + 1]]
+            players.append(player)
+
+        teams = []
+        players_offsets = arrays['team_players_offsets'].tolist()
+        for team_index, (name, current_name, coach, score) in enumerate(zip(
+                arrays['team_name'].tolist(), arrays['team_current_name'].tolist(), arrays['team_coach'].tolist(),
+                arrays['team_score'].tolist())):
+            team = TeamInGame(name=values[name], coach=values[coach], score=score,
+                              players=players[players_offsets[team_index]: players_offsets[team_index + 1]])
+            team.current_name = values[current_name]
+            teams.append(team)
+
+        games = []
+        games_fields = zip(*(arrays[f'game_{field.lstrip("_")}'].tolist() for field in _GAMES_VALUES_FIELDS))
+        for game_index, (full_date, date, fields_values_ids, technical_result) in enumerate(zip(
+                arrays['game_full_date'].tolist(), self._games_dates().tolist(), games_fields,
+                arrays['game_technical_result'].tolist())):
+
+            game = object.__new__(GameData)
+            game.__dict__.update({field: values[value_id]
+                                  for field, value_id in zip(_GAMES_VALUES_FIELDS, fields_values_ids)})
+            # Each game gets its own list, the same (empty) list is saved once for all of the games
+            game._half_parsed_events = list(game._half_parsed_events)
+            game._full_date = _EPOCH + full_date * _MICROSECOND
+            game.date = _EPOCH + date * _MICROSECOND
+            game.home_team = teams[2 * game_index]
+            game.away_team = teams[2 * game_index + 1]
+            game.technical_result = technical_result
+            games.append(game)
+
+        logger.debug(f"Created {len(games)} games, {len(players)} players in game and {len(events)} events "
+                     f"from the snapshot")
+        return games
+
+    def _games_dates(self) -> np.ndarray:
+        """ The games dates (microseconds since the epoch), snapshots before format version 3 keep only the full dates. """
+        if 'game_date' in self.arrays:
+            return self.arrays['game_date']
+
+        full_dates = self.arrays['game_full_date']
+        return full_dates - full_dates % _MICROSECONDS_IN_DAY
+
+    def create_columns(self) -> MaccabiGamesColumns:
+        """
+        Creates the columns straight from the snapshot arrays (the same columns as creating them from the games).
+        """
+        self._check_not_closed()
+        arrays, values = self.arrays, self.values
+        columns = object.__new__(MaccabiGamesColumns)
+        columns.games_count = self.games_count
+
+        # Teams are saved home team first, the columns keep maccabi team first
+        maccabi_names_ids = [value_id for value_id, value in enumerate(values)
+                             if isinstance(value, str) and value in MACCABI_TEAM_NAMES]
+        is_home = np.isin(arrays['team_name'][0::2], maccabi_names_ids)
+        games_first_team = np.arange(self.games_count, dtype=np.int64) * 2
+        maccabi_teams = games_first_team + ~is_home
+        not_maccabi_teams = games_first_team + is_home
+
+        columns.dates = self._games_dates().astype('datetime64[us]')
+        for table_name, column_name, value_ids in (('competitions', 'competition', arrays['game_competition']),
+                                                   ('opponents', 'opponent',
+                                                    arrays['team_current_name'][not_maccabi_teams]),
+                                                   ('stadiums', 'stadium', arrays['game_stadium']),
+                                                   ('referees', 'referee', arrays['game_referee']),
+                                                   ('coaches', 'coach', arrays['team_coach'][maccabi_teams]),
+                                                   ('seasons', 'season', arrays['game_season'])):
+            table, ids = _string_table_by_first_appearance(value_ids, values)
+            setattr(columns, table_name, table)
+            setattr(columns, column_name, ids)
+        columns.maccabi_score = arrays['team_score'][maccabi_teams].astype(np.int32)
+        columns.not_maccabi_score = arrays['team_score'][not_maccabi_teams].astype(np.int32)
+        columns.is_home = is_home
+        columns.technical_result = arrays['game_technical_result'].astype(bool)
+
+        squads_teams = np.column_stack([maccabi_teams, not_maccabi_teams]).ravel()
+        players_offsets = arrays['team_players_offsets']
+        squads_sizes = players_offsets[squads_teams + 1] - players_offsets[squads_teams]
+        squad_rows = _concatenated_ranges(players_offsets[squads_teams], players_offsets[squads_teams + 1])
+        columns.squad_game = np.repeat(squads_teams // 2, squads_sizes).astype(np.int32)
+        columns.players, columns.squad_player = _string_table_by_first_appearance(arrays['player_name'][squad_rows],
+                                                                                  values)
+        columns.squad_is_maccabi = np.repeat(np.tile([True, False], self.games_count), squads_sizes)
+
+        events_offsets = arrays['player_events_offsets']
+        players_events_count = events_offsets[squad_rows + 1] - events_offsets[squad_rows]
+        event_rows = _concatenated_ranges(events_offsets[squad_rows], events_offsets[squad_rows + 1])
+        columns.event_squad_row = np.repeat(np.arange(len(squad_rows), dtype=np.int32), players_events_count)
+        columns.event_game = columns.squad_game[columns.event_squad_row]
+        columns.event_player = columns.squad_player[columns.event_squad_row]
+        columns.event_is_maccabi = columns.squad_is_maccabi[columns.event_squad_row]
+
+        event_types_ids = np.array([event_type_id(event_type) for event_type in self._enum_members(GameEventTypes)],
+                                   dtype=np.int8)
+        columns.event_type = event_types_ids[arrays['event_type'][event_rows]]
+        columns.event_subtype = self._columns_events_subtypes(event_rows, columns.event_type)
+        # Same as int(time_occur.total_seconds())
+        columns.event_second = (arrays['event_time'][event_rows] / 10 ** 6).astype(np.int32)
+
+        # Same as player.played_in_game
+        played_events = np.isin(columns.event_type, [event_type_id(GameEventTypes.LINE_UP),
+                                                     event_type_id(GameEventTypes.SUBSTITUTION_IN)])
+        columns.squad_played = np.zeros(len(squad_rows), dtype=bool)
+        columns.squad_played[columns.event_squad_row[played_events]] = True
+
+        logger.debug(f"Created the columns of {self.games_count} games from the snapshot")
+        return columns
+
+    def _columns_events_subtypes(self, event_rows: np.ndarray, events_types_ids: np.ndarray) -> np.ndarray:
+        kinds = self.arrays['event_kind'][event_rows]
+        subtypes = self.arrays['event_subtype'][event_rows]
+
+        events_subtypes = np.full(len(event_rows), NO_SUBTYPE, dtype=np.int8)
+        for kind, event_type, enum_class, subtype_id in ((_GOAL_EVENT, GameEventTypes.GOAL_SCORE, GoalTypes,
+                                                          goal_type_id),
+                                                         (_ASSIST_EVENT, GameEventTypes.GOAL_ASSIST, AssistTypes,
+                                                          assist_type_id)):
+            mask = (kinds == kind) & (events_types_ids == event_type_id(event_type)) & (subtypes >= 0)
+            subtypes_ids = np.array([subtype_id(member) for member in self._enum_members(enum_class)], dtype=np.int8)
+            events_subtypes[mask] = subtypes_ids[subtypes[mask]]
+
+        return events_subtypes
+
+
+class MaccabiGamesSnapshotStats(MaccabiGamesStats):
+    """
+    A MaccabiGamesStats loaded from a snapshot file, the games and the columns are created on their first use.
+    The columns are created straight from the snapshot arrays, so filtering and the columnar stats don't need
+    the games objects at all.
+    """
+
+    def __init__(self, snapshot: MaccabiGamesSnapshot) -> None:
+        self._snapshot = snapshot
+        self.description = snapshot.description
+        self.players_data = snapshot.create_players_data()
+        self.version = snapshot.maccabistats_version
+
+    def close(self) -> None:
+        """
+        Releases the snapshot file, the games and the columns are created first (if they weren't yet),
+        so these stats remain usable.
+        """
+        if self._snapshot.closed:
+            return
+
+        _ = self.games, self.columns
+        self._snapshot.close()
+
+    def __enter__(self) -> MaccabiGamesSnapshotStats:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @MaccabiGamesStats.games.getter
+    def games(self) -> List[GameData]:
+        if '_games' not in self.__dict__:
+            self._games = self._snapshot.create_games()
+
+        return self._games
+
+    @cached_property
+    def columns(self) -> MaccabiGamesColumns:
+        # Once created, the games may be changed (like by the general fixes), so the columns should follow them
+        if '_games' in self.__dict__:
+            return MaccabiGamesColumns(self.games)
+
+        return self._snapshot.create_columns()
+
+    def __reduce__(self):
+        # Pickle it as a regular MaccabiGamesStats, without the snapshot
+        return partial(MaccabiGamesStats, players_data=self.players_data), (self.games, self.description)
+
+    def __len__(self) -> int:
+        return len(self.games) if '_games' in self.__dict__ else self._snapshot.games_count
+
+
+def load_games_snapshot(file_path: str) -> MaccabiGamesStats:
+    """
+    Loads the snapshot file lazily, the games are created from it on their first use.
+    """
+    return MaccabiGamesSnapshotStats(MaccabiGamesSnapshot(file_path))
+
+
+def convert_pickled_games_to_snapshot(pickled_games_file_path: str, snapshot_file_path: Optional[str] = None) -> str:
+    """
+    Converts a pickled MaccabiGamesStats file to a snapshot file.
+
+    :param pickled_games_file_path: The pickled games file (such as: maccabi-2.70-2024-01-01.games).
+    :param snapshot_file_path: Where to write the snapshot, replaces the pickled file when not given.
+    :return: The snapshot file path.
+    """
+    snapshot_file_path = snapshot_file_path or pickled_games_file_path
+    if is_games_snapshot(pickled_games_file_path):
+        logger.info(f"{pickled_games_file_path} is already a snapshot")
+        return pickled_games_file_path
+
+    with open(pickled_games_file_path, 'rb') as f:
+        maccabi_games_stats = pickle.load(f)
+    if not isinstance(maccabi_games_stats, MaccabiGamesStats):
+        raise RuntimeError(f"{pickled_games_file_path} does not contain a maccabi games stats object")
+
+    # The pickled file is replaced only once the snapshot was fully written
+    write_games_snapshot(maccabi_games_stats, snapshot_file_path)
+
+    logger.info(f"Converted the pickled games at: {pickled_games_file_path} to a snapshot at: {snapshot_file_path}")
+    return snapshot_file_path
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import datetime
 from typing import TYPE_CHECKING, Tuple, List, Optional
 
 from maccabistats.models.game_data import GameData
@@ -8,7 +7,6 @@ from maccabistats.models.game_data import GameData
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
-_ZERO_TIME = datetime.strptime("0:00:00", "%H:%M:%S")
 _TOP_GAMES_NUMBER = 5
 
 GameGoalTiming = Tuple[GameData, int]  # The game and the time it took to score the required goals number
@@ -42,18 +40,8 @@ class MaccabiGamesGoalsTiming(object):
         return sorted(games_goals_timings_without_errors, key=lambda item: item[1])
 
 
-def _maccabi_goals_minutes_for_game(goals):
-    minutes = []
-
-    for current_goal in goals:
-        goal_time = datetime.strptime(current_goal['time_occur'], "%H:%M:%S") - _ZERO_TIME
-        minutes.append(int(goal_time.total_seconds() / 60))
-
-    return minutes
-
-
 def _minimum_goals_time_frame_for_a_game(maccabi_game: GameData, goals_number: int) -> Optional[int]:
-    maccabi_goals_time = _maccabi_goals_minutes_for_game(maccabi_game.maccabi_goals())
+    maccabi_goals_time = [goal.minute for goal in maccabi_game.maccabi_goals_timeline]
 
     # We might miss some data on the actual scorers and time (even if we have the final result)
     if len(maccabi_goals_time) < goals_number:
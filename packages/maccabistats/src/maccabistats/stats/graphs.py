@@ -6,7 +6,6 @@ if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
 from collections import Counter
 
 
@@ -32,15 +31,8 @@ class MaccabiGamesGraphsStats(object):
         plt.show()
 
     def _get_all_goals_minutes_for_player(self, player_name: str):
-        player_goals = [goal for game in self.maccabi_games_stats.games for goal in game.goals() if
-                        goal['name'] == player_name]
-
-        def convert_timedelta_str_to_minutes(t):
-            full_datetime = datetime.strptime(t, "%H:%M:%S")
-            delta = timedelta(hours=full_datetime.hour, minutes=full_datetime.minute)
-            return int(delta.total_seconds() / 60)
-
-        player_goals = [convert_timedelta_str_to_minutes(goal['time_occur']) for goal in player_goals]
+        player_goals = [goal.minute for game in self.maccabi_games_stats.games for goal in game.goals_timeline if
+                        goal.player.name == player_name]
         if not player_goals:
             raise RuntimeError(
                 "Could not find any goals for this player, are you sure this is the player name : {name}?".format(
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Tuple
 
-from maccabistats.models.player_game_events import GoalTypes
-
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
@@ -29,17 +27,18 @@ class MaccabiGamesImportantGoalsStats(object):
 
     def get_top_scorers(self, minimum_diff_for_maccabi: int = -2, maximum_diff_for_maccabi: int = 1,
                         goal_condition=None) -> List[Tuple[str, float]]:
-        if goal_condition is None:
-            goal_condition = lambda x: True
-
-        maccabi_goals = [goal for game in self.games for goal in game.goals() if
-                         goal['team'] == "מכבי תל אביב" and goal['goal_type'] != GoalTypes.OWN_GOAL.value]
+        """
+        :param goal_condition: Callable that receives a goal dict (see GameData.goals) and returns whether to count it.
+        """
+        # Goals of maccabi players (without their own goals)
+        maccabi_goals = [goal for game in self.games for goal in game.goals_timeline if
+                         goal.for_maccabi and not goal.is_own_goal]
         maccabi_important_goals = [
             goal for goal in maccabi_goals if
-            (minimum_diff_for_maccabi <= goal['maccabi_score'] - goal['not_maccabi_score'] <= maximum_diff_for_maccabi)
-            and goal_condition(goal)]
+            (minimum_diff_for_maccabi <= goal.maccabi_score - goal.not_maccabi_score <= maximum_diff_for_maccabi)
+            and (goal_condition is None or goal_condition(goal.json_dict()))]
 
-        important_goals_scorers_names = [goal['name'] for goal in maccabi_important_goals]
+        important_goals_scorers_names = [goal.player.name for goal in maccabi_important_goals]
         return Counter(important_goals_scorers_names).most_common()
 
     def get_top_scorers_by_percentage_from_all_their_goals(
@@ -108,5 +107,4 @@ class MaccabiGamesImportantGoalsStats(object):
         return self.get_top_players_for_goals_per_game(minimum_diff_for_maccabi=minimum_diff_for_maccabi,
                                                        maximum_diff_for_maccabi=maximum_diff_for_maccabi,
                                                        minimum_games=minimum_games,
-                                                       goal_condition=lambda g: g['time_occur'] > str(
-                                                           timedelta(minutes=from_minute)))
+                                                       goal_condition=lambda g: g['time_occur'] > str(timedelta(minutes=from_minute)))
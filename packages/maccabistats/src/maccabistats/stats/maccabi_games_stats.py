@@ -4,9 +4,11 @@ import datetime
 import json
 import logging
 from collections import defaultdict
+from functools import cached_property, partial
 from tempfile import NamedTemporaryFile
-from typing import List, Union, Dict, Any, DefaultDict
+from typing import List, Union, Dict, Any, DefaultDict, Callable, Iterable
 
+import numpy as np
 from dateutil.parser import parse as datetime_parser
 
 from maccabistats.maccabipedia.players import MaccabiPediaPlayers
@@ -14,10 +16,13 @@ from maccabistats.models.game_data import GameData
 from maccabistats.models.player import Player
 from maccabistats.stats.averages import MaccabiGamesAverageStats
 from maccabistats.stats.coaches import MaccabiGamesCoachesStats
+from maccabistats.stats.columns import MaccabiGamesColumns, as_datetime64
 from maccabistats.stats.comebacks import MaccabiGamesComebacksStats
 from maccabistats.stats.consts import TROPHY_COMPETITIONS, EUROPE_COMPETITIONS, LEAGUE_COMPETITIONS, \
     NON_OFFICIAL_COMPETITIONS
 from maccabistats.stats.export import ExportMaccabiGamesStats
+from maccabistats.stats.games_index import MaccabiGamesIndex
+from maccabistats.stats.games_query import MaccabiGamesQuery
 from maccabistats.stats.goals_timing import MaccabiGamesGoalsTiming
 from maccabistats.stats.graphs import MaccabiGamesGraphsStats
 from maccabistats.stats.important_goals import MaccabiGamesImportantGoalsStats
@@ -28,6 +33,7 @@ from maccabistats.stats.players_events_sumamry import MaccabiGamesPlayersEventsS
 from maccabistats.stats.players_first_and_last_games import MaccabiGamesPlayersFirstAndLastGamesStats
 from maccabistats.stats.players_special_games import MaccabiGamesPlayersSpecialGamesStats
 from maccabistats.stats.players_streaks import MaccabiGamesPlayersStreaksStats
+from maccabistats.stats.players_together import MaccabiGamesPlayersTogetherStats
 from maccabistats.stats.referees import MaccabiGamesRefereesStats
 from maccabistats.stats.results import MaccabiGamesResultsStats
 from maccabistats.stats.seasons import MaccabiGamesSeasonsStats
@@ -48,36 +54,13 @@ class MaccabiGamesStats:
 
     def __init__(self, games: List[GameData], description: str = None, *,
                  players_data: MaccabiPediaPlayers) -> None:
-        self.games: List[GameData] = sorted(games, key=lambda g: g.date)  # Sort the games by date
+        self.games = games
         self.description = description or self._DEFAULT_DESCRIPTION
         self.players_data = players_data
-
-        self.coaches = MaccabiGamesCoachesStats(self)
-        self.players = MaccabiGamesPlayersStats(self)
-        self.streaks = MaccabiGamesStreaksStats(self)
-        self.averages = MaccabiGamesAverageStats(self)
-        self.results = MaccabiGamesResultsStats(self)
-        self.referees = MaccabiGamesRefereesStats(self)
-        self.comebacks = MaccabiGamesComebacksStats(self)
-        self.important_goals = MaccabiGamesImportantGoalsStats(self)
-        self.graphs = MaccabiGamesGraphsStats(self)
-        self.players_streaks = MaccabiGamesPlayersStreaksStats(self)
-        self.teams_streaks = MaccabiGamesTeamsStreaksStats(self)
-        self.teams = MaccabiGamesTeamsStats(self)
-        self.players_events_summary = MaccabiGamesPlayersEventsSummaryStats(self)
-        self.players_special_games = MaccabiGamesPlayersSpecialGamesStats(self)
-        self.players_first_and_last_games = MaccabiGamesPlayersFirstAndLastGamesStats(self)
-        self.players_categories = MaccabiGamesPlayersCategoriesStats(self)
-        self.summary = MaccabiGamesSummary(self)
-        self.goals_timing = MaccabiGamesGoalsTiming(self)
-        self.export = ExportMaccabiGamesStats(self)
-        self.players_and_teams_streaks = PlayersAndTeamsStreaksStats(self)
-
-        self.seasons = MaccabiGamesSeasonsStats(self)
-        self._team_names_convertor = TeamNamesConvertor(self)
-
         self.version = maccabistats_version
 
+        # The sub stats objects (players, streaks, seasons...) are cached properties, created on their first use
+
     def __setstate__(self, state):
         if 'players_data' not in state:
             old_version = state.get('version', 'unknown')
@@ -85,23 +68,181 @@ class MaccabiGamesStats:
                 f"This pickled MaccabiGamesStats (version {old_version}) does not contain players_data. "
                 f"Please re-run run_maccabipedia_source() with maccabistats >= 2.60 to create a new pickle."
             )
+        state = _without_derived_attributes(state)
+        state['_games'] = state.pop('games')
         self.__dict__.update(state)
 
+    def __getstate__(self):
+        # The columns & sub stats objects are derived from the games, no need to keep them in the pickle
+        state = _without_derived_attributes(self.__dict__)
+        state['games'] = state.pop('_games')  # The pickles keep the games as they were before games was a property
+        return state
+
+    @property
+    def games(self) -> List[GameData]:
+        return self._games
+
+    @games.setter
+    def games(self, games: List[GameData]) -> None:
+        """
+        Sorts the games by date, the columns, the games index and the sub stats objects are derived from the games,
+        so they are created again on their next use.
+        """
+        self._games = sorted(games, key=lambda g: g.date)
+        self._clear_derived_attributes()
+
+    def _clear_derived_attributes(self) -> None:
+        for name in _DERIVED_ATTRIBUTES_NAMES:
+            self.__dict__.pop(name, None)
+
+    # region sub stats
+
+    @cached_property
+    def coaches(self) -> MaccabiGamesCoachesStats:
+        return MaccabiGamesCoachesStats(self)
+
+    @cached_property
+    def players(self) -> MaccabiGamesPlayersStats:
+        return MaccabiGamesPlayersStats(self)
+
+    @cached_property
+    def streaks(self) -> MaccabiGamesStreaksStats:
+        return MaccabiGamesStreaksStats(self)
+
+    @cached_property
+    def averages(self) -> MaccabiGamesAverageStats:
+        return MaccabiGamesAverageStats(self)
+
+    @cached_property
+    def results(self) -> MaccabiGamesResultsStats:
+        return MaccabiGamesResultsStats(self)
+
+    @cached_property
+    def referees(self) -> MaccabiGamesRefereesStats:
+        return MaccabiGamesRefereesStats(self)
+
+    @cached_property
+    def comebacks(self) -> MaccabiGamesComebacksStats:
+        return MaccabiGamesComebacksStats(self)
+
+    @cached_property
+    def important_goals(self) -> MaccabiGamesImportantGoalsStats:
+        return MaccabiGamesImportantGoalsStats(self)
+
+    @cached_property
+    def graphs(self) -> MaccabiGamesGraphsStats:
+        return MaccabiGamesGraphsStats(self)
+
+    @cached_property
+    def players_streaks(self) -> MaccabiGamesPlayersStreaksStats:
+        return MaccabiGamesPlayersStreaksStats(self)
+
+    @cached_property
+    def teams_streaks(self) -> MaccabiGamesTeamsStreaksStats:
+        return MaccabiGamesTeamsStreaksStats(self)
+
+    @cached_property
+    def teams(self) -> MaccabiGamesTeamsStats:
+        return MaccabiGamesTeamsStats(self)
+
+    @cached_property
+    def players_events_summary(self) -> MaccabiGamesPlayersEventsSummaryStats:
+        return MaccabiGamesPlayersEventsSummaryStats(self)
+
+    @cached_property
+    def players_special_games(self) -> MaccabiGamesPlayersSpecialGamesStats:
+        return MaccabiGamesPlayersSpecialGamesStats(self)
+
+    @cached_property
+    def players_first_and_last_games(self) -> MaccabiGamesPlayersFirstAndLastGamesStats:
+        return MaccabiGamesPlayersFirstAndLastGamesStats(self)
+
+    @cached_property
+    def players_categories(self) -> MaccabiGamesPlayersCategoriesStats:
+        return MaccabiGamesPlayersCategoriesStats(self)
+
+    @cached_property
+    def summary(self) -> MaccabiGamesSummary:
+        return MaccabiGamesSummary(self)
+
+    @cached_property
+    def goals_timing(self) -> MaccabiGamesGoalsTiming:
+        return MaccabiGamesGoalsTiming(self)
+
+    @cached_property
+    def export(self) -> ExportMaccabiGamesStats:
+        return ExportMaccabiGamesStats(self)
+
+    @cached_property
+    def players_and_teams_streaks(self) -> PlayersAndTeamsStreaksStats:
+        return PlayersAndTeamsStreaksStats(self)
+
+    @cached_property
+    def players_together(self) -> MaccabiGamesPlayersTogetherStats:
+        return MaccabiGamesPlayersTogetherStats(self)
+
+    @cached_property
+    def seasons(self) -> MaccabiGamesSeasonsStats:
+        return MaccabiGamesSeasonsStats(self)
+
+    @cached_property
+    def _team_names_convertor(self) -> TeamNamesConvertor:
+        return TeamNamesConvertor(self)
+
+    # endregion
+
+    @cached_property
+    def columns(self) -> MaccabiGamesColumns:
+        """
+        Columnar copy of the games (results, ids and a flat events table), built on the first use.
+        """
+        return MaccabiGamesColumns(self.games)
+
+    @cached_property
+    def _games_index(self) -> MaccabiGamesIndex:
+        """
+        Inverted index of the games (coach, referee, player... to their sorted games indices), built on the first use.
+        """
+        return MaccabiGamesIndex(self.columns)
+
     def create_maccabi_games_stats_with_filtered_games(self, games: List[GameData], description: str) -> MaccabiGamesStats:
         """Create a filtered MaccabiGamesStats that inherits the players data."""
         return MaccabiGamesStats(games, description, players_data=self.players_data)
 
+    def _create_games_view(self, games_indices: Iterable[int], description: str) -> MaccabiGamesStats:
+        """Create a filtered MaccabiGamesStats that shares these games (by their sorted indices) instead of copying them."""
+        return MaccabiGamesStatsView(self, np.asarray(games_indices, dtype=np.intp), description)
+
+    def _create_maccabi_games_stats_by_mask(self, games_mask: np.ndarray, description: str) -> MaccabiGamesStats:
+        """Create a filtered MaccabiGamesStats from a boolean mask over the (columnar) games."""
+        return self._create_games_view(np.flatnonzero(games_mask), description)
+
+    def _create_maccabi_games_stats_by_index(self, entity: str, values: Iterable[str],
+                                             description: str) -> MaccabiGamesStats:
+        """Create a filtered MaccabiGamesStats from the games of the given entity values (see MaccabiGamesIndex)."""
+        return self._create_games_view(self._games_index.games_indices(entity, values), description)
+
+    def query(self) -> MaccabiGamesQuery:
+        """
+        Start a query of these games, its filters are applied at once when its games are taken (see MaccabiGamesQuery).
+        """
+        return MaccabiGamesQuery(self)
+
+    def _create_maccabi_games_stats_by_condition(self, condition: Callable[[GameData], bool],
+                                                 description: str) -> MaccabiGamesStats:
+        """Create a filtered MaccabiGamesStats from the games that match the given condition."""
+        return self._create_games_view([game_index for game_index, game in enumerate(self.games) if condition(game)],
+                                       description)
+
     # region home_away
 
     @property
     def home_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.is_maccabi_home_team],
-                                     self._new_description('Home games'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.is_home, self._new_description('Home games'))
 
     @property
     def away_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if not game.is_maccabi_home_team],
-                                     self._new_description('Away games'))
+        return self._create_maccabi_games_stats_by_mask(~self.columns.is_home, self._new_description('Away games'))
 
     # endregion
 
@@ -109,28 +250,28 @@ class MaccabiGamesStats:
 
     @property
     def trophy_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.competition in TROPHY_COMPETITIONS],
-                                     self._new_description('Trophy games'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.competition_mask(TROPHY_COMPETITIONS),
+                                                        self._new_description('Trophy games'))
 
     @property
     def europe_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.competition in EUROPE_COMPETITIONS],
-                                     self._new_description('Europe games'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.competition_mask(EUROPE_COMPETITIONS),
+                                                        self._new_description('Europe games'))
 
     @property
     def league_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.competition in LEAGUE_COMPETITIONS],
-                                     self._new_description('League games'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.competition_mask(LEAGUE_COMPETITIONS),
+                                                        self._new_description('League games'))
 
     @property
     def official_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.competition not in NON_OFFICIAL_COMPETITIONS],
-                                     self._new_description('Official games'))
+        return self._create_maccabi_games_stats_by_mask(~self.columns.competition_mask(NON_OFFICIAL_COMPETITIONS),
+                                                        self._new_description('Official games'))
 
     @property
     def non_official_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.competition in NON_OFFICIAL_COMPETITIONS],
-                                     self._new_description(f'Non-official games'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.competition_mask(NON_OFFICIAL_COMPETITIONS),
+                                                        self._new_description(f'Non-official games'))
 
     # endregion
 
@@ -138,7 +279,7 @@ class MaccabiGamesStats:
 
     @property
     def available_competitions(self) -> List[str]:
-        return list(set(game.competition for game in self.games))
+        return self._games_index.available_values('competition')
 
     @property
     def available_opponents(self) -> List[str]:
@@ -146,7 +287,7 @@ class MaccabiGamesStats:
 
     @property
     def available_stadiums(self) -> List[str]:
-        return list(set(game.stadium for game in self.games))
+        return self._games_index.available_values('stadium')
 
     @property
     def available_players(self) -> List[Player]:
@@ -158,19 +299,19 @@ class MaccabiGamesStats:
 
     @property
     def available_players_names(self) -> List[str]:
-        return list(set(player.name for player in self.available_players))
+        return self._games_index.available_values('squad_player')
 
     @property
     def available_referees(self) -> List[str]:
-        return list(set(game.referee for game in self.games))
+        return self._games_index.available_values('referee')
 
     @property
     def available_coaches(self) -> List[str]:
-        return list(set(game.maccabi_team.coach for game in self.games))
+        return self._games_index.available_values('coach')
 
     @property
     def available_seasons(self) -> List[str]:
-        return sorted(list(set(game.season for game in self.games)))
+        return sorted(self._games_index.available_values('season'))
 
     # endregion
 
@@ -178,35 +319,35 @@ class MaccabiGamesStats:
 
     @property
     def maccabi_wins(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.is_maccabi_win],
-                                     self._new_description('Wins only'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.maccabi_score_diff > 0,
+                                                        self._new_description('Wins only'))
 
     @property
     def maccabi_ties(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.maccabi_score_diff == 0],
-                                     self._new_description('Ties only'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.maccabi_score_diff == 0,
+                                                        self._new_description('Ties only'))
 
     @property
     def maccabi_losses(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.maccabi_score_diff < 0],
-                                     self._new_description('Losses only'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.maccabi_score_diff < 0,
+                                                        self._new_description('Losses only'))
 
     @property
     def technical_result_games(self) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.technical_result],
-                                     self._new_description('Technical games'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.technical_result,
+                                                        self._new_description('Technical games'))
 
     # endregion
 
     # region date based
 
     def played_before(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.played_before(date)],
-                                     self._new_description(f'Played before: {date}'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.dates <= as_datetime64(date),
+                                                        self._new_description(f'Played before: {date}'))
 
     def played_after(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.played_after(date)],
-                                     self._new_description(f'Player after: {date}'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.dates >= as_datetime64(date),
+                                                        self._new_description(f'Player after: {date}'))
 
     def played_at(self, date: Union[datetime.datetime, datetime.date, str]) -> MaccabiGamesStats:
         if isinstance(date, str):
@@ -214,8 +355,8 @@ class MaccabiGamesStats:
         elif isinstance(date, datetime.datetime):
             date = date.date()  # Leave only year & month & day
 
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.date.date() == date],
-                                     self._new_description(f'Played at: {date}'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.dates.astype('datetime64[D]') == np.datetime64(date),
+                                                        self._new_description(f'Played at: {date}'))
 
     @property
     def first_game_date(self) -> str:
@@ -233,59 +374,64 @@ class MaccabiGamesStats:
         if isinstance(competition_types, str):
             competition_types = [competition_types]
 
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.competition in competition_types],
-                                     self._new_description(f'Competitions: {competition_types}'))
+        return self._create_maccabi_games_stats_by_mask(self.columns.competition_mask(competition_types),
+                                                        self._new_description(f'Competitions: {competition_types}'))
 
     def get_games_by_stadium(self, stadium_name: str) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if stadium_name == game.stadium],
-                                     self._new_description(f'Stadium: {stadium_name}'))
+        return self._create_maccabi_games_stats_by_index('stadium', [stadium_name],
+                                                         self._new_description(f'Stadium: {stadium_name}'))
 
     def get_games_against_team(self, team_name: str) -> MaccabiGamesStats:
         # We count the team name as the name when they appear to the game or the name as they have these days
         current_team_name = self._team_names_convertor.find_team_current_name(team_name)
 
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if
-                                      current_team_name == game.not_maccabi_team.current_name],
-                                     self._new_description(f'Against team: {team_name}'))
+        return self._create_maccabi_games_stats_by_index('opponent', [current_team_name],
+                                                         self._new_description(f'Against team: {team_name}'))
 
     def get_games_by_coach(self, coach_name: str) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if coach_name == game.maccabi_team.coach],
-                                     self._new_description(f'Coach: {coach_name}'))
+        return self._create_maccabi_games_stats_by_index('coach', [coach_name],
+                                                         self._new_description(f'Coach: {coach_name}'))
 
     def get_games_by_referee(self, referee_name: str) -> MaccabiGamesStats:
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if referee_name == game.referee],
-                                     self._new_description(f'Referee: {referee_name}'))
+        return self._create_maccabi_games_stats_by_index('referee', [referee_name],
+                                                         self._new_description(f'Referee: {referee_name}'))
 
     def get_games_by_player_name(self, player_name: str) -> MaccabiGamesStats:
         """
         Returns all the games that this player have any event in, played or at the bench.
         """
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games
-                                      if player_name in [p.name.strip() for p in game.maccabi_team.players]],
-                                     self._new_description(f'Player in squad: {player_name}'))
+        return self._create_maccabi_games_stats_by_index('squad_player', [player_name],
+                                                         self._new_description(f'Player in squad: {player_name}'))
 
     def get_games_by_played_player_name(self, player_name: str) -> MaccabiGamesStats:
         """
         Returns all the games that the given players played at.
         """
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games
-                                      if player_name in [p.name.strip() for p in game.maccabi_team.played_players]],
-                                     self._new_description(f'Played player: {player_name}'))
+        return self._create_maccabi_games_stats_by_index('played_player', [player_name],
+                                                         self._new_description(f'Played player: {player_name}'))
 
     def get_games_by_season(self, season: str) -> MaccabiGamesStats:
         """
         Return Maccabi games stats object with season games, season may be entered as "1900/01".
         """
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if game.season == season],
-                                     self._new_description(f'Season {season}'))
+        return self._create_maccabi_games_stats_by_index('season', [season], self._new_description(f'Season {season}'))
+
+    def get_games_by_seasons(self) -> Dict[str, MaccabiGamesStats]:
+        """
+        Returns a mapping between each available season (sorted) to its games, grouped in one pass over the games.
+        """
+        seasons_groups = self.query().group_by('season')
+        return {season: self._create_games_view(seasons_groups[season].games_indices,
+                                                self._new_description(f'Season {season}'))
+                for season in sorted(seasons_groups)}
 
     def get_games_by_day_at_month(self, day: int, month: int) -> MaccabiGamesStats:
         """
         Filter the maccabi games that played at the given day and month
         """
-        return self.create_maccabi_games_stats_with_filtered_games([game for game in self.games if
-                                      game.date.day == day and game.date.month == month],
-                                     self._new_description(f'Played at DD/MM: {day}/{month}'))
+        return self._create_maccabi_games_stats_by_condition(
+            lambda game: game.date.day == day and game.date.month == month,
+            self._new_description(f'Played at DD/MM: {day}/{month}'))
 
     # endregion
 
@@ -293,15 +439,15 @@ class MaccabiGamesStats:
         """
         Returns a mapping between a player name to the games he participated
         """
-        players_games = defaultdict(list)
+        players_games_indices = defaultdict(list)
 
-        for game in self.games:
+        for game_index, game in enumerate(self.games):
             for player in game.maccabi_team.played_players:
-                players_games[player.name].append(game)
+                players_games_indices[player.name].append(game_index)
 
-        games_by_player = {player_name: self.create_maccabi_games_stats_with_filtered_games(players_games[player_name],
-                                                              self._new_description(f'Player games: {player_name}'))
-                           for player_name in players_games.keys()}
+        games_by_player = {player_name: self._create_games_view(games_indices,
+                                                                self._new_description(f'Player games: {player_name}'))
+                           for player_name, games_indices in players_games_indices.items()}
 
         # Allow to return an empty list for unknown players
         players_data = self.players_data
@@ -318,17 +464,17 @@ class MaccabiGamesStats:
         """
         players_to_teams_to_games_mapping = defaultdict(lambda: defaultdict(list))
 
-        for game in self.games:
+        for game_index, game in enumerate(self.games):
             for player in game.maccabi_team.played_players:
-                # adds at [player][team].append(game)
-                players_to_teams_to_games_mapping[player.name][game.not_maccabi_team.current_name].append(game)
+                # adds at [player][team].append(game_index)
+                players_to_teams_to_games_mapping[player.name][game.not_maccabi_team.current_name].append(game_index)
 
         players_data = self.players_data
         games_by_player_and_team = defaultdict(lambda: defaultdict(lambda: MaccabiGamesStats([], players_data=players_data)))
         for player_name, teams_mapping in players_to_teams_to_games_mapping.items():
-            for team_name, specific_player_and_team_games in teams_mapping.items():
-                current_combination_games = self.create_maccabi_games_stats_with_filtered_games(specific_player_and_team_games,
-                                                                  f'Players {player_name} and Team: {team_name} games')
+            for team_name, specific_player_and_team_games_indices in teams_mapping.items():
+                current_combination_games = self._create_games_view(specific_player_and_team_games_indices,
+                                                                     f'Players {player_name} and Team: {team_name} games')
                 games_by_player_and_team[player_name][team_name] = current_combination_games
 
         # Allow to return an empty list for unknown players, same default dict as above but with MaccabiGamesStats
@@ -439,3 +585,60 @@ class MaccabiGamesStats:
             summary += f" (החל מ {self.first_game_date} ועד {self.last_game_date})"
 
         return summary
+
+
+class MaccabiGamesStatsView(MaccabiGamesStats):
+    """
+    A filtered MaccabiGamesStats that shares the games of the (unfiltered) MaccabiGamesStats it was created from.
+
+    The view keeps only the indices of its games in the root object games, which are already sorted by date,
+    so filtering does not copy or sort anything. The games list and the columns are created on their first use.
+    Filtering a view creates another view of the same root.
+    """
+
+    def __init__(self, parent: MaccabiGamesStats, games_indices: np.ndarray, description: str) -> None:
+        if isinstance(parent, MaccabiGamesStatsView):
+            self._root = parent._root
+            self._games_indices = parent._games_indices[games_indices]
+        else:
+            self._root = parent
+            self._games_indices = games_indices
+
+        self.description = description
+        self.players_data = parent.players_data
+        self.version = maccabistats_version
+
+    @cached_property
+    def games(self) -> List[GameData]:
+        root_games = self._root.games
+        return [root_games[game_index] for game_index in self._games_indices]
+
+    @cached_property
+    def columns(self) -> MaccabiGamesColumns:
+        return self._root.columns.take(self._games_indices)
+
+    def __reduce__(self):
+        # Pickle the view as a regular MaccabiGamesStats, without its root games
+        return partial(MaccabiGamesStats, players_data=self.players_data), (self.games, self.description)
+
+    def __len__(self) -> int:
+        return len(self._games_indices)
+
+
+# The sub stats objects of each MaccabiGamesStats (the cached properties names), old pickles contain them
+_SUB_STATS_NAMES = (
+    'coaches', 'players', 'streaks', 'averages', 'results', 'referees', 'comebacks', 'important_goals', 'graphs',
+    'players_streaks', 'teams_streaks', 'teams', 'players_events_summary', 'players_special_games',
+    'players_first_and_last_games', 'players_categories', 'summary', 'goals_timing', 'export',
+    'players_and_teams_streaks', 'players_together', 'seasons', '_team_names_convertor',
+)
+
+# Everything that is created from the games (cached properties)
+_DERIVED_ATTRIBUTES_NAMES = ('columns', '_games_index') + _SUB_STATS_NAMES
+
+
+def _without_derived_attributes(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Old pickles contain the sub stats objects as well, we drop them so they will be created by the current code.
+    """
+    return {name: value for name, value in state.items() if name not in _DERIVED_ATTRIBUTES_NAMES}
@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Tuple, Callable, NamedTuple, Dict
-
-from maccabistats.models.game_data import GameData
-from maccabistats.models.player_in_game import PlayerInGame
+from typing import TYPE_CHECKING, List, Tuple, NamedTuple, Dict, Union
 
 if TYPE_CHECKING:
+    from maccabistats.models.game_data import GameData
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 from collections import Counter
 from datetime import timedelta
-from functools import reduce
+from functools import cached_property
 import logging
-from maccabistats.models.player_game_events import GameEventTypes, GoalTypes, AssistTypes
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.stats.players_table import MaccabiPlayersTable
 
 logger = logging.getLogger(__name__)
 
@@ -33,16 +32,37 @@ class MaccabiGamesPlayersStats(object):
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
-        self.games = maccabi_games_stats.games
+        self.maccabi_games_stats = maccabi_games_stats
+
+    @property
+    def games(self) -> List[GameData]:
+        # The players stats are taken from the columns, so don't create the games (of a view or a snapshot) for them
+        return self.maccabi_games_stats.games
+
+    @cached_property
+    def _table(self) -> MaccabiPlayersTable:
+        return MaccabiPlayersTable(self.maccabi_games_stats.columns)
+
+    def table(self) -> List[Dict[str, Union[str, int]]]:
+        """
+        All the players metrics (goals, assists, cards, played, wins...), a dict for each player, ready for export.
+        """
+        return self._table.as_dicts()
+
+    def metric_total(self, metric: str) -> int:
+        """
+        The sum of this metric (a column of the players table) for all of the players.
+        """
+        return self._table.total(metric)
 
     # region Top players by last minute goals related sorting
 
     def get_top_scorers_on_last_minutes(self, from_minute: int = 75) -> List[PlayerStats]:
-        from_this_minute_str = str(timedelta(minutes=from_minute))
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: len([event for event in p.events
-                           if event.event_type == GameEventTypes.GOAL_SCORE and str(
-                    event.time_occur) > from_this_minute_str]))
+        table = self._table
+        last_minutes_goals = table.events_mask(GameEventTypes.GOAL_SCORE) & (
+                self.maccabi_games_stats.columns.event_second > timedelta(minutes=from_minute).total_seconds())
+
+        return table.rows_leaderboard(table.count_rows_events(last_minutes_goals))
 
     def get_top_players_for_goals_per_game(self, minimum_games_played: int = 10) -> List[PlayerStats]:
         players_total_played = Counter(dict(self.most_played))
@@ -76,81 +96,71 @@ class MaccabiGamesPlayersStats(object):
 
     @property
     def best_scorers(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.GOAL_SCORE) - p.goals_count_by_goal_type(GoalTypes.OWN_GOAL))
+        # Own goals are registered to the scorer but they are not counted as his goals
+        return self._table.leaderboard('goals')
 
     @property
     def best_scorers_by_freekick(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.goals_count_by_goal_type(GoalTypes.FREE_KICK))
+        return self._table.leaderboard('freekick_goals')
 
     @property
     def best_scorers_by_penalty(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.goals_count_by_goal_type(GoalTypes.PENALTY))
+        return self._table.leaderboard('penalty_goals')
 
     @property
     def best_scorers_by_head(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.goals_count_by_goal_type(GoalTypes.HEADER))
+        return self._table.leaderboard('head_goals')
 
     @property
     def best_scorers_by_foot(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.goals_count_by_goal_type(GoalTypes.NORMAL_KICK))
+        return self._table.leaderboard('foot_goals')
 
     @property
     def best_scorers_by_own_goal(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.goals_count_by_goal_type(GoalTypes.OWN_GOAL))
+        return self._table.leaderboard('own_goals')
 
     @property
     def best_assisters(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.GOAL_ASSIST))
+        return self._table.leaderboard('assists')
 
     @property
     def best_assisters_by_penalty_winning(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.assists_count_by_assist_type(AssistTypes.PENALTY_WINNING_ASSIST))
+        return self._table.leaderboard('penalty_winning_assists')
 
     @property
     def best_assisters_by_corner(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.assists_count_by_assist_type(AssistTypes.CORNER_ASSIST))
+        return self._table.leaderboard('corner_assists')
 
     @property
     def best_assisters_by_free_kick(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.assists_count_by_assist_type(AssistTypes.FREE_KICK_ASSIST))
+        return self._table.leaderboard('free_kick_assists')
 
     @property
     def best_assisters_by_throw_in(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.assists_count_by_assist_type(AssistTypes.THROW_IN_ASSIST))
+        return self._table.leaderboard('throw_in_assists')
 
     @property
     def best_assisters_by_header(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.assists_count_by_assist_type(AssistTypes.HEADER_ASSIST))
+        return self._table.leaderboard('header_assists')
 
     @property
     def most_goals_involved(self) -> List[PlayerStats]:
         """
         Top players which involved in goals (score or assist)
         """
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.GOAL_ASSIST) + p.event_count_by_type(
-                GameEventTypes.GOAL_SCORE) - p.goals_count_by_goal_type(GoalTypes.OWN_GOAL))
+        return self._table.leaderboard('goals_involved')
 
     def best_scorers_in_one_game(self, score_at_least: int) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: 1 if p.event_count_by_type(GameEventTypes.GOAL_SCORE) - p.goals_count_by_goal_type(
-                GoalTypes.OWN_GOAL) >= score_at_least else 0)
+        table = self._table
+        rows_goals = table.count_rows_events(
+            table.events_mask(GameEventTypes.GOAL_SCORE) & ~table.events_mask(GameEventTypes.GOAL_SCORE,
+                                                                               GoalTypes.OWN_GOAL))
+        return table.rows_leaderboard(rows_goals >= score_at_least)
 
     def best_assisters_in_one_game(self, assist_at_least: int) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: 1 if p.event_count_by_type(GameEventTypes.GOAL_ASSIST) >= assist_at_least else 0)
+        table = self._table
+        rows_assists = table.count_rows_events(table.events_mask(GameEventTypes.GOAL_ASSIST))
+        return table.rows_leaderboard(rows_assists >= assist_at_least)
 
     # endregion
 
@@ -158,44 +168,35 @@ class MaccabiGamesPlayersStats(object):
 
     @property
     def most_yellow_carded(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.YELLOW_CARD))
+        return self._table.leaderboard('yellow_cards')
 
     @property
     def most_red_carded(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.RED_CARD) + p.event_count_by_type(
-                GameEventTypes.SECOND_YELLOW_CARD))
+        return self._table.leaderboard('red_cards')
 
     @property
     def most_substitute_off(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.SUBSTITUTION_OUT))
+        return self._table.leaderboard('substitute_off')
 
     @property
     def most_substitute_in(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.SUBSTITUTION_IN))
+        return self._table.leaderboard('substitute_in')
 
     @property
     def most_lineup_players(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.LINE_UP))
+        return self._table.leaderboard('lineups')
 
     @property
     def most_captains(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.CAPTAIN))
+        return self._table.leaderboard('captains')
 
     @property
     def most_penalty_missed(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.PENALTY_MISSED))
+        return self._table.leaderboard('penalties_missed')
 
     @property
     def most_penalty_stopped(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: p.event_count_by_type(GameEventTypes.PENALTY_STOPPED))
+        return self._table.leaderboard('penalties_stopped')
 
     # endregion
 
@@ -203,56 +204,27 @@ class MaccabiGamesPlayersStats(object):
 
     @property
     def most_winners(self) -> List[PlayerStats]:
-        return self.__get_players_with_most_of_this_game_condition(lambda g: g.is_maccabi_win)
+        return self._table.leaderboard('wins')
 
     @property
     def most_losers(self) -> List[PlayerStats]:
-        return self.__get_players_with_most_of_this_game_condition(lambda g: g.maccabi_score_diff < 0)
+        return self._table.leaderboard('losses')
 
     @property
     def most_unbeaten(self) -> List[PlayerStats]:
-        return self.__get_players_with_most_of_this_game_condition(lambda g: g.maccabi_score_diff >= 0)
+        return self._table.leaderboard('unbeaten')
 
     @property
     def most_clean_sheet(self) -> List[PlayerStats]:
-        return self.__get_players_with_most_of_this_game_condition(lambda g: g.not_maccabi_team.score == 0)
+        return self._table.leaderboard('clean_sheets')
 
     @property
     def most_played(self) -> List[PlayerStats]:
-        return self.__get_players_with_most_of_this_game_condition(lambda g: True)
-
-    @staticmethod
-    def __goals_count_after_sub_in(player: PlayerInGame) -> int:
-        """
-        Count the goals after sub in for this player
-        """
-        if not player.scored:
-            return 0
-        if not player.has_event_type(GameEventTypes.SUBSTITUTION_IN):
-            return 0
-
-        count_by_goals = player.event_count_by_type(GameEventTypes.GOAL_SCORE)
-
-        subs_in_time = player.get_events_by_type(GameEventTypes.SUBSTITUTION_IN)[0].time_occur
-        count_goals_after_sub = len(
-            [goal for goal in player.get_events_by_type(GameEventTypes.GOAL_SCORE) if goal.time_occur >= subs_in_time])
-
-        # Avoid bugs in maccabi site which registered players as subs in min 0.
-        if subs_in_time == timedelta(seconds=0):
-            return False
-
-        if count_by_goals != count_goals_after_sub:
-            # TODO: This is just for safety
-            logger.error(f"A player: {player.name} has different number of goals in 'goals_after_sub_in' calculation.")
-
-            return 0
-
-        return count_by_goals
+        return self._table.leaderboard('played')
 
     @property
     def most_goals_after_sub_in(self) -> List[PlayerStats]:
-        return self.__get_players_from_all_games_with_most_of_this_condition(
-            lambda p: self.__goals_count_after_sub_in(p))
+        return self._table.leaderboard('goals_after_sub_in')
 
     # endregion
 
@@ -296,46 +268,6 @@ class MaccabiGamesPlayersStats(object):
 
         return [player for player in played_more_than_minimum_games if player[0] not in players_that_lost]
 
-    def __get_players_from_all_games_with_most_of_this_condition(self, condition: Callable[[PlayerInGame], int]) \
-            -> List[PlayerStats]:
-        """
-        :param condition: this function should get PlayerInGame as param, and return int.
-                          0 wont count this player in the final summary.
-        """
-        players_with_most_event_type = reduce(
-            lambda events_counter_a, events_counter_b: events_counter_a + events_counter_b,
-
-            # TeamInGame saves dict which map between player event to the property
-            # which return the most common players which have this event in this game & team.
-            [game.maccabi_team.get_players_with_most_of_this_condition(condition)
-             for game in self.games],
-            Counter([]))  # When self.games above is empty, reduce will return this default value.
-
-        return players_with_most_event_type.most_common()
-
-    def __get_players_with_most_of_this_game_condition(self, condition: Callable[[GameData], bool] = None) \
-            -> List[PlayerStats]:
-        """
-        Return the players which played the most at games with the given condition,
-        example: __get_players_with_most_of_this_game_condition(lambda g: g.is_maccabi_win)
-        for players who played when maccabi won.
-        :param condition: callable which get game as param and return bool (if need to count this game).
-        """
-
-        if condition is None:
-            condition = lambda g: True
-
-        # Like __get_players_with_most_of_this_event
-        most_played_players_with_game_condition = reduce(
-            lambda played_counter_a, played_counter_b: played_counter_a + played_counter_b,
-            [game.maccabi_team.played_players_with_amount
-             for game in self.games if condition(game)],
-            # Have an initializer for the case that no game satisfies the condition
-            Counter({})
-        )
-
-        return Counter(most_played_players_with_game_condition).most_common()
-
     def __get_most_players_by_percentage_with_this_game_condition(
             self, players_ordered_by_game_condition: PlayerNameToStat, minimum_games_played: int = 0) \
             -> List[_PlayerGamesPercentages]:
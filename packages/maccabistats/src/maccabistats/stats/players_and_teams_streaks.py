@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Callable, Tuple, List
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, Tuple, List
 
-from progressbar import ProgressBar
+import numpy as np
 
-from maccabistats.stats.players_games_condition import PlayerGamesCondition
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.players_streaks_runs import MaccabiPlayersStreaksRuns, PlayersStreaks
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
@@ -23,134 +26,124 @@ class PlayersAndTeamsStreaksStats(object):
     Every streak in this class is calculated from the player PLAYED games only.
     The only stat that calculated from the entire games (including these the players didn't took part it) is:
     get_players_with_current_played_in_game_streak
+
+    The games of each player against each team (by the team current name) are indexed once for all of the streaks,
+    see MaccabiPlayersStreaksRuns.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
-        self.games = maccabi_games_stats.games
 
-    def _get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            self, streak_condition: Callable[[MaccabiGamesStats, str, str], MaccabiGamesStats],
-            top_players_count: int = 10) -> List[PlayerAndTeamGames]:
-        """
-        For each player, given his MaccabiGamesStats (means = ONLY the games he played) - calculate the relevant streak.
-        For example:
-        "streak_condition= lambda games, _ , __, team_name: games.streaks.get_longest_unbeaten_streak_games())"
+    @property
+    def games(self) -> List[GameData]:
+        return self.maccabi_games_stats.games
 
-        :param streak_condition: callable that get (MaccabiGamesStats, player_name, team_name)
-                                 as params and return streak
-        """
-        players_and_teams_games = self.maccabi_games_stats.played_games_by_player_and_team()
+    @cached_property
+    def _runs(self) -> MaccabiPlayersStreaksRuns:
+        return MaccabiPlayersStreaksRuns(self.maccabi_games_stats.columns, by_opponent=True)
+
+    def _top_players_and_teams_streaks(self, players_and_teams_streaks: PlayersStreaks, top_players_count: int,
+                                       from_games_they_played: bool) -> List[PlayerAndTeamGames]:
+        stats = self.maccabi_games_stats
+        columns = stats.columns
+
+        top_streaks = []
+        for group_id, games_indices in self._runs.top(players_and_teams_streaks, top_players_count,
+                                                      include_without_streak=from_games_they_played):
+            player_id, opponent_id = self._runs.group_player_and_opponent(group_id)
+            player_name, team_name = columns.players[player_id], columns.opponents[opponent_id]
+            description = f'Players {player_name} and Team: {team_name} games' if from_games_they_played \
+                else stats._new_description(f'Against team: {team_name}')
+            top_streaks.append((player_name, team_name, stats._create_games_view(games_indices, description)))
+
+        return top_streaks
 
-        unsorted_players_and_teams_streaks = []
-        for player_name, teams_mapping in players_and_teams_games.items():
-            for team_name, specific_player_and_team_games in teams_mapping.items():
-                streak = streak_condition(specific_player_and_team_games, player_name, team_name)
-                unsorted_players_and_teams_streaks.append((player_name, team_name, streak))
+    def _get_top_players_and_teams_streaks_from_games_they_played(self, rows_mask: np.ndarray, current: bool = False,
+                                                                  top_players_count: int = 10) \
+            -> List[PlayerAndTeamGames]:
+        """
+        For each player and team, calculate the streak from ONLY the games the player played against the team.
 
-        return sorted(unsorted_players_and_teams_streaks, key=lambda kv: len(kv[2]), reverse=True)[:top_players_count]
+        :param rows_mask: Whether each of the games the players played against each team
+                          (see MaccabiPlayersStreaksRuns) is in a streak
+        :param current: Whether to take the streak that ends with the last game, rather than the longest one
+        """
+        streaks = self._runs.current_played_games_streaks(rows_mask) if current \
+            else self._runs.longest_played_games_streaks(rows_mask)
+        return self._top_players_and_teams_streaks(streaks, top_players_count, from_games_they_played=True)
 
-    def _get_players_streak_by_condition_from_all_games(
-            self, streak_condition: Callable[[MaccabiGamesStats, str, str], MaccabiGamesStats],
-            top_players_count: int = 10) -> List[PlayerAndTeamGames]:
+    def _get_top_players_and_teams_played_in_game_streaks(self, current: bool = False, top_players_count: int = 10) \
+            -> List[PlayerAndTeamGames]:
         """
-        Same as "_get_players_streak_by_condition", but we don't filters the games for each player.
-        In this function the condition is check against all of the available games,
-        even if the player didn't play in a game
-        (useful for queries like "which player played the most games in a row?").
+        The streaks of games in a row the players played at, these are checked against all of the games against
+        each team, even if the player didn't play in a game (useful for queries like
+        "which player played the most games in a row against a team?").
         """
-        pbar = ProgressBar()
-        unsorted_players_and_teams_streaks = []
-        for team_name in pbar(self.maccabi_games_stats.available_opponents):
-            team_games = self.maccabi_games_stats.get_games_against_team(team_name)
+        streaks = self._runs.current_played_in_game_streaks() if current \
+            else self._runs.longest_played_in_game_streaks()
+        return self._top_players_and_teams_streaks(streaks, top_players_count, from_games_they_played=False)
 
-            for player_name in self.maccabi_games_stats.available_players_names:
-                streak = streak_condition(team_games, player_name, team_name)
-                if not streak:
-                    continue
-                    
-                unsorted_players_and_teams_streaks.append((player_name, team_name, streak))
+    def _games_results(self, predicate: str, value=None) -> np.ndarray:
+        return self._runs.games_predicate_rows_mask(predicate, value)
 
-        return sorted(unsorted_players_and_teams_streaks, key=lambda kv: len(kv[2]), reverse=True)[:top_players_count]
+    def _players_events(self, events_types: Iterable[GameEventTypes], minimum_count: int) -> np.ndarray:
+        return self._runs.events_count_rows_mask(events_types, minimum_count)
 
     # region Top players streaks
 
     def get_players_with_best_unbeaten_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_unbeaten_streak_games())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('unbeaten'))
 
     def get_players_with_best_win_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_wins_streak_games())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('wins'))
 
     def get_players_with_best_ties_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_ties_streak_games())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('ties'))
 
     def get_players_with_best_losses_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_losses_streak_games())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('losses'))
 
     def get_players_with_best_maccabi_score_goal_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_score_at_least_games(1))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('score_at_least', 1))
 
     def get_players_with_best_maccabi_score_at_least_goals_streak(self, goals: int) -> List[PlayerAndTeamGames]:
         """
         :param goals: Goals amount that maccabi scored (at least)
         """
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_score_at_least_games(goals))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('score_at_least', goals))
 
     def get_players_with_best_maccabi_score_no_goal_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_score_exactly_games(0))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('score_exactly', 0))
 
     def get_players_with_best_maccabi_score_exactly_goals_streak(self, goals: int) -> List[PlayerAndTeamGames]:
         """
         :param goals: Goals amount that maccabi scored (exactly)
         """
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_score_exactly_games(goals))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('score_exactly', goals))
 
     def get_players_with_best_clean_sheets_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_clean_sheet_games())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('clean_sheet'))
 
     def get_players_with_best_played_in_game_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_players_streak_by_condition_from_all_games(
-            lambda games, player_name, __: games.streaks.get_longest_player_played_in_game(player_name))
+        return self._get_top_players_and_teams_played_in_game_streaks()
 
     def get_players_with_best_goal_scoring_streak(self, goals: int = 1):
-        goals_in_a_game = PlayerGamesCondition.create_score_x_goals_in_game__condition(goals)
-
-        def _find_best_goal_scoring_streak_from_played_games(games: MaccabiGamesStats, player_name: str, team_name):
-            return games.streaks._get_longest_streak_by_condition(lambda g: goals_in_a_game(g, player_name))
-
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            _find_best_goal_scoring_streak_from_played_games)
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE], goals))
 
     def get_players_with_best_goal_assisting_streak(self, assists: int = 1) -> List[PlayerAndTeamGames]:
-        assists_in_a_game = PlayerGamesCondition.create_assist_x_goals_in_game__condition(assists)
-
-        def _find_best_goal_assisting_streak_from_played_games(games: MaccabiGamesStats, player_name: str, team_name):
-            return games.streaks._get_longest_streak_by_condition(lambda g: assists_in_a_game(g, player_name))
-
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            _find_best_goal_assisting_streak_from_played_games)
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_ASSIST], assists))
 
     def get_players_with_best_goal_involving_streak(self, goals_involved: int = 1) -> List[PlayerAndTeamGames]:
-        involved_in_a_game = PlayerGamesCondition.create_involved_in_x_goals_in_game__condition(goals_involved)
-
-        def _find_best_goals_involved_streak_from_played_games(games: MaccabiGamesStats, player_name: str, team_name):
-            return games.streaks._get_longest_streak_by_condition(lambda g: involved_in_a_game(g, player_name))
-
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            _find_best_goals_involved_streak_from_played_games)
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE, GameEventTypes.GOAL_ASSIST], goals_involved))
 
     def get_players_with_current_unbeaten_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_unbeaten_streak())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('unbeaten'), current=True)
 
     # endregion
 
@@ -158,38 +151,35 @@ class PlayersAndTeamsStreaksStats(object):
 
     def get_players_with_best_scored_against_maccabi_not_more_than_streak(self, not_maccabi_score: int) \
             -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_longest_scored_against_maccabi_not_more_than_games(
-                not_maccabi_score))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('conceded_not_more_than', not_maccabi_score))
 
     def get_players_with_current_win_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_wins_streak())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('wins'), current=True)
 
     def get_players_with_current_ties_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_ties_streak())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(self._games_results('ties'), current=True)
 
     def get_players_with_current_losses_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_losses_streak())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('losses'), current=True)
 
     def get_players_with_current_maccabi_score_goal_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_score_at_least_streak(1))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('score_at_least', 1), current=True)
 
-    def get_players_with_current_maccabi_score_at_least_goals_streak(self, goals_amount: int) -> List[
-        PlayerAndTeamGames]:
+    def get_players_with_current_maccabi_score_at_least_goals_streak(self, goals_amount: int) \
+            -> List[PlayerAndTeamGames]:
         """
         :param goals_amount: Goals amount that maccabi scored (at least)
         """
 
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_score_at_least_streak(goals_amount))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('score_at_least', goals_amount), current=True)
 
     def get_players_with_current_maccabi_score_no_goal_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_score_exactly_streak(0))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('score_exactly', 0), current=True)
 
     def get_players_with_current_maccabi_score_exactly_goals_streak(self, goals_amount: int) \
             -> List[PlayerAndTeamGames]:
@@ -197,50 +187,32 @@ class PlayersAndTeamsStreaksStats(object):
         :param goals_amount: Goals amount that maccabi scored (exactly)
         """
 
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_score_exactly_streak(goals_amount))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('score_exactly', goals_amount), current=True)
 
     def get_players_with_current_clean_sheets_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_clean_sheet_streak())
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('clean_sheet'), current=True)
 
     def get_players_with_current_goal_scoring_streak(self, goals: int = 1) -> List[PlayerAndTeamGames]:
-        goals_in_a_game = PlayerGamesCondition.create_score_x_goals_in_game__condition(goals)
-
-        def _find_current_goal_scoring_streak_from_played_games(games: MaccabiGamesStats, player_name: str, team_name):
-            return games.streaks._get_current_streak_by_condition(lambda g: goals_in_a_game(g, player_name))
-
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            _find_current_goal_scoring_streak_from_played_games)
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE], goals), current=True)
 
     def get_players_with_current_goal_assisting_streak(self, assists: int = 1) -> List[PlayerAndTeamGames]:
-        assists_in_a_game = PlayerGamesCondition.create_assist_x_goals_in_game__condition(assists)
-
-        def _find_current_goal_assisting_streak_from_played_games(games: MaccabiGamesStats, player_name: str,
-                                                                  team_name):
-            return games.streaks._get_current_streak_by_condition(lambda g: assists_in_a_game(g, player_name))
-
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            _find_current_goal_assisting_streak_from_played_games)
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_ASSIST], assists), current=True)
 
     def get_players_with_current_goal_involving_streak(self, goals_involved: int = 1) -> List[PlayerAndTeamGames]:
-        involved_in_a_game = PlayerGamesCondition.create_involved_in_x_goals_in_game__condition(goals_involved)
-
-        def _find_current_goals_involved_streak_from_played_games(games: MaccabiGamesStats, player_name: str,
-                                                                  team_name):
-            return games.streaks._get_current_streak_by_condition(lambda g: involved_in_a_game(g, player_name))
-
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            _find_current_goals_involved_streak_from_played_games)
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE, GameEventTypes.GOAL_ASSIST], goals_involved),
+            current=True)
 
     def get_players_with_current_scored_against_maccabi_not_more_than_streak(self, not_maccabi_score: int) \
             -> List[PlayerAndTeamGames]:
-        return self._get_top_players_and_teams_streaks_by_condition_from_games_they_played(
-            lambda games, _, __: games.streaks.get_current_scored_against_maccabi_not_more_than_streak(
-                not_maccabi_score))
+        return self._get_top_players_and_teams_streaks_from_games_they_played(
+            self._games_results('conceded_not_more_than', not_maccabi_score), current=True)
 
     def get_players_with_current_played_in_game_streak(self) -> List[PlayerAndTeamGames]:
-        return self._get_players_streak_by_condition_from_all_games(
-            lambda games, player_name, __: games.streaks.get_current_player_played_in_game_streak(player_name))
+        return self._get_top_players_and_teams_played_in_game_streaks(current=True)
 
     # endregion
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.columns import event_type_id
+
+if TYPE_CHECKING:
+    from maccabistats.stats.columns import MaccabiGamesColumns
+
+logger = logging.getLogger(__name__)
+
+# A game ends at the 90th minute, unless it has events after it (extra time)
+GAME_SECONDS = 90 * 60
+
+# The values the players pairs can be weighted by: games together, wins together or minutes on the pitch together
+PAIRS_WEIGHTS = ('games', 'wins', 'minutes')
+
+
+class PlayersPairs(NamedTuple):
+    """
+    Sparse (upper triangle, first player id < second player id) players x players matrix, of the pairs that played
+    together at least once. Ordered by the pairs ids.
+    """
+    first_players: np.ndarray
+    second_players: np.ndarray
+    weights: np.ndarray
+    first_games: np.ndarray  # The first game each pair played together at, to order pairs with the same weight
+
+
+class PlayersGroups(NamedTuple):
+    """
+    Groups of players that played together (all of them at the same games), a row of players ids for each group.
+    """
+    players: np.ndarray
+    games_counts: np.ndarray
+    first_games: np.ndarray
+
+
+def _is_in_sorted(values: np.ndarray, sorted_values: np.ndarray) -> np.ndarray:
+    positions = np.minimum(np.searchsorted(sorted_values, values), max(len(sorted_values) - 1, 0))
+    return sorted_values[positions] == values if len(sorted_values) else np.zeros(len(values), dtype=bool)
+
+
+def _next_rows(last_rows: np.ndarray, rows_game_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs each of the given rows with every next row of its game.
+    :return: The index of the given row of each pair, and the next row of each pair.
+    """
+    next_rows_counts = rows_game_end[last_rows] - last_rows - 1
+    pairs_count = int(next_rows_counts.sum())
+    last_rows_indices = np.repeat(np.arange(len(last_rows)), next_rows_counts)
+    pairs_starts = np.cumsum(next_rows_counts) - next_rows_counts
+
+    return last_rows_indices, last_rows[last_rows_indices] + 1 + (np.arange(pairs_count) -
+                                                                 pairs_starts[last_rows_indices])
+
+
+class MaccabiPlayersCoOccurrence(object):
+    """
+    Which maccabi players played together, from the squads table instead of the combinations of each game players.
+
+    The rows are the players each game had on the pitch, ordered by the game and then by the player id, so the pairs
+    of a game are each of its rows with every next row, generated for all of the games at once. The pairs are summed
+    into a sparse players x players matrix, groups of more players are extended level by level (apriori style):
+    only from groups that played enough games together and only with players that played enough games with each of
+    the group players.
+    """
+
+    def __init__(self, columns: MaccabiGamesColumns) -> None:
+        self.columns = columns
+        self._players_count = max(len(columns.players), 1)
+
+        played_squad_rows = np.flatnonzero(columns.maccabi_played_mask)
+        # A player is counted once per game, even if his name appears twice at the game squad
+        rows_keys, rows_first_squad_rows = np.unique(
+            columns.squad_game[played_squad_rows].astype(np.int64) * self._players_count +
+            columns.squad_player[played_squad_rows], return_index=True)
+        self.rows_game, self.rows_player = np.divmod(rows_keys, self._players_count)
+        self._rows_squad_row = played_squad_rows[rows_first_squad_rows]
+
+        # The row after the last row of each row game
+        self._rows_game_end = np.cumsum(np.bincount(self.rows_game, minlength=columns.games_count))[self.rows_game]
+
+        self._pairs_first_rows, self._pairs_second_rows = self._rows_pairs()
+        self._weighted_pairs: Dict[str, PlayersPairs] = {}
+
+        logger.debug(f'Created {len(self._pairs_first_rows)} pairs from {len(rows_keys)} played games rows')
+
+    def _rows_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        rows = np.arange(len(self.rows_game))
+        first_rows_indices, second_rows = _next_rows(rows, self._rows_game_end)
+        return rows[first_rows_indices], second_rows
+
+    def _pairs_keys(self, first_rows: np.ndarray, second_rows: np.ndarray) -> np.ndarray:
+        return self.rows_player[first_rows] * self._players_count + self.rows_player[second_rows]
+
+    @cached_property
+    def _pairs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :return: The (sorted) keys of the pairs, the pair of each pair instance (in a game) and the first instance.
+        """
+        pairs_keys, first_instances, instances_pairs = np.unique(
+            self._pairs_keys(self._pairs_first_rows, self._pairs_second_rows), return_index=True, return_inverse=True)
+        return pairs_keys, instances_pairs.reshape(-1), first_instances
+
+    # region Weights
+
+    def _rows_seconds_on_pitch(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The second each row player got on the pitch (0 or his sub in) and left it (sub out, red card or the game end).
+        """
+        columns = self.columns
+        games_end = np.full(columns.games_count, GAME_SECONDS, dtype=np.int64)
+        np.maximum.at(games_end, columns.event_game, columns.event_second)
+
+        def rows_first_event_second(events_types: Tuple[GameEventTypes, ...], default: np.ndarray) -> np.ndarray:
+            events = np.flatnonzero(np.isin(columns.event_type, [event_type_id(event_type)
+                                                                 for event_type in events_types]))
+            squad_rows_seconds = np.full(len(columns.squad_player), np.iinfo(np.int64).max, dtype=np.int64)
+            np.minimum.at(squad_rows_seconds, columns.event_squad_row[events], columns.event_second[events])
+
+            rows_seconds = squad_rows_seconds[self._rows_squad_row]
+            return np.where(rows_seconds == np.iinfo(np.int64).max, default, rows_seconds)
+
+        rows_start = rows_first_event_second((GameEventTypes.SUBSTITUTION_IN,),
+                                             np.zeros(len(self.rows_game), dtype=np.int64))
+        rows_end = rows_first_event_second(
+            (GameEventTypes.SUBSTITUTION_OUT, GameEventTypes.RED_CARD, GameEventTypes.SECOND_YELLOW_CARD),
+            games_end[self.rows_game])
+        return rows_start, np.maximum(rows_start, rows_end)
+
+    def _instances_weights(self, weight: str) -> np.ndarray:
+        if weight == 'games':
+            return np.ones(len(self._pairs_first_rows), dtype=np.int64)
+        elif weight == 'wins':
+            return (self.columns.maccabi_score_diff > 0)[self.rows_game[self._pairs_first_rows]].astype(np.int64)
+        elif weight == 'minutes':
+            rows_start, rows_end = self._rows_seconds_on_pitch()
+            together_start = np.maximum(rows_start[self._pairs_first_rows], rows_start[self._pairs_second_rows])
+            together_end = np.minimum(rows_end[self._pairs_first_rows], rows_end[self._pairs_second_rows])
+            return np.maximum(together_end - together_start, 0)
+
+        raise ValueError(f"Unknown pairs weight: {weight}, should be one of: {list(PAIRS_WEIGHTS)}")
+
+    # endregion
+
+    def pairs(self, weight: str = 'games') -> PlayersPairs:
+        """
+        The players x players matrix of the given weight (one of PAIRS_WEIGHTS), created once per weight.
+        """
+        pairs = self._weighted_pairs.get(weight)
+        if pairs is None:
+            pairs_keys, instances_pairs, first_instances = self._pairs
+            weights = np.bincount(instances_pairs, weights=self._instances_weights(weight),
+                                  minlength=len(pairs_keys)).astype(np.int64)
+            if weight == 'minutes':
+                weights //= 60
+
+            first_players, second_players = np.divmod(pairs_keys, self._players_count)
+            pairs = self._weighted_pairs[weight] = PlayersPairs(
+                first_players, second_players, weights, self.rows_game[self._pairs_first_rows[first_instances]])
+
+        return pairs
+
+    # region Groups
+
+    def _extend_groups_instances(self, groups_rows: np.ndarray, frequent_pairs_keys: np.ndarray) -> np.ndarray:
+        """
+        Extends each group instance (a row of the game rows of its players) with every next player of its game,
+        that played together with each of the group players at least the required games (a frequent pair).
+        """
+        groups_indices, next_rows = _next_rows(groups_rows[:, -1], self._rows_game_end)
+        extended_groups_rows = groups_rows[groups_indices]
+
+        with_frequent_pairs = np.ones(len(next_rows), dtype=bool)
+        for group_rows in extended_groups_rows.T:
+            with_frequent_pairs &= _is_in_sorted(self._pairs_keys(group_rows, next_rows), frequent_pairs_keys)
+
+        return np.column_stack([extended_groups_rows[with_frequent_pairs], next_rows[with_frequent_pairs]])
+
+    def _count_groups(self, groups_rows: np.ndarray) -> Tuple[np.ndarray, PlayersGroups]:
+        """
+        :return: The group of each instance, and the groups (by their players ids) with their games counts.
+        """
+        instances_players = self.rows_player[groups_rows]
+        if self._players_count ** groups_rows.shape[1] < np.iinfo(np.int64).max:
+            # Sorting one int64 key per instance is much faster than sorting the players rows
+            instances_keys = np.zeros(len(groups_rows), dtype=np.int64)
+            for players in instances_players.T:
+                instances_keys = instances_keys * self._players_count + players
+        else:
+            instances_keys = instances_players
+
+        _, first_instances, instances_groups, games_counts = np.unique(
+            instances_keys, axis=0, return_index=True, return_inverse=True, return_counts=True)
+        # The instances are ordered by their game, so the first instance of each group is its first game
+        return instances_groups.reshape(-1), PlayersGroups(instances_players[first_instances], games_counts,
+                                                           self.rows_game[groups_rows[first_instances, 0]])
+
+    def frequent_groups(self, group_size: int, minimum_games: int) -> PlayersGroups:
+        """
+        :return: The groups of group_size players (2 or more) that played together at least minimum_games games.
+        """
+        if group_size < 2:
+            raise ValueError(f"A group of players should have at least 2 players, got: {group_size}")
+
+        pairs_keys, instances_pairs, _ = self._pairs
+        pairs_games = self.pairs().weights
+        groups_rows = np.column_stack([self._pairs_first_rows, self._pairs_second_rows])[
+            pairs_games[instances_pairs] >= minimum_games]
+        frequent_pairs_keys = pairs_keys[pairs_games >= minimum_games]
+
+        for _ in range(group_size - 2):
+            groups_rows = self._extend_groups_instances(groups_rows, frequent_pairs_keys)
+            # Only the groups that played enough games together are kept, so only they are extended to bigger groups
+            instances_groups, groups = self._count_groups(groups_rows)
+            groups_rows = groups_rows[groups.games_counts[instances_groups] >= minimum_games]
+
+        return self._count_groups(groups_rows)[1]
+
+    def top_groups(self, group_size: int, top_count: int) -> List[Tuple[np.ndarray, int]]:
+        """
+        The groups of group_size players that played the most games together, ordered by their games count.
+
+        A group played at most as many games as each of its pairs, so we look for the groups that played as many games
+        as the top_count pair (at least), then lower this minimum until we have top_count groups.
+        """
+        pairs_games = np.sort(self.pairs().weights)[::-1]
+        minimum_games = int(pairs_games[top_count - 1]) if len(pairs_games) >= top_count else 1
+        groups = self.frequent_groups(group_size, minimum_games)
+        while len(groups.games_counts) < top_count and minimum_games > 1:
+            minimum_games = max(minimum_games // 2, 1)
+            groups = self.frequent_groups(group_size, minimum_games)
+
+        logger.debug(f'Found {len(groups.games_counts)} groups of {group_size} players, '
+                     f'with at least {minimum_games} games together')
+        top = np.lexsort((groups.first_games, -groups.games_counts))[:top_count]
+        return [(groups.players[group], int(groups.games_counts[group])) for group in top.tolist()]
+
+    # endregion
+
+    def distinct_teammates(self) -> np.ndarray:
+        """
+        :return: The count of the different players each player (by id) played together with.
+        """
+        pairs = self.pairs()
+        return np.bincount(pairs.first_players, minlength=self._players_count) + \
+            np.bincount(pairs.second_players, minlength=self._players_count)
+
+    def players_first_games(self) -> np.ndarray:
+        """
+        :return: The first game each player (by id) played at, the games count for players that never played.
+        """
+        players_first_games = np.full(self._players_count, self.columns.games_count, dtype=np.int64)
+        np.minimum.at(players_first_games, self.rows_player, self.rows_game)
+        return players_first_games
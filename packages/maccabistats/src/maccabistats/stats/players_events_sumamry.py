@@ -20,75 +20,75 @@ class MaccabiGamesPlayersEventsSummaryStats(object):
     # region assists
     @property
     def total_goals_assists_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_assisters)
+        return self.maccabi_games_stats.players.metric_total('assists')
 
     @property
     def total_goals_assists_by_penalty_winning_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_assisters_by_penalty_winning)
+        return self.maccabi_games_stats.players.metric_total('penalty_winning_assists')
 
     @property
     def total_goals_assists_by_corner_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_assisters_by_corner)
+        return self.maccabi_games_stats.players.metric_total('corner_assists')
 
     @property
     def total_goals_assists_by_free_kick_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_assisters_by_free_kick)
+        return self.maccabi_games_stats.players.metric_total('free_kick_assists')
 
     @property
     def total_goals_assists_by_throw_in_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_assisters_by_throw_in)
+        return self.maccabi_games_stats.players.metric_total('throw_in_assists')
 
     @property
     def total_goals_assists_by_header_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_assisters_by_header)
+        return self.maccabi_games_stats.players.metric_total('header_assists')
 
     # endregion
 
     # region goals
     @property
     def total_goals_scoring_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_scorers)
+        return self.maccabi_games_stats.players.metric_total('goals')
 
     @property
     def total_penalties_goals_scoring_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_scorers_by_penalty)
+        return self.maccabi_games_stats.players.metric_total('penalty_goals')
 
     @property
     def total_freekicks_goals_scoring_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_scorers_by_freekick)
+        return self.maccabi_games_stats.players.metric_total('freekick_goals')
 
     @property
     def total_own_goals_scoring_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_scorers_by_own_goal)
+        return self.maccabi_games_stats.players.metric_total('own_goals')
 
     @property
     def total_head_goals_scoring_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_scorers_by_head)
+        return self.maccabi_games_stats.players.metric_total('head_goals')
 
     @property
     def total_foot_goals_scoring_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.best_scorers_by_foot)
+        return self.maccabi_games_stats.players.metric_total('foot_goals')
 
     # endregion
     @property
     def total_goals_involved_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.most_goals_involved)
+        return self.maccabi_games_stats.players.metric_total('goals_involved')
 
     @property
     def total_yellow_card_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.most_yellow_carded)
+        return self.maccabi_games_stats.players.metric_total('yellow_cards')
 
     @property
     def total_red_card_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.most_red_carded)
+        return self.maccabi_games_stats.players.metric_total('red_cards')
 
     @property
     def total_captains_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.most_captains)
+        return self.maccabi_games_stats.players.metric_total('captains')
 
     @property
     def total_lineups_counted_for_maccabi_players(self) -> int:
-        return sum(player[1] for player in self.maccabi_games_stats.players.most_lineup_players)
+        return self.maccabi_games_stats.players.metric_total('lineups')
 
     @property
     def _players_with_numbers_for_maccabi(self) -> Tuple[int, int]:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Callable, Tuple, List
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, Tuple, List
 
-from progressbar import ProgressBar
+import numpy as np
 
-from .players_games_condition import PlayerGamesCondition
+from maccabistats.models.game_data import GameData
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.players_streaks_runs import MaccabiPlayersStreaksRuns, PlayersStreaks
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
@@ -22,122 +25,115 @@ class MaccabiGamesPlayersStreaksStats(object):
     Every streak in this class is calculated from the player PLAYED games only.
     The only stat that calculated from the entire games (including these the players didn't took part it) is:
     get_players_with_current_played_in_game_streak
-    """
 
+    The streaks of all of the players are calculated at once (see MaccabiPlayersStreaksRuns),
+    the games are created only for the top players streaks.
+    """
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
-        self.games = maccabi_games_stats.games
 
-    def _get_top_players_streaks_by_condition_from_games_they_played(
-            self, streak_condition: Callable[[MaccabiGamesStats, str], MaccabiGamesStats],
-            top_players_count: int = 10) -> List[PlayerAndGames]:
-        """
-        For each player, given his MaccabiGamesStats (means = ONLY the games he played) - calculate the relevant streak.
-        For example: "streak_condition= lambda games, player_name: games.streaks.get_longest_unbeaten_streak_games())"
+    @property
+    def games(self) -> List[GameData]:
+        return self.maccabi_games_stats.games
 
-        :param streak_condition: callable that get (MaccabiGamesStats, player_name) as params and return streak
-        """
-        players_games = self.maccabi_games_stats.played_games_by_player_name()
+    @cached_property
+    def _runs(self) -> MaccabiPlayersStreaksRuns:
+        return MaccabiPlayersStreaksRuns(self.maccabi_games_stats.columns)
+
+    def _top_players_streaks(self, players_streaks: PlayersStreaks, top_players_count: int,
+                             from_games_they_played: bool) -> List[PlayerAndGames]:
+        stats = self.maccabi_games_stats
+        players_names = stats.columns.players
+
+        top_players_streaks = []
+        for player_id, games_indices in self._runs.top(players_streaks, top_players_count):
+            player_name = players_names[player_id]
+            description = stats._new_description(f'Player games: {player_name}') if from_games_they_played \
+                else stats.description
+            top_players_streaks.append((player_name, stats._create_games_view(games_indices, description)))
 
-        unsorted_players_streaks = {player_name: streak_condition(players_games[player_name], player_name) for
-                                    player_name in self.maccabi_games_stats.available_players_names}
+        return top_players_streaks
 
-        return sorted(unsorted_players_streaks.items(), key=lambda kv: len(kv[1]), reverse=True)[:top_players_count]
+    def _get_top_players_streaks_from_games_they_played(self, rows_mask: np.ndarray, current: bool = False,
+                                                        top_players_count: int = 10) -> List[PlayerAndGames]:
+        """
+        For each player, calculate the streak from ONLY the games he played.
+
+        :param rows_mask: Whether each of the games the players played (see MaccabiPlayersStreaksRuns) is in a streak
+        :param current: Whether to take the streak that ends with the player last game, rather than the longest one
+        """
+        players_streaks = self._runs.current_played_games_streaks(rows_mask) if current \
+            else self._runs.longest_played_games_streaks(rows_mask)
+        return self._top_players_streaks(players_streaks, top_players_count, from_games_they_played=True)
 
-    def _get_players_streak_by_condition_from_all_games(
-            self, streak_condition: Callable[[MaccabiGamesStats, str], MaccabiGamesStats],
-            top_players_count: int = 10) -> List[PlayerAndGames]:
+    def _get_top_players_played_in_game_streaks(self, current: bool = False, top_players_count: int = 10) \
+            -> List[PlayerAndGames]:
         """
-        Same as "_get_players_streak_by_condition", but we don't filters the games for each player.
-        In this function the condition is check against all of the available games,
-        even if the player didn't play in a game
-        (useful for queries like "which player played the most games in a row?").
+        The streaks of games in a row the players played at, these are checked against all of the available games,
+        even if the player didn't play in a game (useful for queries like "which player played the most games in a row?").
         """
-        pbar = ProgressBar()
-        unsorted_players_streaks = dict()
-        for player in pbar(self.maccabi_games_stats.available_players):
-            unsorted_players_streaks[player.name] = streak_condition(self.maccabi_games_stats, player.name)
+        players_streaks = self._runs.current_played_in_game_streaks() if current \
+            else self._runs.longest_played_in_game_streaks()
+        return self._top_players_streaks(players_streaks, top_players_count, from_games_they_played=False)
+
+    def _games_results(self, predicate: str, value=None) -> np.ndarray:
+        return self._runs.games_predicate_rows_mask(predicate, value)
 
-        return sorted(unsorted_players_streaks.items(), key=lambda kv: len(kv[1]), reverse=True)[:top_players_count]
+    def _players_events(self, events_types: Iterable[GameEventTypes], minimum_count: int) -> np.ndarray:
+        return self._runs.events_count_rows_mask(events_types, minimum_count)
 
     # region Top players streaks
 
     def get_players_with_best_unbeaten_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_unbeaten_streak_games())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('unbeaten'))
 
     def get_players_with_best_win_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_wins_streak_games())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('wins'))
 
     def get_players_with_best_ties_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_ties_streak_games())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('ties'))
 
     def get_players_with_best_losses_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_losses_streak_games())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('losses'))
 
     def get_players_with_best_maccabi_score_goal_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_score_at_least_games(1))
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('score_at_least', 1))
 
     def get_players_with_best_maccabi_score_at_least_goals_streak(self, goals: int) -> List[PlayerAndGames]:
         """
         :param goals: Goals amount that maccabi scored (at least)
         """
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_score_at_least_games(goals))
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('score_at_least', goals))
 
     def get_players_with_best_maccabi_score_no_goal_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_score_exactly_games(0))
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('score_exactly', 0))
 
     def get_players_with_best_maccabi_score_exactly_goals_streak(self, goals: int) -> List[PlayerAndGames]:
         """
         :param goals: Goals amount that maccabi scored (exactly)
         """
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_score_exactly_games(goals))
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('score_exactly', goals))
 
     def get_players_with_best_clean_sheets_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_clean_sheet_games())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('clean_sheet'))
 
     def get_players_with_best_played_in_game_streak(self) -> List[PlayerAndGames]:
-        return self._get_players_streak_by_condition_from_all_games(
-            lambda games, player_name: games.streaks.get_longest_player_played_in_game(player_name))
+        return self._get_top_players_played_in_game_streaks()
 
     def get_players_with_best_goal_scoring_streak(self, goals: int = 1):
-        goals_in_a_game = PlayerGamesCondition.create_score_x_goals_in_game__condition(goals)
-
-        def _find_best_goal_scoring_streak_from_played_games(games: MaccabiGamesStats, player_name: str):
-            return games.streaks._get_longest_streak_by_condition(lambda g: goals_in_a_game(g, player_name))
-
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            _find_best_goal_scoring_streak_from_played_games)
+        return self._get_top_players_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE], goals))
 
     def get_players_with_best_goal_assisting_streak(self, assists: int = 1) -> List[PlayerAndGames]:
-        assists_in_a_game = PlayerGamesCondition.create_assist_x_goals_in_game__condition(assists)
-
-        def _find_best_goal_assisting_streak_from_played_games(games: MaccabiGamesStats, player_name: str):
-            return games.streaks._get_longest_streak_by_condition(lambda g: assists_in_a_game(g, player_name))
-
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            _find_best_goal_assisting_streak_from_played_games)
+        return self._get_top_players_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_ASSIST], assists))
 
     def get_players_with_best_goal_involving_streak(self, goals_involved: int = 1) -> List[PlayerAndGames]:
-        involved_in_a_game = PlayerGamesCondition.create_involved_in_x_goals_in_game__condition(goals_involved)
-
-        def _find_best_goals_involved_streak_from_played_games(games: MaccabiGamesStats, player_name: str):
-            return games.streaks._get_longest_streak_by_condition(lambda g: involved_in_a_game(g, player_name))
-
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            _find_best_goals_involved_streak_from_played_games)
+        return self._get_top_players_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE, GameEventTypes.GOAL_ASSIST], goals_involved))
 
     def get_players_with_current_unbeaten_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_unbeaten_streak())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('unbeaten'), current=True)
 
     # endregion
 
@@ -145,85 +141,64 @@ class MaccabiGamesPlayersStreaksStats(object):
 
     def get_players_with_best_scored_against_maccabi_not_more_than_streak(self, not_maccabi_score: int) \
             -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_longest_scored_against_maccabi_not_more_than_games(
-                not_maccabi_score))
+        return self._get_top_players_streaks_from_games_they_played(
+            self._games_results('conceded_not_more_than', not_maccabi_score))
 
     def get_players_with_current_win_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_wins_streak())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('wins'), current=True)
 
     def get_players_with_current_ties_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_ties_streak())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('ties'), current=True)
 
     def get_players_with_current_losses_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_losses_streak())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('losses'), current=True)
 
     def get_players_with_current_maccabi_score_goal_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_score_at_least_streak(1))
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('score_at_least', 1),
+                                                                    current=True)
 
     def get_players_with_current_maccabi_score_at_least_goals_streak(self, goals_amount: int) -> List[PlayerAndGames]:
         """
         :param goals_amount: Goals amount that maccabi scored (at least)
         """
 
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_score_at_least_streak(goals_amount))
+        return self._get_top_players_streaks_from_games_they_played(
+            self._games_results('score_at_least', goals_amount), current=True)
 
     def get_players_with_current_maccabi_score_no_goal_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_score_exactly_streak(0))
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('score_exactly', 0),
+                                                                    current=True)
 
     def get_players_with_current_maccabi_score_exactly_goals_streak(self, goals_amount: int) -> List[PlayerAndGames]:
         """
         :param goals_amount: Goals amount that maccabi scored (exactly)
         """
 
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_score_exactly_streak(goals_amount))
+        return self._get_top_players_streaks_from_games_they_played(
+            self._games_results('score_exactly', goals_amount), current=True)
 
     def get_players_with_current_clean_sheets_streak(self) -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_clean_sheet_streak())
+        return self._get_top_players_streaks_from_games_they_played(self._games_results('clean_sheet'), current=True)
 
     def get_players_with_current_goal_scoring_streak(self, goals: int = 1) -> List[PlayerAndGames]:
-        goals_in_a_game = PlayerGamesCondition.create_score_x_goals_in_game__condition(goals)
-
-        def _find_current_goal_scoring_streak_from_played_games(games: MaccabiGamesStats, player_name: str):
-            return games.streaks._get_current_streak_by_condition(lambda g: goals_in_a_game(g, player_name))
-
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            _find_current_goal_scoring_streak_from_played_games)
+        return self._get_top_players_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE], goals), current=True)
 
     def get_players_with_current_goal_assisting_streak(self, assists: int = 1) -> List[PlayerAndGames]:
-        assists_in_a_game = PlayerGamesCondition.create_assist_x_goals_in_game__condition(assists)
-
-        def _find_current_goal_assisting_streak_from_played_games(games: MaccabiGamesStats, player_name: str):
-            return games.streaks._get_current_streak_by_condition(lambda g: assists_in_a_game(g, player_name))
-
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            _find_current_goal_assisting_streak_from_played_games)
+        return self._get_top_players_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_ASSIST], assists), current=True)
 
     def get_players_with_current_goal_involving_streak(self, goals_involved: int = 1) -> List[PlayerAndGames]:
-        involved_in_a_game = PlayerGamesCondition.create_involved_in_x_goals_in_game__condition(goals_involved)
-
-        def _find_current_goals_involved_streak_from_played_games(games: MaccabiGamesStats, player_name: str):
-            return games.streaks._get_current_streak_by_condition(lambda g: involved_in_a_game(g, player_name))
-
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            _find_current_goals_involved_streak_from_played_games)
+        return self._get_top_players_streaks_from_games_they_played(
+            self._players_events([GameEventTypes.GOAL_SCORE, GameEventTypes.GOAL_ASSIST], goals_involved),
+            current=True)
 
     def get_players_with_current_scored_against_maccabi_not_more_than_streak(self, not_maccabi_score: int) \
             -> List[PlayerAndGames]:
-        return self._get_top_players_streaks_by_condition_from_games_they_played(
-            lambda games, player_name: games.streaks.get_current_scored_against_maccabi_not_more_than_streak(
-                not_maccabi_score))
+        return self._get_top_players_streaks_from_games_they_played(
+            self._games_results('conceded_not_more_than', not_maccabi_score), current=True)
 
     def get_players_with_current_played_in_game_streak(self) -> List[PlayerAndGames]:
-        return self._get_players_streak_by_condition_from_all_games(
-            lambda games, player_name: games.streaks.get_current_player_played_in_game_streak(player_name))
+        return self._get_top_players_played_in_game_streaks(current=True)
 
     # endregion
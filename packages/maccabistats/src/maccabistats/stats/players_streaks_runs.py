@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.columns import event_type_id
+from maccabistats.stats.streaks_runs import Runs, STREAKS_PREDICATES
+
+if TYPE_CHECKING:
+    from maccabistats.stats.columns import MaccabiGamesColumns
+
+logger = logging.getLogger(__name__)
+
+# Group id to its streak (first row, length), the rows are the groups played games (see MaccabiPlayersStreaksRuns)
+PlayersStreaks = Dict[int, Tuple[int, int]]
+
+
+class MaccabiPlayersStreaksRuns(object):
+    """
+    The streaks of all of the maccabi players at once, instead of creating the games of each player.
+
+    The rows are the games each group played, a group is a player (or a player & an opponent, when by_opponent),
+    ordered by the group and then by the game. So the rows of each group are the ordered games indices it played
+    (its posting list), and the runs of all of the groups are one sweep over the rows, a run ends at its group last row.
+    """
+
+    def __init__(self, columns: MaccabiGamesColumns, by_opponent: bool = False) -> None:
+        self.columns = columns
+        self.games_count = columns.games_count
+        self.by_opponent = by_opponent
+        self._opponents_count = max(len(columns.opponents), 1) if by_opponent else 1
+
+        played_rows = columns.maccabi_played_mask
+        # A player is counted once per game, even if his name appears twice at the game squad
+        self._rows_keys, rows_first_squad_rows = np.unique(
+            self._group_game_keys(columns.squad_player[played_rows], columns.squad_game[played_rows]),
+            return_index=True)
+        self.rows_group, self.rows_game = np.divmod(self._rows_keys, max(self.games_count, 1))
+        self.rows_player, self.rows_opponent = np.divmod(self.rows_group, self._opponents_count)
+
+        self._group_first_rows = np.ones(len(self._rows_keys), dtype=bool)
+        self._group_first_rows[1:] = self.rows_group[1:] != self.rows_group[:-1]
+
+        self.groups_ids = self._ordered_groups(rows_first_squad_rows)
+        self._rows_game_position, self._rows_last_game_position = self._games_positions()
+
+        logger.debug(f'Created {len(self._rows_keys)} played games rows for {len(self.groups_ids)} groups '
+                     f'(by opponent: {by_opponent})')
+
+    def _group_game_keys(self, players: np.ndarray, games: np.ndarray) -> np.ndarray:
+        groups = players.astype(np.int64) * self._opponents_count
+        if self.by_opponent:
+            groups += self.columns.opponent[games]
+
+        return groups * max(self.games_count, 1) + games
+
+    def _ordered_groups(self, rows_first_squad_rows: np.ndarray) -> List[int]:
+        if not self.by_opponent:
+            # The players (in the maccabi squads, even if they never played) by their ids order
+            return np.unique(self.columns.squad_player[self.columns.squad_is_maccabi]).tolist()
+
+        # The player & opponent pairs that played, by the order the player first played and then the pair
+        groups_first_rows = np.minimum.reduceat(rows_first_squad_rows, np.flatnonzero(self._group_first_rows)) \
+            if len(rows_first_squad_rows) else rows_first_squad_rows
+        groups = self.rows_group[self._group_first_rows]
+        groups_players = groups // self._opponents_count
+
+        players_first_rows = np.full(len(self.columns.players), len(rows_first_squad_rows), dtype=np.int64)
+        np.minimum.at(players_first_rows, groups_players, groups_first_rows)
+
+        return groups[np.lexsort((groups_first_rows, players_first_rows[groups_players]))].tolist()
+
+    def _games_positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The position of each row game within the games the group can play at (all of the games or the games against
+        its opponent), and the position of the last of these games.
+        """
+        if not self.by_opponent:
+            return self.rows_game, np.full(len(self.rows_game), self.games_count - 1)
+
+        opponent = self.columns.opponent
+        games_by_opponent = np.argsort(opponent, kind='stable')
+        opponents_games_count = np.bincount(opponent, minlength=self._opponents_count)
+        opponents_first_positions = np.cumsum(opponents_games_count) - opponents_games_count
+
+        games_position = np.empty(self.games_count, dtype=np.int64)
+        games_position[games_by_opponent] = np.arange(self.games_count) - opponents_first_positions[
+            opponent[games_by_opponent]]
+        return games_position[self.rows_game], opponents_games_count[self.rows_opponent] - 1
+
+    # region Rows masks
+
+    def games_predicate_rows_mask(self, predicate: str, value: Any = None) -> np.ndarray:
+        """
+        Mask of the rows whose game fulfill the given streak predicate (see STREAKS_PREDICATES).
+        """
+        return STREAKS_PREDICATES[predicate](self.columns, value)[self.rows_game]
+
+    def events_count_rows_mask(self, events_types: Iterable[GameEventTypes], minimum_count: int) -> np.ndarray:
+        """
+        Mask of the rows which the player has at least the given count of events (from any of the given types) at.
+        """
+        columns = self.columns
+        events = columns.event_is_maccabi & np.isin(columns.event_type, [event_type_id(event_type)
+                                                                         for event_type in events_types])
+        events_keys = self._group_game_keys(columns.event_player[events], columns.event_game[events])
+
+        # Events of players that did not play are not in the rows
+        events_rows = np.searchsorted(self._rows_keys, events_keys)
+        found = events_rows < len(self._rows_keys)
+        found[found] = self._rows_keys[events_rows[found]] == events_keys[found]
+
+        return np.bincount(events_rows[found], minlength=len(self._rows_keys)) >= minimum_count
+
+    # endregion
+
+    def _runs(self, rows_mask: np.ndarray, new_streak_rows: np.ndarray) -> Runs:
+        """
+        The runs of the True rows, a run is broken at the False rows and at the given new streak rows.
+        """
+        continues_previous = np.zeros(len(rows_mask), dtype=bool)
+        continues_previous[1:] = rows_mask[:-1] & rows_mask[1:] & ~new_streak_rows[1:]
+        continues_to_next = np.zeros(len(rows_mask), dtype=bool)
+        continues_to_next[:-1] = continues_previous[1:]
+
+        starts = np.flatnonzero(rows_mask & ~continues_previous)
+        ends = np.flatnonzero(rows_mask & ~continues_to_next) + 1
+        return Runs(starts=starts, lengths=ends - starts)
+
+    def _longest_by_group(self, runs: Runs) -> PlayersStreaks:
+        runs_groups = self.rows_group[runs.starts]
+        # The first longest run of each group
+        ordered_runs = np.lexsort((runs.starts, -runs.lengths, runs_groups))
+        groups, groups_first_runs = np.unique(runs_groups[ordered_runs], return_index=True)
+        best_runs = ordered_runs[groups_first_runs]
+
+        return dict(zip(groups.tolist(), zip(runs.starts[best_runs].tolist(), runs.lengths[best_runs].tolist())))
+
+    def _by_group(self, runs: Runs, runs_to_take: np.ndarray) -> PlayersStreaks:
+        return dict(zip(self.rows_group[runs.starts[runs_to_take]].tolist(),
+                        zip(runs.starts[runs_to_take].tolist(), runs.lengths[runs_to_take].tolist())))
+
+    # region Streaks from the games the players played
+
+    def longest_played_games_streaks(self, rows_mask: np.ndarray) -> PlayersStreaks:
+        return self._longest_by_group(self._runs(rows_mask, self._group_first_rows))
+
+    def current_played_games_streaks(self, rows_mask: np.ndarray) -> PlayersStreaks:
+        """
+        The streaks that end with the last game of each group.
+        """
+        runs = self._runs(rows_mask, self._group_first_rows)
+        runs_ends = runs.starts + runs.lengths
+        group_last_runs = np.ones(len(runs_ends), dtype=bool)
+        group_last_runs[runs_ends < len(self._rows_keys)] = \
+            self._group_first_rows[runs_ends[runs_ends < len(self._rows_keys)]]
+
+        return self._by_group(runs, group_last_runs)
+
+    # endregion
+
+    # region Streaks of played games from all of the games
+
+    def _played_in_game_runs(self) -> Runs:
+        new_streak_rows = self._group_first_rows.copy()
+        new_streak_rows[1:] |= self._rows_game_position[1:] != self._rows_game_position[:-1] + 1
+        return self._runs(np.ones(len(self._rows_keys), dtype=bool), new_streak_rows)
+
+    def longest_played_in_game_streaks(self) -> PlayersStreaks:
+        """
+        The longest streak of (consecutive) games each player played at, from all of the games
+        (or all of the games against the opponent, when by_opponent).
+        """
+        return self._longest_by_group(self._played_in_game_runs())
+
+    def current_played_in_game_streaks(self) -> PlayersStreaks:
+        """
+        The streak of (consecutive) games each player played at, that ends with the last game
+        (or the last game against the opponent, when by_opponent).
+        """
+        runs = self._played_in_game_runs()
+        runs_last_rows = runs.starts + runs.lengths - 1
+        return self._by_group(runs, self._rows_game_position[runs_last_rows] ==
+                              self._rows_last_game_position[runs_last_rows])
+
+    # endregion
+
+    def group_player_and_opponent(self, group_id: int) -> Tuple[int, int]:
+        """
+        :return: The player id and the opponent id (0 when not by_opponent) of the given group.
+        """
+        player_id, opponent_id = divmod(group_id, self._opponents_count)
+        return player_id, opponent_id
+
+    def top(self, players_streaks: PlayersStreaks, top_count: int, include_without_streak: bool = True) \
+            -> List[Tuple[int, np.ndarray]]:
+        """
+        :param include_without_streak: Whether the groups without a streak are counted (with an empty streak).
+        :return: The groups (id) with the longest streaks and their streak games indices, ordered by the streak length.
+        """
+        def streak_length(group_id: int) -> int:
+            return players_streaks.get(group_id, (0, 0))[1]
+
+        groups_ids = self.groups_ids if include_without_streak \
+            else [group_id for group_id in self.groups_ids if group_id in players_streaks]
+        top_groups = heapq.nlargest(top_count, groups_ids, key=streak_length)
+
+        top_groups_games = []
+        for group_id in top_groups:
+            first_row, length = players_streaks.get(group_id, (0, 0))
+            top_groups_games.append((group_id, self.rows_game[first_row: first_row + length]))
+
+        return top_groups_games
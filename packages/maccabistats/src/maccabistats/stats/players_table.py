@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes, AssistTypes
+from maccabistats.stats.columns import event_type_id, goal_type_id, assist_type_id
+
+if TYPE_CHECKING:
+    from maccabistats.stats.columns import MaccabiGamesColumns
+
+logger = logging.getLogger(__name__)
+
+PlayerStats = Tuple[str, int]  # Player name to the current stat (an int ranking)
+
+# Metric name to the events (type & optional goal/assist subtype) which are counted for it
+_EVENTS_METRICS: Dict[str, Tuple[Tuple[GameEventTypes, Optional[Union[GoalTypes, AssistTypes]]], ...]] = {
+    'freekick_goals': ((GameEventTypes.GOAL_SCORE, GoalTypes.FREE_KICK),),
+    'penalty_goals': ((GameEventTypes.GOAL_SCORE, GoalTypes.PENALTY),),
+    'head_goals': ((GameEventTypes.GOAL_SCORE, GoalTypes.HEADER),),
+    'foot_goals': ((GameEventTypes.GOAL_SCORE, GoalTypes.NORMAL_KICK),),
+    'own_goals': ((GameEventTypes.GOAL_SCORE, GoalTypes.OWN_GOAL),),
+    'assists': ((GameEventTypes.GOAL_ASSIST, None),),
+    'penalty_winning_assists': ((GameEventTypes.GOAL_ASSIST, AssistTypes.PENALTY_WINNING_ASSIST),),
+    'corner_assists': ((GameEventTypes.GOAL_ASSIST, AssistTypes.CORNER_ASSIST),),
+    'free_kick_assists': ((GameEventTypes.GOAL_ASSIST, AssistTypes.FREE_KICK_ASSIST),),
+    'throw_in_assists': ((GameEventTypes.GOAL_ASSIST, AssistTypes.THROW_IN_ASSIST),),
+    'header_assists': ((GameEventTypes.GOAL_ASSIST, AssistTypes.HEADER_ASSIST),),
+    'yellow_cards': ((GameEventTypes.YELLOW_CARD, None),),
+    'red_cards': ((GameEventTypes.RED_CARD, None), (GameEventTypes.SECOND_YELLOW_CARD, None)),
+    'substitute_off': ((GameEventTypes.SUBSTITUTION_OUT, None),),
+    'substitute_in': ((GameEventTypes.SUBSTITUTION_IN, None),),
+    'lineups': ((GameEventTypes.LINE_UP, None),),
+    'captains': ((GameEventTypes.CAPTAIN, None),),
+    'penalties_missed': ((GameEventTypes.PENALTY_MISSED, None),),
+    'penalties_stopped': ((GameEventTypes.PENALTY_STOPPED, None),),
+}
+
+METRICS: Tuple[str, ...] = ('goals',) + tuple(_EVENTS_METRICS) + (
+    'goals_involved', 'goals_after_sub_in', 'played', 'wins', 'losses', 'unbeaten', 'clean_sheets')
+
+
+class MaccabiPlayersTable(object):
+    """
+    Every per player metric of the maccabi players, computed in one pass over the columns.
+
+    We first count each metric per maccabi player in game (a row of the squads table), then sum the rows per player.
+    For every player & metric we keep the first row that counted for it as well, so leaderboards are ordered
+    as Counter.most_common() ordered them when we summed the players of each game one by one.
+    """
+
+    def __init__(self, columns: MaccabiGamesColumns) -> None:
+        self.columns = columns
+        self._squad_rows_count = len(columns.squad_player)
+        self._maccabi_rows = np.flatnonzero(columns.squad_is_maccabi)
+
+        # The players are ordered by their first appearance (in any team), players ids of the columns are like that
+        self.players_ids, self._rows_players_indices = np.unique(columns.squad_player[self._maccabi_rows],
+                                                                 return_inverse=True)
+        self.players: List[str] = [columns.players[player_id] for player_id in self.players_ids]
+
+        rows_values = self._count_rows_metrics()
+        self.values = np.column_stack([self._sum_per_player(rows_values[metric]) for metric in METRICS])
+        self._first_rows = np.column_stack([self._first_row_per_player(rows_values[metric]) for metric in METRICS])
+
+        logger.debug(f'Built players table of {len(self.players)} players and {len(METRICS)} metrics')
+
+    # region Rows (player in game) metrics
+
+    def count_rows_events(self, events_mask: np.ndarray) -> np.ndarray:
+        """
+        Counts the events of the given mask per squad row.
+        """
+        return np.bincount(self.columns.event_squad_row[events_mask], minlength=self._squad_rows_count)
+
+    def events_mask(self, event_type: GameEventTypes,
+                     subtype: Optional[Union[GoalTypes, AssistTypes]] = None) -> np.ndarray:
+        mask = self.columns.event_type == event_type_id(event_type)
+        if isinstance(subtype, GoalTypes):
+            mask &= self.columns.event_subtype == goal_type_id(subtype)
+        elif isinstance(subtype, AssistTypes):
+            mask &= self.columns.event_subtype == assist_type_id(subtype)
+
+        return mask
+
+    def _count_rows_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Counts each metric for every squad row (both teams), the maccabi rows are taken when summing per player.
+        """
+        rows_values = {metric: sum(self.count_rows_events(self.events_mask(event_type, subtype))
+                                   for event_type, subtype in events)
+                       for metric, events in _EVENTS_METRICS.items()}
+
+        rows_goals = self.count_rows_events(self.events_mask(GameEventTypes.GOAL_SCORE))  # Own goals included
+        rows_values['goals'] = rows_goals - rows_values['own_goals']
+        rows_values['goals_involved'] = rows_values['goals'] + rows_values['assists']
+        rows_values['goals_after_sub_in'] = self._rows_goals_after_sub_in(rows_goals)
+
+        played = self.columns.squad_played.astype(np.int64)
+        score_diff = self.columns.maccabi_score_diff[self.columns.squad_game]
+        rows_values['played'] = played
+        rows_values['wins'] = played * (score_diff > 0)
+        rows_values['losses'] = played * (score_diff < 0)
+        rows_values['unbeaten'] = played * (score_diff >= 0)
+        rows_values['clean_sheets'] = played * (self.columns.not_maccabi_score[self.columns.squad_game] == 0)
+
+        return rows_values
+
+    def _rows_goals_after_sub_in(self, rows_goals: np.ndarray) -> np.ndarray:
+        """
+        The goals of the players that scored only after they were subbed in.
+        Players that were registered as subbed in at minute 0 are ignored (a known bug of the maccabi site).
+        """
+        columns = self.columns
+        sub_in_events = np.flatnonzero(self.events_mask(GameEventTypes.SUBSTITUTION_IN))
+        # Events are ordered by their squad row, so the first index of each row is its first sub in
+        rows_with_sub_in, first_sub_in = np.unique(columns.event_squad_row[sub_in_events], return_index=True)
+        sub_in_second = np.full(self._squad_rows_count, -1, dtype=np.int64)
+        sub_in_second[rows_with_sub_in] = columns.event_second[sub_in_events[first_sub_in]]
+
+        goals_events = self.events_mask(GameEventTypes.GOAL_SCORE)
+        goals_events &= columns.event_second >= sub_in_second[columns.event_squad_row]
+        goals_after_sub_in = self.count_rows_events(goals_events)
+
+        scored_only_after_sub_in = (sub_in_second > 0) & (goals_after_sub_in == rows_goals)
+        self._log_goals_before_sub_in(np.flatnonzero((sub_in_second > 0) & ~scored_only_after_sub_in))
+
+        return np.where(scored_only_after_sub_in, rows_goals, 0)
+
+    def _log_goals_before_sub_in(self, squad_rows: np.ndarray) -> None:
+        for squad_row in squad_rows[self.columns.squad_is_maccabi[squad_rows]].tolist():
+            # TODO: This is just for safety
+            player_name = self.columns.players[self.columns.squad_player[squad_row]]
+            logger.error(f"A player: {player_name} has different number of goals in 'goals_after_sub_in' calculation.")
+
+    # endregion
+
+    # region Per player aggregation
+
+    def _sum_per_player(self, rows_values: np.ndarray) -> np.ndarray:
+        return np.bincount(self._rows_players_indices, weights=rows_values[self._maccabi_rows],
+                           minlength=len(self.players)).astype(np.int64)
+
+    def _first_row_per_player(self, rows_values: np.ndarray) -> np.ndarray:
+        first_rows = np.full(len(self.players), np.iinfo(np.int64).max, dtype=np.int64)
+        positive_rows = np.flatnonzero(rows_values[self._maccabi_rows] > 0)
+        np.minimum.at(first_rows, self._rows_players_indices[positive_rows], positive_rows)
+
+        return first_rows
+
+    def _leaderboard(self, totals: np.ndarray, first_rows: np.ndarray) -> List[PlayerStats]:
+        positive = np.flatnonzero(totals > 0)
+        order = positive[np.lexsort((first_rows[positive], -totals[positive]))]
+        return [(self.players[index], int(totals[index])) for index in order]
+
+    def leaderboard(self, metric: str) -> List[PlayerStats]:
+        """
+        The players with a positive value of this metric, sorted as Counter.most_common() would do.
+        """
+        metric_index = METRICS.index(metric)
+        return self._leaderboard(self.values[:, metric_index], self._first_rows[:, metric_index])
+
+    def rows_leaderboard(self, rows_values: np.ndarray) -> List[PlayerStats]:
+        """
+        Sums the given value of each squad row per player, for metrics that depend on a parameter.
+        """
+        return self._leaderboard(self._sum_per_player(rows_values), self._first_row_per_player(rows_values))
+
+    def total(self, metric: str) -> int:
+        return int(self.values[:, METRICS.index(metric)].sum())
+
+    # endregion
+
+    def as_dicts(self) -> List[Dict[str, Union[str, int]]]:
+        """
+        The whole table, a dict of the player name & all of his metrics for each player (ordered by first appearance).
+        """
+        return [dict(name=player_name, **{metric: int(value) for metric, value in zip(METRICS, player_values)})
+                for player_name, player_values in zip(self.players, self.values.tolist())]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from maccabistats.stats.players_co_occurrence import MaccabiPlayersCoOccurrence
+
+if TYPE_CHECKING:
+    from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+logger = logging.getLogger(__name__)
+
+PlayerStats = Tuple[str, int]  # Player name to the current stat (an int ranking)
+PlayersTogetherStats = Tuple[Tuple[str, ...], int]  # Players names (ordered by name) to the current stat together
+
+
+class MaccabiGamesPlayersTogetherStats(object):
+    """
+    This class will handle the statistics of the maccabi players that played together (on the pitch at the same game).
+    """
+
+    def __init__(self, maccabi_games_stats: MaccabiGamesStats) -> None:
+        self.maccabi_games_stats = maccabi_games_stats
+
+    @cached_property
+    def _co_occurrence(self) -> MaccabiPlayersCoOccurrence:
+        return MaccabiPlayersCoOccurrence(self.maccabi_games_stats.columns)
+
+    def _players_names(self, players_ids: Iterable[int]) -> Tuple[str, ...]:
+        players = self.maccabi_games_stats.columns.players
+        return tuple(sorted(players[player_id] for player_id in players_ids))
+
+    def _top_pairs(self, weight: str, top_count: int) -> List[PlayersTogetherStats]:
+        pairs = self._co_occurrence.pairs(weight)
+        positive = np.flatnonzero(pairs.weights > 0)
+        top = positive[np.lexsort((pairs.first_games[positive], -pairs.weights[positive]))][:top_count]
+
+        return [(self._players_names((first_player, second_player)), pair_weight)
+                for first_player, second_player, pair_weight in zip(pairs.first_players[top].tolist(),
+                                                                    pairs.second_players[top].tolist(),
+                                                                    pairs.weights[top].tolist())]
+
+    def most_played_together(self, players_count: int = 2, top_count: int = 25) -> List[PlayersTogetherStats]:
+        """
+        The groups of players that played the most games together (all of them at the same games).
+
+        :param players_count: The players count of each group, 2 for couples, 3 for trios and so on.
+        """
+        if players_count == 2:
+            return self._top_pairs('games', top_count)
+
+        return [(self._players_names(players_ids.tolist()), games_count)
+                for players_ids, games_count in self._co_occurrence.top_groups(players_count, top_count)]
+
+    def most_wins_together(self, top_count: int = 25) -> List[PlayersTogetherStats]:
+        """
+        The couples of players that won the most games together (both of them played at the game).
+        """
+        return self._top_pairs('wins', top_count)
+
+    def most_minutes_together(self, top_count: int = 25) -> List[PlayersTogetherStats]:
+        """
+        The couples of players that were on the pitch together the most minutes (from the line ups, subs & red cards).
+        """
+        return self._top_pairs('minutes', top_count)
+
+    def most_distinct_teammates(self, top_count: Optional[int] = None) -> List[PlayerStats]:
+        """
+        The players that played together with the most different players.
+        """
+        distinct_teammates = self._co_occurrence.distinct_teammates()
+        positive = np.flatnonzero(distinct_teammates > 0)
+        top = positive[np.lexsort((self._co_occurrence.players_first_games()[positive],
+                                   -distinct_teammates[positive]))][:top_count]
+
+        players = self.maccabi_games_stats.columns.players
+        return [(players[player_id], teammates_count)
+                for player_id, teammates_count in zip(top.tolist(), distinct_teammates[top].tolist())]
@@ -7,6 +7,18 @@ if TYPE_CHECKING:
 
 from sys import maxsize
 
+import numpy as np
+
+
+def results_ratio(count: int, total: int) -> float:
+    """
+    count / total rounded to 3 digits (the percentages & goals ratio of the results), maxsize when total is 0.
+    """
+    if total == 0:
+        return maxsize
+
+    return round(count / total, 3)
+
 
 class MaccabiGamesResultsStats(object):
     """
@@ -14,15 +26,16 @@ class MaccabiGamesResultsStats(object):
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
+        self.maccabi_games_stats = maccabi_games_stats
         self.games = maccabi_games_stats.games
 
     @property
     def total_goals_against_maccabi(self) -> int:
-        return sum([game.not_maccabi_team.score for game in self.games])
+        return int(self.maccabi_games_stats.columns.not_maccabi_score.sum())
 
     @property
     def total_goals_for_maccabi(self) -> int:
-        return sum([game.maccabi_score for game in self.games])
+        return int(self.maccabi_games_stats.columns.maccabi_score.sum())
 
     @property
     def total_goals_diff_for_maccabi(self) -> int:
@@ -33,10 +46,7 @@ class MaccabiGamesResultsStats(object):
         """
         Goals for maccabi / Goals against maccabi
         """
-        if self.total_goals_against_maccabi == 0:
-            return maxsize
-
-        return round(self.total_goals_for_maccabi / self.total_goals_against_maccabi, 3)
+        return results_ratio(self.total_goals_for_maccabi, self.total_goals_against_maccabi)
 
     @property
     def total_games_count(self) -> int:
@@ -44,47 +54,35 @@ class MaccabiGamesResultsStats(object):
 
     @property
     def wins_count(self) -> int:
-        return len([game for game in self.games if game.is_maccabi_win])
+        return int(np.count_nonzero(self.maccabi_games_stats.columns.maccabi_score_diff > 0))
 
     @property
     def wins_percentage(self) -> float:
-        if len(self.games) == 0:
-            return maxsize
-
-        return round(self.wins_count / len(self.games), 3)
+        return results_ratio(self.wins_count, len(self.games))
 
     @property
     def losses_count(self) -> int:
-        return len([game for game in self.games if game.maccabi_score_diff < 0])
+        return int(np.count_nonzero(self.maccabi_games_stats.columns.maccabi_score_diff < 0))
 
     @property
     def losses_percentage(self) -> float:
-        if len(self.games) == 0:
-            return maxsize
-
-        return round(self.losses_count / len(self.games), 3)
+        return results_ratio(self.losses_count, len(self.games))
 
     @property
     def ties_count(self) -> int:
-        return len([game for game in self.games if game.maccabi_score_diff == 0])
+        return int(np.count_nonzero(self.maccabi_games_stats.columns.maccabi_score_diff == 0))
 
     @property
     def ties_percentage(self) -> float:
-        if len(self.games) == 0:
-            return maxsize
-
-        return round(self.ties_count / len(self.games), 3)
+        return results_ratio(self.ties_count, len(self.games))
 
     @property
     def clean_sheets_count(self) -> int:
-        return len([game for game in self.games if game.not_maccabi_team.score == 0])
+        return int(np.count_nonzero(self.maccabi_games_stats.columns.not_maccabi_score == 0))
 
     @property
     def clean_sheets_percentage(self) -> float:
-        if len(self.games) == 0:
-            return maxsize
-
-        return round(self.clean_sheets_count / len(self.games), 3)
+        return results_ratio(self.clean_sheets_count, len(self.games))
 
     def json_dict(self) -> Dict[str, Any]:
         return dict(total_games_count=self.total_games_count,
@@ -17,26 +17,33 @@ class MaccabiGamesSeasonsStats:
 
     The pattern for adding "sort_by" function is to add lambda which receive just the season maccabi games stats object,
     inside the function itself you should set the key with lambda that 'removes' the season string.
+    example function - sort_by_average_goals_for_maccabi_per_game.
+    Sorting by the season results (wins count, goals for maccabi...) takes the results aggregate of each season instead,
     example function - sort_by_wins_count.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
+        # The games & results of all of the seasons, grouped in one pass over the games
+        self._seasons_results = self.maccabi_games_stats.query().group_by('season')
 
         # In order to avoid recursion, when we face one season ony, don't create new MaccabiGamesStats object
-        if len(self.maccabi_games_stats.available_seasons) == 1:
-            self._seasons_dict = {self.maccabi_games_stats.available_seasons[0]: self.maccabi_games_stats}
+        if len(self._seasons_results) == 1:
+            self._seasons_dict = {season: self.maccabi_games_stats for season in self._seasons_results}
         else:
-            self._seasons_dict = {season: self.maccabi_games_stats.get_games_by_season(season) for season in
-                                  self.maccabi_games_stats.available_seasons}
-
-        # sort attribute use to show the relevant data after sorting.
-        self._current_sort_attribute_function = str  # Use empty str as default sort
+            self._seasons_dict = {
+                season: self.maccabi_games_stats._create_games_view(
+                    self._seasons_results[season].games_indices,
+                    self.maccabi_games_stats._new_description(f'Season {season}'))
+                for season in sorted(self._seasons_results)}
+
+        # sort key (gets the season) use to show the relevant data after sorting.
+        self._current_sort_key: Callable[[str], Any] = lambda season: str(self[season])  # Use str as default sort
         self._current_sort_attribute_description = "order by season number"
 
     def __repr__(self) -> str:
         # Pad the season representation to 7 chars, like '2015/16', to have one year seasons aligned (like '1955')
-        ordered_seasons = pprint.pformat([f'{season: <7} ({self._current_sort_attribute_function(self[season])})'
+        ordered_seasons = pprint.pformat([f'{season: <7} ({self._current_sort_key(season)})'
                                           for season in self._seasons_dict.keys()])
 
         return f'{self._current_sort_attribute_description}: \n\n{ordered_seasons}'
@@ -61,85 +68,96 @@ class MaccabiGamesSeasonsStats:
         :param sort_attribute_function: The callable to sort the seasons by (gets season item - MaccabiGamesStats)
         :param sort_attribute_description: The description of this current sorting, will be shown on the repr
         """
-        self._current_sort_attribute_function = sort_attribute_function
+        self._refresh_sorting_by_key(lambda season: sort_attribute_function(self[season]), sort_attribute_description)
+
+    def _refresh_sorting_by_results(self, results_attribute: str, sort_attribute_description: str) -> None:
+        """
+        Updates the current seasons sorting by the season results aggregate, without going over the season games.
+        :param results_attribute: The GamesGroup attribute to sort the seasons by, such as wins_count
+        :param sort_attribute_description: The description of this current sorting, will be shown on the repr
+        """
+        self._refresh_sorting_by_key(lambda season: getattr(self._seasons_results[season], results_attribute),
+                                     sort_attribute_description)
+
+    def _refresh_sorting_by_key(self, sort_key: Callable[[str], Any], sort_attribute_description: str) -> None:
+        self._current_sort_key = sort_key
         self._current_sort_attribute_description = sort_attribute_description
 
         self._seasons_dict = OrderedDict(
-            sorted(self._seasons_dict.items(), key=lambda item: self._current_sort_attribute_function(item[1]),
-                   reverse=True))
+            sorted(self._seasons_dict.items(), key=lambda item: self._current_sort_key(item[0]), reverse=True))
 
     # region Games Results
     def sort_by_games_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: len(s),
-                              sort_attribute_description="sort by games count")
+        self._refresh_sorting_by_results('total_games_count',
+                                         sort_attribute_description="sort by games count")
 
     def sort_by_wins_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.wins_count,
-                              sort_attribute_description="sort by wins count")
+        self._refresh_sorting_by_results('wins_count',
+                                         sort_attribute_description="sort by wins count")
 
     def sort_by_wins_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.wins_percentage,
-                              sort_attribute_description="sort by wins percentage")
+        self._refresh_sorting_by_results('wins_percentage',
+                                         sort_attribute_description="sort by wins percentage")
 
     def sort_by_losses_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.losses_count,
-                              sort_attribute_description="sort by losses count")
+        self._refresh_sorting_by_results('losses_count',
+                                         sort_attribute_description="sort by losses count")
 
     def sort_by_losses_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.losses_percentage,
-                              sort_attribute_description="sort by losses percentage")
+        self._refresh_sorting_by_results('losses_percentage',
+                                         sort_attribute_description="sort by losses percentage")
 
     def sort_by_ties_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.ties_count,
-                              sort_attribute_description="sort by ties count")
+        self._refresh_sorting_by_results('ties_count',
+                                         sort_attribute_description="sort by ties count")
 
     def sort_by_ties_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.ties_percentage,
-                              sort_attribute_description="sort by ties percentage")
+        self._refresh_sorting_by_results('ties_percentage',
+                                         sort_attribute_description="sort by ties percentage")
 
     # endregion
 
     # region Goals manipulations:
 
     def sort_by_total_goals_diff(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.total_goals_diff_for_maccabi,
-                              sort_attribute_description="sort by total goals diff for maccabi")
+        self._refresh_sorting_by_results('total_goals_diff_for_maccabi',
+                                         sort_attribute_description="sort by total goals diff for maccabi")
 
     def sort_by_average_goals_diff_per_game(self) -> None:
         self._refresh_sorting(sort_attribute_function=lambda s: s.averages.maccabi_diff,
                               sort_attribute_description="sort by average (per game) goal diff for maccabi")
 
     def sort_by_total_goals_for_maccabi(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.total_goals_for_maccabi,
-                              sort_attribute_description="sort by total goals for maccabi")
+        self._refresh_sorting_by_results('total_goals_for_maccabi',
+                                         sort_attribute_description="sort by total goals for maccabi")
 
     def sort_by_average_goals_for_maccabi_per_game(self) -> None:
         self._refresh_sorting(sort_attribute_function=lambda s: s.averages.goals_for_maccabi,
                               sort_attribute_description="sort by average goals (per game) for maccabi")
 
     def sort_by_total_goals_against_maccabi(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.total_goals_against_maccabi,
-                              sort_attribute_description="sort by total goals against maccabi")
+        self._refresh_sorting_by_results('total_goals_against_maccabi',
+                                         sort_attribute_description="sort by total goals against maccabi")
 
     def sort_by_average_goals_against_maccabi_per_game(self) -> None:
         self._refresh_sorting(sort_attribute_function=lambda s: s.averages.goals_against_maccabi,
                               sort_attribute_description="sort by average goals (per game) against maccabi")
 
     def sort_by_clean_sheet_count(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.clean_sheets_count,
-                              sort_attribute_description="sort by clean sheets count")
+        self._refresh_sorting_by_results('clean_sheets_count',
+                                         sort_attribute_description="sort by clean sheets count")
 
     def sort_by_clean_sheet_percentage(self) -> None:
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.clean_sheets_percentage,
-                              sort_attribute_description="sort by clean sheets percentage")
+        self._refresh_sorting_by_results('clean_sheets_percentage',
+                                         sort_attribute_description="sort by clean sheets percentage")
 
     def sort_by_goals_ratio(self) -> None:
         """
         Goals for maccabi / Goals against maccabi
         """
-        self._refresh_sorting(sort_attribute_function=lambda s: s.results.goals_ratio,
-                              sort_attribute_description=
-                              "sort by goals ratio (Goals for maccabi / Goals against maccabi)")
+        self._refresh_sorting_by_results('goals_ratio',
+                                         sort_attribute_description=
+                                         "sort by goals ratio (Goals for maccabi / Goals against maccabi)")
 
     def sort_by_home_players_goals_count(self) -> None:
         self._refresh_sorting(sort_attribute_function=lambda s: s.players_categories.home_players_goals_count(),
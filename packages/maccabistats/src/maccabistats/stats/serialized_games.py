@@ -6,6 +6,7 @@ import pickle
 from pathlib import Path
 from typing import Optional
 
+from maccabistats.stats.games_snapshot import is_games_snapshot, load_games_snapshot, write_games_snapshot
 from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ def get_maccabi_stats_as_newest_wrapper(file_name: Optional[str] = None) -> Macc
 
 def get_maccabi_stats(file_name: Optional[str] = None) -> MaccabiGamesStats:
     """
-    :param file_name: pickled maccabi games (probably MaccabiGamesStats object).
+    :param file_name: serialized maccabi games, a snapshot or a pickled MaccabiGamesStats (older versions).
                       When no file is given, Try to load the latest maccabi*.games from the default folder.
     """
 
@@ -45,8 +46,18 @@ def get_maccabi_stats(file_name: Optional[str] = None) -> MaccabiGamesStats:
             raise RuntimeError(
                 "You should have maccabi.games serialized object, you can use maccabistats.serialize_maccabi_games() to do that.")
 
+    logger.info(f"Loading maccabi games from {file_name}")
+    return load_maccabi_games_file(file_name)
+
+
+def load_maccabi_games_file(file_name: str) -> MaccabiGamesStats:
+    """
+    Loads a serialized games file, snapshots are loaded lazily (see games_snapshot), older files are pickles.
+    """
+    if is_games_snapshot(file_name):
+        return load_games_snapshot(file_name)
+
     with open(file_name, 'rb') as f:
-        logger.info(f"Loading maccabi games from {file_name}")
         return pickle.load(f)
 
 
@@ -54,7 +65,7 @@ def serialize_maccabi_games(maccabi_games_stats: MaccabiGamesStats,
                             folder_path: str = _serialized_maccabi_games_folder_path) -> None:
     """
     Re-serialize maccabi games stats, after doing manually manipulation (run_manual_fixes) or anything else.
-    :param folder_path: Folder path to pickle maccabi game at
+    :param folder_path: Folder path to save the maccabi games snapshot at
     """
 
     if not isinstance(maccabi_games_stats, MaccabiGamesStats):
@@ -63,7 +74,6 @@ def serialize_maccabi_games(maccabi_games_stats: MaccabiGamesStats,
     file_name = os.path.join(folder_path, _serialized_maccabi_games_file_name_pattern).format(
         version=maccabi_games_stats.version,
         date=str(datetime.date.today()))
-    with open(file_name, 'wb') as f:
-        pickle.dump(maccabi_games_stats, f)
+    write_games_snapshot(maccabi_games_stats, file_name)
 
     logger.info(f"Serialized maccabi games to {file_name}")
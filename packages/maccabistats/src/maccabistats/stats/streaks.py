@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from itertools import groupby, takewhile
-from typing import List, TYPE_CHECKING
+from functools import cached_property
+from typing import Any, List, TYPE_CHECKING
+
+import numpy as np
 
 from maccabistats.models.game_data import GameData
+from maccabistats.stats.streaks_runs import MaccabiGamesStreaksRuns, Runs, STREAKS_PREDICATES
 
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
@@ -13,38 +16,45 @@ if TYPE_CHECKING:
 class MaccabiGamesStreaksStats(object):
     """
     This class will handle all streaks statistics.
+    The streaks are taken from the runs of the games (see MaccabiGamesStreaksRuns), which are created once per games.
     """
 
     def __init__(self, maccabi_games_stats: MaccabiGamesStats):
         self.maccabi_games_stats = maccabi_games_stats
-        self.games = maccabi_games_stats.games
+
+    @property
+    def games(self) -> List[GameData]:
+        return self.maccabi_games_stats.games
+
+    @cached_property
+    def _runs(self) -> MaccabiGamesStreaksRuns:
+        return MaccabiGamesStreaksRuns(self.maccabi_games_stats.columns)
 
     # region Internal game filtering functions
 
-    def _get_longest_streak_by_condition(self, condition: Callable[[GameData], bool]) -> MaccabiGamesStats:
-        """
-        :param condition: Function that gets a game and return bool regarding the condition being checked
-        """
-        games_fulfill_condition = [condition(game) for game in self.games]
-        streak_by_condition = [len(list(streak_list)) for condition_fulfill, streak_list in
-                               groupby(games_fulfill_condition) if condition_fulfill]
+    def _streak_games(self, start: int, length: int) -> MaccabiGamesStats:
+        return self.maccabi_games_stats._create_games_view(np.arange(start, start + length),
+                                                           self.maccabi_games_stats.description)
 
-        if not streak_by_condition:  # In case were handling empty streak, just return empty list of games.
-            return self.maccabi_games_stats.create_maccabi_stats_from_games([])
+    def _longest_streak(self, runs: Runs) -> MaccabiGamesStats:
+        longest_run = self._runs.longest(runs)
+        # In case were handling empty streak, just return empty list of games.
+        return self._streak_games(*longest_run) if longest_run is not None else self._streak_games(0, 0)
 
-        max_streak_by_condition = max(streak_by_condition)
+    def _similar_streaks(self, runs: Runs, minimum_streak_length: int) -> List[MaccabiGamesStats]:
+        return [self._streak_games(start, length) for start, length in self._runs.at_least(runs, minimum_streak_length)]
 
-        games_before_streak = 0
-        for condition_fulfill, streak_list in groupby(games_fulfill_condition):
-            # Count only if condition is true, if we reach the max streak we should stop!
-            current_results_length = len(list(streak_list))
-            if condition_fulfill and max_streak_by_condition == current_results_length:
-                break
-            else:
-                games_before_streak += current_results_length
+    def _current_streak(self, runs: Runs) -> MaccabiGamesStats:
+        return self._streak_games(*self._runs.current(runs))
 
-        return self.maccabi_games_stats.create_maccabi_stats_from_games(
-            self.games[games_before_streak: games_before_streak + max_streak_by_condition])
+    def _condition_runs(self, condition: Callable[[GameData], bool]) -> Runs:
+        return self._runs.runs_by_mask(np.array([condition(game) for game in self.games], dtype=bool))
+
+    def _get_longest_streak_by_condition(self, condition: Callable[[GameData], bool]) -> MaccabiGamesStats:
+        """
+        :param condition: Function that gets a game and return bool regarding the condition being checked
+        """
+        return self._longest_streak(self._condition_runs(condition))
 
     def _get_similar_streaks(self, condition: Callable[[GameData], bool], minimum_streak_length: int = 0) \
             -> List[MaccabiGamesStats]:
@@ -52,21 +62,7 @@ class MaccabiGamesStreaksStats(object):
         :param condition: Function that gets a game and return bool regarding the condition being checked
         :param minimum_streak_length: the size of the minimum streak to search for.
         """
-        games_fulfill_condition = [condition(game) for game in self.games]
-
-        similar_streaks = []
-        games_before_streak = 0
-
-        for condition_fulfill, streak_list in groupby(games_fulfill_condition):
-            # Count only if condition is true, if we reach the max streak we should stop!
-            current_results_length = len(list(streak_list))
-            if condition_fulfill and current_results_length >= minimum_streak_length:
-                similar_streaks.append(self.maccabi_games_stats.create_maccabi_stats_from_games(
-                    self.games[games_before_streak: games_before_streak + current_results_length]))
-
-            games_before_streak += current_results_length
-
-        return similar_streaks
+        return self._similar_streaks(self._condition_runs(condition), minimum_streak_length)
 
     def _get_current_streak_by_condition(self, condition: Callable[[GameData], bool]) -> MaccabiGamesStats:
         """
@@ -74,122 +70,134 @@ class MaccabiGamesStreaksStats(object):
 
         :param condition: Function that gets a game and return bool regarding the condition being checked
         """
-        current_streak = list(takewhile(condition, self.games[::-1]))
-        return self.maccabi_games_stats.create_maccabi_stats_from_games(current_streak)
+        return self._current_streak(self._condition_runs(condition))
+
+    def _longest(self, predicate: str, value: Any = None) -> MaccabiGamesStats:
+        return self._longest_streak(self._runs.runs(predicate, value))
+
+    def _similar(self, predicate: str, minimum_streak_length: int, value: Any = None) -> List[MaccabiGamesStats]:
+        return self._similar_streaks(self._runs.runs(predicate, value), minimum_streak_length)
+
+    def _current(self, predicate: str, value: Any = None) -> MaccabiGamesStats:
+        return self._current_streak(self._runs.runs(predicate, value))
 
     # endregion
 
+    def get_top_streaks(self, predicate: str, top_count: int = 10, value: Any = None) -> List[MaccabiGamesStats]:
+        """
+        The longest streaks of this predicate, the earlier streak first when they have the same length.
+
+        :param predicate: One of STREAKS_PREDICATES, such as: wins, unbeaten, clean_sheet or score_at_least.
+        :param top_count: How many streaks to return.
+        :param value: The predicate value, when it has one (like the minimum score of score_at_least).
+        """
+        if predicate not in STREAKS_PREDICATES:
+            raise ValueError(f"Unknown streak predicate: {predicate}, should be one of: {list(STREAKS_PREDICATES)}")
+
+        return [self._streak_games(start, length)
+                for start, length in self._runs.top(self._runs.runs(predicate, value), top_count)]
+
     # region Streak of game results
 
     def get_longest_wins_streak_games(self) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.is_maccabi_win)
+        return self._longest('wins')
 
     def get_similar_wins_streak_by_length(self, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.is_maccabi_win, minimum_streak_length=minimum_streak_length)
+        return self._similar('wins', minimum_streak_length)
 
     def get_current_wins_streak(self) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.is_maccabi_win)
+        return self._current('wins')
 
     def get_longest_ties_streak_games(self) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score_diff == 0)
+        return self._longest('ties')
 
     def get_similar_ties_streak_by_length(self, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score_diff == 0,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('ties', minimum_streak_length)
 
     def get_current_ties_streak(self) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score_diff == 0)
+        return self._current('ties')
 
     def get_longest_losses_streak_games(self) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score_diff < 0)
+        return self._longest('losses')
 
     def get_similar_losses_streak_by_length(self, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score_diff < 0,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('losses', minimum_streak_length)
 
     def get_similar_not_win_streak_by_length(self, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score_diff <= 0,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('not_win', minimum_streak_length)
 
     def get_current_losses_streak(self) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score_diff < 0)
+        return self._current('losses')
 
     # endregion
 
     def get_longest_unbeaten_streak_games(self) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score_diff >= 0)
+        return self._longest('unbeaten')
 
     def get_similar_unbeaten_streak_by_length(self, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score_diff >= 0,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('unbeaten', minimum_streak_length)
 
     def get_current_unbeaten_streak(self) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score_diff >= 0)
+        return self._current('unbeaten')
 
     def get_longest_score_at_least_games(self, minimum_maccabi_score) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score >= minimum_maccabi_score)
+        return self._longest('score_at_least', minimum_maccabi_score)
 
     def get_similar_score_at_least_streak_by_length(self, minimum_maccabi_score: int, minimum_streak_length: int = 0) \
             -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score >= minimum_maccabi_score,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('score_at_least', minimum_streak_length, value=minimum_maccabi_score)
 
     def get_current_score_at_least_streak(self, minimum_maccabi_score) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score >= minimum_maccabi_score)
+        return self._current('score_at_least', minimum_maccabi_score)
 
     def get_longest_score_exactly_games(self, maccabi_score) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score == maccabi_score)
+        return self._longest('score_exactly', maccabi_score)
 
     def get_current_score_exactly_streak(self, maccabi_score) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score == maccabi_score)
+        return self._current('score_exactly', maccabi_score)
 
     def get_similar_score_exactly_streak_by_length(self, maccabi_score: int, minimum_streak_length: int = 0) \
             -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score == maccabi_score,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('score_exactly', minimum_streak_length, value=maccabi_score)
 
     def get_longest_score_diff_at_least_games(self, minimum_maccabi_score_diff: int) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score_diff >= minimum_maccabi_score_diff)
+        return self._longest('score_diff_at_least', minimum_maccabi_score_diff)
 
     def get_similar_score_diff_at_least_streak_by_length(self, minimum_maccabi_score_diff: int,
                                                          minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score_diff >= minimum_maccabi_score_diff,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('score_diff_at_least', minimum_streak_length, value=minimum_maccabi_score_diff)
 
     def get_current_score_diff_at_least_streak(self, minimum_maccabi_score_diff: int) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score_diff >= minimum_maccabi_score_diff)
+        return self._current('score_diff_at_least', minimum_maccabi_score_diff)
 
     def get_longest_score_diff_exactly_games(self, maccabi_score_diff: int) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.maccabi_score_diff == maccabi_score_diff)
+        return self._longest('score_diff_exactly', maccabi_score_diff)
 
     def get_similar_score_diff_exactly_streak_by_length(self, maccabi_score_diff: int,
                                                         minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.maccabi_score_diff == maccabi_score_diff,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('score_diff_exactly', minimum_streak_length, value=maccabi_score_diff)
 
     def get_current_score_diff_exactly_streak(self, maccabi_score_diff: int) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.maccabi_score_diff == maccabi_score_diff)
+        return self._current('score_diff_exactly', maccabi_score_diff)
 
     def get_longest_clean_sheet_games(self) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.not_maccabi_team.score == 0)
+        return self._longest('clean_sheet')
 
     def get_similar_clean_sheet_streak_by_length(self, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.not_maccabi_team.score == 0,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('clean_sheet', minimum_streak_length)
 
     def get_current_clean_sheet_streak(self) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.not_maccabi_team.score == 0)
+        return self._current('clean_sheet')
 
     def get_longest_scored_against_maccabi_not_more_than_games(self, not_maccabi_score: int) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: g.not_maccabi_team.score <= not_maccabi_score)
+        return self._longest('conceded_not_more_than', not_maccabi_score)
 
     def get_similar_scored_against_maccabi_not_more_than_streak_by_length(
             self, not_maccabi_score: int, minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: g.not_maccabi_team.score <= not_maccabi_score,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('conceded_not_more_than', minimum_streak_length, value=not_maccabi_score)
 
     def get_current_scored_against_maccabi_not_more_than_streak(self, not_maccabi_score: int) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: g.not_maccabi_team.score <= not_maccabi_score)
+        return self._current('conceded_not_more_than', not_maccabi_score)
 
     def get_longest_goals_from_bench_games(self) -> MaccabiGamesStats:
         return self._get_longest_streak_by_condition(lambda g: g.maccabi_team.has_goal_from_bench)
@@ -202,12 +210,11 @@ class MaccabiGamesStreaksStats(object):
         return self._get_current_streak_by_condition(lambda g: g.maccabi_team.has_goal_from_bench)
 
     def get_longest_player_played_in_game(self, player_name: str) -> MaccabiGamesStats:
-        return self._get_longest_streak_by_condition(lambda g: player_name in g.maccabi_team.played_players_with_amount)
+        return self._longest('player_played', player_name)
 
     def get_similar_player_played_in_game_streak_by_length(self, player_name: int,
                                                            minimum_streak_length: int = 0) -> List[MaccabiGamesStats]:
-        return self._get_similar_streaks(lambda g: player_name in g.maccabi_team.played_players_with_amount,
-                                         minimum_streak_length=minimum_streak_length)
+        return self._similar('player_played', minimum_streak_length, value=player_name)
 
     def get_current_player_played_in_game_streak(self, player_name: str) -> MaccabiGamesStats:
-        return self._get_current_streak_by_condition(lambda g: player_name in g.maccabi_team.played_players_with_amount)
+        return self._current('player_played', player_name)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from maccabistats.stats.columns import MaccabiGamesColumns
+
+logger = logging.getLogger(__name__)
+
+# Predicate name to the games mask it creates from the columns (and the predicate value, like the minimum score)
+STREAKS_PREDICATES: Dict[str, Callable[[MaccabiGamesColumns, Any], np.ndarray]] = dict(
+    wins=lambda columns, _: columns.maccabi_score_diff > 0,
+    ties=lambda columns, _: columns.maccabi_score_diff == 0,
+    losses=lambda columns, _: columns.maccabi_score_diff < 0,
+    unbeaten=lambda columns, _: columns.maccabi_score_diff >= 0,
+    not_win=lambda columns, _: columns.maccabi_score_diff <= 0,
+    scored=lambda columns, _: columns.maccabi_score > 0,
+    clean_sheet=lambda columns, _: columns.not_maccabi_score == 0,
+    score_at_least=lambda columns, score: columns.maccabi_score >= score,
+    score_exactly=lambda columns, score: columns.maccabi_score == score,
+    score_diff_at_least=lambda columns, score_diff: columns.maccabi_score_diff >= score_diff,
+    score_diff_exactly=lambda columns, score_diff: columns.maccabi_score_diff == score_diff,
+    conceded_not_more_than=lambda columns, score: columns.not_maccabi_score <= score,
+    player_played=lambda columns, player_name: _player_played_mask(columns, player_name),
+)
+
+# The predicates without a value, their runs are created together (on the first streak query)
+_STANDARD_PREDICATES = ('wins', 'ties', 'losses', 'unbeaten', 'not_win', 'scored', 'clean_sheet')
+
+
+def _player_played_mask(columns: MaccabiGamesColumns, player_name: str) -> np.ndarray:
+    played_rows = columns.maccabi_played_mask & (columns.squad_player == columns.players.find(player_name))
+    mask = np.zeros(columns.games_count, dtype=bool)
+    mask[columns.squad_game[played_rows]] = True
+    return mask
+
+
+class Runs(NamedTuple):
+    """
+    The runs (streaks) of consecutive games that fulfill a condition, by their first game index and their length.
+    """
+    starts: np.ndarray
+    lengths: np.ndarray
+
+
+def true_runs(masks: np.ndarray) -> List[Runs]:
+    """
+    Run-length encodes the True values of each row of the given (rows x games) masks, in one pass for all of the rows.
+    """
+    rows_count, games_count = masks.shape
+    padded = np.zeros((rows_count, games_count + 2), dtype=np.int8)
+    padded[:, 1:-1] = masks
+    edges = np.diff(padded, axis=1)
+
+    # np.nonzero goes row by row, so the runs of each row are consecutive and ordered
+    starts_rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    rows_bounds = np.searchsorted(starts_rows, np.arange(rows_count + 1))
+
+    return [Runs(starts=starts[first:last], lengths=ends[first:last] - starts[first:last])
+            for first, last in zip(rows_bounds[:-1], rows_bounds[1:])]
+
+
+class MaccabiGamesStreaksRuns(object):
+    """
+    The runs of the games (in their date order) for each streak predicate, created once per games (stats object).
+    Longest, current, all the runs from a length and the top runs are taken from them.
+    """
+
+    def __init__(self, columns: MaccabiGamesColumns) -> None:
+        self.columns = columns
+        self.games_count = columns.games_count
+        self._runs: Dict[Hashable, Runs] = {}
+
+    def runs(self, predicate: str, value: Any = None) -> Runs:
+        if not self._runs:
+            self._create_standard_runs()
+
+        key = (predicate, value)
+        runs = self._runs.get(key)
+        if runs is None:
+            runs = self._runs[key] = true_runs(STREAKS_PREDICATES[predicate](self.columns, value)[np.newaxis])[0]
+
+        return runs
+
+    def runs_by_mask(self, games_mask: np.ndarray) -> Runs:
+        """
+        The runs of any other condition (not cached), by its games mask.
+        """
+        return true_runs(np.asarray(games_mask, dtype=bool)[np.newaxis])[0]
+
+    def _create_standard_runs(self) -> None:
+        masks = np.stack([STREAKS_PREDICATES[predicate](self.columns, None) for predicate in _STANDARD_PREDICATES])
+        self._runs.update({(predicate, None): runs
+                           for predicate, runs in zip(_STANDARD_PREDICATES, true_runs(masks))})
+        logger.debug(f'Created the runs of {len(_STANDARD_PREDICATES)} streaks predicates '
+                     f'for {self.games_count} games')
+
+    @staticmethod
+    def longest(runs: Runs) -> Optional[Tuple[int, int]]:
+        """
+        :return: The first longest run (start, length), None if there are no runs.
+        """
+        if not len(runs.lengths):
+            return None
+
+        longest_run = int(np.argmax(runs.lengths))
+        return int(runs.starts[longest_run]), int(runs.lengths[longest_run])
+
+    def current(self, runs: Runs) -> Tuple[int, int]:
+        """
+        :return: The run (start, length) that ends with the last game, an empty run if the last game is not in a run.
+        """
+        if len(runs.lengths) and runs.starts[-1] + runs.lengths[-1] == self.games_count:
+            return int(runs.starts[-1]), int(runs.lengths[-1])
+
+        return self.games_count, 0
+
+    @staticmethod
+    def at_least(runs: Runs, minimum_length: int) -> List[Tuple[int, int]]:
+        """
+        :return: The runs (start, length) from the given length, by their order.
+        """
+        long_runs = runs.lengths >= minimum_length
+        return list(zip(runs.starts[long_runs].tolist(), runs.lengths[long_runs].tolist()))
+
+    @staticmethod
+    def top(runs: Runs, top_count: int) -> List[Tuple[int, int]]:
+        """
+        :return: The longest runs (start, length), the earlier run first when they have the same length.
+        """
+        top_runs = np.argsort(-runs.lengths, kind='stable')[:top_count]
+        return list(zip(runs.starts[top_runs].tolist(), runs.lengths[top_runs].tolist()))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
 from typing import TYPE_CHECKING, Callable, Tuple, List, Dict
 
+import numpy as np
+
 if TYPE_CHECKING:
     from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
 
@@ -24,19 +25,19 @@ class MaccabiGamesTeamsStreaksStats(object):
     def _get_team_streak_by_condition(self, streak_condition: Callable[[MaccabiGamesStats], MaccabiGamesStats],
                                       top_teams_count: int = 20) -> List[TeamAndGames]:
         """
-        Creates a MaccabiGamesStats for each team, Then calculate the longest streak length
+        Creates a MaccabiGamesStats (view) for each team, Then calculate the longest streak length
 
         :param streak_condition: Gets the Team's MaccabiGamesStats and return the streak as MaccabiGamesStats
         """
-        teams_games = defaultdict(list)
-
-        for game in self.games:
-            teams_games[game.not_maccabi_team.current_name].append(game)
+        columns = self.maccabi_games_stats.columns
 
+        # The teams by their first game, the same order as walking the games
+        opponents_ids, first_games = np.unique(columns.opponent, return_index=True)
         teams_maccabi_games_stats: Dict[str, MaccabiGamesStats] = dict()
-        for team_name in teams_games.keys():
-            teams_maccabi_games_stats[team_name] = streak_condition(
-                self.maccabi_games_stats.create_maccabi_stats_from_games(teams_games[team_name]))
+        for opponent_id in opponents_ids[np.argsort(first_games)].tolist():
+            teams_maccabi_games_stats[columns.opponents[opponent_id]] = streak_condition(
+                self.maccabi_games_stats._create_games_view(np.flatnonzero(columns.opponent == opponent_id),
+                                                            self.maccabi_games_stats.description))
 
         return sorted(teams_maccabi_games_stats.items(),
                       key=lambda team_name_to_games: len(team_name_to_games[1]), reverse=True)[:top_teams_count]
@@ -1 +1 @@
-version = "2.67"
+version = "2.88"
@@ -0,0 +1,34 @@
+"""
+Reference leaderboards for the players stats tests, computed by walking the games objects (game by game).
+"""
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+
+
+def walk_players_condition(maccabi_games, condition):
+    return reduce(lambda a, b: a + b,
+                  [game.maccabi_team.get_players_with_most_of_this_condition(condition) for game in maccabi_games.games],
+                  Counter()).most_common()
+
+
+def walk_game_condition(maccabi_games, condition):
+    return reduce(lambda a, b: a + b,
+                  [game.maccabi_team.played_players_with_amount for game in maccabi_games.games if condition(game)],
+                  Counter()).most_common()
+
+
+def goals(p):
+    return p.event_count_by_type(GameEventTypes.GOAL_SCORE) - p.goals_count_by_goal_type(GoalTypes.OWN_GOAL)
+
+
+def goals_after_sub_in(p):
+    if not p.scored or not p.has_event_type(GameEventTypes.SUBSTITUTION_IN):
+        return 0
+    sub_in_time = p.get_events_by_type(GameEventTypes.SUBSTITUTION_IN)[0].time_occur
+    p_goals = p.get_events_by_type(GameEventTypes.GOAL_SCORE)
+    if sub_in_time == timedelta(0) or any(goal.time_occur < sub_in_time for goal in p_goals):
+        return 0
+    return len(p_goals)
@@ -0,0 +1,99 @@
+"""
+Synthetic maccabi-tlv.co.il pages (a season page, a game events page and a game squads page), with the elements the
+site parsers look for, for offline testing of the crawling.
+"""
+from urllib.parse import quote
+
+GAME_LINK = 'https://www.maccabi-tlv.co.il/match/מכבי-תל-אביב-הפועל-חיפה/'
+
+
+def _page(body: str) -> bytes:
+    return f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>מכבי</title></head>\n<body>{body}</body></html>' \
+        .encode('utf8')
+
+
+def _game_article(link: str, date: str, is_home: bool = True, with_round: bool = True) -> str:
+    home_class = ' Home' if is_home else ''
+    round_div = '<div class="round">מחזור 3</div>' if with_round else ''
+    return f'''
+<article>
+    <a href="{quote(link, safe=':/')}">
+        <div class="league-title">ליגת העל</div>
+        {round_div}
+        <div class="location"><span>{date}</span> <div>20:30 בלומפילד</div></div>
+        <div class="matchresult{home_class}">
+            <div class="holder maccabi nn">מכבי תל אביב</div><span class="ss maccabi h">3</span>
+            <div class="holder notmaccabi nn">הפועל חיפה</div><span class="ss h">1</span>
+        </div>
+    </a>
+</article>'''
+
+
+def season_page(games_links=(GAME_LINK,), season='2023/24') -> bytes:
+    articles = ''.join(_game_article(link, f'{day + 10} ספט 2023', is_home=day % 2 == 0, with_round=day != 1)
+                       for day, link in enumerate(games_links))
+    return _page(f'''
+<main>
+    <div class="dropdown"><a href="#">כל העונות ({season})</a></div>
+    {articles}
+</main>''')
+
+
+def _event(event_type: str, minute: int, event_text: str) -> str:
+    return f'<li class="{event_type} event"><div class="min">{minute}</div><p> {event_text} </p></li>'
+
+
+def events_page(finished: bool = True) -> bytes:
+    live_class = '' if finished else ' live'
+    events = ''.join([
+        _event('whistle', 0, 'שריקת פתיחה'),
+        _event('goal', 10, 'שער של ערן זהבי (פנדל)'),
+        _event('assist', 10, 'בישול על ידי דור פרץ'),
+        _event('yellow', 30, 'כרטיס צהוב ל שרן ייני'),
+        _event('goal', 40, 'שער של שחקן לא ידוע'),
+        _event('sub', 60, 'דור פרץ החליף את שרן ייני'),
+        _event('corner', 70, 'קרן'),
+        _event('goal', 125, 'שער של ערן זהבי'),
+    ])
+    return _page(f'''
+<div class="site-top-banner fixtures-list{live_class}"></div>
+<article>
+    <div class="play-by-play-homepage"><ul class="play-by-play">{events}</ul></div>
+</article>''')
+
+
+def _player(number: int, name: str, goals: str = '', cards: str = '', exchange: str = '') -> str:
+    return f'''
+            <li><b>{number}</b>{name}<div class="goals" id="goals-{number}">{goals}</div>
+                <div id="red-{number}">{cards}</div><div id="exchange-{number}">{exchange}</div></li>'''
+
+
+def _team(lineup: str, bench: str, coach: str, maccabi: bool) -> str:
+    team_class = 'p50 yellow' if maccabi else 'p50'
+    return f'''
+    <div class="{team_class}"><ul><li>הרכב</li>{lineup}</ul></div>
+    <div class="{team_class}"><ul>{bench}</ul></div>
+    <div class="{team_class}"><ul><li> {coach} </li></ul></div>'''
+
+
+def squads_page() -> bytes:
+    maccabi_team = _team(
+        lineup=''.join([
+            _player(7, 'ערן זהבי (ק)', goals="10' 55'"),
+            _player(10, 'שרן ייני', cards='<img src="/images/yellow.png"> 30\'', exchange="60'"),
+            _player(4, 'עידן נחמיאס', cards='<img src="/images/yellow.png"><img src="/images/red.png">'),
+        ]),
+        bench=''.join([
+            _player(42, 'דור פרץ', exchange="<img src=\"/images/in.png\">60' <img src=\"/images/out.png\">85'"),
+            _player(19, 'שחקן ספסל'),
+            _player(23, 'שחקן ותיק', exchange='<img src="/images/exchange.png">'),
+        ]),
+        coach='רובי קין', maccabi=True)
+    not_maccabi_team = _team(lineup=_player(9, 'חלוץ חיפה', goals="80'"), bench=_player(14, 'מחליף חיפה'),
+                             coach='חיים סילבס', maccabi=False)
+
+    return _page(f'''
+<article>
+    <div class="teams">{maccabi_team}{not_maccabi_team}</div>
+    <div class="info"><div class="referee">שופט: אורי אזולאי</div><div class="viewers">צופים: 25000</div></div>
+</article>''')
@@ -0,0 +1,135 @@
+"""Tests for the cargo crawler pages prefetching & streaming decode (without network, pages are faked)."""
+import json
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+from maccabistats.parse.maccabipedia import maccabipedia_cargo_chunks_crawler
+from maccabistats.parse.maccabipedia.maccabipedia_cargo_chunks_crawler import MaccabiPediaCargoChunksCrawler, \
+    iter_json_array_items
+
+_PAGE_SIZE = 3
+
+
+class _FakeResponse(object):
+    def __init__(self, body: bytes):
+        self.body = body
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        # Small chunks, so rows (and hebrew letters) are split between chunks
+        return (self.body[index:index + 7] for index in range(0, len(self.body), 7))
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class _FakeCargoCrawler(MaccabiPediaCargoChunksCrawler):
+    """Serves `rows_count` rows, in pages of _PAGE_SIZE rows."""
+
+    def __init__(self, rows_count, failing_offset=None, **kwargs):
+        super().__init__(tables_name="Games_Events", tables_fields="_pageName", **kwargs)
+        self.rows_count = rows_count
+        self.failing_offset = failing_offset
+        self.requested_offsets = []
+        self._lock = threading.Lock()
+
+    def _fetch_page(self, offset):
+        with self._lock:
+            self.requested_offsets.append(offset)
+        if offset == self.failing_offset:
+            raise ValueError("status code 500 while fetching data from maccabipedia")
+
+        rows = [{"_pageName": f"שורה {row}", "Empty": None} for row in range(offset, min(offset + _PAGE_SIZE,
+                                                                                          self.rows_count))]
+        return _FakeResponse(json.dumps(rows, ensure_ascii=False, indent=1).encode('utf-8'))
+
+
+@pytest.fixture(autouse=True)
+def small_pages(monkeypatch):
+    monkeypatch.setattr(maccabipedia_cargo_chunks_crawler, "_MAX_LIMIT_PER_REQUEST", _PAGE_SIZE)
+
+
+def _expected_rows(rows_count):
+    return [{"_pageName": f"שורה {row}"} for row in range(rows_count)]
+
+
+class TestCargoCrawlerPrefetching:
+    @pytest.mark.parametrize("rows_count", [0, 2, 3, 10, 30])
+    def test_rows_are_in_order(self, rows_count):
+        crawler = _FakeCargoCrawler(rows_count, concurrent_requests=4)
+        assert list(crawler) == _expected_rows(rows_count)
+
+    def test_same_rows_without_concurrency(self):
+        assert list(_FakeCargoCrawler(10, concurrent_requests=1)) == list(_FakeCargoCrawler(10, concurrent_requests=4))
+
+    def test_one_page_query_requests_only_one_page(self):
+        crawler = _FakeCargoCrawler(2, concurrent_requests=4)
+        list(crawler)
+        assert crawler.requested_offsets == [0]
+
+    def test_pages_are_requested_ahead(self):
+        crawler = _FakeCargoCrawler(30, concurrent_requests=4)
+        # The first page is requested alone, the next pages are requested once we know that it was a full page
+        for _ in range(_PAGE_SIZE + 1):
+            next(crawler)
+        wait(crawler._requested_pages)
+        assert len(crawler.requested_offsets) == 1 + 4
+
+    def test_pages_responses_are_closed(self):
+        responses = []
+
+        class _RecordingCrawler(_FakeCargoCrawler):
+            def _fetch_page(self, offset):
+                responses.append(super()._fetch_page(offset))
+                return responses[-1]
+
+        crawler = _RecordingCrawler(10, concurrent_requests=4)
+        list(crawler)
+        crawler._executor.shutdown(wait=True)  # The responses of the pages after the last one are closed when they arrive
+        assert responses and all(response.closed for response in responses)
+
+    def test_failing_page_raises(self):
+        crawler = _FakeCargoCrawler(30, failing_offset=2 * _PAGE_SIZE, concurrent_requests=4)
+        with pytest.raises(ValueError):
+            list(crawler)
+
+
+class TestJsonArrayStreamingDecode:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+    def test_same_as_json_loads(self, chunk_size):
+        items = [{"name": "מכבי תל אביב", "minute": 90, "part": None}, {"value": 12345}, [1, 2], "text", 3.5]
+        body = json.dumps(items, ensure_ascii=False).encode('utf-8')
+        chunks = [body[index:index + chunk_size] for index in range(0, len(body), chunk_size)]
+        assert list(iter_json_array_items(chunks)) == items
+
+    def test_empty_array(self):
+        assert list(iter_json_array_items([b" [ ", b"] "])) == []
+
+    def test_not_an_array_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array_items([b"<html></html>"]))
+
+    def test_truncated_array_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array_items([b'[{"a": 1}, {"b": ']))
+
+    def test_truncated_after_an_item_raises(self):
+        # A page cut off between items would look like a smaller (last) page
+        with pytest.raises(ValueError, match="truncated"):
+            list(iter_json_array_items([b'[1, 2']))
+
+    @pytest.mark.parametrize("chunks", [[b'[1] garbage'], [b'[1]', b' ', b'x']])
+    def test_data_after_the_array_raises(self, chunks):
+        with pytest.raises(ValueError, match="after the json array"):
+            list(iter_json_array_items(chunks))
+
+    def test_whitespaces_after_the_array(self):
+        assert list(iter_json_array_items([b'[1, 2]', b' \n'])) == [1, 2]
@@ -0,0 +1,50 @@
+"""Tests for the columnar games store (MaccabiGamesColumns)."""
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.columns import event_type_id
+
+from games_walking import goals, walk_players_condition
+
+
+class TestColumnsTables:
+    def test_games_table_length(self, maccabi_games):
+        columns = maccabi_games.columns
+        assert columns.games_count == 10
+        assert len(columns.dates) == 10
+        assert columns.maccabi_score.sum() == 17
+        assert columns.not_maccabi_score.sum() == 10
+
+    def test_home_games_column(self, maccabi_games):
+        assert maccabi_games.columns.is_home.sum() == 7
+
+    def test_events_table_matches_the_games_objects(self, maccabi_games):
+        columns = maccabi_games.columns
+        total_events = sum(len(player.events) for game in maccabi_games
+                           for team in (game.home_team, game.away_team) for player in team.players)
+        assert len(columns.event_player) == total_events
+
+    def test_maccabi_goals_events_count(self, maccabi_games):
+        columns = maccabi_games.columns
+        maccabi_goals = columns.event_is_maccabi & (columns.event_type == event_type_id(GameEventTypes.GOAL_SCORE))
+        assert maccabi_goals.sum() == sum(player.event_count_by_type(GameEventTypes.GOAL_SCORE)
+                                  for game in maccabi_games for player in game.maccabi_team.players)
+
+    def test_columns_are_built_once(self, maccabi_games):
+        assert maccabi_games.columns is maccabi_games.columns
+
+
+class TestColumnsLeaderboards:
+    def test_best_scorers_same_order_as_walking_the_games(self, maccabi_games):
+        assert maccabi_games.players.best_scorers == walk_players_condition(maccabi_games, goals)
+
+    def test_best_scorers_of_filtered_games(self, maccabi_games):
+        away_games = maccabi_games.away_games
+        assert away_games.players.best_scorers == walk_players_condition(away_games, goals)
+
+    def test_own_goal_is_not_counted(self, own_goal_games):
+        assert own_goal_games.players.best_scorers == []
+
+    def test_empty_games(self, maccabi_games):
+        empty = maccabi_games.played_before("1900")
+        assert empty.players.best_scorers == []
+        assert empty.players.most_played == []
+        assert empty.results.wins_count == 0
@@ -0,0 +1,78 @@
+"""Tests for the ErrorsFinder games checks (one facts pass for all of the checks) and their errors report."""
+import copy
+import json
+from datetime import timedelta
+
+import pytest
+
+from maccabistats import ErrorsFinder
+from maccabistats.error_finder.games_checks import GAMES_CHECKS
+from maccabistats.models.player_game_events import GameEvent, GameEventTypes
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
+from game_fixtures import GAMES
+from players_data_fixtures import create_stub_players_data
+
+
+@pytest.fixture(scope="module")
+def games_with_errors() -> MaccabiGamesStats:
+    games = copy.deepcopy(GAMES)
+    games[1].date = games[0].date
+    games[2].maccabi_team.players[0].events.append(GameEvent(GameEventTypes.SUBSTITUTION_IN, timedelta(minutes=50)))
+    games[3].maccabi_team.players[0].events.append(GameEvent(GameEventTypes.UNKNOWN, timedelta(minutes=50)))
+    games[4].season = '2010/11'
+    games[5].maccabi_team.players = games[5].maccabi_team.players[1:]  # One line up player less
+    games[6].maccabi_team.score += 1  # A goal without an event
+
+    return MaccabiGamesStats(games, players_data=create_stub_players_data())
+
+
+class TestErrorsFinder:
+    def test_no_errors(self, maccabi_games):
+        errors_report = ErrorsFinder(maccabi_games).create_errors_report()
+
+        assert len(errors_report) == 0
+        assert errors_report.to_text() == f'Showing errors for: {maccabi_games}:\n'
+
+    def test_games_errors(self, games_with_errors):
+        errors_finder = ErrorsFinder(games_with_errors)
+        games = games_with_errors.games
+
+        assert errors_finder.get_dates_with_more_than_one_game() == {games[0].date.date(): games[:2]}
+        assert errors_finder.get_lineup_players_with_substitution_in() == [(games[2].maccabi_team.players[0],
+                                                                            games[2])]
+        assert errors_finder.get_players_with_unknown_events() == [(games[3].maccabi_team.players[0], games[3])]
+        assert errors_finder.get_games_with_incorrect_season() == [('2010/11', str(games[4].date.date()), games[4])]
+        assert errors_finder.get_games_without_11_maccabi_players_on_lineup().games == [games[5]]
+        assert errors_finder.get_games_with_missing_goals_events().games == [games[6]]
+        assert not errors_finder.get_games_with_wrong_goals_team_belonging()
+
+    def test_report(self, games_with_errors):
+        errors_report = ErrorsFinder(games_with_errors).create_errors_report()
+        games = games_with_errors.games
+
+        assert len(errors_report) == 6
+        assert f'\nGames with incorrect season:\n    {("2010/11", str(games[4].date.date()), games[4])}' in \
+               errors_report.to_text()
+
+        errors = json.loads(errors_report.to_json())['errors']
+        assert list(errors) == sorted(GAMES_CHECKS)
+        assert errors['missing_goals_events'] == [dict(games=[repr(games[6])])]
+
+    def test_report_of_games_subset(self, games_with_errors):
+        errors_finder = ErrorsFinder(games_with_errors)
+        errors_finder.create_errors_report()
+
+        errors_report = errors_finder.create_errors_report(games_indices=range(4, 7))
+        assert {check_name for check_name, findings in errors_report.checks_findings.items() if findings} == \
+               {'incorrect_season', 'games_without_11_lineup_players', 'missing_goals_events'}
+        games_subset = games_with_errors.create_maccabi_games_stats_with_filtered_games(games_with_errors[4:7], 'Subset')
+        assert errors_report.checks_findings == ErrorsFinder(games_subset).create_errors_report().checks_findings
+
+    def test_processes_pool(self, games_with_errors):
+        assert ErrorsFinder(games_with_errors, processes=2).create_errors_report().to_json() == \
+               ErrorsFinder(games_with_errors).create_errors_report().to_json()
+
+    def test_unknown_check(self, maccabi_games):
+        with pytest.raises(ValueError):
+            ErrorsFinder(maccabi_games).find_errors('games_without_stadium')
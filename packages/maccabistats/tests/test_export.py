@@ -1,6 +1,9 @@
 """Tests for ExportMaccabiGamesStats using synthetic fixture."""
+import csv
 import json
 
+import pytest
+
 
 def test_export_players_events_json(tmp_path, maccabi_games):
     path = maccabi_games.export.export_players_events_json(folder_path=tmp_path)
@@ -40,3 +43,54 @@ def test_export_everything_csv(tmp_path, maccabi_games):
     path = maccabi_games.export.export_everything_csv(folder_path=tmp_path)
     assert path.exists()
     assert path.suffix == '.zip'
+
+
+def test_export_players_events_json_same_as_json_dumps(tmp_path, maccabi_games):
+    path = maccabi_games.export.export_players_events_json(folder_path=tmp_path)
+    players_events = list(maccabi_games.export._players_events())
+
+    # Streamed one event at a time, the same text as dumping all of the events at once
+    assert path.read_text(encoding='utf8') == json.dumps(players_events, indent=4, ensure_ascii=False)
+    assert all(isinstance(player_event['player_time_occur'], int) for player_event in players_events)
+
+
+def test_export_players_events_json_lines(tmp_path, maccabi_games):
+    path = maccabi_games.export.export_players_events_json_lines(folder_path=tmp_path)
+    json_lines = [json.loads(line) for line in path.read_text(encoding='utf8').splitlines()]
+
+    assert json_lines == json.loads(maccabi_games.export.export_players_events_json(folder_path=tmp_path).read_text(
+        encoding='utf8'))
+
+
+def test_export_players_events_csv_rows(tmp_path, maccabi_games):
+    path = maccabi_games.export.export_players_events_csv(folder_path=tmp_path)
+    with path.open(encoding='utf8', newline='') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+
+    assert len(rows) == sum(len(game.events) for game in maccabi_games)
+    assert 'player_goal_type' in rows[0]
+
+
+def test_export_players_events_parquet(tmp_path, maccabi_games):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = maccabi_games.export.export_players_events_parquet(folder_path=tmp_path)
+
+    players_events_table = pq.read_table(path)
+    assert players_events_table.num_rows == sum(len(game.events) for game in maccabi_games)
+    assert players_events_table.column('player_time_occur').to_pylist() == \
+           [player_event['player_time_occur'] for player_event in maccabi_games.export._players_events()]
+
+
+def test_export_empty_games(tmp_path, maccabi_games):
+    empty_games = maccabi_games.played_before("1900")
+    assert json.loads(empty_games.export.export_players_events_json(folder_path=tmp_path).read_text()) == []
+    assert empty_games.export.export_games_data_csv(folder_path=tmp_path).read_text(encoding='utf8').count('\n') == 1
+
+
+def test_players_events_by_game_same_as_the_streamed_events(maccabi_games):
+    players_events_by_game = maccabi_games.export._players_events_dict()
+
+    assert len(players_events_by_game) == len(maccabi_games)
+    assert [player_event for game_events in players_events_by_game for player_event in game_events] == \
+           list(maccabi_games.export._players_events())
+    assert maccabi_games.export._create_all_games_data() == list(maccabi_games.export._games_data())
@@ -1,6 +1,11 @@
 """Tests for MaccabiGamesStats filtering methods."""
+import copy
 import datetime
 
+import pytest
+
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+
 
 class TestCompetitionFilters:
     def test_league_games(self, maccabi_games):
@@ -154,3 +159,77 @@ class TestMaccabiGamesStatsBasics:
         assert len(by_player["ערן זהבי"]) == 3
         # Unknown player returns empty
         assert len(by_player["unknown"]) == 0
+
+    def test_filters_follow_reassigned_games(self, maccabi_games):
+        stats = MaccabiGamesStats(maccabi_games.games, players_data=maccabi_games.players_data)
+        removed_game = stats.home_games[0]
+        coach = removed_game.maccabi_team.coach
+        assert removed_game in stats.get_games_by_coach(coach).games
+
+        stats.games = [game for game in stats.games if game is not removed_game]
+        assert len(stats.home_games) == len(maccabi_games.home_games) - 1
+        assert removed_game not in stats.get_games_by_coach(coach).games
+        assert stats.get_games_against_team(removed_game.not_maccabi_team.current_name).games == \
+               [game for game in stats.games
+                if game.not_maccabi_team.current_name == removed_game.not_maccabi_team.current_name]
+
+    def test_reassigned_games_are_sorted_with_their_changed_dates(self, maccabi_games):
+        games = copy.deepcopy(maccabi_games.games)
+        stats = MaccabiGamesStats(games, players_data=maccabi_games.players_data)
+        first_game = stats.games[0]
+        assert len(stats.played_at(first_game.date)) == 1
+
+        first_game.date = datetime.datetime(2030, 1, 1)
+        stats.games = stats.games
+        assert stats.games[-1] is first_game
+        assert stats.played_at(datetime.datetime(2030, 1, 1)).games == [first_game]
+        assert stats.played_after("2029-01-01").games == [first_game]
+
+
+class TestGamesIndex:
+    @pytest.mark.parametrize('filtered', ['all', 'home', 'league'])
+    def test_same_as_scanning_the_games(self, maccabi_games, filtered):
+        games = dict(all=maccabi_games, home=maccabi_games.home_games, league=maccabi_games.league_games)[filtered]
+
+        def expected(condition):
+            return [game for game in games.games if condition(game)]
+
+        for player_name in ["אבי נמני", "ערן זהבי", "nobody"]:
+            assert games.get_games_by_player_name(player_name).games == \
+                   expected(lambda game: player_name in [p.name for p in game.maccabi_team.players])
+            assert games.get_games_by_played_player_name(player_name).games == \
+                   expected(lambda game: player_name in [p.name for p in game.maccabi_team.played_players])
+        for coach in games.available_coaches:
+            assert games.get_games_by_coach(coach).games == expected(lambda game: game.maccabi_team.coach == coach)
+        for referee in games.available_referees:
+            assert games.get_games_by_referee(referee).games == expected(lambda game: game.referee == referee)
+        for stadium in games.available_stadiums:
+            assert games.get_games_by_stadium(stadium).games == expected(lambda game: game.stadium == stadium)
+        for team_name in games.available_opponents:
+            assert games.get_games_against_team(team_name).games == \
+                   expected(lambda game: game.not_maccabi_team.current_name == team_name)
+
+    def test_available_of_filtered_games(self, maccabi_games):
+        cup_games = maccabi_games.get_games_by_competition("גביע המדינה")
+        assert cup_games.available_competitions == ["גביע המדינה"]
+        assert cup_games.available_referees == [cup_games[0].referee]
+        assert sorted(cup_games.available_players_names) == \
+               sorted({player.name for player in cup_games[0].maccabi_team.players})
+
+    def test_player_name_is_stripped(self, maccabi_games):
+        games = copy.deepcopy(maccabi_games.games)
+        player = games[0].maccabi_team.players[0]
+        player_name, player.name = player.name, f' {player.name} '
+
+        stats = MaccabiGamesStats(games, players_data=maccabi_games.players_data)
+        assert len(stats.get_games_by_player_name(player_name)) == \
+               len(maccabi_games.get_games_by_player_name(player_name))
+
+    def test_lookups_use_only_the_index(self, maccabi_games, monkeypatch):
+        stats = MaccabiGamesStats(maccabi_games.games, players_data=maccabi_games.players_data)
+        stats.get_games_by_played_player_name("אבי נמני")
+        monkeypatch.setattr(MaccabiGamesStats, 'games', property(lambda _: pytest.fail('The games were scanned')),
+                            raising=False)
+
+        assert len(stats._games_index.games_indices('played_player', ["ערן זהבי"])) == 3
+        assert len(stats.get_games_by_played_player_name("ערן זהבי")) == 3
@@ -0,0 +1,82 @@
+"""Tests for MaccabiGamesQuery, compared to the chained MaccabiGamesStats filters."""
+import pytest
+
+from maccabistats.stats.consts import LEAGUE_COMPETITIONS
+
+GRANT = "אברם גרנט"
+
+
+def _games_dates(games):
+    return [game.date for game in games]
+
+
+class TestQueryFilters:
+    def test_same_as_chained_filters(self, maccabi_games):
+        queried = maccabi_games.query().competition(in_=LEAGUE_COMPETITIONS).home().season('2019/20').games()
+        chained = maccabi_games.get_games_by_competition(LEAGUE_COMPETITIONS).home_games.get_games_by_season('2019/20')
+
+        assert len(queried) > 0
+        assert _games_dates(queried) == _games_dates(chained)
+        assert queried.description == chained.description
+
+    @pytest.mark.parametrize('query', [
+        lambda q: q.coach(GRANT).stadium("בלומפילד").wins(),
+        lambda q: q.wins().stadium("בלומפילד").coach(GRANT),
+    ])
+    def test_filters_order_does_not_matter(self, maccabi_games, query):
+        expected = maccabi_games.get_games_by_coach(GRANT).get_games_by_stadium("בלומפילד").maccabi_wins
+        assert _games_dates(query(maccabi_games.query()).games()) == _games_dates(expected)
+
+    def test_player_and_opponent(self, maccabi_games):
+        player_name = maccabi_games.available_players_names[0]
+        team_name = maccabi_games.available_opponents[0]
+        expected = maccabi_games.get_games_by_player_name(player_name).get_games_against_team(team_name)
+
+        queried = maccabi_games.query().player(player_name).opponent(team_name).games()
+        assert _games_dates(queried) == _games_dates(expected)
+
+    def test_unknown_value_has_no_games(self, maccabi_games):
+        assert len(maccabi_games.query().home().coach("no such coach").season('2019/20').games()) == 0
+
+    def test_without_filters(self, maccabi_games):
+        games = maccabi_games.query().games()
+        assert len(games) == len(maccabi_games)
+        assert games.description == maccabi_games.description
+
+    def test_query_of_view(self, maccabi_games):
+        home_games = maccabi_games.home_games
+        queried = home_games.query().season('2020/21').losses().games()
+
+        assert _games_dates(queried) == _games_dates(home_games.get_games_by_season('2020/21').maccabi_losses)
+        assert queried.description == 'Home games + Season 2020/21 + Losses only'
+
+
+class TestQueryGroupBy:
+    @pytest.mark.parametrize('entity, get_games', [
+        ('season', lambda games, season: games.get_games_by_season(season)),
+        ('opponent', lambda games, team_name: games.get_games_against_team(team_name)),
+        ('coach', lambda games, coach_name: games.get_games_by_coach(coach_name)),
+    ])
+    def test_same_as_each_group_games(self, maccabi_games, entity, get_games):
+        groups = maccabi_games.query().group_by(entity)
+
+        assert len(groups) > 1
+        for name, group in groups.items():
+            group_games = get_games(maccabi_games, name)
+            assert _games_dates(maccabi_games[i] for i in group.games_indices) == _games_dates(group_games)
+            assert {key: getattr(group, key) for key in group_games.results.json_dict()} == \
+                   group_games.results.json_dict()
+
+    def test_groups_of_the_queried_games(self, maccabi_games):
+        groups = maccabi_games.query().away().group_by('season')
+        away_games = maccabi_games.away_games
+
+        assert sum(group.total_games_count for group in groups.values()) == len(away_games)
+        assert sum(group.wins_count for group in groups.values()) == away_games.results.wins_count
+
+    def test_groups_ordered_by_first_game(self, maccabi_games):
+        assert list(maccabi_games.query().group_by('season')) == ['2019/20', '2020/21']
+
+    def test_unknown_entity(self, maccabi_games):
+        with pytest.raises(ValueError):
+            maccabi_games.query().group_by('squad_player')
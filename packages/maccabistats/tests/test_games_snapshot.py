@@ -0,0 +1,228 @@
+"""Tests for the games snapshot files (columnar arrays & values table), compared to the games they were written from."""
+import copy
+import pickle
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from maccabistats.maccabipedia.players import MaccabiPediaPlayerData, MaccabiPediaPlayers
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.stats import games_snapshot
+from maccabistats.stats.columns import _STRING_TABLES, _GAMES_COLUMNS, _SQUADS_COLUMNS, _EVENTS_COLUMNS
+from maccabistats.stats.games_snapshot import write_games_snapshot, load_games_snapshot, is_games_snapshot, \
+    convert_pickled_games_to_snapshot, SNAPSHOT_MAGIC
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.serialized_games import get_maccabi_stats
+
+
+def _game_state(game):
+    players = {team: [(player.name, player.number,
+                       [(type(event), event.event_type, event.time_occur, getattr(event, 'goal_type', None),
+                         getattr(event, 'assist_type', None)) for event in player.events])
+                      for player in getattr(game, team).players]
+               for team in ('home_team', 'away_team')}
+    teams = {team: dict(vars(getattr(game, team)), players=players[team]) for team in ('home_team', 'away_team')}
+    return dict({name: value for name, value in vars(game).items() if name != '_goals_timeline'}, **teams)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, maccabi_games):
+    path = str(tmp_path / "maccabi.games")
+    write_games_snapshot(maccabi_games, path)
+    return path
+
+
+@pytest.fixture
+def picklable_games(maccabi_games):
+    players_data = MaccabiPediaPlayers({"אבי נמני": MaccabiPediaPlayerData(name="אבי נמני",
+                                                                          birth_date=datetime(1972, 5, 26),
+                                                                          is_home_player=True)})
+    return MaccabiGamesStats(maccabi_games.games, players_data=players_data)
+
+
+class TestGamesSnapshotRoundTrip:
+    def test_is_snapshot(self, snapshot_path, tmp_path):
+        assert is_games_snapshot(snapshot_path)
+        pickled_path = tmp_path / "pickled.games"
+        pickled_path.write_bytes(pickle.dumps([]))
+        assert not is_games_snapshot(str(pickled_path))
+
+    def test_games_are_the_same(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        assert [_game_state(game) for game in loaded.games] == [_game_state(game) for game in maccabi_games.games]
+
+    @pytest.mark.parametrize('games_name', ['maccabi_games', 'own_goal_games'])
+    def test_columns_are_the_same_as_created_from_the_games(self, tmp_path, request, games_name):
+        games = request.getfixturevalue(games_name)
+        write_games_snapshot(games, str(tmp_path / "maccabi.games"))
+        columns = load_games_snapshot(str(tmp_path / "maccabi.games")).columns
+
+        for table_name in _STRING_TABLES:
+            assert getattr(columns, table_name).values == getattr(games.columns, table_name).values
+        for column_name in _GAMES_COLUMNS + _SQUADS_COLUMNS + _EVENTS_COLUMNS:
+            column, expected_column = getattr(columns, column_name), getattr(games.columns, column_name)
+            assert column.dtype == expected_column.dtype
+            assert np.array_equal(column, expected_column), column_name
+
+    def test_stats_without_creating_the_games(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        assert len(loaded) == len(maccabi_games)
+        assert len(loaded.home_games) == len(maccabi_games.home_games)
+        assert loaded.players.best_scorers == maccabi_games.players.best_scorers
+        assert '_games' not in vars(loaded)
+
+    def test_stats_are_the_same(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        assert loaded.results.wins_percentage == maccabi_games.results.wins_percentage
+        assert loaded.players.most_played == maccabi_games.players.most_played
+        assert repr(loaded.streaks.get_longest_wins_streak_games().games) == \
+               repr(maccabi_games.streaks.get_longest_wins_streak_games().games)
+
+    def test_description_and_version_are_kept(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        assert loaded.description == maccabi_games.description
+        assert loaded.version == maccabi_games.version
+
+    def test_players_data_is_kept(self, tmp_path, picklable_games):
+        write_games_snapshot(picklable_games, str(tmp_path / "maccabi.games"))
+        players_data = load_games_snapshot(str(tmp_path / "maccabi.games")).players_data
+        assert players_data.home_players == {"אבי נמני"}
+        assert players_data.players_dates["אבי נמני"] == datetime(1972, 5, 26)
+        assert players_data.players_dates["unknown"] == MaccabiPediaPlayers.missing_birth_date_value
+
+    def test_loose_values_are_kept(self, tmp_path, maccabi_games):
+        game = copy.deepcopy(maccabi_games.games[0])
+        game.crowd = 1000
+        game.fixture = None
+        game._half_parsed_events = [dict(name="שחקן", event_type=GameEventTypes.GOAL_SCORE,
+                                         time_occur=timedelta(minutes=52), goal_type=GoalTypes.HEADER)]
+        other_game = copy.deepcopy(maccabi_games.games[1])
+        other_game.crowd = "1000"
+        write_games_snapshot(MaccabiGamesStats([game, other_game], players_data=maccabi_games.players_data),
+                             str(tmp_path / "maccabi.games"))
+
+        loaded_game, loaded_other_game = load_games_snapshot(str(tmp_path / "maccabi.games")).games
+        assert (loaded_game.crowd, loaded_game.fixture, loaded_other_game.crowd) == (1000, None, "1000")
+        assert loaded_game._half_parsed_events == game._half_parsed_events
+        assert loaded_other_game._half_parsed_events == []
+
+    def test_fixed_game_date_is_kept(self, tmp_path, maccabi_games):
+        # The maccabi-tlv site fixes change the game date only, not its full date
+        game = copy.deepcopy(maccabi_games.games[0])
+        game.date = datetime(2019, 8, 1)
+        assert game.date.date() != game._full_date.date()
+        write_games_snapshot(MaccabiGamesStats([game], players_data=maccabi_games.players_data),
+                             str(tmp_path / "maccabi.games"))
+
+        loaded = load_games_snapshot(str(tmp_path / "maccabi.games"))
+        assert loaded.columns.dates.tolist() == [datetime(2019, 8, 1)]
+        assert (loaded.games[0].date, loaded.games[0]._full_date) == (game.date, game._full_date)
+        assert len(loaded.played_at(datetime(2019, 8, 1))) == 1
+
+    def test_columns_follow_the_changed_games(self, snapshot_path):
+        loaded = load_games_snapshot(snapshot_path)
+        loaded.games[0].competition = "משחק מבחן"
+        assert "משחק מבחן" in loaded.columns.competitions.values
+
+    def test_columns_follow_the_reassigned_games(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        assert len(loaded.home_games) == len(maccabi_games.home_games)
+        loaded.games = [game for game in loaded.games if not game.is_maccabi_home_team]
+        assert len(loaded) == len(maccabi_games.away_games)
+        assert len(loaded.home_games) == 0
+
+    def test_pickled_as_regular_stats(self, tmp_path, picklable_games):
+        write_games_snapshot(picklable_games, str(tmp_path / "maccabi.games"))
+        restored = pickle.loads(pickle.dumps(load_games_snapshot(str(tmp_path / "maccabi.games"))))
+        assert type(restored) is MaccabiGamesStats
+        assert len(restored) == len(picklable_games)
+
+    def test_empty_games(self, tmp_path, maccabi_games):
+        write_games_snapshot(maccabi_games.played_before("1900"), str(tmp_path / "maccabi.games"))
+        loaded = load_games_snapshot(str(tmp_path / "maccabi.games"))
+        assert loaded.games == []
+        assert loaded.players.best_scorers == []
+
+
+class TestGamesSnapshotFile:
+    def test_rewriting_a_loaded_snapshot_file(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        # A smaller snapshot to the same file, the loaded one still maps the previous file
+        write_games_snapshot(maccabi_games.played_before("1900"), snapshot_path)
+
+        assert [_game_state(game) for game in loaded.games] == [_game_state(game) for game in maccabi_games.games]
+        assert len(load_games_snapshot(snapshot_path)) == 0
+        assert [path.name for path in Path(snapshot_path).parent.iterdir()] == ["maccabi.games"]
+
+    def test_close_keeps_the_stats_usable(self, snapshot_path, maccabi_games):
+        with load_games_snapshot(snapshot_path) as loaded:
+            pass
+
+        assert loaded._snapshot.closed
+        assert len(loaded.games) == len(maccabi_games)
+        assert loaded.players.best_scorers == maccabi_games.players.best_scorers
+
+    def test_closed_snapshot_raises(self, snapshot_path):
+        snapshot = games_snapshot.MaccabiGamesSnapshot(snapshot_path)
+        snapshot.close()
+        snapshot.close()  # Closing twice is fine
+
+        with pytest.raises(ValueError, match="closed"):
+            snapshot.create_games()
+
+
+class TestGamesSnapshotVersions:
+    def test_newer_format_version_raises(self, snapshot_path):
+        with open(snapshot_path, 'r+b') as f:
+            f.seek(len(SNAPSHOT_MAGIC))
+            f.write(struct.pack('<I', games_snapshot.SNAPSHOT_FORMAT_VERSION + 1))
+
+        with pytest.raises(ValueError, match="upgrade maccabistats"):
+            load_games_snapshot(snapshot_path)
+
+    def test_format_version_2_dates_are_taken_from_the_full_dates(self, snapshot_path, maccabi_games):
+        loaded = load_games_snapshot(snapshot_path)
+        del loaded._snapshot.arrays['game_date']
+        assert loaded.columns.dates.tolist() == [game.date for game in maccabi_games.games]
+        assert [game.date for game in loaded.games] == [game.date for game in maccabi_games.games]
+
+    def test_enums_are_loaded_by_their_values(self, snapshot_path, maccabi_games, monkeypatch):
+        # A newer maccabistats may reorder the enums members, the snapshot keeps their values
+        loaded = load_games_snapshot(snapshot_path)
+        monkeypatch.setattr(loaded._snapshot, '_enums_values',
+                            dict(loaded._snapshot._enums_values, GoalTypes=['normal goal'] * len(GoalTypes)))
+
+        goals = [event for game in loaded.games for team in (game.home_team, game.away_team) for player in team.players
+                 for event in player.events if hasattr(event, 'goal_type')]
+        assert goals and all(goal.goal_type is GoalTypes.UNKNOWN for goal in goals)
+
+
+class TestGetMaccabiStats:
+    def test_loads_snapshot(self, snapshot_path, maccabi_games):
+        assert len(get_maccabi_stats(snapshot_path)) == len(maccabi_games)
+
+    def test_loads_pickle(self, tmp_path, picklable_games):
+        pickled_path = tmp_path / "maccabi.games"
+        pickled_path.write_bytes(pickle.dumps(picklable_games))
+        assert len(get_maccabi_stats(str(pickled_path))) == len(picklable_games)
+
+    def test_convert_pickle_to_snapshot(self, tmp_path, picklable_games):
+        pickled_path = tmp_path / "maccabi.games"
+        pickled_path.write_bytes(pickle.dumps(picklable_games))
+
+        assert convert_pickled_games_to_snapshot(str(pickled_path)) == str(pickled_path)
+        assert is_games_snapshot(str(pickled_path))
+        loaded = get_maccabi_stats(str(pickled_path))
+        assert [_game_state(game) for game in loaded.games] == [_game_state(game) for game in picklable_games.games]
+        assert loaded.players_data.home_players == {"אבי נמני"}
+
+    def test_convert_to_another_file(self, tmp_path, picklable_games):
+        pickled_path, snapshot_path = tmp_path / "maccabi.games", tmp_path / "maccabi-snapshot.games"
+        pickled_path.write_bytes(pickle.dumps(picklable_games))
+
+        convert_pickled_games_to_snapshot(str(pickled_path), str(snapshot_path))
+        assert not is_games_snapshot(str(pickled_path))
+        assert is_games_snapshot(str(snapshot_path))
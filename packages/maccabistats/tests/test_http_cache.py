@@ -0,0 +1,145 @@
+"""Tests for the maccabi-tlv.co.il http cache (without network, the site is faked)."""
+import gzip
+
+import pytest
+import requests
+
+from maccabistats.parse.maccabi_tlv_site import game_pages_provider
+from maccabistats.parse.maccabi_tlv_site.http_cache import MaccabiSiteHttpCache
+
+from maccabi_site_pages import events_page
+
+_URL = 'https://www.maccabi-tlv.co.il/match/game/'
+
+
+class _FakeResponse(object):
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error')
+
+
+class _FakeSite(object):
+    """Answers with the current page, or 304 when the request ETag matches it."""
+
+    def __init__(self, content=b'<html>game</html>'):
+        self.content = content
+        self.failing = False
+        self.requests_headers = []
+
+    @property
+    def etag(self):
+        return f'"{hash(self.content)}"'
+
+    def get(self, url, headers, timeout):
+        self.requests_headers.append(headers)
+        if self.failing:
+            raise requests.ConnectionError('maccabi-tlv.co.il is down')
+        if headers.get('If-None-Match') == self.etag:
+            return _FakeResponse(304)
+        return _FakeResponse(200, self.content, {'ETag': self.etag, 'Last-Modified': 'Sat, 17 Oct 2026 20:00:00 GMT'})
+
+
+@pytest.fixture
+def site():
+    return _FakeSite()
+
+
+@pytest.fixture
+def http_cache(tmp_path, site):
+    return MaccabiSiteHttpCache(tmp_path, session=site)
+
+
+class TestMaccabiSiteHttpCache:
+    def test_download_once(self, http_cache, site):
+        assert http_cache.get(_URL, max_age=None) == site.content
+        assert http_cache.get(_URL, max_age=60) == site.content
+        assert len(site.requests_headers) == 1
+        assert http_cache.stats == {'downloaded': 1, 'hit': 1}
+
+    def test_revalidate_not_modified(self, http_cache, site):
+        http_cache.get(_URL)
+        assert http_cache.get(_URL, max_age=0) == site.content
+
+        assert site.requests_headers[-1] == {'If-None-Match': site.etag,
+                                             'If-Modified-Since': 'Sat, 17 Oct 2026 20:00:00 GMT'}
+        assert http_cache.stats['not_modified'] == 1
+
+    def test_revalidate_changed(self, http_cache, site):
+        http_cache.get(_URL)
+        site.content = b'<html>finished game</html>'
+
+        assert http_cache.get(_URL, max_age=0) == b'<html>finished game</html>'
+        assert http_cache.stats['downloaded'] == 2
+
+    def test_expired_entry(self, http_cache, site, monkeypatch):
+        http_cache.get(_URL)
+        monkeypatch.setattr('maccabistats.parse.maccabi_tlv_site.http_cache.time.time', lambda: 2 ** 40)
+
+        http_cache.get(_URL, max_age=60)
+        assert http_cache.stats['not_modified'] == 1
+
+    def test_final_entry(self, http_cache, site):
+        http_cache.get(_URL)
+        http_cache.mark_final(_URL)
+
+        assert http_cache.is_final(_URL)
+        http_cache.get(_URL, max_age=1e-9)
+        assert len(site.requests_headers) == 1
+        http_cache.get(_URL, max_age=0)
+        assert len(site.requests_headers) == 2
+
+    def test_bodies_by_content(self, http_cache, site, tmp_path):
+        http_cache.get(_URL)
+        http_cache.get(_URL + 'teams')
+
+        bodies = list((tmp_path / 'bodies').rglob('*.gz'))
+        assert len(bodies) == 1
+        assert gzip.decompress(bodies[0].read_bytes()) == site.content
+
+    def test_stale_entry_when_the_site_fails(self, http_cache, site):
+        http_cache.get(_URL)
+        site.failing = True
+
+        assert http_cache.get(_URL) == site.content
+        assert http_cache.stats['stale'] == 1
+        with pytest.raises(requests.ConnectionError):
+            http_cache.get(_URL + 'teams')
+
+    def test_missing_body(self, http_cache, site, tmp_path):
+        http_cache.get(_URL)
+        for body_path in (tmp_path / 'bodies').rglob('*.gz'):
+            body_path.unlink()
+
+        assert http_cache.get(_URL, max_age=None) == site.content
+        assert http_cache.stats['downloaded'] == 2
+
+
+class TestGamePagesProvider:
+    @pytest.fixture
+    def provider_cache(self, http_cache, monkeypatch):
+        monkeypatch.setattr(game_pages_provider, 'get_maccabi_site_http_cache', lambda: http_cache)
+        return http_cache
+
+    def test_squads_page_revalidated_until_final(self, provider_cache, site):
+        site.content = events_page(finished=True)
+        game_pages_provider.fetch_game_pages(_URL)
+        game_pages_provider.fetch_game_pages(_URL)
+        # The events page is kept by the games pages max age, the squads page (of a live game) is revalidated
+        assert len(site.requests_headers) == 3
+        assert not provider_cache.is_final(_URL) and not provider_cache.is_final(_URL + 'teams')
+
+        game_pages_provider.mark_game_pages_final(_URL)
+        game_pages_provider.fetch_game_pages(_URL)
+        assert len(site.requests_headers) == 3
+        assert game_pages_provider.get_game_pages(_URL) == (site.content, site.content)
+
+    def test_squads_page_not_fetched_for_unfinished_game(self, provider_cache, site):
+        site.content = events_page(finished=False)
+        game_pages_provider.fetch_game_pages(_URL)
+        assert len(site.requests_headers) == 1
+        assert game_pages_provider.get_game_pages(_URL) == (site.content, None)
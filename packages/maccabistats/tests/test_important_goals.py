@@ -1,4 +1,5 @@
 """Tests for MaccabiGamesImportantGoalsStats."""
+from maccabistats.models.player_game_events import GoalTypes
 
 
 class TestImportantGoals:
@@ -26,3 +27,15 @@ class TestImportantGoals:
         blowout = maccabi_games.important_goals.get_top_scorers(
             minimum_diff_for_maccabi=5, maximum_diff_for_maccabi=10)
         assert len(blowout) == 0
+
+    def test_goal_condition_receives_the_goal_dict(self, maccabi_games):
+        goals = []
+
+        def goal_condition(goal):
+            goals.append(goal)
+            return goal['goal_type'] == GoalTypes.PENALTY.value
+
+        scorers = dict(maccabi_games.important_goals.get_top_scorers(goal_condition=goal_condition))
+        maccabi_goals = [goal for game in maccabi_games for goal in game.maccabi_goals()]
+        assert goals and all(goal in maccabi_goals for goal in goals)
+        assert sum(scorers.values()) == sum(goal['goal_type'] == GoalTypes.PENALTY.value for goal in goals)
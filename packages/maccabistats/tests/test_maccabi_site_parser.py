@@ -0,0 +1,137 @@
+"""Tests for the maccabi-tlv.co.il pages parsing & crawling (without network, on synthetic pages)."""
+from datetime import timedelta
+
+import pytest
+import requests
+
+from maccabistats.config import MaccabiStatsConfigSingleton
+from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.parse.maccabi_tlv_site import game_pages_provider, main_parser
+from maccabistats.parse.maccabi_tlv_site.game_squads_parser import GameRecord, MaccabiSiteGameSquadsParser
+from maccabistats.parse.maccabi_tlv_site.html_elements import parse_html
+from maccabistats.parse.maccabi_tlv_site.http_cache import MaccabiSiteHttpCache
+from maccabistats.parse.maccabi_tlv_site.match_status import MatchNotFinishedError
+
+from maccabi_site_pages import GAME_LINK, events_page, season_page, squads_page
+
+_LIVE_GAME_LINK = GAME_LINK + 'live/'
+_OTHER_SEASON_GAME_LINK = GAME_LINK + 'other-season/'
+
+
+def _game_records(page_content):
+    return [MaccabiSiteGameSquadsParser.parse_game_record(game_element)
+            for game_element in parse_html(page_content).xpath('//article')]
+
+
+def _player(team, name):
+    return next(player for player in team.players if player.name == name)
+
+
+def _events_types(player):
+    return [(event.event_type, event.time_occur // timedelta(minutes=1)) for event in player.events]
+
+
+def test_use_lxml_parser_is_deprecated():
+    maccabi_site_config = MaccabiStatsConfigSingleton.maccabi_site
+    with pytest.warns(DeprecationWarning, match="use_lxml_parser"):
+        maccabi_site_config.use_lxml_parser = False
+    with pytest.warns(DeprecationWarning, match="use_lxml_parser"):
+        assert maccabi_site_config.use_lxml_parser
+
+
+class TestMaccabiSiteGameParser:
+    def test_game_record(self):
+        home_game_record, away_game_record = _game_records(season_page([GAME_LINK, _LIVE_GAME_LINK]))
+
+        assert home_game_record == GameRecord(
+            date='10 ספט 2023 20:30', competition='ליגת העל', fixture='מחזור 3', stadium='בלומפילד', maccabi_score=3,
+            not_maccabi_score=1, not_maccabi_team_name='הפועל חיפה', is_maccabi_home_team=True, link=GAME_LINK)
+        assert away_game_record.fixture == 'No round found' and not away_game_record.is_maccabi_home_team
+
+    def test_game(self):
+        game = MaccabiSiteGameSquadsParser.parse_game(_game_records(season_page())[0], '2023/24', events_page(),
+                                                      squads_page())
+
+        assert (game.competition, game.fixture, game.stadium, game.season) == ('ליגת העל', 'מחזור 3', 'בלומפילד',
+                                                                                '2023/24')
+        assert (game.referee, game.crowd) == ('אורי אזולאי', '25000')
+        assert (game.maccabi_team.coach, game.not_maccabi_team.coach) == ('רובי קין', 'חיים סילבס')
+        assert (game.maccabi_team.score, game.not_maccabi_team.score) == (3, 1)
+        assert [player.number for player in game.maccabi_team.players] == ['7', '10', '4', '42', '19', '23']
+
+        captain = _player(game.maccabi_team, 'ערן זהבי')
+        assert _events_types(captain) == [(GameEventTypes.CAPTAIN, 0), (GameEventTypes.LINE_UP, 0),
+                                          (GameEventTypes.GOAL_SCORE, 10), (GameEventTypes.GOAL_SCORE, 55)]
+        assert captain.events[2].goal_type is GoalTypes.PENALTY  # From the events page
+        assert _events_types(_player(game.maccabi_team, 'שרן ייני')) == [
+            (GameEventTypes.LINE_UP, 0), (GameEventTypes.YELLOW_CARD, 30), (GameEventTypes.SUBSTITUTION_OUT, 60)]
+        assert _events_types(_player(game.maccabi_team, 'דור פרץ')) == [
+            (GameEventTypes.SUBSTITUTION_IN, 60), (GameEventTypes.SUBSTITUTION_OUT, 85), (GameEventTypes.GOAL_ASSIST, 10)]
+        # Old games: a card / substitution image without its minute
+        assert _events_types(_player(game.maccabi_team, 'עידן נחמיאס')) == [(GameEventTypes.LINE_UP, 0),
+                                                                            (GameEventTypes.YELLOW_CARD, 0)]
+        assert _events_types(_player(game.maccabi_team, 'שחקן ותיק')) == [(GameEventTypes.SUBSTITUTION_IN, 0)]
+        assert [event['name'] for event in game._half_parsed_events] == ['שחקן לא ידוע']
+
+    def test_not_finished_game(self):
+        with pytest.raises(MatchNotFinishedError):
+            MaccabiSiteGameSquadsParser.parse_game(_game_records(season_page())[0], '2023/24',
+                                                   events_page(finished=False), squads_page())
+
+
+class _FakeSite(object):
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested_urls = []
+
+    def get(self, url, headers, timeout):
+        self.requested_urls.append(url)
+        response = requests.Response()
+        response.status_code, response._content = 200, self.pages[url]
+        return response
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    season_link = MaccabiStatsConfigSingleton.maccabi_site.season_page_pattern.format
+    fake_site = _FakeSite({
+        season_link(season_number=0): season_page([GAME_LINK, _LIVE_GAME_LINK], season='2023/24'),
+        season_link(season_number=1): season_page([_OTHER_SEASON_GAME_LINK], season='2024/25'),
+        GAME_LINK: events_page(), f'{GAME_LINK}teams': squads_page(),
+        _LIVE_GAME_LINK: events_page(finished=False), f'{_LIVE_GAME_LINK}teams': squads_page(),
+        _OTHER_SEASON_GAME_LINK: events_page(), f'{_OTHER_SEASON_GAME_LINK}teams': squads_page(),
+    })
+
+    http_cache = MaccabiSiteHttpCache(tmp_path, session=fake_site)
+    for module in (main_parser, game_pages_provider):
+        monkeypatch.setattr(module, 'get_maccabi_site_http_cache', lambda: http_cache)
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabi_site, 'max_seasons_to_crawl', 2)
+    monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabi_site, 'crawling_process_number', 2)
+    monkeypatch.delenv('START_SEASON_TO_CRAWL', raising=False)
+    return fake_site, http_cache
+
+
+class TestMaccabiSiteCrawling:
+    @pytest.mark.parametrize('use_multiprocess_crawling', [False, True])
+    def test_crawl(self, site, monkeypatch, use_multiprocess_crawling):
+        fake_site, http_cache = site
+        monkeypatch.setattr(MaccabiStatsConfigSingleton.maccabi_site, 'use_multiprocess_crawling',
+                            use_multiprocess_crawling)
+
+        games = main_parser.get_parsed_maccabi_games_from_maccabi_site()
+
+        assert [(game.season, game.date_as_hebrew_string) for game in games] == [('2023/24', '10 ספט 2023 20:30'),
+                                                                                 ('2024/25', '10 ספט 2023 20:30')]
+        # The squads page of the live game is not fetched
+        assert sorted(fake_site.requested_urls) == sorted(set(fake_site.pages) - {f'{_LIVE_GAME_LINK}teams'})
+        assert http_cache.is_final(GAME_LINK) and http_cache.is_final(f'{GAME_LINK}teams')
+        assert not http_cache.is_final(_LIVE_GAME_LINK)
+
+    def test_crawl_again_from_the_cache(self, site):
+        fake_site, _ = site
+        main_parser.get_parsed_maccabi_games_from_maccabi_site()
+        fake_site.requested_urls.clear()
+
+        assert len(main_parser.get_parsed_maccabi_games_from_maccabi_site()) == 2
+        # The finished games pages are final and the live game events page is kept by the games pages max age
+        assert fake_site.requested_urls == []
@@ -0,0 +1,126 @@
+"""Tests for splicing the modified MaccabiPedia games into the previous crawl games (incremental crawl)."""
+import copy
+import json
+from datetime import timedelta
+
+import pytest
+import requests
+
+from maccabistats.parse.maccabipedia.maccabipedia_parser import MaccabiPediaParser
+from maccabistats.parse.maccabipedia.maccabipedia_source import MaccabiPediaSource, splice_modified_games
+
+
+@pytest.fixture
+def previous_crawl(maccabi_games):
+    games = list(maccabi_games.games)
+    games_pages = {f"משחק:{index}": game.date.isoformat() for index, game in enumerate(games)}
+    return games, games_pages
+
+
+class TestSpliceModifiedGames:
+    def test_nothing_modified(self, previous_crawl):
+        games, games_pages = previous_crawl
+        spliced_games, spliced_pages = splice_modified_games(games, games_pages, set(games_pages), {})
+        assert spliced_games == games
+        assert spliced_pages == games_pages
+
+    def test_modified_game_is_replaced(self, previous_crawl):
+        games, games_pages = previous_crawl
+        modified_game = copy.deepcopy(games[3])
+        modified_game.crowd = "12345"
+
+        spliced_games, spliced_pages = splice_modified_games(games, games_pages, set(games_pages),
+                                                             {"משחק:3": modified_game})
+        assert len(spliced_games) == len(games)
+        assert modified_game in spliced_games
+        assert games[3] not in spliced_games
+        assert spliced_pages == games_pages
+
+    def test_modified_game_date_changed(self, previous_crawl):
+        games, games_pages = previous_crawl
+        modified_game = copy.deepcopy(games[3])
+        modified_game.date = modified_game.date + timedelta(days=1)
+
+        spliced_games, spliced_pages = splice_modified_games(games, games_pages, set(games_pages),
+                                                             {"משחק:3": modified_game})
+        assert len(spliced_games) == len(games)
+        assert games[3] not in spliced_games
+        assert spliced_pages["משחק:3"] == modified_game.date.isoformat()
+
+    def test_new_game_is_added(self, previous_crawl):
+        games, games_pages = previous_crawl
+        new_game = copy.deepcopy(games[0])
+        new_game.date = new_game.date.replace(year=2030)
+
+        spliced_games, spliced_pages = splice_modified_games(games, games_pages, set(games_pages) | {"משחק:new"},
+                                                             {"משחק:new": new_game})
+        assert len(spliced_games) == len(games) + 1
+        assert spliced_pages["משחק:new"] == new_game.date.isoformat()
+
+    def test_deleted_game_is_removed(self, previous_crawl):
+        games, games_pages = previous_crawl
+        spliced_games, spliced_pages = splice_modified_games(games, games_pages, set(games_pages) - {"משחק:5"}, {})
+        assert games[5] not in spliced_games
+        assert len(spliced_games) == len(games) - 1
+        assert "משחק:5" not in spliced_pages
+
+    def test_unknown_page_needs_full_crawl(self, previous_crawl):
+        games, games_pages = previous_crawl
+        assert splice_modified_games(games, games_pages, set(games_pages) | {"משחק:unknown"}, {}) is None
+
+    def test_unmodified_games_at_the_same_day_are_kept(self, previous_crawl):
+        games, games_pages = previous_crawl
+        same_day_game = copy.deepcopy(games[0])
+        games_pages = dict(games_pages, **{"משחק:same day": games_pages["משחק:0"]})
+
+        spliced_games, _ = splice_modified_games(games + [same_day_game], games_pages, set(games_pages), {})
+        assert len(spliced_games) == len(games) + 1
+
+    def test_modified_game_at_the_same_day_needs_full_crawl(self, previous_crawl):
+        games, games_pages = previous_crawl
+        same_day_game = copy.deepcopy(games[0])
+        games_pages = dict(games_pages, **{"משחק:same day": games_pages["משחק:0"]})
+
+        assert splice_modified_games(games + [same_day_game], games_pages, set(games_pages),
+                                     {"משחק:same day": same_day_game}) is None
+
+
+class TestIncrementalCrawlState:
+    def test_no_previous_crawl_needs_full_crawl(self, tmp_path, monkeypatch):
+        source = MaccabiPediaSource(incremental=True)
+        monkeypatch.setattr(source, "find_last_created_source_maccabi_games_file",
+                            lambda: str(tmp_path / "MaccabiPedia-1-1.games"))
+        assert source._rerun_source_incrementally() is None
+
+    def test_games_pages_file_is_next_to_the_games_file(self):
+        path = MaccabiPediaSource.games_pages_file_path("/a/MaccabiPedia-2.73-2026-10-18 20-00-00.games")
+        assert path.name == "MaccabiPedia-2.73-2026-10-18 20-00-00.pages.json"
+
+    @pytest.fixture
+    def source_with_previous_crawl(self, tmp_path, monkeypatch, maccabi_games):
+        source = MaccabiPediaSource(incremental=True)
+        games_file = str(tmp_path / "MaccabiPedia-1-1.games")
+        source.games_pages_file_path(games_file).write_text(
+            json.dumps(dict(crawled_at="2026-10-18T20:00:00+00:00", games_pages={})), encoding='utf-8')
+        monkeypatch.setattr(source, "find_last_created_source_maccabi_games_file", lambda: games_file)
+        monkeypatch.setattr(source, "load_serialized_games",
+                            lambda: setattr(source, "maccabi_games_stats", maccabi_games))
+        monkeypatch.setattr(MaccabiPediaParser, "get_modified_games_names_pages", staticmethod(lambda _since: set()))
+        return source
+
+    def test_crawl_errors_need_full_crawl(self, source_with_previous_crawl, monkeypatch):
+        requests_sent = []
+
+        def timeout():
+            requests_sent.append(1)
+            raise requests.Timeout("Read timed out")
+
+        monkeypatch.setattr(MaccabiPediaParser, "get_games_pages_names", staticmethod(timeout))
+        assert source_with_previous_crawl._rerun_source_incrementally() is None
+        assert requests_sent
+
+    def test_modified_names_pages_need_full_crawl(self, source_with_previous_crawl, monkeypatch):
+        monkeypatch.setattr(MaccabiPediaParser, "get_modified_games_names_pages",
+                            staticmethod(lambda _since: {"יריבה:הפועל תל אביב"}))
+        monkeypatch.setattr(MaccabiPediaParser, "get_games_pages_names", staticmethod(lambda: pytest.fail()))
+        assert source_with_previous_crawl._rerun_source_incrementally() is None
@@ -1,8 +1,11 @@
 """Tests for GameData, TeamInGame, and PlayerInGame model properties."""
+import copy
 import datetime
+import pickle
 from datetime import timedelta
 
-from maccabistats.models.player_game_events import GameEventTypes, GoalTypes
+from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalGameEvent, GoalTypes
+from maccabistats.models.player_in_game import PlayerInGame
 
 
 class TestGameData:
@@ -95,6 +98,45 @@ class TestGameData:
                            if g['team'] != 'מכבי תל אביב' and g.get('goal_type') != GoalTypes.OWN_GOAL.value]
         assert len(opponent_regular) == 0
 
+    def test_maccabi_goals__excludes_maccabi_own_goals(self, own_goal_games):
+        game = own_goal_games.games[0]
+        assert len(game.goals_timeline) == 1
+        assert game.maccabi_goals() == []
+
+    def test_goals_timeline__running_score_and_minutes(self, maccabi_games):
+        # Game 5: opp 10'(0-1), opp 20'(0-2), maccabi 50'(1-2), own 60'(2-2)
+        timeline = maccabi_games.games[4].goals_timeline
+        assert [goal.minute for goal in timeline[:4]] == [10, 20, 50, 60]
+        assert [(goal.maccabi_score, goal.not_maccabi_score) for goal in timeline[:4]] == [(0, 1), (0, 2), (1, 2),
+                                                                                           (2, 2)]
+        assert timeline[3].is_own_goal and timeline[3].for_maccabi
+
+    def test_goals_timeline__same_as_goals(self, maccabi_games):
+        for game in maccabi_games:
+            assert [(goal['name'], goal['maccabi_score'], goal['not_maccabi_score']) for goal in game.goals()] == \
+                   [(goal.player.name, goal.maccabi_score, goal.not_maccabi_score) for goal in game.goals_timeline]
+
+    def test_goals_timeline__cached_until_events_change(self, maccabi_games):
+        game = copy.deepcopy(maccabi_games.games[0])
+        timeline = game.goals_timeline
+        assert game.goals_timeline is timeline
+
+        game.maccabi_team.players[0].add_event(GoalGameEvent(timedelta(minutes=89)))
+        assert len(game.goals_timeline) == len(timeline) + 1
+        assert game.goals_timeline[-1].maccabi_score == timeline[-1].maccabi_score + 1
+
+    def test_goals_timeline__other_games_changes_keep_the_cache(self, maccabi_games):
+        game, other_game = copy.deepcopy(maccabi_games.games[:2])
+        timeline = game.goals_timeline
+
+        other_game.maccabi_team.players[0].add_event(GoalGameEvent(timedelta(minutes=89)))
+        assert game.goals_timeline is timeline
+
+    def test_goals_timeline__not_pickled(self, maccabi_games):
+        game = copy.deepcopy(maccabi_games.games[0])
+        game.goals_timeline
+        assert '_goals_timeline' not in game.__getstate__()
+
     def test_league_fixture__parses_number(self, maccabi_games):
         assert maccabi_games.games[0].league_fixture == 1
 
@@ -208,3 +250,59 @@ class TestPlayerInGame:
         assert player.goals_count_by_goal_type(GoalTypes.PENALTY) == 1
 
 
+class TestPlayerInGameEventsCounts:
+    @staticmethod
+    def _create_player():
+        return PlayerInGame("אבי נמני", 10, [GameEvent(GameEventTypes.LINE_UP, timedelta(0)),
+                                             GoalGameEvent(timedelta(minutes=10), GoalTypes.HEADER)])
+
+    def test_counts_by_type_and_goal_type(self):
+        player = self._create_player()
+        assert player.event_count_by_type(GameEventTypes.GOAL_SCORE) == 1
+        assert player.goals_count_by_goal_type(GoalTypes.HEADER) == 1
+        assert player.goals_count_by_goal_type(GoalTypes.PENALTY) == 0
+
+    def test_add_event_refreshes_the_counts(self):
+        player = self._create_player()
+        assert player.event_count_by_type(GameEventTypes.GOAL_SCORE) == 1
+        player.add_event(GoalGameEvent(timedelta(minutes=20), GoalTypes.PENALTY))
+        assert player.event_count_by_type(GameEventTypes.GOAL_SCORE) == 2
+        assert player.goals_count_by_goal_type(GoalTypes.PENALTY) == 1
+
+    def test_set_goal_type_refreshes_the_counts(self):
+        player = self._create_player()
+        assert player.goals_count_by_goal_type(GoalTypes.HEADER) == 1
+        player.set_goal_type(player.events[1], GoalTypes.OWN_GOAL)
+        assert player.goals_count_by_goal_type(GoalTypes.HEADER) == 0
+        assert player.goals_count_by_goal_type(GoalTypes.OWN_GOAL) == 1
+
+    def test_goal_without_goal_type(self):
+        player = PlayerInGame("אבי נמני", 10, [GameEvent(GameEventTypes.GOAL_SCORE, timedelta(minutes=10))])
+        assert player.scored is True
+        assert player.goals_count_by_goal_type(GoalTypes.UNKNOWN) == 0
+
+    def test_players_and_events_have_no_dict(self):
+        player = self._create_player()
+        assert not hasattr(player, '__dict__')
+        assert not hasattr(player.events[1], '__dict__')
+
+    def test_pickle_roundtrip(self):
+        player = self._create_player()
+        player.event_count_by_type(GameEventTypes.LINE_UP)
+        restored = pickle.loads(pickle.dumps(player))
+        assert restored == player
+        assert restored.events == player.events
+        assert restored.events[1].goal_type is GoalTypes.HEADER
+        assert restored.goals_count_by_goal_type(GoalTypes.HEADER) == 1
+
+    def test_load_state_from_before_slots(self):
+        # Pickles from before __slots__ kept the attributes dict as the state
+        player = object.__new__(PlayerInGame)
+        player.__setstate__(dict(name="אבי נמני", number=10,
+                                 events=[GameEvent(GameEventTypes.LINE_UP, timedelta(0))]))
+        assert player.played_in_game is True
+
+        event = object.__new__(GoalGameEvent)
+        event.__setstate__(dict(event_type=GameEventTypes.GOAL_SCORE, time_occur=timedelta(minutes=3),
+                                goal_type=GoalTypes.PENALTY))
+        assert event.goal_type is GoalTypes.PENALTY
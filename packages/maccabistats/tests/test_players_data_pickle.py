@@ -115,6 +115,20 @@ def test_unpickle_then_filter_works_offline(monkeypatch):
     assert filtered.players_categories.maccabi_home_players_names == {"שחקן א"}
 
 
+def test_pickled_filtered_stats_are_regular_stats():
+    """Filtered stats share the root games, pickling them should keep just their own games."""
+    players = _make_players_instance()
+    games = [_make_game(datetime(2024, 9, 1)), _make_game(datetime(2024, 10, 1))]
+    stats = MaccabiGamesStats(games, players_data=players)
+    filtered = stats.played_after(datetime(2024, 9, 15))
+
+    restored = pickle.loads(pickle.dumps(filtered))
+    assert type(restored) is MaccabiGamesStats
+    assert len(restored) == 1
+    assert restored.description == filtered.description
+    assert restored.players_data.home_players == {"שחקן א"}
+
+
 def test_empty_games_works_with_players_data():
     """Creating MaccabiGamesStats with empty games and players data should work."""
     players = _make_players_instance()
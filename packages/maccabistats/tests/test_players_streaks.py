@@ -0,0 +1,134 @@
+"""Tests for the players (and players & teams) streaks, compared to the streaks of each player (and team) games."""
+import pytest
+
+from maccabistats.models.player_game_events import GameEventTypes
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.players_games_condition import PlayerGamesCondition
+
+ALL_PLAYERS = 1000
+
+
+def _streaks_by_player(players_streaks):
+    return {player_name: streak.games for player_name, streak in players_streaks}
+
+
+@pytest.fixture(params=['all', 'home', 'league'])
+def games(request, maccabi_games):
+    return dict(all=maccabi_games, home=maccabi_games.home_games, league=maccabi_games.league_games)[request.param]
+
+
+class TestPlayersStreaksFromGamesTheyPlayed:
+    @pytest.mark.parametrize('predicate, value, condition', [
+        ('wins', None, lambda g, _: g.is_maccabi_win),
+        ('unbeaten', None, lambda g, _: g.maccabi_score_diff >= 0),
+        ('clean_sheet', None, lambda g, _: g.not_maccabi_team.score == 0),
+        ('score_at_least', 2, lambda g, _: g.maccabi_team.score >= 2),
+    ])
+    @pytest.mark.parametrize('current', [False, True])
+    def test_same_as_each_player_games(self, games, predicate, value, condition, current):
+        players_streaks = games.players_streaks
+        streaks = players_streaks._get_top_players_streaks_from_games_they_played(
+            players_streaks._games_results(predicate, value), current=current, top_players_count=ALL_PLAYERS)
+
+        players_games = games.played_games_by_player_name()
+        expected = {}
+        for player_name in games.available_players_names:
+            player_streaks = players_games[player_name].streaks
+            streak = player_streaks._get_current_streak_by_condition(lambda g: condition(g, player_name)) if current \
+                else player_streaks._get_longest_streak_by_condition(lambda g: condition(g, player_name))
+            expected[player_name] = streak.games
+
+        assert _streaks_by_player(streaks) == expected
+
+    @pytest.mark.parametrize('current', [False, True])
+    def test_goals_involving_streak(self, games, current):
+        players_streaks = games.players_streaks
+        streaks = players_streaks._get_top_players_streaks_from_games_they_played(
+            players_streaks._players_events([GameEventTypes.GOAL_SCORE, GameEventTypes.GOAL_ASSIST], 1),
+            current=current, top_players_count=ALL_PLAYERS)
+
+        involved_in_a_game = PlayerGamesCondition.create_involved_in_x_goals_in_game__condition(1)
+        players_games = games.played_games_by_player_name()
+        for player_name, streak_games in _streaks_by_player(streaks).items():
+            player_streaks = players_games[player_name].streaks
+            get_streak = player_streaks._get_current_streak_by_condition if current \
+                else player_streaks._get_longest_streak_by_condition
+            assert streak_games == get_streak(lambda g: involved_in_a_game(g, player_name)).games
+
+    def test_top_players_ordered_by_streak_length(self, maccabi_games):
+        streaks = maccabi_games.players_streaks.get_players_with_best_unbeaten_streak()
+        streaks_lengths = [len(streak) for _, streak in streaks]
+
+        assert len(streaks) == 10
+        assert streaks_lengths == sorted(streaks_lengths, reverse=True)
+        assert streaks_lengths[0] == 5
+        assert streaks[0][1].description == 'Player games: ' + streaks[0][0]
+
+    def test_without_creating_each_player_games(self, maccabi_games, monkeypatch):
+        monkeypatch.setattr(MaccabiGamesStats, 'played_games_by_player_name', None)
+        assert maccabi_games.players_streaks.get_players_with_best_goal_scoring_streak()
+
+
+class TestPlayersPlayedInGameStreaks:
+    @pytest.mark.parametrize('current', [False, True])
+    def test_same_as_all_games_streak(self, games, current):
+        streaks = games.players_streaks._get_top_players_played_in_game_streaks(current=current,
+                                                                                top_players_count=ALL_PLAYERS)
+
+        get_streak = games.streaks.get_current_player_played_in_game_streak if current \
+            else games.streaks.get_longest_player_played_in_game
+        assert _streaks_by_player(streaks) == {player_name: get_streak(player_name).games
+                                               for player_name in games.available_players_names}
+
+    def test_empty_games(self, maccabi_games):
+        empty_games = maccabi_games.played_before("1900")
+        assert empty_games.players_streaks.get_players_with_best_played_in_game_streak() == []
+        assert empty_games.players_streaks.get_players_with_current_win_streak() == []
+
+
+class TestPlayersAndTeamsStreaks:
+    @pytest.mark.parametrize('current', [False, True])
+    def test_same_as_each_player_and_team_games(self, games, current):
+        players_and_teams_streaks = games.players_and_teams_streaks
+        streaks = players_and_teams_streaks._get_top_players_and_teams_streaks_from_games_they_played(
+            players_and_teams_streaks._games_results('unbeaten'), current=current, top_players_count=ALL_PLAYERS)
+
+        expected = []
+        for player_name, teams_games in games.played_games_by_player_and_team().items():
+            for team_name, player_and_team_games in teams_games.items():
+                get_streak = player_and_team_games.streaks.get_current_unbeaten_streak if current \
+                    else player_and_team_games.streaks.get_longest_unbeaten_streak_games
+                expected.append((player_name, team_name, get_streak().games))
+
+        # Same order for the same streak length: the player first game and then the team first game
+        assert [(player_name, team_name, streak.games) for player_name, team_name, streak in streaks] == \
+               sorted(expected, key=lambda streak: len(streak[2]), reverse=True)
+
+    @pytest.mark.parametrize('current', [False, True])
+    def test_played_in_game_streaks_from_the_games_against_the_team(self, games, current):
+        streaks = games.players_and_teams_streaks._get_top_players_and_teams_played_in_game_streaks(
+            current=current, top_players_count=ALL_PLAYERS)
+
+        expected = {}
+        for team_name in games.available_opponents:
+            team_games = games.get_games_against_team(team_name)
+            for player_name in games.available_players_names:
+                get_streak = team_games.streaks.get_current_player_played_in_game_streak if current \
+                    else team_games.streaks.get_longest_player_played_in_game
+                streak = get_streak(player_name)
+                if streak:
+                    expected[(player_name, team_name)] = (streak.games, streak.description)
+
+        assert {(player_name, team_name): (streak.games, streak.description)
+                for player_name, team_name, streak in streaks} == expected
+
+    def test_top_streaks(self, maccabi_games):
+        streaks = maccabi_games.players_and_teams_streaks.get_players_with_best_goal_scoring_streak()
+        streaks_lengths = [len(streak) for _, _, streak in streaks]
+
+        assert 0 < len(streaks) <= 10
+        assert streaks_lengths == sorted(streaks_lengths, reverse=True)
+        player_name, team_name, streak = streaks[0]
+        assert streak.description == f'Players {player_name} and Team: {team_name} games'
+        assert all(game.not_maccabi_team.current_name == team_name and
+                   game.maccabi_team.scored_players_with_amount[player_name] >= 1 for game in streak.games)
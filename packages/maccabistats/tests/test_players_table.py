@@ -0,0 +1,133 @@
+"""Tests for the players table (all players metrics in one pass), compared to walking the games objects."""
+import copy
+import logging
+from datetime import timedelta
+
+import pytest
+
+from maccabistats.models.player_game_events import GameEvent, GameEventTypes, GoalGameEvent, GoalTypes, AssistTypes
+from maccabistats.models.player_in_game import PlayerInGame
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats
+from maccabistats.stats.players_table import METRICS
+
+from games_walking import goals, goals_after_sub_in, walk_game_condition, walk_players_condition
+
+
+_PLAYERS_CONDITIONS = {
+    'best_scorers': goals,
+    'best_scorers_by_freekick': lambda p: p.goals_count_by_goal_type(GoalTypes.FREE_KICK),
+    'best_scorers_by_penalty': lambda p: p.goals_count_by_goal_type(GoalTypes.PENALTY),
+    'best_scorers_by_head': lambda p: p.goals_count_by_goal_type(GoalTypes.HEADER),
+    'best_scorers_by_foot': lambda p: p.goals_count_by_goal_type(GoalTypes.NORMAL_KICK),
+    'best_scorers_by_own_goal': lambda p: p.goals_count_by_goal_type(GoalTypes.OWN_GOAL),
+    'best_assisters': lambda p: p.event_count_by_type(GameEventTypes.GOAL_ASSIST),
+    'best_assisters_by_corner': lambda p: p.assists_count_by_assist_type(AssistTypes.CORNER_ASSIST),
+    'best_assisters_by_header': lambda p: p.assists_count_by_assist_type(AssistTypes.HEADER_ASSIST),
+    'most_goals_involved': lambda p: goals(p) + p.event_count_by_type(GameEventTypes.GOAL_ASSIST),
+    'most_yellow_carded': lambda p: p.event_count_by_type(GameEventTypes.YELLOW_CARD),
+    'most_red_carded': lambda p: (p.event_count_by_type(GameEventTypes.RED_CARD) +
+                                  p.event_count_by_type(GameEventTypes.SECOND_YELLOW_CARD)),
+    'most_substitute_off': lambda p: p.event_count_by_type(GameEventTypes.SUBSTITUTION_OUT),
+    'most_substitute_in': lambda p: p.event_count_by_type(GameEventTypes.SUBSTITUTION_IN),
+    'most_lineup_players': lambda p: p.event_count_by_type(GameEventTypes.LINE_UP),
+    'most_captains': lambda p: p.event_count_by_type(GameEventTypes.CAPTAIN),
+    'most_goals_after_sub_in': goals_after_sub_in,
+}
+
+_GAME_CONDITIONS = {
+    'most_played': lambda g: True,
+    'most_winners': lambda g: g.is_maccabi_win,
+    'most_losers': lambda g: g.maccabi_score_diff < 0,
+    'most_unbeaten': lambda g: g.maccabi_score_diff >= 0,
+    'most_clean_sheet': lambda g: g.not_maccabi_team.score == 0,
+}
+
+
+@pytest.fixture(params=['all', 'away', 'home'])
+def games(request, maccabi_games):
+    return {'all': maccabi_games, 'away': maccabi_games.away_games, 'home': maccabi_games.home_games}[request.param]
+
+
+class TestPlayersTableLeaderboards:
+    @pytest.mark.parametrize('property_name', sorted(_PLAYERS_CONDITIONS))
+    def test_players_condition_same_as_walking_the_games(self, games, property_name):
+        assert getattr(games.players, property_name) == walk_players_condition(
+            games, _PLAYERS_CONDITIONS[property_name])
+
+    @pytest.mark.parametrize('property_name', sorted(_GAME_CONDITIONS))
+    def test_game_condition_same_as_walking_the_games(self, games, property_name):
+        assert getattr(games.players, property_name) == walk_game_condition(games, _GAME_CONDITIONS[property_name])
+
+    @pytest.mark.parametrize('at_least', [1, 2])
+    def test_best_scorers_in_one_game(self, games, at_least):
+        assert games.players.best_scorers_in_one_game(at_least) == walk_players_condition(
+            games, lambda p: 1 if goals(p) >= at_least else 0)
+
+    def test_best_assisters_in_one_game(self, games):
+        assert games.players.best_assisters_in_one_game(1) == walk_players_condition(
+            games, lambda p: 1 if p.event_count_by_type(GameEventTypes.GOAL_ASSIST) >= 1 else 0)
+
+    @pytest.mark.parametrize('from_minute', [0, 45, 75])
+    def test_top_scorers_on_last_minutes(self, games, from_minute):
+        assert games.players.get_top_scorers_on_last_minutes(from_minute) == walk_players_condition(
+            games, lambda p: len([e for e in p.get_events_by_type(GameEventTypes.GOAL_SCORE)
+                                  if e.time_occur > timedelta(minutes=from_minute)]))
+
+    def test_own_goal_is_counted_only_as_own_goal(self, own_goal_games):
+        players = own_goal_games.players
+        assert players.best_scorers == []
+        assert [count for _, count in players.best_scorers_by_own_goal] == [1]
+
+
+class TestPlayersTableExport:
+    def test_table_has_every_metric(self, maccabi_games):
+        table = maccabi_games.players.table()
+        assert table
+        assert all(list(row) == ['name'] + list(METRICS) for row in table)
+
+    def test_table_matches_the_leaderboards(self, maccabi_games):
+        players = maccabi_games.players
+        by_name = {row['name']: row for row in players.table()}
+        assert {name: by_name[name]['goals'] for name, _ in players.best_scorers} == dict(players.best_scorers)
+        assert {name: by_name[name]['played'] for name, _ in players.most_played} == dict(players.most_played)
+
+    def test_metric_total_is_the_leaderboard_sum(self, maccabi_games):
+        players = maccabi_games.players
+        assert players.metric_total('assists') == sum(count for _, count in players.best_assisters)
+        assert maccabi_games.players_events_summary.total_goals_scoring_counted_for_maccabi_players == \
+               sum(count for _, count in players.best_scorers)
+
+    def test_empty_games(self, maccabi_games):
+        empty = maccabi_games.played_before("1900")
+        assert empty.players.table() == []
+        assert empty.players.best_assisters == []
+        assert empty.players.metric_total('goals') == 0
+
+    def test_table_is_built_once(self, maccabi_games):
+        players = maccabi_games.players
+        assert players._table is players._table
+
+
+class TestPlayersTableEdgeCases:
+    @staticmethod
+    def _stats_with_extra_maccabi_player(maccabi_games, player):
+        game = copy.deepcopy(maccabi_games.games[0])
+        game.maccabi_team.players.append(player)
+        return MaccabiGamesStats([game], players_data=maccabi_games.players_data)
+
+    def test_goal_before_sub_in_is_logged(self, maccabi_games, caplog):
+        player = PlayerInGame("שחקן מחליף", 99, [GameEvent(GameEventTypes.SUBSTITUTION_IN, timedelta(minutes=60)),
+                                                   GoalGameEvent(timedelta(minutes=30), GoalTypes.NORMAL_KICK)])
+        stats = self._stats_with_extra_maccabi_player(maccabi_games, player)
+
+        with caplog.at_level(logging.ERROR):
+            assert "שחקן מחליף" not in dict(stats.players.most_goals_after_sub_in)
+        assert "A player: שחקן מחליף has different number of goals" in caplog.text
+
+    def test_players_with_the_same_name_in_a_game_are_summed(self, maccabi_games):
+        game = maccabi_games.games[0]
+        player = copy.deepcopy(game.maccabi_team.played_players[0])
+        player.number = 99
+        stats = self._stats_with_extra_maccabi_player(maccabi_games, player)
+
+        assert dict(stats.players.most_played)[player.name] == 2
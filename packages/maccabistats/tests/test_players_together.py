@@ -0,0 +1,58 @@
+"""Tests for the players that played together, compared to the combinations of each game played players."""
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+ALL_GROUPS = 10000
+
+
+def _played_together(games, players_count, only_wins=False):
+    played_together = Counter()
+    for game in games:
+        if only_wins and not game.is_maccabi_win:
+            continue
+        for players in combinations(sorted(game.maccabi_team.played_players_with_amount), players_count):
+            played_together[players] += 1
+
+    return played_together
+
+
+class TestPlayersTogether:
+    @pytest.mark.parametrize('players_count', [2, 3, 4])
+    def test_same_as_each_game_combinations(self, maccabi_games, players_count):
+        assert dict(maccabi_games.players_together.most_played_together(players_count, ALL_GROUPS)) == \
+               dict(_played_together(maccabi_games, players_count))
+
+    @pytest.mark.parametrize('players_count', [2, 3])
+    def test_top_groups(self, maccabi_games, players_count):
+        top = maccabi_games.players_together.most_played_together(players_count, top_count=5)
+        expected_games_counts = [games_count for _, games_count
+                                 in _played_together(maccabi_games, players_count).most_common(5)]
+
+        assert [games_count for _, games_count in top] == expected_games_counts
+
+    def test_wins_together(self, maccabi_games):
+        assert dict(maccabi_games.players_together.most_wins_together(ALL_GROUPS)) == \
+               dict(_played_together(maccabi_games, 2, only_wins=True))
+
+    def test_minutes_together(self, maccabi_games):
+        minutes_together = dict(maccabi_games.players_together.most_minutes_together(ALL_GROUPS))
+
+        # The line up players played the whole game together, unless one of them was subbed out (or got a red card)
+        assert max(minutes_together.values()) <= 90 * len(maccabi_games)
+        assert set(minutes_together) <= set(_played_together(maccabi_games, 2))
+
+    def test_distinct_teammates(self, maccabi_games):
+        players_games = maccabi_games.played_games_by_player_name()
+        assert dict(maccabi_games.players_together.most_distinct_teammates()) == \
+               {player_name: len(games.players.most_played) - 1 for player_name, games in players_games.items()}
+
+    def test_empty_games(self, maccabi_games):
+        empty_games = maccabi_games.played_before("1900")
+        assert empty_games.players_together.most_played_together(3) == []
+        assert empty_games.players_together.most_distinct_teammates() == []
+
+    def test_unknown_weight(self, maccabi_games):
+        with pytest.raises(ValueError):
+            maccabi_games.players_together._co_occurrence.pairs('goals')
@@ -17,6 +17,10 @@
 # Unbeaten: [1] then [3,4,5,6,7] then [9,10] -> longest = 5
 # Clean sheet: games 4,6 both clean but not consecutive; 9,10 consecutive -> longest = 2
 # Scoring: games 1,_,3,4,5,6,7,8,_,10 -> 1 then 3-8 then 10 -> longest scoring = 6
+import numpy as np
+import pytest
+
+from maccabistats.stats.streaks_runs import true_runs
 
 
 class TestLongestStreaks:
@@ -118,3 +122,52 @@ class TestEmptyStreaks:
         empty = MaccabiGamesStats([], players_data=create_stub_players_data())
         streak = empty.streaks.get_longest_wins_streak_games()
         assert len(streak) == 0
+
+
+class TestStreaksRuns:
+    def test_true_runs_of_each_row(self):
+        masks = np.array([[1, 1, 0, 1, 0, 1, 1, 1],
+                          [0, 0, 0, 0, 0, 0, 0, 0],
+                          [1, 1, 1, 1, 1, 1, 1, 1]], dtype=bool)
+        runs = true_runs(masks)
+        assert [(row.starts.tolist(), row.lengths.tolist()) for row in runs] == [([0, 3, 5], [2, 1, 3]),
+                                                                                 ([], []),
+                                                                                 ([0], [8])]
+
+    def test_runs_are_created_once(self, maccabi_games):
+        runs = maccabi_games.streaks._runs
+        assert runs.runs('wins') is runs.runs('wins')
+        assert runs.runs('score_at_least', 2) is runs.runs('score_at_least', 2)
+
+    def test_same_as_walking_the_games(self, maccabi_games):
+        for games in (maccabi_games, maccabi_games.home_games, maccabi_games.league_games):
+            streaks = games.streaks
+            for predicate, condition in (('wins', lambda g: g.is_maccabi_win),
+                                         ('unbeaten', lambda g: g.maccabi_score_diff >= 0),
+                                         ('clean_sheet', lambda g: g.not_maccabi_team.score == 0)):
+                assert streaks._longest(predicate).games == streaks._get_longest_streak_by_condition(condition).games
+                assert streaks._current(predicate).games == streaks._get_current_streak_by_condition(condition).games
+                assert [streak.games for streak in streaks._similar(predicate, 1)] == \
+                       [streak.games for streak in streaks._get_similar_streaks(condition, 1)]
+
+    def test_player_played_streak(self, maccabi_games):
+        streak = maccabi_games.streaks.get_longest_player_played_in_game("אבי נמני")
+        assert len(streak) == len(maccabi_games.streaks._get_longest_streak_by_condition(
+            lambda g: "אבי נמני" in g.maccabi_team.played_players_with_amount))
+        assert len(maccabi_games.streaks.get_longest_player_played_in_game("nobody")) == 0
+
+
+class TestTopStreaks:
+    def test_top_wins_streaks(self, maccabi_games):
+        top_streaks = maccabi_games.streaks.get_top_streaks('wins', top_count=2)
+        # [4,5,6,7] and then the earlier of [1] and [10]
+        assert [len(streak) for streak in top_streaks] == [4, 1]
+        assert top_streaks[1].games[0] is maccabi_games.games[0]
+
+    def test_top_streaks_with_value(self, maccabi_games):
+        top_streaks = maccabi_games.streaks.get_top_streaks('score_at_least', top_count=10, value=1)
+        assert [len(streak) for streak in top_streaks] == [6, 1, 1]
+
+    def test_unknown_predicate(self, maccabi_games):
+        with pytest.raises(ValueError):
+            maccabi_games.streaks.get_top_streaks('longest')
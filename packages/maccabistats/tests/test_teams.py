@@ -45,3 +45,6 @@ class TestTeamsStats:
         teams = dict(maccabi_games.teams.teams_ordered_by_goals_diff())
         # מכבי ת"א שחר: (3-1)+(4-2) = +4
         assert teams['מכבי ת"א שחר'] == 4
+
+    def test_teams_games_are_the_games(self, maccabi_games):
+        assert maccabi_games.teams.games is maccabi_games.games
@@ -0,0 +1,71 @@
+"""Tests for the filtered games views (MaccabiGamesStatsView)."""
+import pytest
+
+from maccabistats.stats import maccabi_games_stats
+from maccabistats.stats.maccabi_games_stats import MaccabiGamesStats, MaccabiGamesStatsView
+
+
+class TestViewsShareTheGames:
+    def test_filter_returns_a_view(self, maccabi_games):
+        assert isinstance(maccabi_games.home_games, MaccabiGamesStatsView)
+
+    def test_view_games_are_the_root_games(self, maccabi_games):
+        home = maccabi_games.home_games
+        assert all(any(game is root_game for root_game in maccabi_games.games) for game in home)
+
+    def test_view_of_view_keeps_the_root(self, maccabi_games):
+        home_wins = maccabi_games.home_games.maccabi_wins
+        assert home_wins._root is maccabi_games
+        assert [g.date for g in home_wins] == [g.date for g in maccabi_games
+                                               if g.is_maccabi_home_team and g.is_maccabi_win]
+
+    def test_view_keeps_the_games_sorted(self, maccabi_games):
+        dates = [g.date for g in maccabi_games.league_games.away_games]
+        assert dates == sorted(dates)
+
+    def test_chained_description(self, maccabi_games):
+        assert maccabi_games.home_games.maccabi_wins.description == 'Home games + Wins only'
+
+
+class TestViewsAreLazy:
+    def test_sub_stats_created_on_first_use(self, maccabi_games):
+        home = maccabi_games.home_games
+        assert 'players' not in home.__dict__
+        assert home.players is home.players
+        assert 'players' in home.__dict__
+
+    def test_unknown_attribute_raises(self, maccabi_games):
+        with pytest.raises(AttributeError):
+            maccabi_games.home_games.no_such_attribute
+
+    def test_view_columns_match_fresh_columns(self, maccabi_games):
+        away = maccabi_games.away_games
+        fresh = MaccabiGamesStats(away.games, players_data=maccabi_games.players_data)
+        assert (away.columns.maccabi_score == fresh.columns.maccabi_score).all()
+        assert len(away.columns.event_player) == len(fresh.columns.event_player)
+        assert away.players.best_scorers == fresh.players.best_scorers
+        assert away.players.most_played == fresh.players.most_played
+
+
+class TestLazySubStats:
+    def test_sub_stats_are_not_built_on_init(self, maccabi_games):
+        stats = type(maccabi_games)(maccabi_games.games, players_data=maccabi_games.players_data)
+        assert 'seasons' not in stats.__dict__
+        assert 'players' not in stats.__dict__
+        assert len(stats.seasons) == 2
+
+    def test_sub_stats_are_not_pickled(self, maccabi_games):
+        stats = type(maccabi_games)(maccabi_games.games, players_data=maccabi_games.players_data)
+        stats.players.best_scorers
+        assert 'players' not in stats.__getstate__()
+
+    def test_attribute_errors_inside_the_cached_properties_are_not_hidden(self, maccabi_games, monkeypatch):
+        def broken_columns(games):
+            raise AttributeError("'GameData' object has no attribute 'broken'")
+
+        monkeypatch.setattr(maccabi_games_stats, 'MaccabiGamesColumns', broken_columns)
+        stats = type(maccabi_games)(maccabi_games.games, players_data=maccabi_games.players_data)
+        with pytest.raises(AttributeError, match="'broken'"):
+            stats.columns
+        with pytest.raises(AttributeError, match="'broken'"):
+            stats.home_games